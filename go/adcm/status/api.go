@@ -82,25 +82,27 @@ func (api *AdcmApi) getToken() (string, bool) {
 	return v.Token, true
 }
 
-func (api *AdcmApi) checkAuth(token string) bool {
+const SessionExpiresHeader = "ADCM-Session-Expires"
+
+func (api *AdcmApi) checkAuth(token string) authCheckResult {
 	client := api.getClient()
 	req, _ := http.NewRequest("GET", api.Url+"/rbac/me/", nil)
 	req.Header.Add("Authorization", "Token "+token)
 	resp, err := client.Do(req)
 	if err != nil {
 		logg.E.Printf("checkAuth: http error: %v", err)
-		return false
+		return authCheckResult{}
 	}
 	defer resp.Body.Close()
 	if resp.StatusCode != 200 {
 		logg.W.Printf("check ADCM token %s fail: %v", token, resp.Status)
-		return false
+		return authCheckResult{valid: false, cacheable: isAuthRejection(resp.StatusCode)}
 	}
 	logg.D.Println("checkAuth: check ADCM token ok")
-	return true
+	return authCheckResult{valid: true, cacheable: true}
 }
 
-func (api *AdcmApi) checkSessionAuth(sessionId string) bool {
+func (api *AdcmApi) checkSessionAuth(sessionId string) authCheckResult {
 	client := api.getClient()
 	req, _ := http.NewRequest("GET", api.Url+"/stack/", nil)
 	req.AddCookie(&http.Cookie{Name: "sessionid", Value: sessionId})
@@ -108,15 +110,34 @@ func (api *AdcmApi) checkSessionAuth(sessionId string) bool {
 	resp, err := client.Do(req)
 	if err != nil {
 		logg.E.Printf("checkSessionAuth: http error: %v", err)
-		return false
+		return authCheckResult{}
 	}
 	defer resp.Body.Close()
 	if resp.StatusCode != 200 {
 		logg.W.Printf("check ADCM sessionId %s fail: %v", sessionId, resp.Status)
-		return false
+		return authCheckResult{valid: false, cacheable: isAuthRejection(resp.StatusCode)}
 	}
 	logg.D.Println("checkSessionAuth: check ADCM sessionId ok")
-	return true
+	return authCheckResult{valid: true, cacheable: true, expires: parseSessionExpires(resp.Header)}
+}
+
+// parseSessionExpires returns expiration date of checked session reported by ADCM
+// or zero time if it's absent
+func parseSessionExpires(header http.Header) time.Time {
+	value := header.Get(SessionExpiresHeader)
+	if value == "" {
+		return time.Time{}
+	}
+	expires, err := http.ParseTime(value)
+	if err != nil {
+		logg.W.Printf("checkSessionAuth: can't parse %s header '%s': %v", SessionExpiresHeader, value, err)
+		return time.Time{}
+	}
+	return expires
+}
+
+func isAuthRejection(statusCode int) bool {
+	return statusCode == http.StatusUnauthorized || statusCode == http.StatusForbidden
 }
 
 func (api *AdcmApi) loadServiceMap() bool {
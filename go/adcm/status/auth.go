@@ -15,29 +15,15 @@ package status
 import (
 	"net/http"
 	"strings"
-	"time"
 )
 
 func checkADCMUserToken(hub Hub, token string) bool {
-	checkADCMAuth := func(token string) bool {
-		if hub.AdcmApi.checkAuth(token) {
-			hub.Secrets.adcmTokens[token] = time.Now().Add(hub.Secrets.tokenTimeOut)
-			return true
-		} else {
-			return false
-		}
-	}
-
-	val, ok := hub.Secrets.adcmTokens[token]
-	if !ok {
-		return checkADCMAuth(token)
-	}
-
-	if time.Now().Before(val) {
-		return true
+	if token == "" {
+		return false
 	}
-
-	return checkADCMAuth(token)
+	return hub.AuthCache.check(tokenCacheKey(token), func() authCheckResult {
+		return hub.AdcmApi.checkAuth(token)
+	})
 }
 
 func djangoAuth(r *http.Request, hub Hub) bool {
@@ -46,7 +32,9 @@ func djangoAuth(r *http.Request, hub Hub) bool {
 		logg.D.Println("No sessionid cookie")
 		return false
 	}
-	return hub.AdcmApi.checkSessionAuth(sessionId.Value)
+	return hub.AuthCache.check(sessionCacheKey(sessionId.Value), func() authCheckResult {
+		return hub.AdcmApi.checkSessionAuth(sessionId.Value)
+	})
 }
 
 func canAuthWithWebSocketHeaderCredentials(r *http.Request, hub Hub) bool {
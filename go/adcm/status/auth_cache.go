@@ -0,0 +1,169 @@
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package status
+
+import (
+	"container/list"
+	"sync"
+	"time"
+)
+
+const (
+	AuthCacheSize        = 10000
+	AuthCacheTimeOut     = 10 * time.Minute
+	AuthCacheFailTimeOut = 10 * time.Second
+)
+
+// AuthCache keeps results of ADCM token/session checks,
+// so ADCM is asked at most once per time out for each credential.
+// Failed checks are kept for a shorter time (negative caching),
+// least recently used entries are evicted when cache is full.
+
+// authCheckResult is result of credential check done by ADCM.
+// It's cached only when reliable (ADCM answered with definite status),
+// non-zero `expires` limits the time it's cached for (e.g. by expiration date of session).
+type authCheckResult struct {
+	valid     bool
+	cacheable bool
+	expires   time.Time
+}
+
+type authCacheEntry struct {
+	key     string
+	valid   bool
+	expires time.Time
+}
+
+type AuthCache struct {
+	size        int
+	timeOut     time.Duration
+	failTimeOut time.Duration
+	entries     map[string]*list.Element
+	order       *list.List
+	mutex       sync.Mutex
+}
+
+type AuthCacheInvalidation struct {
+	Tokens   []string `json:"tokens"`
+	Sessions []string `json:"sessions"`
+	All      bool     `json:"all"`
+}
+
+func newAuthCache(size int, timeOut time.Duration, failTimeOut time.Duration) *AuthCache {
+	return &AuthCache{
+		size:        size,
+		timeOut:     timeOut,
+		failTimeOut: failTimeOut,
+		entries:     map[string]*list.Element{},
+		order:       list.New(),
+	}
+}
+
+func tokenCacheKey(token string) string {
+	return "token:" + token
+}
+
+func sessionCacheKey(sessionId string) string {
+	return "session:" + sessionId
+}
+
+// check returns cached result of credential check or calls `checker` and caches its result.
+func (c *AuthCache) check(key string, checker func() authCheckResult) bool {
+	if valid, ok := c.get(key); ok {
+		return valid
+	}
+	result := checker()
+	if result.cacheable {
+		c.set(key, result.valid, result.expires)
+	}
+	return result.valid
+}
+
+func (c *AuthCache) get(key string) (bool, bool) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	elem, ok := c.entries[key]
+	if !ok {
+		return false, false
+	}
+	entry := elem.Value.(*authCacheEntry)
+	if time.Now().After(entry.expires) {
+		c.order.Remove(elem)
+		delete(c.entries, key)
+		return false, false
+	}
+	c.order.MoveToFront(elem)
+	return entry.valid, true
+}
+
+func (c *AuthCache) set(key string, valid bool, expires time.Time) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	timeOut := c.timeOut
+	if !valid {
+		timeOut = c.failTimeOut
+	}
+	entry := &authCacheEntry{key: key, valid: valid, expires: time.Now().Add(timeOut)}
+	if !expires.IsZero() && expires.Before(entry.expires) {
+		entry.expires = expires
+	}
+
+	if elem, ok := c.entries[key]; ok {
+		elem.Value = entry
+		c.order.MoveToFront(elem)
+		return
+	}
+	c.entries[key] = c.order.PushFront(entry)
+	for c.order.Len() > c.size {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*authCacheEntry).key)
+	}
+}
+
+func (c *AuthCache) remove(keys ...string) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	for _, key := range keys {
+		if elem, ok := c.entries[key]; ok {
+			c.order.Remove(elem)
+			delete(c.entries, key)
+		}
+	}
+}
+
+func (c *AuthCache) clear() {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	c.entries = map[string]*list.Element{}
+	c.order.Init()
+}
+
+func (c *AuthCache) invalidate(inv AuthCacheInvalidation) {
+	if inv.All {
+		c.clear()
+		return
+	}
+	keys := []string{}
+	for _, token := range inv.Tokens {
+		keys = append(keys, tokenCacheKey(token))
+	}
+	for _, sessionId := range inv.Sessions {
+		keys = append(keys, sessionCacheKey(sessionId))
+	}
+	c.remove(keys...)
+}
@@ -0,0 +1,47 @@
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package status
+
+import (
+	"testing"
+	"time"
+)
+
+func TestAuthCacheEntryNotOutlivesSession(t *testing.T) {
+	cache := newAuthCache(10, time.Minute, time.Second)
+	calls := 0
+	checker := func(expires time.Time) func() authCheckResult {
+		return func() authCheckResult {
+			calls++
+			return authCheckResult{valid: true, cacheable: true, expires: expires}
+		}
+	}
+
+	cache.check("expired", checker(time.Now().Add(-time.Second)))
+	cache.check("expired", checker(time.Now().Add(-time.Second)))
+	if calls != 2 {
+		t.Errorf("result for expired session is cached, checks done: %d", calls)
+	}
+
+	calls = 0
+	cache.check("long", checker(time.Now().Add(time.Hour)))
+	cache.check("long", checker(time.Now().Add(time.Hour)))
+	cache.check("no expiration", checker(time.Time{}))
+	cache.check("no expiration", checker(time.Time{}))
+	if calls != 2 {
+		t.Errorf("result isn't cached, checks done: %d", calls)
+	}
+	if expires := cache.entries["long"].Value.(*authCacheEntry).expires; expires.After(time.Now().Add(time.Minute)) {
+		t.Errorf("result is cached for longer than time out: %v", expires)
+	}
+}
@@ -42,6 +42,7 @@ var apiErrors = map[string]ApiErr{
 	"HC_NOT_FOUND":      {"host component doesn't exist", 404, ERROR, ""},
 	"STATUS_UNDEFINED":  {"status is undefined", 409, WARNING, ""},
 	"LOG_ERROR":         {"log error", 409, ERROR, ""},
+	"NO_SERVICE_MAP":    {"service map is not loaded yet", 409, ERROR, ""},
 	"PAGE_NOT_FOUND":    {"page not found", 404, WARNING, ""},
 	"UNKNOWN_ERROR":     {"unknown error", 501, CRITICAL, ""},
 }
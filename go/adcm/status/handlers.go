@@ -84,6 +84,66 @@ func showAll(h Hub, w http.ResponseWriter, r *http.Request) {
 	jsonOut(w, r, all)
 }
 
+// statusBatchRequest lists objects which statuses should be returned by one call,
+// services are identified by [cluster, service] and host components by [host, component]
+type statusBatchRequest struct {
+	Clusters       []int    `json:"clusters"`
+	Services       [][2]int `json:"services"`
+	Components     []int    `json:"components"`
+	Hosts          []int    `json:"hosts"`
+	HostComponents [][2]int `json:"hostcomponents"`
+}
+
+// statusBatchResponse contains the same statuses as separate calls for every object would return,
+// host components are keyed by "host.component", unknown hosts are absent
+type statusBatchResponse struct {
+	Clusters       map[int]int    `json:"clusters"`
+	Services       map[int]int    `json:"services"`
+	Components     map[int]int    `json:"components"`
+	Hosts          map[int]int    `json:"hosts"`
+	HostComponents map[string]int `json:"hostcomponents"`
+}
+
+func showStatusBatch(h Hub, w http.ResponseWriter, r *http.Request) {
+	allow(w, "POST")
+	var req statusBatchRequest
+	if _, err := decodeBody(w, r, &req); err != nil {
+		ErrOut4(w, r, "JSON_ERROR", err.Error())
+		return
+	}
+
+	out := statusBatchResponse{
+		Clusters:       map[int]int{},
+		Services:       map[int]int{},
+		Components:     map[int]int{},
+		Hosts:          map[int]int{},
+		HostComponents: map[string]int{},
+	}
+	for _, clusterId := range req.Clusters {
+		out.Clusters[clusterId] = getClusterStatus(h, clusterId).Status
+	}
+	for _, service := range req.Services {
+		status, _ := getServiceStatus(h, service[0], service[1])
+		out.Services[service[1]] = status.Status
+	}
+	for _, compId := range req.Components {
+		status, _ := getComponentStatus(h, compId)
+		out.Components[compId] = status.Status
+	}
+	for _, hostId := range req.Hosts {
+		if _, ok := h.ServiceMap.getHostCluster(hostId); !ok {
+			continue
+		}
+		status, _ := h.HostStatusStorage.get(ALL, hostId)
+		out.Hosts[hostId] = status.Status
+	}
+	for _, hc := range req.HostComponents {
+		status, _ := h.HostComponentStorage.get(hc[0], hc[1])
+		out.HostComponents[fmt.Sprintf("%d.%d", hc[0], hc[1])] = status.Status
+	}
+	jsonOut(w, r, out)
+}
+
 func clusterList(h Hub, w http.ResponseWriter, r *http.Request) {
 	allow(w, "GET")
 	clusterOut := []struct {
@@ -252,6 +312,25 @@ func postEvent(h Hub, w http.ResponseWriter, r *http.Request) {
 	jsonOut(w, r, "")
 }
 
+func postEventBatch(h Hub, w http.ResponseWriter, r *http.Request) {
+	allow(w, "POST")
+	events := []eventMessage{}
+	body, err := decodeBody(w, r, &events)
+	if err != nil {
+		return
+	}
+	logg.D.Printf("postEventBatch - %d events", len(events))
+	for _, event := range events {
+		// one malformed event shouldn't block delivery of the others
+		if event.Event == "" || event.Object.Id == 0 {
+			logg.W.Printf("postEventBatch: skip malformed event %+v, POST body: '%s'", event, body)
+			continue
+		}
+		h.EventWS.send2ws(event)
+	}
+	jsonOut(w, r, "")
+}
+
 func getPostStatus(w http.ResponseWriter, r *http.Request) (int, error) {
 	status := Status{}
 	_, err := decodeBody(w, r, &status)
@@ -348,6 +427,30 @@ func postServiceMap(h Hub, w http.ResponseWriter, r *http.Request) {
 	// h.ServiceStorage.pure()
 }
 
+func postServiceMapDelta(h Hub, w http.ResponseWriter, r *http.Request) {
+	allow(w, "POST")
+	var delta ServiceMapsDelta
+	_, err := decodeBody(w, r, &delta)
+	if err != nil {
+		ErrOut4(w, r, "JSON_ERROR", err.Error())
+		return
+	}
+	logg.D.Printf("postServiceMapDelta: %+v", delta)
+	if !h.ServiceMap.update(delta) {
+		ErrOut(w, r, "NO_SERVICE_MAP")
+	}
+}
+
+func invalidateAuthCache(h Hub, w http.ResponseWriter, r *http.Request) {
+	allow(w, "POST")
+	var inv AuthCacheInvalidation
+	if _, err := decodeBody(w, r, &inv); err != nil {
+		ErrOut4(w, r, "JSON_ERROR", err.Error())
+		return
+	}
+	h.AuthCache.invalidate(inv)
+}
+
 func postMMObjects(h Hub, w http.ResponseWriter, r *http.Request) {
 	allow(w, "POST")
 	h.MMObjects.mutex.Lock()
@@ -34,6 +34,7 @@ type Hub struct {
 	StatusEvent          *StatusEvent
 	AdcmApi              *AdcmApi
 	Secrets              *SecretConfig
+	AuthCache            *AuthCache
 	MMObjects            *MMObjects
 }
 
@@ -43,6 +44,7 @@ func Start(secrets *SecretConfig, logFile string, logLevel string) {
 	initSignal()
 
 	hub.MMObjects = newMMObjects()
+	hub.AuthCache = newAuthCache(AuthCacheSize, AuthCacheTimeOut, AuthCacheFailTimeOut)
 
 	hub.HostComponentStorage = newStorage(dbMap2{}, "HostComponent")
 	go hub.HostComponentStorage.run()
@@ -93,8 +95,10 @@ func startHTTP(httpPort string, hub Hub) {
 	router.POST("/api/v1/log/", authWrap(hub, postLogLevel, isADCM))
 
 	router.POST("/api/v1/event/", authWrap(hub, postEvent, isADCM))
+	router.POST("/api/v1/event/batch/", authWrap(hub, postEventBatch, isADCM))
 
 	router.GET("/api/v1/all/", authWrap(hub, showAll, isADCM, isADCMUser))
+	router.POST("/api/v1/batch/", authWrap(hub, showStatusBatch, isADCM))
 
 	router.GET("/api/v1/host/", authWrap(hub, hostList, isADCM, isADCMUser))
 	router.GET("/api/v1/host/:hostid/", authWrap(hub, showHost, isStatusChecker, isADCM, isADCMUser))
@@ -118,8 +122,11 @@ func startHTTP(httpPort string, hub Hub) {
 
 	router.GET("/api/v1/servicemap/", authWrap(hub, showServiceMap, isADCM))
 	router.POST("/api/v1/servicemap/", authWrap(hub, postServiceMap, isADCM))
+	router.POST("/api/v1/servicemap/delta/", authWrap(hub, postServiceMapDelta, isADCM))
 	router.POST("/api/v1/servicemap/reload/", authWrap(hub, readConfig, isADCM))
 
+	router.POST("/api/v1/auth/invalidate/", authWrap(hub, invalidateAuthCache, isADCM))
+
 	log.Fatal(http.ListenAndServe(httpPort, router))
 }
 
@@ -16,7 +16,6 @@ import (
 	"encoding/json"
 	"log"
 	"os"
-	"time"
 )
 
 type SecretConfig struct {
@@ -26,8 +25,6 @@ type SecretConfig struct {
 	} `json:"adcmuser"`
 	Token             string `json:"token"`
 	ADCMInternalToken string `json:"adcm_internal_token"`
-	adcmTokens        map[string]time.Time
-	tokenTimeOut      time.Duration
 }
 
 func ReadSecret(filename *string) *SecretConfig {
@@ -43,7 +40,5 @@ func ReadSecret(filename *string) *SecretConfig {
 	if err := jsonParser.Decode(&config); err != nil {
 		log.Fatalf("Can't decode json file %s: %v", *filename, err)
 	}
-	config.adcmTokens = map[string]time.Time{}
-	config.tokenTimeOut = 60 * time.Minute
 	return &config
 }
@@ -44,12 +44,30 @@ type ServiceMaps struct {
 	HostService map[string]ClusterService `json:"hostservice"`
 }
 
+// ServiceMapsDelta:
+// Clusters: cluster -> new content of this cluster's part of map, null or empty content drops cluster.
+//           Hosts that are no longer in cluster are treated as hosts without cluster.
+// Hosts:    host -> cluster (0 for host without cluster), null drops host.
+
+type ServiceMapsDelta struct {
+	Clusters map[Id]*ClusterServiceMaps `json:"clusters"`
+	Hosts    map[Id]*int                `json:"hosts"`
+}
+
+type ClusterServiceMaps struct {
+	Host        []int                     `json:"host"`
+	Service     []int                     `json:"service"`
+	Component   map[Id][]string           `json:"component"`
+	HostService map[string]ClusterService `json:"hostservice"`
+}
+
 type ssReq struct {
 	command  string
 	cluster  int
 	service  int
 	hostcomp string
 	smap     ServiceMaps
+	delta    ServiceMapsDelta
 }
 
 type ssResp struct {
@@ -62,9 +80,10 @@ type ssResp struct {
 }
 
 type ServiceServer struct {
-	in   chan ssReq
-	out  chan ssResp
-	smap ServiceMaps
+	in          chan ssReq
+	out         chan ssResp
+	smap        ServiceMaps
+	initialized bool
 }
 
 type Id int
@@ -96,7 +115,15 @@ func (s *ServiceServer) run() {
 		switch c.command {
 		case "init":
 			s.smap = initServiceMap(c.smap)
+			s.initialized = true
 			s.out <- ssResp{ok: true}
+		case "update":
+			// delta can't be applied to a map that was never loaded from ADCM,
+			// full map should be sent first
+			if s.initialized {
+				s.smap = s.smap.withDelta(c.delta)
+			}
+			s.out <- ssResp{ok: s.initialized}
 		case "getmap":
 			s.out <- ssResp{smap: s.smap}
 		case "gethosts":
@@ -136,6 +163,12 @@ func (s *ServiceServer) init(sm ServiceMaps) {
 	<-s.out
 }
 
+func (s *ServiceServer) update(delta ServiceMapsDelta) bool {
+	s.in <- ssReq{command: "update", delta: delta}
+	resp := <-s.out
+	return resp.ok
+}
+
 func (s *ServiceServer) getMap() ServiceMaps {
 	s.in <- ssReq{command: "getmap"}
 	resp := <-s.out
@@ -193,6 +226,18 @@ func (s *ServiceServer) getComponentHosts(compId int) ([]int, bool) {
 // Internal
 
 func initServiceMap(smap ServiceMaps) ServiceMaps {
+	if smap.Host == nil {
+		smap.Host = map[Id][]int{}
+	}
+	if smap.Service == nil {
+		smap.Service = map[Id][]int{}
+	}
+	if smap.Component == nil {
+		smap.Component = map[Id]map[Id][]string{}
+	}
+	if smap.HostService == nil {
+		smap.HostService = map[string]ClusterService{}
+	}
 	smap.HostCluster = map[Id]int{}
 	for clusterId, hosts := range smap.Host {
 		for _, hostId := range hosts {
@@ -202,6 +247,124 @@ func initServiceMap(smap ServiceMaps) ServiceMaps {
 	return smap
 }
 
+// Maps returned to readers (e.g. encoded to JSON by handlers) are used outside of server's goroutine,
+// so they are never changed in place: delta is applied to a copy that replaces the current map.
+func (s ServiceMaps) withDelta(delta ServiceMapsDelta) ServiceMaps {
+	result := s.clone()
+	result.applyDelta(delta)
+	return result
+}
+
+func (s ServiceMaps) clone() ServiceMaps {
+	result := ServiceMaps{
+		Host:        make(map[Id][]int, len(s.Host)),
+		HostCluster: make(map[Id]int, len(s.HostCluster)),
+		Service:     make(map[Id][]int, len(s.Service)),
+		Component:   make(map[Id]map[Id][]string, len(s.Component)),
+		HostService: make(map[string]ClusterService, len(s.HostService)),
+	}
+	for clusterId, hosts := range s.Host {
+		result.Host[clusterId] = append([]int{}, hosts...)
+	}
+	for hostId, clusterId := range s.HostCluster {
+		result.HostCluster[hostId] = clusterId
+	}
+	for clusterId, services := range s.Service {
+		result.Service[clusterId] = append([]int{}, services...)
+	}
+	for clusterId, services := range s.Component {
+		components := make(map[Id][]string, len(services))
+		for serviceId, hostComponents := range services {
+			components[serviceId] = append([]string{}, hostComponents...)
+		}
+		result.Component[clusterId] = components
+	}
+	for key, cs := range s.HostService {
+		result.HostService[key] = cs
+	}
+	return result
+}
+
+func (s *ServiceMaps) applyDelta(delta ServiceMapsDelta) {
+	for clusterId, cluster := range delta.Clusters {
+		s.replaceCluster(int(clusterId), cluster)
+	}
+	for hostId, clusterId := range delta.Hosts {
+		s.removeHost(int(hostId))
+		if clusterId != nil {
+			s.addHost(int(hostId), *clusterId)
+		}
+	}
+}
+
+func (s *ServiceMaps) replaceCluster(clusterId int, cluster *ClusterServiceMaps) {
+	if cluster == nil {
+		cluster = &ClusterServiceMaps{}
+	}
+
+	for _, hostComponents := range s.Component[Id(clusterId)] {
+		for _, key := range hostComponents {
+			delete(s.HostService, key)
+		}
+	}
+	delete(s.Component, Id(clusterId))
+	delete(s.Service, Id(clusterId))
+
+	if len(cluster.Component) > 0 {
+		s.Component[Id(clusterId)] = cluster.Component
+	}
+	if len(cluster.Service) > 0 {
+		s.Service[Id(clusterId)] = cluster.Service
+	}
+	for key, cs := range cluster.HostService {
+		s.HostService[key] = cs
+	}
+
+	newHosts := map[int]bool{}
+	for _, hostId := range cluster.Host {
+		newHosts[hostId] = true
+	}
+	oldHosts := append([]int{}, s.Host[Id(clusterId)]...)
+	for _, hostId := range oldHosts {
+		if !newHosts[hostId] {
+			s.removeHost(hostId)
+			s.addHost(hostId, 0)
+		}
+	}
+	for _, hostId := range cluster.Host {
+		if current, ok := s.HostCluster[Id(hostId)]; ok && current == clusterId {
+			continue
+		}
+		s.removeHost(hostId)
+		s.addHost(hostId, clusterId)
+	}
+}
+
+func (s *ServiceMaps) removeHost(hostId int) {
+	clusterId, ok := s.HostCluster[Id(hostId)]
+	if !ok {
+		return
+	}
+	delete(s.HostCluster, Id(hostId))
+
+	hosts := []int{}
+	for _, id := range s.Host[Id(clusterId)] {
+		if id != hostId {
+			hosts = append(hosts, id)
+		}
+	}
+	if len(hosts) > 0 {
+		s.Host[Id(clusterId)] = hosts
+	} else {
+		delete(s.Host, Id(clusterId))
+	}
+}
+
+func (s *ServiceMaps) addHost(hostId int, clusterId int) {
+	s.Host[Id(clusterId)] = append(s.Host[Id(clusterId)], hostId)
+	s.HostCluster[Id(hostId)] = clusterId
+}
+
 func (s *ServiceMaps) getHostComponent(hostComponent string) (ClusterService, bool) {
 	v, ok := s.HostService[hostComponent]
 	return v, ok
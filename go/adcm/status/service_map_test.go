@@ -0,0 +1,122 @@
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package status
+
+import (
+	"encoding/json"
+	"reflect"
+	"sync"
+	"testing"
+)
+
+func newTestServiceServer(t *testing.T) *ServiceServer {
+	t.Helper()
+	InitLog("", "ERROR")
+
+	server := newServiceServer()
+	go server.run()
+	server.init(ServiceMaps{
+		Host:    map[Id][]int{1: {10, 11}, 0: {12}},
+		Service: map[Id][]int{1: {100}},
+		Component: map[Id]map[Id][]string{
+			1: {100: {"10.1000", "11.1000"}},
+		},
+		HostService: map[string]ClusterService{
+			"10.1000": {Cluster: 1, Service: 100},
+			"11.1000": {Cluster: 1, Service: 100},
+		},
+	})
+	return server
+}
+
+func TestServiceMapDeltaApplied(t *testing.T) {
+	server := newTestServiceServer(t)
+	before := server.getMap()
+	noCluster := 0
+
+	ok := server.update(ServiceMapsDelta{
+		Clusters: map[Id]*ClusterServiceMaps{
+			1: {
+				Host:        []int{10},
+				Service:     []int{100},
+				Component:   map[Id][]string{100: {"10.1000"}},
+				HostService: map[string]ClusterService{"10.1000": {Cluster: 1, Service: 100}},
+			},
+		},
+		Hosts: map[Id]*int{12: nil, 13: &noCluster},
+	})
+	if !ok {
+		t.Fatal("delta is rejected")
+	}
+
+	after := server.getMap()
+	if hosts, _ := after.getHosts(1); !reflect.DeepEqual(hosts, []int{10}) {
+		t.Errorf("unexpected hosts of cluster: %v", hosts)
+	}
+	if clusterId, _ := after.getHostCluster(11); clusterId != 0 {
+		t.Errorf("host removed from cluster should be without cluster, got %d", clusterId)
+	}
+	if _, ok := after.getHostCluster(12); ok {
+		t.Error("deleted host is still in map")
+	}
+	if _, ok := after.getHostComponent("11.1000"); ok {
+		t.Error("host component of removed host is still in map")
+	}
+
+	// map retrieved before the delta is left intact
+	if hosts, _ := before.getHosts(1); !reflect.DeepEqual(hosts, []int{10, 11}) {
+		t.Errorf("previously retrieved map is changed: %v", hosts)
+	}
+	if _, ok := before.getHostComponent("11.1000"); !ok {
+		t.Error("previously retrieved map is changed")
+	}
+}
+
+// Run with `go test -race` to detect concurrent access to maps
+func TestServiceMapConcurrentDeltaAndRead(t *testing.T) {
+	server := newTestServiceServer(t)
+	var wg sync.WaitGroup
+
+	for i := 0; i < 4; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			for j := 0; j < 100; j++ {
+				clusterId := (i+j)%2 + 1
+				server.update(ServiceMapsDelta{
+					Clusters: map[Id]*ClusterServiceMaps{
+						Id(clusterId): {
+							Host:        []int{10 + j%3},
+							Service:     []int{100},
+							Component:   map[Id][]string{100: {"10.1000"}},
+							HostService: map[string]ClusterService{"10.1000": {Cluster: clusterId, Service: 100}},
+						},
+					},
+				})
+			}
+		}(i)
+
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for j := 0; j < 100; j++ {
+				if _, err := json.Marshal(server.getMap()); err != nil {
+					t.Error(err)
+				}
+				server.getHosts(1)
+			}
+		}()
+	}
+
+	wg.Wait()
+}
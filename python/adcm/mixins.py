@@ -23,6 +23,8 @@ from cm.models import (
 )
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import ObjectDoesNotExist
+from guardian.mixins import PermissionListMixin as GuardianPermissionListMixin
+from rbac.backends import get_objects_for_user
 
 ParentObject: TypeAlias = ConfigHostGroup | Cluster | Service | Component | Provider | Host | None
 
@@ -72,3 +74,12 @@ class GetParentObjectMixin:
                 )
 
         return parent_object
+
+
+class PermissionListMixin(GuardianPermissionListMixin):
+    """`guardian.mixins.PermissionListMixin` that evaluates permissions on tasks, jobs and logs by policies"""
+
+    def get_queryset(self, *args, **kwargs):
+        queryset = super(GuardianPermissionListMixin, self).get_queryset(*args, **kwargs)
+
+        return get_objects_for_user(**self.get_get_objects_for_user_kwargs(queryset))
@@ -18,7 +18,7 @@ from cm.models import ADCMEntity
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Model
-from guardian.shortcuts import get_objects_for_user
+from rbac.backends import get_objects_for_user
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import (
     DjangoModelPermissions,
@@ -47,6 +47,12 @@ PYTHON_SITE_PACKAGES = Path(
 )
 
 ANSIBLE_VAULT_HEADER = "$ANSIBLE_VAULT;1.1;AES256"
+# secrets are encrypted/decrypted by pool of worker processes when there are at least that many of them in one batch
+ANSIBLE_VAULT_PARALLEL_THRESHOLD = int(os.getenv("ANSIBLE_VAULT_PARALLEL_THRESHOLD", "256"))
+# amount of worker processes in that pool, each web server process keeps its own pool until it stops
+ANSIBLE_VAULT_WORKERS = int(os.getenv("ANSIBLE_VAULT_WORKERS", "2"))
+# amount of ciphertexts each process remembers as valid to avoid decrypting them on each config save
+ANSIBLE_VAULT_CACHE_SIZE = int(os.getenv("ANSIBLE_VAULT_CACHE_SIZE", "4096"))
 DEFAULT_SALT = b'"j\xebi\xc0\xea\x82\xe0\xa8\xba\x9e\x12E>\x11D'
 
 ADCM_TOKEN = get_adcm_token(ADCM_TOKEN_FILE)
@@ -189,6 +195,7 @@ DATABASES = {
 AUTHENTICATION_BACKENDS = (
     "django.contrib.auth.backends.ModelBackend",
     "guardian.backends.ObjectPermissionBackend",
+    "rbac.backends.TaskPermissionBackend",
     "rbac.ldap.CustomLDAPBackend",
     "adcm.auth_backend.CustomYandexOAuth2",
     "adcm.auth_backend.CustomGoogleOAuth2",
@@ -344,6 +351,13 @@ EMPTY_REQUEST_STATUS_CODE = 32
 VALUE_ERROR_STATUS_CODE = 8
 EMPTY_STATUS_STATUS_CODE = 4
 STATUS_REQUEST_TIMEOUT = 0.1
+# seconds during which status map retrieved from SS is reused by the same process
+STATUS_MAP_CACHE_TIMEOUT = float(os.getenv("STATUS_MAP_CACHE_TIMEOUT", "2"))
+# events for SS are sent in background by batches of this size or after this delay (seconds)
+STATUS_EVENTS_BATCH_SIZE = int(os.getenv("STATUS_EVENTS_BATCH_SIZE", "100"))
+STATUS_EVENTS_FLUSH_INTERVAL = float(os.getenv("STATUS_EVENTS_FLUSH_INTERVAL", "0.05"))
+# batch of events is sent this number of times if SS doesn't respond
+STATUS_EVENTS_SEND_ATTEMPTS = int(os.getenv("STATUS_EVENTS_SEND_ATTEMPTS", "3"))
 
 JOB_TYPE = "job"
 TASK_TYPE = "task"
@@ -386,5 +400,10 @@ STDOUT_STDERR_LOG_CUT_LENGTH = 1500
 STDOUT_STDERR_LOG_LINE_CUT_LENGTH = 1000
 STDOUT_STDERR_LOG_MAX_UNCUT_LENGTH = STDOUT_STDERR_LOG_CUT_LENGTH * STDOUT_STDERR_LOG_LINE_CUT_LENGTH
 STDOUT_STDERR_TRUNCATED_LOG_MESSAGE = "<Truncated. Download full version via link>"
+# Follow request occupies the worker while waiting for new log content, so the wait is kept short
+STDOUT_STDERR_LOG_FOLLOW_MAX_TIMEOUT = 10
+STDOUT_STDERR_LOG_FOLLOW_POLL_INTERVAL = 0.5
+# Max amount of bytes returned by one follow request
+STDOUT_STDERR_LOG_FOLLOW_CHUNK_SIZE = 1024 * 1024
 
 TEST_RUNNER = "adcm.tests.runner.SubTestParallelRunner"
@@ -0,0 +1,73 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Generator
+from unittest import skipUnless
+import os
+import sys
+import time
+import tracemalloc
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Benchmarks are too slow to be a part of regular unittests run, so they are skipped unless explicitly enabled:
+#   ADCM_BENCHMARKS=1 python/manage.py test python -k benchmark
+BENCHMARKS_ENABLED = os.environ.get("ADCM_BENCHMARKS") == "1"
+
+benchmark = skipUnless(BENCHMARKS_ENABLED, "Benchmarks are disabled, set ADCM_BENCHMARKS=1 to run them")
+
+
+@dataclass(slots=True)
+class Measurement:
+    name: str
+    seconds: float = 0.0
+    queries: int = 0
+    items: int | None = None
+    peak_memory: int | None = None
+    extra: dict = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        extra = "".join(f" | {key}={value}" for key, value in self.extra.items())
+        throughput = f" | {self.items / self.seconds:.2f} items/s" if self.items and self.seconds else ""
+        memory = f" | peak memory={self.peak_memory / 2**20:.2f}MiB" if self.peak_memory is not None else ""
+        return f"[benchmark] {self.name} | {self.seconds:.3f}s | queries={self.queries}{throughput}{memory}{extra}"
+
+
+@contextmanager
+def measure(name: str, trace_memory: bool = False, **extra) -> Generator[Measurement, None, None]:
+    """
+    Measure wall time and amount of queries made via default connection in current thread.
+    Set `items` on yielded result to get throughput reported.
+    With `trace_memory` peak of memory allocated by Python is reported too, yet it slows down the measured code.
+    Result is printed to stderr on exit, so it's visible in test run output.
+    """
+
+    result = Measurement(name=name, extra=extra)
+
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            yield result
+            result.seconds = time.perf_counter() - start
+    finally:
+        if trace_memory:
+            _, result.peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    result.queries = len(queries)
+    sys.stderr.write(f"\n{result}\n")
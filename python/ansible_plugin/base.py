@@ -29,6 +29,7 @@ from ansible.module_utils._text import to_native
 from ansible.plugins.action import ActionBase
 from cm.converters import core_type_to_model
 from cm.models import Cluster, Component, Host, Provider, Service
+from cm.services.job.inventory import OBJECTS_CHANGED_MARKER
 from core.types import ADCMCoreType, CoreObjectDescriptor, ObjectID
 from django.conf import settings
 from django.db.models import ObjectDoesNotExist
@@ -589,12 +590,17 @@ class ADCMAnsiblePlugin(ActionBase):
         # when we can rely on transactions correctness using PostgreSQL.
         #
         # Ergo this behavior and its motivation should be revisioned, alternative solutions discovered.
-        with (settings.RUN_DIR / str(task_vars["job"]["id"]) / "config.json").open(encoding="utf-8") as file:
+        job_dir = settings.RUN_DIR / str(task_vars["job"]["id"])
+        with (job_dir / "config.json").open(encoding="utf-8") as file:
             fcntl.flock(file.fileno(), fcntl.LOCK_EX)
 
             executor = self._get_executor(tmp=tmp, task_vars=task_vars)
             execution_result = executor.execute()
 
+            if execution_result.changed:
+                # let task runner know that inventory built before this job is outdated
+                (job_dir / OBJECTS_CHANGED_MARKER).touch()
+
             if execution_result.error:
                 raise AnsibleActionFail(message=to_native(execution_result.error.message)) from execution_result.error
 
@@ -32,7 +32,6 @@ from ansible_plugin.base import (
 from ansible_plugin.errors import (
     PluginRuntimeError,
 )
-from ansible_plugin.utils import assign_view_logstorage_permissions_by_job
 
 
 class CheckArguments(BaseStrictModel):
@@ -130,9 +129,7 @@ class ADCMCheckPluginExecutor(ADCMAnsiblePluginExecutor[CheckArguments, None]):
                     group.result = result
                     group.save(update_fields=["message", "result"])
 
-                log_storage, _ = LogStorage.objects.get_or_create(job=job, name="ansible", type="check", format="json")
-
-                assign_view_logstorage_permissions_by_job(log_storage)
+                LogStorage.objects.get_or_create(job=job, name="ansible", type="check", format="json")
         except AdcmEx as e:
             error_message = f"Failed to create checklog: {check_data}, group: {group_data}, error: {e}"
             return CallResult(value="", changed=False, error=PluginRuntimeError(message=error_message))
@@ -17,7 +17,6 @@ from typing import Callable, Collection
 
 from cm.models import LogStorage
 from core.types import CoreObjectDescriptor
-from django.db.transaction import atomic
 from pydantic import model_validator
 from typing_extensions import Self
 
@@ -29,7 +28,6 @@ from ansible_plugin.base import (
     PluginExecutorConfig,
     RuntimeEnvironment,
 )
-from ansible_plugin.utils import assign_view_logstorage_permissions_by_job
 
 
 class LogFormat(str, Enum):
@@ -73,11 +71,9 @@ class ADCMCustomLogPluginExecutor(ADCMAnsiblePluginExecutor[CustomLogArguments,
         if arguments.path:
             body = self.retrieve_from_path(arguments.path)
 
-        with atomic():
-            log = LogStorage.objects.create(
-                job_id=runtime.vars.job.id, name=arguments.name, type="custom", format=arguments.format.value, body=body
-            )
-            assign_view_logstorage_permissions_by_job(log_storage=log)
+        LogStorage.objects.create(
+            job_id=runtime.vars.job.id, name=arguments.name, type="custom", format=arguments.format.value, body=body
+        )
 
         return CallResult(value=None, changed=False, error=None)
 
@@ -10,8 +10,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import patch
-
 from cm.models import LogStorage
 from cm.services.job.run.repo import JobRepoImpl
 
@@ -19,8 +17,6 @@ from ansible_plugin.errors import PluginValidationError
 from ansible_plugin.executors.custom_log import ADCMCustomLogPluginExecutor
 from ansible_plugin.tests.base import BaseTestEffectsOfADCMAnsiblePlugins
 
-EXECUTOR_MODULE = "ansible_plugin.executors.custom_log"
-
 
 class TestEffectsOfADCMAnsiblePlugins(BaseTestEffectsOfADCMAnsiblePlugins):
     EXECUTOR_CLASS = ADCMCustomLogPluginExecutor[lambda _, path: str(path)]
@@ -43,14 +39,12 @@ class TestEffectsOfADCMAnsiblePlugins(BaseTestEffectsOfADCMAnsiblePlugins):
             call_context=job,
         )
 
-        with patch(f"{EXECUTOR_MODULE}.assign_view_logstorage_permissions_by_job") as permissions_mock:
-            result = executor.execute()
+        result = executor.execute()
 
         self.assertIsNone(result.error)
         self.assertTrue(
             LogStorage.objects.filter(job_id=job.id, type="custom", format=format_, name=name, body=content).exists()
         )
-        permissions_mock.assert_called_once()
 
     def test_path_content(self) -> None:
         name = "cool name"
@@ -130,11 +124,9 @@ class TestEffectsOfADCMAnsiblePlugins(BaseTestEffectsOfADCMAnsiblePlugins):
             call_context=job,
         )
 
-        with patch(f"{EXECUTOR_MODULE}.assign_view_logstorage_permissions_by_job") as permissions_mock:
-            result = executor.execute()
+        result = executor.execute()
 
         self.assertIsNotNone(result.error)
         self.assertFalse(
             LogStorage.objects.filter(job_id=job.id, type="custom", format=format_, name=name, body=content).exists()
         )
-        permissions_mock.assert_not_called()
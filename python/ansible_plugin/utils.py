@@ -16,8 +16,6 @@ import json
 
 # isort: off
 from ansible.errors import AnsibleError
-from django.contrib.auth.models import Permission
-from django.contrib.contenttypes.models import ContentType
 
 from cm.adcm_config.config import get_option_value
 from cm.models import (
@@ -29,8 +27,6 @@ from cm.models import (
     LogStorage,
     Prototype,
 )
-from rbac.models import Role, Policy
-from rbac.roles import assign_group_perm
 # isort: on
 
 
@@ -58,17 +54,6 @@ def cast_to_type(field_type: str, value: Any, limits: dict) -> Any:
         raise AnsibleError(f"Could not convert '{value}' to '{field_type}'") from error
 
 
-def assign_view_logstorage_permissions_by_job(log_storage: LogStorage) -> None:
-    task_role = Role.objects.filter(name=f"View role for task {log_storage.job.task_id}", built_in=True).first()
-    view_logstorage_permission, _ = Permission.objects.get_or_create(
-        content_type=ContentType.objects.get_for_model(model=LogStorage),
-        codename=f"view_{LogStorage.__name__.lower()}",
-    )
-
-    for policy in (policy for policy in Policy.objects.all() if task_role in policy.role.child.all()):
-        assign_group_perm(policy=policy, permission=view_logstorage_permission, obj=log_storage)
-
-
 def get_checklogs_data_by_job_id(job_id: int) -> list[dict[str, Any]]:
     data = []
     group_subs = defaultdict(list)
@@ -41,7 +41,7 @@ from api.component.serializers import ComponentShortSerializer
 from api.concern.serializers import ConcernItemSerializer, ConcernItemUISerializer
 from api.config_host_group.serializers import CHGsHyperlinkedIdentityField
 from api.host.serializers import HostSerializer
-from api.serializers import DoUpgradeSerializer, StringListSerializer
+from api.serializers import DoUpgradeSerializer, StringListSerializer, WithStatusListSerializer
 from api.utils import CommonAPIURL, ObjectURL, UrlField, check_obj, filter_actions, get_requires
 
 
@@ -93,6 +93,9 @@ class ClusterSerializer(Serializer):
 
 
 class ClusterDetailSerializer(ClusterSerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     bundle_id = IntegerField(read_only=True)
     edition = CharField(read_only=True)
     license = CharField(read_only=True)
@@ -127,9 +130,8 @@ class ClusterDetailSerializer(ClusterSerializer):
     locked = BooleanField(read_only=True)
     group_config = CHGsHyperlinkedIdentityField(view_name="v1:group-config-list")
 
-    @staticmethod
-    def get_status(obj: Cluster) -> int:
-        return get_cluster_status(obj)
+    def get_status(self, obj: Cluster) -> int:
+        return get_cluster_status(obj, statuses=self.context.get("statuses"))
 
 
 class ClusterUISerializer(ClusterDetailSerializer):
@@ -160,9 +162,8 @@ class ClusterUISerializer(ClusterDetailSerializer):
     def get_prototype_display_name(obj: Cluster) -> str | None:
         return obj.prototype.display_name
 
-    @staticmethod
-    def get_status(obj: Cluster) -> int:
-        return get_cluster_status(obj)
+    def get_status(self, obj: Cluster) -> int:
+        return get_cluster_status(obj, statuses=self.context.get("statuses"))
 
 
 class ClusterUpdateSerializer(EmptySerializer):
@@ -235,6 +236,9 @@ class ClusterDetailUISerializer(ClusterDetailSerializer):
 
 
 class ClusterStatusSerializer(EmptySerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     id = IntegerField(read_only=True)
     component_id = IntegerField(read_only=True)
     service_id = IntegerField(read_only=True)
@@ -249,8 +253,7 @@ class ClusterStatusSerializer(EmptySerializer):
         data["service_display_name"] = instance.service.prototype.display_name
         data["service_version"] = instance.service.prototype.version
         data["monitoring"] = instance.component.prototype.monitoring
-        status = get_hc_status(instance)
-        data["status"] = status
+        data["status"] = get_hc_status(instance, statuses=self.context.get("statuses"))
 
         return data
 
@@ -28,7 +28,7 @@ from rest_framework.serializers import (
 from api.action.serializers import ActionShort
 from api.concern.serializers import ConcernItemSerializer, ConcernItemUISerializer
 from api.config_host_group.serializers import CHGsHyperlinkedIdentityField
-from api.serializers import StringListSerializer
+from api.serializers import StringListSerializer, WithStatusListSerializer
 from api.utils import CommonAPIURL, ObjectURL, filter_actions
 
 
@@ -53,6 +53,9 @@ class ComponentSerializer(EmptySerializer):
 
 
 class ComponentUISerializer(ComponentSerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     action = CommonAPIURL(read_only=True, view_name="v1:object-action")
     version = SerializerMethodField()
     status = SerializerMethodField()
@@ -66,9 +69,8 @@ class ComponentUISerializer(ComponentSerializer):
     def get_version(obj: Component) -> str:
         return obj.prototype.version
 
-    @staticmethod
-    def get_status(obj: Component) -> int:
-        return get_component_status(obj)
+    def get_status(self, obj: Component) -> int:
+        return get_component_status(obj, statuses=self.context.get("statuses"))
 
 
 class ComponentShortSerializer(ComponentSerializer):
@@ -84,6 +86,9 @@ class ComponentShortSerializer(ComponentSerializer):
 
 
 class ComponentDetailSerializer(ComponentSerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     constraint = JSONField(read_only=True)
     requires = JSONField(read_only=True)
     bound_to = JSONField(read_only=True)
@@ -102,19 +107,20 @@ class ComponentDetailSerializer(ComponentSerializer):
     locked = BooleanField(read_only=True)
     group_config = CHGsHyperlinkedIdentityField(view_name="v1:group-config-list")
 
-    @staticmethod
-    def get_status(obj: Component) -> int:
-        return get_component_status(obj)
+    def get_status(self, obj: Component) -> int:
+        return get_component_status(obj, statuses=self.context.get("statuses"))
 
 
 class ComponentStatusSerializer(EmptySerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     id = IntegerField(read_only=True)
     name = CharField(read_only=True)
     status = SerializerMethodField()
 
-    @staticmethod
-    def get_status(obj: Component) -> int:
-        return get_component_status(obj)
+    def get_status(self, obj: Component) -> int:
+        return get_component_status(obj, statuses=self.context.get("statuses"))
 
 
 class ComponentDetailUISerializer(ComponentDetailSerializer):
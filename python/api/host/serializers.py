@@ -24,6 +24,7 @@ from cm.models import (
 )
 from cm.status_api import get_host_status
 from cm.validators import HostUniqueValidator, StartMidEndValidator
+from core.types import ADCMCoreType, CoreObjectDescriptor
 from django.conf import settings
 from rest_framework.serializers import (
     BooleanField,
@@ -37,7 +38,7 @@ from rest_framework.serializers import (
 
 from api.action.serializers import ActionShort
 from api.concern.serializers import ConcernItemSerializer, ConcernItemUISerializer
-from api.serializers import StringListSerializer
+from api.serializers import StringListSerializer, WithStatusListSerializer
 from api.utils import CommonAPIURL, ObjectURL, check_obj, filter_actions
 
 
@@ -94,6 +95,9 @@ class HostSerializer(EmptySerializer):
 
 
 class HostDetailSerializer(HostSerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     bundle_id = IntegerField(read_only=True)
     status = SerializerMethodField()
     config = CommonAPIURL(view_name="v1:object-config")
@@ -107,9 +111,8 @@ class HostDetailSerializer(HostSerializer):
     concerns = ConcernItemSerializer(many=True, read_only=True)
     locked = BooleanField(read_only=True)
 
-    @staticmethod
-    def get_status(obj):
-        return get_host_status(obj)
+    def get_status(self, obj) -> int:
+        return get_host_status(obj, statuses=self.context.get("statuses"))
 
 
 class HostUpdateSerializer(HostDetailSerializer):
@@ -120,7 +123,7 @@ class HostUpdateSerializer(HostDetailSerializer):
 
         update_hierarchy_issues(instance.cluster)
         update_hierarchy_issues(instance.provider)
-        update_issues_and_flags_after_deleting()
+        update_issues_and_flags_after_deleting(objects=(CoreObjectDescriptor(id=instance.id, type=ADCMCoreType.HOST),))
 
         return instance
 
@@ -181,16 +184,21 @@ class ProvideHostSerializer(HostSerializer):
 
 
 class HostStatusSerializer(EmptySerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     id = IntegerField(read_only=True)
     fqdn = CharField(read_only=True)
     status = SerializerMethodField()
 
-    @staticmethod
-    def get_status(obj):
-        return get_host_status(obj)
+    def get_status(self, obj) -> int:
+        return get_host_status(obj, statuses=self.context.get("statuses"))
 
 
 class HostUISerializer(HostSerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     action = CommonAPIURL(view_name="v1:object-action")
     cluster_name = SerializerMethodField()
     prototype_version = SerializerMethodField()
@@ -225,9 +233,8 @@ class HostUISerializer(HostSerializer):
             return obj.provider.name
         return None
 
-    @staticmethod
-    def get_status(obj: Host) -> int:
-        return get_host_status(obj)
+    def get_status(self, obj: Host) -> int:
+        return get_host_status(obj, statuses=self.context.get("statuses"))
 
 
 class HostDetailUISerializer(HostDetailSerializer):
@@ -31,7 +31,7 @@ from cm.models import (
 )
 from cm.services.maintenance_mode import get_maintenance_mode_response
 from cm.services.status.notify import (
-    reset_hc_map,
+    reset_hosts_hc_map,
     reset_objects_in_mm,
     update_mm_objects,
 )
@@ -256,7 +256,7 @@ class HostDetail(PermissionListMixin, DetailView):
             raise AdcmEx("HOST_UPDATE_ERROR")
 
         serializer.save(**kwargs)
-        reset_hc_map()
+        reset_hosts_hc_map(host_ids=(host.id,))
         reset_objects_in_mm()
 
         return Response(self.get_serializer(self.get_object()).data, status=HTTP_200_OK)
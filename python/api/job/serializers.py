@@ -14,6 +14,7 @@ from pathlib import Path
 import json
 
 from ansible_plugin.utils import get_checklogs_data_by_job_id
+from cm.log import extract_log_preview_from_fs
 from cm.models import JobLog, JobStatus, LogStorage, TaskLog
 from cm.services.job.action import ActionRunPayload, run_action
 from core.cluster.types import HostComponentEntry
@@ -286,14 +287,7 @@ class LogStorageRetrieveSerializer(HyperlinkedModelSerializer):
 
     @staticmethod
     def _get_ansible_content(obj):
-        path_file = settings.RUN_DIR / f"{obj.job.id}" / f"{obj.name}-{obj.type}.{obj.format}"
-        try:
-            with open(path_file, encoding=settings.ENCODING_UTF_8) as f:
-                content = f.read()
-        except FileNotFoundError:
-            content = ""
-
-        return content
+        return extract_log_preview_from_fs(jobs_dir=settings.RUN_DIR, log_info=obj) or ""
 
     def get_content(self, obj: LogStorage) -> str:
         if obj.type in {"stdout", "stderr"}:
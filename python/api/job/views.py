@@ -15,6 +15,7 @@ import io
 import re
 import tarfile
 
+from adcm.mixins import PermissionListMixin
 from adcm.permissions import check_custom_perm, get_object_for_user
 from audit.utils import audit
 from cm.errors import AdcmEx
@@ -32,7 +33,6 @@ from django_filters.rest_framework import (
     NumberFilter,
     OrderingFilter,
 )
-from guardian.mixins import PermissionListMixin
 from rest_framework.decorators import action
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.permissions import DjangoModelPermissions
@@ -14,6 +14,8 @@ from adcm.serializers import EmptySerializer
 from cm.adcm_config.config import get_action_variant, get_prototype_config, ui_config
 from cm.errors import raise_adcm_ex
 from cm.models import Cluster, ConfigHostGroup, PrototypeConfig, Provider, Upgrade
+from cm.status_api import retrieve_objects_statuses
+from django.db.models import Manager
 from rest_framework.reverse import reverse
 from rest_framework.serializers import (
     BooleanField,
@@ -23,6 +25,7 @@ from rest_framework.serializers import (
     IntegerField,
     JSONField,
     ListField,
+    ListSerializer,
     SerializerMethodField,
 )
 
@@ -119,6 +122,19 @@ class StringListSerializer(ListField):
     item = CharField()
 
 
+class WithStatusListSerializer(ListSerializer):
+    """
+    Retrieves statuses of all serialized objects with one SS request.
+    Child serializer should pass `self.context.get("statuses")` to `get_*_status` functions.
+    """
+
+    def to_representation(self, data):
+        objects = list(data.all() if isinstance(data, Manager) else data)
+        self.context["statuses"] = retrieve_objects_statuses(objects=objects)
+
+        return super().to_representation(objects)
+
+
 class UIConfigField(JSONField):
     """Serializing config field for UI"""
 
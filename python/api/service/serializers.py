@@ -42,7 +42,7 @@ from api.cluster.serializers import BindSerializer
 from api.component.serializers import ComponentUISerializer
 from api.concern.serializers import ConcernItemSerializer, ConcernItemUISerializer
 from api.config_host_group.serializers import CHGsHyperlinkedIdentityField
-from api.serializers import StringListSerializer
+from api.serializers import StringListSerializer, WithStatusListSerializer
 from api.utils import CommonAPIURL, ObjectURL, check_obj, filter_actions
 
 
@@ -79,6 +79,9 @@ class ServiceSerializer(EmptySerializer):
 
 
 class ServiceUISerializer(ServiceSerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     action = CommonAPIURL(read_only=True, view_name="v1:object-action")
     name = CharField(read_only=True)
     version = SerializerMethodField()
@@ -93,9 +96,8 @@ class ServiceUISerializer(ServiceSerializer):
     def get_version(obj: Service) -> str:
         return obj.prototype.version
 
-    @staticmethod
-    def get_status(obj: Service) -> int:
-        return get_service_status(obj)
+    def get_status(self, obj: Service) -> int:
+        return get_service_status(obj, statuses=self.context.get("statuses"))
 
 
 class ClusterServiceSerializer(ServiceSerializer):
@@ -111,6 +113,9 @@ class ClusterServiceSerializer(ServiceSerializer):
 
 
 class ServiceDetailSerializer(ServiceSerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     prototype_id = IntegerField(read_only=True)
     description = CharField(read_only=True)
     bundle_id = IntegerField(read_only=True)
@@ -132,9 +137,8 @@ class ServiceDetailSerializer(ServiceSerializer):
     locked = BooleanField(read_only=True)
     group_config = CHGsHyperlinkedIdentityField(view_name="v1:group-config-list")
 
-    @staticmethod
-    def get_status(obj: Service) -> int:
-        return get_service_status(obj)
+    def get_status(self, obj: Service) -> int:
+        return get_service_status(obj, statuses=self.context.get("statuses"))
 
 
 class ServiceDetailUISerializer(ServiceDetailSerializer):
@@ -213,13 +217,15 @@ class ServiceBindPostSerializer(EmptySerializer):
 
 
 class ServiceStatusSerializer(EmptySerializer):
+    class Meta:
+        list_serializer_class = WithStatusListSerializer
+
     id = IntegerField(read_only=True)
     name = CharField(read_only=True)
     status = SerializerMethodField()
 
-    @staticmethod
-    def get_status(obj):
-        return get_service_status(obj)
+    def get_status(self, obj) -> int:
+        return get_service_status(obj, statuses=self.context.get("statuses"))
 
 
 class ServiceChangeMaintenanceModeSerializer(ModelSerializer):
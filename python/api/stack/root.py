@@ -12,9 +12,13 @@
 
 """Stack endpoint root view"""
 
+from django.utils.http import http_date
 from rest_framework.permissions import AllowAny
 from rest_framework.routers import APIRootView
 
+# SS checks sessions with this endpoint and doesn't cache result of the check for longer than session lives
+SESSION_EXPIRES_HEADER = "ADCM-Session-Expires"
+
 
 class StackRoot(APIRootView):
     permission_classes = (AllowAny,)
@@ -28,3 +32,11 @@ class StackRoot(APIRootView):
         "provider": "provider-prototype-list",
         "cluster": "cluster-prototype-list",
     }
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if request.user.is_authenticated and request.session.session_key:
+            response[SESSION_EXPIRES_HEADER] = http_date(request.session.get_expiry_date().timestamp())
+
+        return response
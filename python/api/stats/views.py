@@ -10,8 +10,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from adcm.mixins import PermissionListMixin
 from cm.models import JobLog, JobStatus, TaskLog
-from guardian.mixins import PermissionListMixin
 from rest_framework import permissions
 from rest_framework.response import Response
 
@@ -897,7 +897,7 @@ class TestAPI2(BaseTestCase):
         set_host_component_mapping(cluster_id=cluster.id, bundle_id=cluster.bundle_id, new_mapping=new_mapping)
         return list(HostComponent.objects.filter(cluster=cluster))
 
-    @patch("cm.services.mapping._base.reset_hc_map")
+    @patch("cm.services.mapping._base.reset_clusters_hc_map")
     def test_save_hc(self, mock_reset_hc_map):
         cluster_object = Service.objects.create(prototype=self.service_prototype, cluster=self.cluster)
         host = Host.objects.create(prototype=self.cluster_prototype, cluster=self.cluster)
@@ -925,7 +925,7 @@ class TestAPI2(BaseTestCase):
 
         self.assertListEqual(hc_list, [HostComponent.objects.first()])
 
-        mock_reset_hc_map.assert_called_once()
+        mock_reset_hc_map.assert_called_once_with(cluster_ids=(self.cluster.id,))
 
     @patch("cm.services.status.notify.reset_hc_map")
     @patch("cm.api.update_hierarchy_issues")
@@ -11,6 +11,7 @@
 # limitations under the License.
 
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 from adcm.tests.base import APPLICATION_JSON, BaseTestCase
 from cm.models import (
@@ -57,6 +58,21 @@ class TestHostAPI(BaseTestCase):
             provider=self.host_provider,
         )
 
+    def test_list_statuses_retrieved_once_success(self):
+        hosts = [self.host] + [
+            Host.objects.create(fqdn=f"host-{i}", prototype=self.host_prototype, provider=self.host_provider)
+            for i in range(5)
+        ]
+        statuses = {"hosts": {str(host.pk): 16 for host in hosts}}
+
+        with patch("cm.status_api.api_request", return_value=Mock(json=Mock(return_value=statuses))) as request:
+            response: Response = self.client.get(path=reverse(viewname="v1:host"), data={"view": "interface"})
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        request.assert_called_once()
+        self.assertEqual(request.call_args.kwargs["url"], "batch/")
+        self.assertSetEqual({host["status"] for host in response.json()}, {16})
+
     def test_change_mm_wrong_name_fail(self):
         response: Response = self.client.post(
             path=reverse(viewname="v1:host-maintenance-mode", kwargs={"host_id": self.host.pk}),
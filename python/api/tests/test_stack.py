@@ -15,9 +15,12 @@ from pathlib import Path
 from adcm.tests.base import BaseTestCase
 from cm.models import Prototype
 from django.urls import reverse
+from django.utils.http import http_date, parse_http_date
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 
+from api.stack.root import SESSION_EXPIRES_HEADER
+
 
 class TestPrototypeAPI(BaseTestCase):
     def test_cluster_prototype_retrieve_success(self):
@@ -34,3 +37,22 @@ class TestPrototypeAPI(BaseTestCase):
         )
 
         self.assertEqual(response.status_code, HTTP_200_OK)
+
+
+class TestStackRootAPI(BaseTestCase):
+    def test_session_expiration_date_returned_success(self):
+        response: Response = self.client.get(path=reverse(viewname="v1:stack"))
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            parse_http_date(response[SESSION_EXPIRES_HEADER]),
+            parse_http_date(http_date(self.client.session.get_expiry_date().timestamp())),
+        )
+
+    def test_no_session_expiration_date_for_anonymous_success(self):
+        self.client.logout()
+
+        response: Response = self.client.get(path=reverse(viewname="v1:stack"))
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertNotIn(SESSION_EXPIRES_HEADER, response)
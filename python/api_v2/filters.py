@@ -10,7 +10,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from itertools import chain
 from typing import Collection, Generator
 
 from cm.models import ADCMEntityStatus, Cluster, Component, Host, Service
@@ -28,8 +27,7 @@ def _filter_status(queryset: QuerySet, value: str, query: Q) -> QuerySet:
 
 
 def filter_cluster_status(queryset: QuerySet, value: Collection[str] | str) -> QuerySet:
-    status_map = retrieve_status_map()
-    clusters_up = {cluster_id for cluster_id, status_info in status_map.clusters.items() if status_info.status == 0}
+    clusters_up = retrieve_status_map().get_cluster_ids_with_status(0)
 
     cluster_up_condition = Q(pk__in=clusters_up)
 
@@ -37,39 +35,21 @@ def filter_cluster_status(queryset: QuerySet, value: Collection[str] | str) -> Q
 
 
 def filter_service_status(queryset: QuerySet, value: str) -> QuerySet:
-    status_map = retrieve_status_map()
-    services_up = {
-        service_id
-        for service_id, service_info in chain.from_iterable(
-            cluster_info.services.items() for cluster_info in status_map.clusters.values()
-        )
-        if service_info.status == 0
-    }
+    services_up = retrieve_status_map().get_service_ids_with_status(0)
     service_up_condition = Q(pk__in=services_up) | Q(prototype__monitoring="passive")
 
     return _filter_status(queryset=queryset, value=value, query=service_up_condition)
 
 
 def filter_component_status(queryset: QuerySet, value: Collection[str] | str) -> QuerySet:
-    status_map = retrieve_status_map()
-
-    components_up = set()
-
-    for cluster_info in status_map.clusters.values():
-        for service_info in cluster_info.services.values():
-            for component_id, component_info in service_info.components.items():
-                if component_info.status == 0:
-                    components_up.add(component_id)
-
+    components_up = retrieve_status_map().get_component_ids_with_status(0)
     component_up_condition = Q(pk__in=components_up)
 
     return _filter_status(queryset=queryset, value=value, query=component_up_condition)
 
 
 def filter_host_status(queryset: QuerySet, value: Collection[str] | str) -> QuerySet:
-    status_map = retrieve_status_map()
-
-    hosts_up = {host_id for host_id, status_info in status_map.hosts.items() if status_info.status == 0}
+    hosts_up = retrieve_status_map().get_host_ids_with_status(0)
     host_up_condition = Q(pk__in=hosts_up)
 
     return _filter_status(queryset=queryset, value=value, query=host_up_condition)
@@ -30,6 +30,9 @@ class ActionListSerializer(ModelSerializer):
         fields = ["id", "name", "display_name", "start_impossible_reason"]
 
     def get_start_impossible_reason(self, action: Action) -> str | None:
+        if "availability" in self.context:
+            return self.context["availability"].get_start_impossible_reason(action=action)
+
         return action.get_start_impossible_reason(obj=self.context["obj"])
 
 
@@ -31,6 +31,7 @@ from cm.models import (
 from cm.services.bundle import ADCMBundlePathResolver, BundlePathResolver
 from cm.services.config.jinja import get_jinja_config
 from django.conf import settings
+from guardian.core import ObjectPermissionChecker
 from rbac.models import User
 
 from api_v2.generic.config.utils import convert_attr_to_adcm_meta, get_config_schema
@@ -45,7 +46,10 @@ def get_run_actions_permissions(actions: Iterable[Action]) -> list[str]:
 
 
 def filter_actions_by_user_perm(user: User, obj: ADCMEntity, actions: Iterable[Action]) -> Iterator[Action]:
-    mask = [user.has_perm(perm=perm, obj=obj) for perm in get_run_actions_permissions(actions=actions)]
+    # checker retrieves object permissions of user once and reuses them for all actions,
+    # while `user.has_perm` does it on each call
+    checker = ObjectPermissionChecker(user_or_group=user)
+    mask = [checker.has_perm(perm=perm, obj=obj) for perm in get_run_actions_permissions(actions=actions)]
 
     return compress(data=actions, selectors=mask)
 
@@ -22,6 +22,7 @@ from cm.models import (
     HostComponent,
     PrototypeConfig,
 )
+from cm.services.action import ActionAvailability
 from cm.services.config.jinja import get_jinja_config
 from cm.services.job.action import ActionRunPayload, run_action
 from cm.stack import check_hostcomponents_objects_exist
@@ -218,7 +219,11 @@ class ActionViewSet(ListModelMixin, RetrieveModelMixin, GetParentObjectMixin, AD
         actions = list(compress(actions, allowed_actions_mask))
         actions = filter_actions_by_user_perm(user=request.user, obj=self._get_actions_owner(), actions=actions)
 
-        serializer = self.get_serializer_class()(instance=actions, many=True, context={"obj": self.parent_object})
+        serializer = self.get_serializer_class()(
+            instance=actions,
+            many=True,
+            context={"obj": self.parent_object, "availability": ActionAvailability(owner=self.parent_object)},
+        )
 
         return Response(data=serializer.data)
 
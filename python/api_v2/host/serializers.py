@@ -143,6 +143,26 @@ class HostCreateSerializer(EmptySerializer):
     cluster_id = IntegerField(required=False)
 
 
+class ProviderHostCreateSerializer(EmptySerializer):
+    # uniqueness is checked for all hosts of request at once
+    name = CharField(
+        allow_null=False,
+        required=True,
+        max_length=253,
+        help_text="fully qualified domain name",
+        validators=[
+            StartMidEndValidator(
+                start=settings.ALLOWED_HOST_FQDN_START_CHARS,
+                mid=settings.ALLOWED_HOST_FQDN_MID_END_CHARS,
+                end=settings.ALLOWED_HOST_FQDN_MID_END_CHARS,
+                err_code="BAD_REQUEST",
+                err_msg="Wrong FQDN.",
+            ),
+        ],
+        source="fqdn",
+    )
+
+
 class HostAddSerializer(EmptySerializer):
     host_id = IntegerField()
 
@@ -23,7 +23,7 @@ from cm.models import Cluster, Host, ObjectType, Prototype
 from cm.services.concern import retrieve_issue
 from cm.services.concern.locks import get_lock_on_object
 from cm.services.maintenance_mode import get_maintenance_mode_response
-from cm.services.status.notify import reset_hc_map
+from cm.services.status.notify import reset_hosts_hc_map
 from core.types import ADCMCoreType, BundleID, CoreObjectDescriptor, ProviderID
 from rbac.models import re_apply_object_policy
 from rest_framework.request import Request
@@ -70,7 +70,7 @@ def process_config_issues_policies_hc(host: Host) -> None:
     if cluster := host.cluster:
         re_apply_object_policy(apply_object=cluster)
 
-    reset_hc_map()
+    reset_hosts_hc_map(host_ids=(host.id,))
 
     if cluster:
         logger.info("host #%s %s is added to cluster #%s %s", host.pk, host.fqdn, cluster.pk, cluster.name)
@@ -13,11 +13,12 @@
 from contextlib import suppress
 import json
 
-from adcm import settings
+from adcm.serializers import EmptySerializer
 from ansible_plugin.utils import get_checklogs_data_by_job_id
-from cm.log import extract_log_content_from_fs
+from cm.log import cut_lines, extract_log_preview_from_fs, format_truncated_log
 from cm.models import LogStorage
-from rest_framework.fields import SerializerMethodField
+from django.conf import settings
+from rest_framework.fields import BooleanField, CharField, FloatField, IntegerField, SerializerMethodField
 from rest_framework.serializers import ModelSerializer
 
 
@@ -41,7 +42,8 @@ class LogStorageSerializer(ModelSerializer):
         # retrieve if empty
         if content is None:
             if log_type in {"stdout", "stderr"}:
-                content = extract_log_content_from_fs(jobs_dir=settings.RUN_DIR, log_info=obj)
+                # file logs are truncated on read, so there's no need to load the whole file
+                return extract_log_preview_from_fs(jobs_dir=settings.RUN_DIR, log_info=obj) or ""
 
             if log_type == "check":
                 content = get_checklogs_data_by_job_id(obj.job_id)
@@ -52,16 +54,11 @@ class LogStorageSerializer(ModelSerializer):
             and content is not None
             and len(content) >= settings.STDOUT_STDERR_LOG_MAX_UNCUT_LENGTH
         ):
-            cut_lines = "\n".join(
-                line
-                if len(line) <= settings.STDOUT_STDERR_LOG_LINE_CUT_LENGTH
-                else (line[: settings.STDOUT_STDERR_LOG_LINE_CUT_LENGTH] + settings.STDOUT_STDERR_TRUNCATED_LOG_MESSAGE)
-                for line in content.splitlines()[-1500:]
-            )
-            content = (
-                f"{settings.STDOUT_STDERR_TRUNCATED_LOG_MESSAGE}\n"
-                f"{cut_lines}\n"
-                f"{settings.STDOUT_STDERR_TRUNCATED_LOG_MESSAGE}\n"
+            content = format_truncated_log(
+                lines=cut_lines(
+                    lines=content.splitlines()[-settings.STDOUT_STDERR_LOG_CUT_LENGTH :],
+                    max_length=settings.STDOUT_STDERR_LOG_LINE_CUT_LENGTH,
+                )
             )
         elif log_type == "check" and isinstance(content, str):
             content = json.loads(content)
@@ -71,3 +68,21 @@ class LogStorageSerializer(ModelSerializer):
                 content = json.dumps(custom_content)
 
         return content or ""
+
+
+class LogFollowQuerySerializer(EmptySerializer):
+    offset = IntegerField(min_value=0, default=0, help_text="Amount of bytes already received by client")
+    timeout = FloatField(
+        min_value=0,
+        max_value=settings.STDOUT_STDERR_LOG_FOLLOW_MAX_TIMEOUT,
+        default=settings.STDOUT_STDERR_LOG_FOLLOW_MAX_TIMEOUT,
+        help_text="How long (in seconds) to wait for new content if there's none yet",
+    )
+
+
+class LogFollowSerializer(EmptySerializer):
+    content = CharField(help_text="Content appended to the log since `offset`")
+    offset = IntegerField()
+    next_offset = IntegerField(help_text="Offset to request the next portion of the log from")
+    size = IntegerField(help_text="Size of the whole log in bytes at the moment of reading")
+    is_finished = BooleanField(help_text="Job is finished, so there won't be new content")
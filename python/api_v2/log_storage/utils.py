@@ -12,10 +12,11 @@
 
 from datetime import datetime, timezone
 from pathlib import Path
-import io
+from typing import Generator, Iterable, Iterator, NamedTuple
+import re
+import zlib
 import tarfile
 
-from adcm import settings
 from cm.models import (
     ActionType,
     Component,
@@ -26,6 +27,61 @@ from cm.models import (
     TaskLog,
 )
 from cm.utils import str_remove_non_alnum
+from django.conf import settings
+
+ARCHIVE_READ_CHUNK_SIZE = 64 * 1024
+# zlib produces gzip container (header and trailer) with +16 to window bits
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+_BYTES_RANGE_PATTERN = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+class BytesRange(NamedTuple):
+    offset: int
+    length: int
+
+    @property
+    def last(self) -> int:
+        return self.offset + self.length - 1
+
+
+class RangeNotSatisfiableError(Exception):
+    pass
+
+
+def parse_bytes_range(header: str, size: int) -> BytesRange | None:
+    """
+    Parse single range of `Range: bytes=...` header (RFC 9110) against content of `size` bytes.
+    Return `None` if header should be ignored (malformed, multiple ranges),
+    so the whole content is returned.
+    """
+
+    match = _BYTES_RANGE_PATTERN.match(header.strip())
+    if match is None:
+        return None
+
+    start, end = match.group("start"), match.group("end")
+
+    if not start:
+        if not end:
+            return None
+
+        # suffix range: last `end` bytes
+        length = min(int(end), size)
+        if length == 0:
+            raise RangeNotSatisfiableError
+
+        return BytesRange(offset=size - length, length=length)
+
+    offset = int(start)
+    if offset >= size:
+        raise RangeNotSatisfiableError
+
+    last = size - 1 if not end else min(int(end), size - 1)
+    if last < offset:
+        return None
+
+    return BytesRange(offset=offset, length=last - offset + 1)
 
 
 def get_task_download_archive_name(task: TaskLog) -> str:
@@ -51,9 +107,42 @@ def get_task_download_archive_name(task: TaskLog) -> str:
     return f"{str_remove_non_alnum(value=object_name)}_{archive_name}"
 
 
-def get_task_download_archive_file_handler(task: TaskLog) -> io.BytesIO:
-    jobs = JobLog.objects.filter(task=task)
+def iter_task_download_archive(task: TaskLog, chunk_size: int = ARCHIVE_READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Generate `.tar.gz` archive of task's jobs logs chunk by chunk.
+
+    Files are read and compressed by chunks as the archive is consumed,
+    so memory consumption doesn't depend on the size of logs.
+    """
+
+    compressor = zlib.compressobj(level=zlib.Z_DEFAULT_COMPRESSION, wbits=_GZIP_WBITS)
+    written = 0
+
+    for tarinfo, chunks in _iter_task_archive_members(task=task, chunk_size=chunk_size):
+        header = tarinfo.tobuf(
+            format=tarfile.DEFAULT_FORMAT, encoding=settings.ENCODING_UTF_8, errors="surrogateescape"
+        )
+        written += len(header)
+        yield compressor.compress(header)
+
+        for chunk in chunks:
+            written += len(chunk)
+            yield compressor.compress(chunk)
+
+        padding = -tarinfo.size % tarfile.BLOCKSIZE
+        written += padding
+        yield compressor.compress(tarfile.NUL * padding)
 
+    # end-of-archive marker is two empty blocks, the whole archive is padded to the record size (same as `tarfile`)
+    end_marker_size = 2 * tarfile.BLOCKSIZE
+    end_marker_size += -(written + end_marker_size) % tarfile.RECORDSIZE
+    yield compressor.compress(tarfile.NUL * end_marker_size)
+    yield compressor.flush()
+
+
+def _iter_task_archive_members(
+    task: TaskLog, chunk_size: int
+) -> Generator[tuple[tarfile.TarInfo, Iterable[bytes]], None, None]:
     if task.action and task.action.type == ActionType.JOB:
         task_dir_name_suffix = str_remove_non_alnum(value=task.action.display_name) or str_remove_non_alnum(
             value=task.action.name,
@@ -61,34 +150,46 @@ def get_task_download_archive_file_handler(task: TaskLog) -> io.BytesIO:
     else:
         task_dir_name_suffix = None
 
-    file_handler = io.BytesIO()
-    with tarfile.open(fileobj=file_handler, mode="w:gz") as tar_file:
-        for job in jobs:
-            if task_dir_name_suffix is None:
-                dir_name_suffix = str_remove_non_alnum(value=job.display_name or "") or str_remove_non_alnum(
-                    value=job.name
+    for job in JobLog.objects.filter(task=task):
+        if task_dir_name_suffix is None:
+            dir_name_suffix = str_remove_non_alnum(value=job.display_name or "") or str_remove_non_alnum(value=job.name)
+        else:
+            dir_name_suffix = task_dir_name_suffix
+
+        directory = Path(settings.RUN_DIR, str(job.pk))
+        if directory.is_dir():
+            for log_file in (item for item in directory.iterdir() if item.is_file()):
+                stat = log_file.stat()
+                tarinfo = tarfile.TarInfo(f'{f"{job.pk}-{dir_name_suffix}".strip("-")}/{log_file.name}')
+                tarinfo.size = stat.st_size
+                tarinfo.mtime = stat.st_mtime
+
+                yield tarinfo, _read_file_chunks(path=log_file, size=tarinfo.size, chunk_size=chunk_size)
+        else:
+            for log_storage in LogStorage.objects.filter(job=job, type__in={"stdout", "stderr"}):
+                tarinfo = tarfile.TarInfo(
+                    f'{f"{job.pk}-{dir_name_suffix}".strip("-")}' f"/{log_storage.name}-{log_storage.type}.txt",
                 )
-            else:
-                dir_name_suffix = task_dir_name_suffix
-
-            directory = Path(settings.RUN_DIR, str(job.pk))
-            if directory.is_dir():
-                files = [item for item in Path(settings.RUN_DIR, str(job.pk)).iterdir() if item.is_file()]
-                for log_file in files:
-                    tarinfo = tarfile.TarInfo(f'{f"{job.pk}-{dir_name_suffix}".strip("-")}/{log_file.name}')
-                    tarinfo.size = log_file.stat().st_size
-                    tarinfo.mtime = log_file.stat().st_mtime
-                    tar_file.addfile(tarinfo=tarinfo, fileobj=io.BytesIO(log_file.read_bytes()))
-            else:
-                log_storages = LogStorage.objects.filter(job=job, type__in={"stdout", "stderr"})
-                for log_storage in log_storages:
-                    tarinfo = tarfile.TarInfo(
-                        f'{f"{job.pk}-{dir_name_suffix}".strip("-")}' f"/{log_storage.name}-{log_storage.type}.txt",
-                    )
-                    # using `or ""` here to avoid passing None to `bytes`
-                    body = io.BytesIO(bytes(log_storage.body or "", settings.ENCODING_UTF_8))
-                    tarinfo.size = body.getbuffer().nbytes
-                    tarinfo.mtime = datetime.now(tz=timezone.utc).timestamp()
-                    tar_file.addfile(tarinfo=tarinfo, fileobj=body)
-
-    return file_handler
+                # using `or ""` here to avoid passing None to `bytes`
+                body = bytes(log_storage.body or "", settings.ENCODING_UTF_8)
+                tarinfo.size = len(body)
+                tarinfo.mtime = datetime.now(tz=timezone.utc).timestamp()
+
+                yield tarinfo, (body,)
+
+
+def _read_file_chunks(path: Path, size: int, chunk_size: int) -> Generator[bytes, None, None]:
+    # Exactly `size` bytes declared in tar header should be written,
+    # while logs of running jobs may change between `stat` and read
+    left = size
+    with path.open(mode="rb") as file:
+        while left > 0:
+            chunk = file.read(min(chunk_size, left))
+            if not chunk:
+                break
+
+            left -= len(chunk)
+            yield chunk
+
+    if left > 0:
+        yield tarfile.NUL * left
@@ -10,26 +10,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pathlib import Path
+from contextlib import suppress
 import re
+import time
 
-from adcm import settings
+from adcm.mixins import PermissionListMixin
 from adcm.permissions import VIEW_LOGSTORAGE_PERMISSION
-from cm.models import JobLog, LogStorage
-from django.http import HttpResponse
+from cm.log import LogChunk, get_log_file_path, iter_log_range, read_body_appended, read_log_appended
+from cm.models import UNFINISHED_STATUS, JobLog, LogStorage
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
-from guardian.mixins import PermissionListMixin
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.status import HTTP_200_OK, HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
 
 from api_v2.api_schema import ErrorSerializer, responses
 from api_v2.log_storage.filters import LogFilter
 from api_v2.log_storage.permissions import LogStoragePermissions
-from api_v2.log_storage.serializers import LogStorageSerializer
+from api_v2.log_storage.serializers import LogFollowQuerySerializer, LogFollowSerializer, LogStorageSerializer
+from api_v2.log_storage.utils import RangeNotSatisfiableError, parse_bytes_range
 from api_v2.views import ADCMGenericViewSet
 
 
@@ -50,7 +60,8 @@ from api_v2.views import ADCMGenericViewSet
     ),
     download=extend_schema(
         operation_id="getJobLogDownload",
-        description="Download specific job log.",
+        description="Download specific job log. Single `Range: bytes=...` header is supported "
+        "to download only the part of the log.",
         summary="GET job log download",
         parameters=[
             OpenApiParameter(
@@ -69,9 +80,22 @@ from api_v2.views import ADCMGenericViewSet
         responses={
             (HTTP_200_OK, "text/plain"): {"type": "string", "format": "binary"},
             (HTTP_200_OK, "application/json"): {"type": "string", "format": "binary"},
+            (HTTP_206_PARTIAL_CONTENT, "text/plain"): {"type": "string", "format": "binary"},
+            (HTTP_206_PARTIAL_CONTENT, "application/json"): {"type": "string", "format": "binary"},
             **{err_code: ErrorSerializer for err_code in (HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND)},
         },
     ),
+    follow=extend_schema(
+        operation_id="getJobLogFollow",
+        description="Get content appended to the log after `offset`. "
+        "If there's no new content and job isn't finished, waits for it up to `timeout` seconds (long polling).",
+        summary="GET job log new content",
+        parameters=[LogFollowQuerySerializer],
+        responses=responses(
+            success=(HTTP_200_OK, LogFollowSerializer),
+            errors=(HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND),
+        ),
+    ),
 )
 class LogStorageViewSet(PermissionListMixin, ListModelMixin, RetrieveModelMixin, ADCMGenericViewSet):
     queryset = LogStorage.objects.select_related("job")
@@ -97,6 +121,52 @@ class LogStorageViewSet(PermissionListMixin, ListModelMixin, RetrieveModelMixin,
 
         return super().retrieve(request, *args, **kwargs)
 
+    @action(methods=["get"], detail=True)
+    def follow(self, request: Request, **kwargs) -> Response:  # noqa: ARG002
+        query = LogFollowQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        log_storage = self.get_object()
+        offset = query.validated_data["offset"]
+        limit = settings.STDOUT_STDERR_LOG_FOLLOW_CHUNK_SIZE
+        deadline = time.monotonic() + query.validated_data["timeout"]
+
+        while True:
+            is_finished = JobLog.objects.filter(id=log_storage.job_id).exclude(status__in=UNFINISHED_STATUS).exists()
+            chunk = self._read_appended(log_storage=log_storage, offset=offset, limit=limit, is_complete=is_finished)
+
+            remaining = deadline - time.monotonic()
+            # log stored in DB is written at once, there's nothing to wait for
+            if chunk.content or is_finished or log_storage.body is not None or remaining <= 0:
+                break
+
+            # only file size is checked while waiting, content isn't re-read
+            time.sleep(min(settings.STDOUT_STDERR_LOG_FOLLOW_POLL_INTERVAL, remaining))
+
+        return Response(
+            data=LogFollowSerializer(
+                instance={
+                    "content": chunk.content.decode(settings.ENCODING_UTF_8, errors="replace"),
+                    "offset": chunk.offset,
+                    "next_offset": chunk.next_offset,
+                    "size": chunk.size,
+                    "is_finished": is_finished and chunk.next_offset >= chunk.size,
+                }
+            ).data,
+            status=HTTP_200_OK,
+        )
+
+    @staticmethod
+    def _read_appended(log_storage: LogStorage, offset: int, limit: int, is_complete: bool) -> LogChunk:
+        if log_storage.body is None:
+            file_path = get_log_file_path(jobs_dir=settings.RUN_DIR, log_info=log_storage)
+            with suppress(FileNotFoundError):
+                return read_log_appended(path=file_path, offset=offset, limit=limit, is_complete=is_complete)
+
+        return read_body_appended(
+            body=(log_storage.body or "").encode(settings.ENCODING_UTF_8), offset=offset, limit=limit
+        )
+
     @action(methods=["get"], detail=True)
     def download(self, request: Request, **kwargs) -> HttpResponse:  # noqa: ARG001, ARG002
         log_storage = self.get_object()
@@ -110,27 +180,47 @@ class LogStorageViewSet(PermissionListMixin, ListModelMixin, RetrieveModelMixin,
         filename = re.sub(r"\s+", "_", filename)
         mime_type = "text/plain" if log_storage.format == "txt" else "application/json"
 
+        file_path = None
         if log_storage.body is None:
-            file_path = Path(
-                settings.RUN_DIR,
-                f"{job_pk}",
-                f"{log_storage.name}-{log_storage.type}.{log_storage.format}",
-            )
-            if Path.is_file(file_path):
-                with open(file_path, encoding=settings.ENCODING_UTF_8) as f:
-                    body = f.read()
-                    length = len(body)
+            file_path = get_log_file_path(jobs_dir=settings.RUN_DIR, log_info=log_storage)
+            if not file_path.is_file():
+                file_path = None
+
+        body = b"" if file_path is not None else (log_storage.body or "").encode(settings.ENCODING_UTF_8)
+        size = file_path.stat().st_size if file_path is not None else len(body)
+
+        bytes_range = None
+        if range_header := request.headers.get("Range"):
+            try:
+                bytes_range = parse_bytes_range(header=range_header, size=size)
+            except RangeNotSatisfiableError:
+                return HttpResponse(
+                    status=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers={"Content-Range": f"bytes */{size}"}
+                )
+
+        if bytes_range is not None:
+            if file_path is not None:
+                # range of file may be as big as file itself, so it's streamed by chunks as well
+                response = StreamingHttpResponse(
+                    iter_log_range(path=file_path, offset=bytes_range.offset, length=bytes_range.length),
+                    status=HTTP_206_PARTIAL_CONTENT,
+                )
             else:
-                body = ""
-                length = 0
+                body = body[bytes_range.offset : bytes_range.offset + bytes_range.length]
+                response = HttpResponse(body, status=HTTP_206_PARTIAL_CONTENT)
+
+            response["Content-Range"] = f"bytes {bytes_range.offset}-{bytes_range.last}/{size}"
+            size = bytes_range.length
+        elif file_path is not None:
+            # file is streamed by chunks instead of being read into memory
+            response = FileResponse(file_path.open(mode="rb"))
         else:
-            body = log_storage.body
-            length = len(body)
+            response = HttpResponse(body)
 
-        response = HttpResponse(body)
         response["Content-Type"] = mime_type
-        response["Content-Length"] = length
+        response["Content-Length"] = size
         response["Content-Encoding"] = settings.ENCODING_UTF_8
         response["Content-Disposition"] = f"attachment; filename={filename}"
+        response["Accept-Ranges"] = "bytes"
 
         return response
@@ -23,6 +23,7 @@ from api_v2.provider.views import (
     ProviderConfigCHGViewSet,
     ProviderConfigViewSet,
     ProviderHostCHGViewSet,
+    ProviderHostViewSet,
     ProviderUpgradeViewSet,
     ProviderViewSet,
 )
@@ -41,6 +42,9 @@ action_router.register(prefix="actions", viewset=ProviderActionViewSet, basename
 config_router = NestedSimpleRouter(parent_router=router, parent_prefix="", lookup="provider")
 config_router.register(prefix="configs", viewset=ProviderConfigViewSet, basename="provider-config")
 
+host_router = NestedSimpleRouter(parent_router=router, parent_prefix="", lookup="provider")
+host_router.register(prefix="hosts", viewset=ProviderHostViewSet, basename="provider-host")
+
 upgrade_router = NestedSimpleRouter(parent_router=router, parent_prefix="", lookup="provider")
 upgrade_router.register(prefix="upgrades", viewset=ProviderUpgradeViewSet)
 
@@ -59,5 +63,6 @@ urlpatterns = [
     *action_router.urls,
     *config_router.urls,
     *upgrade_router.urls,
+    *host_router.urls,
     *extract_urls_from_routers(config_host_group_routers),
 ]
@@ -10,11 +10,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from adcm.permissions import VIEW_PROVIDER_PERM
-from audit.alt.api import audit_create, audit_delete
+from adcm.permissions import VIEW_PROVIDER_PERM, get_object_for_user
+from audit.alt.api import audit_create, audit_delete, audit_update
 from cm.api import add_host_provider, delete_host_provider
 from cm.errors import AdcmEx
-from cm.models import ObjectType, Prototype, Provider
+from cm.models import Host, ObjectType, Prototype, Provider
+from cm.services.host import create_hosts
+from django.db.transaction import atomic
 from django.db.utils import IntegrityError
 from django_filters.rest_framework.backends import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
@@ -25,6 +27,7 @@ from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
@@ -51,6 +54,8 @@ from api_v2.generic.config_host_group.views import CHGViewSet, HostCHGViewSet
 from api_v2.generic.upgrade.api_schema import document_upgrade_viewset
 from api_v2.generic.upgrade.audit import audit_upgrade_viewset
 from api_v2.generic.upgrade.views import UpgradeViewSet
+from api_v2.host.permissions import HostsPermissions
+from api_v2.host.serializers import HostSerializer, ProviderHostCreateSerializer
 from api_v2.provider.filters import ProviderFilter
 from api_v2.provider.permissions import ProviderPermissions
 from api_v2.provider.serializers import (
@@ -58,8 +63,13 @@ from api_v2.provider.serializers import (
     ProviderSchemaSerializer,
     ProviderSerializer,
 )
-from api_v2.utils.audit import parent_provider_from_lookup, provider_from_lookup, provider_from_response
-from api_v2.views import ADCMGenericViewSet
+from api_v2.utils.audit import (
+    parent_provider_from_lookup,
+    provider_from_lookup,
+    provider_from_response,
+    set_created_hosts_name,
+)
+from api_v2.views import ADCMGenericViewSet, ObjectWithStatusViewMixin
 
 
 @extend_schema_view(
@@ -142,6 +152,62 @@ class ProviderViewSet(PermissionListMixin, ConfigSchemaMixin, RetrieveModelMixin
         return Response(status=HTTP_204_NO_CONTENT)
 
 
+@extend_schema_view(
+    create=extend_schema(
+        operation_id="postHostproviderHosts",
+        summary="POST hostprovider hosts",
+        description="Create multiple hosts of a specific hostprovider at once.",
+        request=ProviderHostCreateSerializer(many=True),
+        responses=responses(
+            success=(HTTP_201_CREATED, HostSerializer(many=True)),
+            errors=(HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND, HTTP_409_CONFLICT),
+        ),
+    ),
+)
+class ProviderHostViewSet(ObjectWithStatusViewMixin, ADCMGenericViewSet):
+    queryset = (
+        Host.objects.select_related("provider", "cluster", "cluster__prototype", "prototype")
+        .prefetch_related("concerns", "hostcomponent_set__component__prototype")
+        .order_by("fqdn")
+    )
+    serializer_class = ProviderHostCreateSerializer
+    permission_classes = [IsAuthenticated, HostsPermissions]
+
+    @audit_update(name="Hosts created", object_=parent_provider_from_lookup).attach_hooks(
+        pre_call=set_created_hosts_name
+    )
+    def create(self, request, *_, **kwargs):
+        provider = get_object_for_user(
+            user=request.user, perms=VIEW_PROVIDER_PERM, klass=Provider, id=kwargs["provider_pk"]
+        )
+
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        fqdns = [entry["fqdn"] for entry in serializer.validated_data]
+        if len(set(fqdns)) != len(fqdns):
+            raise AdcmEx(code="HOST_CONFLICT", msg="Host with the same name already exists.")
+
+        try:
+            with atomic():
+                if Host.objects.filter(fqdn__in=fqdns).exists():
+                    raise AdcmEx(code="HOST_CONFLICT", msg="Host with the same name already exists.")
+
+                hosts = create_hosts(provider=provider, fqdns=fqdns)
+        except IntegrityError as e:
+            # host with the same FQDN may be created concurrently after the check
+            raise AdcmEx(code="HOST_CONFLICT", msg="Host with the same name already exists.") from e
+
+        return Response(
+            data=HostSerializer(
+                instance=self.get_queryset().filter(id__in=(host.id for host in hosts)),
+                many=True,
+                context=self.get_serializer_context(),
+            ).data,
+            status=HTTP_201_CREATED,
+        )
+
+
 @document_config_host_group_viewset(object_type="hostprovider")
 @audit_config_host_group_viewset(retrieve_owner=parent_provider_from_lookup)
 class ProviderCHGViewSet(CHGViewSet):
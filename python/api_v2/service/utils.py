@@ -27,7 +27,7 @@ from cm.models import (
 from cm.services.cluster import retrieve_cluster_topology
 from cm.services.concern.cases import recalculate_own_concerns_on_add_services
 from cm.services.concern.distribution import redistribute_issues_and_flags
-from cm.services.status.notify import reset_hc_map
+from cm.services.status.notify import reset_clusters_hc_map
 from cm.status_api import notify_about_redistributed_concerns_from_maps
 from django.db import connection, transaction
 from django.db.models import Count, QuerySet
@@ -69,7 +69,7 @@ def bulk_add_services_to_cluster(cluster: Cluster, prototypes: QuerySet[Prototyp
 
         re_apply_object_policy(apply_object=cluster)
 
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster.id,))
     notify_about_redistributed_concerns_from_maps(added=added, removed=removed)
 
     return services
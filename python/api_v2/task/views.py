@@ -10,14 +10,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from adcm.mixins import PermissionListMixin
 from adcm.permissions import VIEW_TASKLOG_PERMISSION
 from adcm.serializers import EmptySerializer
 from audit.alt.api import audit_update
 from cm.models import TaskLog
 from django.contrib.contenttypes.models import ContentType
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
-from guardian.mixins import PermissionListMixin
 from rest_framework.decorators import action
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.permissions import IsAuthenticated
@@ -32,8 +32,8 @@ from rest_framework.status import (
 
 from api_v2.api_schema import DefaultParams, ErrorSerializer, responses
 from api_v2.log_storage.utils import (
-    get_task_download_archive_file_handler,
     get_task_download_archive_name,
+    iter_task_download_archive,
 )
 from api_v2.task.filters import TaskFilter
 from api_v2.task.permissions import TaskPermissions
@@ -142,9 +142,8 @@ class TaskViewSet(PermissionListMixin, ListModelMixin, RetrieveModelMixin, ADCMG
     @action(methods=["get"], detail=True, url_path="logs/download")
     def download(self, request: Request, *args, **kwargs):  # noqa: ARG001, ARG002
         task = self.get_object()
-        response = HttpResponse(
-            content=get_task_download_archive_file_handler(task=task).getvalue(),
-            content_type="application/tar+gzip",
+        response = StreamingHttpResponse(
+            streaming_content=iter_task_download_archive(task=task), content_type="application/tar+gzip"
         )
         response["Content-Disposition"] = f'attachment; filename="{get_task_download_archive_name(task=task)}"'
 
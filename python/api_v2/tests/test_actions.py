@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import copy
 from functools import partial
 from operator import itemgetter
 from typing import TypeAlias
@@ -18,6 +19,10 @@ import json
 import unittest
 
 from cm.models import (
+    COMPONENT_IN_MM,
+    HOST_IN_MM,
+    MANY_HOSTS_IN_MM,
+    SERVICE_IN_MM,
     Action,
     Cluster,
     Component,
@@ -32,6 +37,8 @@ from cm.models import (
 )
 from cm.services.jinja_env import _get_action_info
 from cm.tests.mocks.task_runner import RunTaskMock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rbac.models import Role
 from rbac.services.group import create as create_group
 from rbac.services.policy import policy_create
@@ -509,6 +516,48 @@ class TestActionsFiltering(BaseAPITestCase):
 
         self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
 
+    def test_list_queries_amount_not_depend_on_actions_amount_success(self) -> None:
+        self.add_host_to_cluster(cluster=self.cluster, host=self.host_1)
+        self.set_hostcomponent(cluster=self.cluster, entries=[(self.host_1, self.component_1)])
+        self.host_1.maintenance_mode = MaintenanceMode.ON
+        self.host_1.save(update_fields=["maintenance_mode"])
+
+        for object_, reason in (
+            (self.cluster, MANY_HOSTS_IN_MM),
+            (self.service_1, SERVICE_IN_MM),
+            (self.component_1, COMPONENT_IN_MM),
+            (self.host_1, HOST_IN_MM),
+        ):
+            with self.subTest(object_.__class__.__name__):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.v2[object_, "actions"].get()
+
+                self.assertEqual(response.status_code, HTTP_200_OK)
+                actions_amount = len(response.json())
+
+                template = Action.objects.filter(prototype=object_.prototype, name="state_any").get()
+                extra_actions = []
+                for i in range(10):
+                    template.pk = None
+                    template.name = template.display_name = f"extra_action_{i}"
+                    template.allow_in_maintenance_mode = i % 2 == 0
+                    extra_actions.append(copy(template))
+
+                Action.objects.bulk_create(extra_actions)
+
+                with self.assertNumQueries(len(queries)):
+                    response = self.client.v2[object_, "actions"].get()
+
+                self.assertEqual(response.status_code, HTTP_200_OK)
+                data = response.json()
+                self.assertEqual(len(data), actions_amount + 10)
+
+                expected_reasons = {
+                    action.pk: None if action.allow_in_maintenance_mode else reason
+                    for action in Action.objects.filter(pk__in=[entry["id"] for entry in data])
+                }
+                self.assertDictEqual({entry["id"]: entry["startImpossibleReason"] for entry in data}, expected_reasons)
+
     def check_object_action_list(
         self, object_: Cluster | Service | Component | Provider | Host, expected_actions: list[str]
     ) -> None:
@@ -13,11 +13,13 @@
 from datetime import datetime
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import call, patch
 import tarfile
 
 from cm.bundle import _get_file_hashes
 from cm.models import ADCM, Action, Bundle, ConfigLog, ObjectType, Prototype
 from cm.services.adcm import adcm_config
+from core.bundle_alt.bundle_load import get_hash_safe
 from django.conf import settings
 from django.db.models import F
 from rest_framework.status import (
@@ -273,6 +275,26 @@ class TestBundle(BaseAPITestCase):
             },
         )
 
+    def test_upload_hashes_archive_once_success(self):
+        with patch("cm.services.bundle_alt.load.get_hash_safe", wraps=get_hash_safe) as get_hash_mock:
+            with open(settings.TMP_DIR / self.new_bundle_file, encoding=settings.ENCODING_UTF_8) as f:
+                response = (self.client.v2 / "bundles").post(data={"file": f}, format_="multipart")
+
+            self.assertEqual(response.status_code, HTTP_201_CREATED)
+            uploaded_file = settings.DOWNLOAD_DIR / self.new_bundle_file
+            self.assertNotIn(call(uploaded_file), get_hash_mock.call_args_list)
+            self.assertNotIn(call(path=uploaded_file), get_hash_mock.call_args_list)
+            get_hash_mock.reset_mock()
+
+            with open(settings.TMP_DIR / self.new_bundle_file, encoding=settings.ENCODING_UTF_8) as f:
+                response = (self.client.v2 / "bundles").post(data={"file": f}, format_="multipart")
+
+            self.assertEqual(response.status_code, HTTP_409_CONFLICT)
+            self.assertIn(f"is already uploaded {uploaded_file}", response.json()["desc"])
+            get_hash_mock.assert_not_called()
+
+        self.assertListEqual(list((settings.DOWNLOAD_DIR / ".incoming").iterdir()), [])
+
     def test_adcm_6455_upload_sig_fail_and_cleanup(self):
         adcm_config = ConfigLog.objects.get(obj_ref=ADCM.objects.first().config)
         adcm_config.config["global"]["accept_only_verified_bundles"] = True
@@ -10,12 +10,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cm.models import Action, ConfigHostGroup, Provider
+from unittest.mock import patch
+
+from cm.models import Action, ConcernCause, ConfigHostGroup, Host, Provider
+from cm.services.host import create_hosts
 from cm.tests.mocks.task_runner import RunTaskMock
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
 )
@@ -150,6 +154,73 @@ class TestProvider(BaseAPITestCase):
         )
 
 
+class TestProviderHosts(BaseAPITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.concerned_provider = self.add_provider(
+            bundle=self.add_bundle(self.test_bundles_dir / "provider_concerns"), name="Concerned HP"
+        )
+
+    def test_create_multiple_success(self):
+        with patch("cm.services.host.re_apply_object_policy") as re_apply_policy, patch(
+            "cm.services.host.reset_hosts_hc_map"
+        ) as reset_hc_map:
+            response = self.client.v2[self.concerned_provider, "hosts"].post(
+                data=[{"name": "host-b"}, {"name": "host-a"}, {"name": "host-c"}]
+            )
+
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertListEqual([host["name"] for host in response.json()], ["host-a", "host-b", "host-c"])
+        re_apply_policy.assert_called_once_with(apply_object=self.concerned_provider)
+        reset_hc_map.assert_called_once()
+
+        provider_issue = self.concerned_provider.get_own_issue(ConcernCause.CONFIG)
+        for host in Host.objects.filter(provider=self.concerned_provider):
+            self.assertEqual(host.config.current, host.config.configlog_set.get().id)
+            self.assertSetEqual(
+                set(host.concerns.values_list("id", flat=True)),
+                {provider_issue.id, host.get_own_issue(ConcernCause.CONFIG).id},
+            )
+
+    def test_create_multiple_duplicated_names_fail(self):
+        response = self.client.v2[self.concerned_provider, "hosts"].post(data=[{"name": "host"}, {"name": "host"}])
+
+        self.assertEqual(response.status_code, HTTP_409_CONFLICT)
+        self.assertFalse(Host.objects.filter(fqdn="host").exists())
+
+    def test_create_multiple_existing_name_fail(self):
+        self.add_host(provider=self.provider, fqdn="existing-host")
+
+        response = self.client.v2[self.concerned_provider, "hosts"].post(
+            data=[{"name": "new-host"}, {"name": "existing-host"}]
+        )
+
+        self.assertEqual(response.status_code, HTTP_409_CONFLICT)
+        self.assertFalse(Host.objects.filter(fqdn="new-host").exists())
+
+    def test_create_multiple_name_taken_concurrently_fail(self):
+        def create_concurrently(provider, fqdns):
+            # host with the same name is created by another request after the check
+            self.add_host(provider=self.provider, fqdn="existing-host")
+            return create_hosts(provider=provider, fqdns=fqdns)
+
+        with patch("api_v2.provider.views.create_hosts", side_effect=create_concurrently):
+            response = self.client.v2[self.concerned_provider, "hosts"].post(
+                data=[{"name": "new-host"}, {"name": "existing-host"}]
+            )
+
+        self.assertEqual(response.status_code, HTTP_409_CONFLICT)
+        self.assertEqual(response.json()["code"], "HOST_CONFLICT")
+        self.assertFalse(Host.objects.filter(fqdn="new-host").exists())
+
+    def test_create_multiple_wrong_name_fail(self):
+        response = self.client.v2[self.concerned_provider, "hosts"].post(data=[{"name": "new-host"}, {"name": "-"}])
+
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertFalse(Host.objects.filter(fqdn="new-host").exists())
+
+
 class TestProviderActions(BaseAPITestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -12,16 +12,25 @@
 
 from unittest.mock import patch
 
+from cm.log import get_log_file_path
 from cm.models import (
     Action,
     Component,
     JobLog,
+    JobStatus,
     LogStorage,
     ObjectType,
     Prototype,
 )
 from django.conf import settings
-from rest_framework.status import HTTP_200_OK, HTTP_404_NOT_FOUND
+from django.test import override_settings
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
 
 from api_v2.tests.base import BaseAPITestCase
 
@@ -151,9 +160,13 @@ class TestJob(BaseAPITestCase):
         _, job = self.simulate_finished_task(object_=self.component, action=self.component_action)
         log = job.logstorage_set.filter(type="stdout").last()
         log_content = "\n".join("logline908" for _ in range(200_000))
+        log.body = None
+        log.save(update_fields=["body"])
+        log_file = get_log_file_path(jobs_dir=settings.RUN_DIR, log_info=log)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log_file.write_text(log_content, encoding="utf-8")
 
-        with patch("api_v2.log_storage.serializers.extract_log_content_from_fs", return_value=log_content):
-            response = self.client.v2[log].get()
+        response = self.client.v2[log].get()
 
         self.assertEqual(response.status_code, HTTP_200_OK)
         content = response.json()["content"].splitlines()
@@ -186,6 +199,144 @@ class TestJob(BaseAPITestCase):
         self.assertNotIn(self.TRUNCATED_LOG_MESSAGE, content)
         self.assertEqual(body, content)
 
+    def test_job_log_download_range_success(self) -> None:
+        _, job = self.simulate_finished_task(object_=self.service, action=self.service_action)
+        log = job.logstorage_set.filter(type="stdout").last()
+        log.body = None
+        log.save(update_fields=["body"])
+        body = "".join(f"line {i}\n" for i in range(10_000)).encode("utf-8")
+        log_file = get_log_file_path(jobs_dir=settings.RUN_DIR, log_info=log)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log_file.write_bytes(body)
+
+        with self.subTest("Full file"):
+            response = self.client.v2[log, "download"].get()
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertEqual(b"".join(response.streaming_content), body)
+            self.assertEqual(response["Accept-Ranges"], "bytes")
+
+        for header, expected_start, expected_end in (
+            ("bytes=0-99", 0, 99),
+            ("bytes=1000-", 1000, len(body) - 1),
+            ("bytes=-50", len(body) - 50, len(body) - 1),
+            ("bytes=100-100000000", 100, len(body) - 1),
+        ):
+            with self.subTest("Range", header=header):
+                response = self.client.v2[log, "download"].get(headers={"HTTP_RANGE": header})
+
+                self.assertEqual(response.status_code, HTTP_206_PARTIAL_CONTENT)
+                self.assertEqual(b"".join(response.streaming_content), body[expected_start : expected_end + 1])
+                self.assertEqual(response["Content-Range"], f"bytes {expected_start}-{expected_end}/{len(body)}")
+                self.assertEqual(int(response["Content-Length"]), expected_end - expected_start + 1)
+
+        with self.subTest("Range is streamed by chunks"), patch("cm.log.READ_CHUNK_SIZE", new=1000):
+            response = self.client.v2[log, "download"].get(headers={"HTTP_RANGE": "bytes=0-"})
+
+            self.assertEqual(response.status_code, HTTP_206_PARTIAL_CONTENT)
+            self.assertTrue(response.streaming)
+            chunks = list(response.streaming_content)
+            self.assertEqual(b"".join(chunks), body)
+            self.assertEqual(max(map(len, chunks)), 1000)
+
+        with self.subTest("Unsatisfiable range"):
+            response = self.client.v2[log, "download"].get(headers={"HTTP_RANGE": f"bytes={len(body)}-"})
+
+            self.assertEqual(response.status_code, HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.assertEqual(response["Content-Range"], f"bytes */{len(body)}")
+
+    def test_job_log_follow_success(self) -> None:
+        _, job = self.simulate_running_task(object_=self.cluster_1, action=self.cluster_1_action)
+        log = job.logstorage_set.filter(type="stdout").last()
+        log.body = None
+        log.save(update_fields=["body"])
+        log_file = get_log_file_path(jobs_dir=settings.RUN_DIR, log_info=log)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log_file.write_text("first line\n", encoding="utf-8")
+
+        with self.subTest("From the start"):
+            response = self.client.v2[log, "follow"].get(query={"timeout": 0})
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertDictEqual(
+                response.json(),
+                {"content": "first line\n", "offset": 0, "nextOffset": 11, "size": 11, "isFinished": False},
+            )
+
+        with self.subTest("Nothing new"):
+            response = self.client.v2[log, "follow"].get(query={"offset": 11, "timeout": 0})
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertEqual(response.json()["content"], "")
+            self.assertEqual(response.json()["nextOffset"], 11)
+
+        with self.subTest("Only appended content is returned"):
+            with log_file.open(mode="a", encoding="utf-8") as file:
+                file.write("second line\n")
+
+            response = self.client.v2[log, "follow"].get(query={"offset": 11, "timeout": 0})
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertEqual(response.json()["content"], "second line\n")
+            self.assertEqual(response.json()["nextOffset"], 23)
+
+        with self.subTest("Incomplete char is left for the next read"):
+            with log_file.open(mode="ab") as file:
+                file.write("ю".encode()[:1])
+
+            response = self.client.v2[log, "follow"].get(query={"offset": 23, "timeout": 0})
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertEqual(response.json()["content"], "")
+            self.assertEqual(response.json()["nextOffset"], 23)
+
+        with self.subTest("Finished job"):
+            job.status = JobStatus.SUCCESS
+            job.save(update_fields=["status"])
+            log_file.write_text("done\n", encoding="utf-8")
+
+            response = self.client.v2[log, "follow"].get(query={"offset": 0})
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertDictEqual(
+                response.json(), {"content": "done\n", "offset": 0, "nextOffset": 5, "size": 5, "isFinished": True}
+            )
+
+        with self.subTest("Incomplete char of finished job is returned"):
+            with log_file.open(mode="ab") as file:
+                file.write("ю".encode()[:1])
+
+            response = self.client.v2[log, "follow"].get(query={"offset": 5})
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertDictEqual(
+                response.json(), {"content": "\ufffd", "offset": 5, "nextOffset": 6, "size": 6, "isFinished": True}
+            )
+
+        with self.subTest("Wrong offset"):
+            response = self.client.v2[log, "follow"].get(query={"offset": -1})
+
+            self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+    @override_settings(STDOUT_STDERR_LOG_FOLLOW_CHUNK_SIZE=3)
+    def test_job_log_follow_log_from_db_success(self) -> None:
+        _, job = self.simulate_running_task(object_=self.cluster_1, action=self.cluster_1_action)
+        log = job.logstorage_set.filter(type="stdout").last()
+        log.body = "юю"
+        log.save(update_fields=["body"])
+
+        with patch("api_v2.log_storage.views.time.sleep") as sleep_mock:
+            first = self.client.v2[log, "follow"].get(query={"offset": 0})
+            second = self.client.v2[log, "follow"].get(query={"offset": first.json()["nextOffset"]})
+            third = self.client.v2[log, "follow"].get(query={"offset": second.json()["nextOffset"]})
+
+        sleep_mock.assert_not_called()
+        self.assertEqual(first.json()["content"], "ю")
+        self.assertEqual(first.json()["nextOffset"], 2)
+        self.assertEqual(second.json()["content"], "ю")
+        self.assertEqual(second.json()["nextOffset"], 4)
+        self.assertEqual(third.json()["content"], "")
+
     def test_job_log_not_found_download_fail(self):
         _, job = self.simulate_finished_task(object_=self.component, action=self.component_action)
 
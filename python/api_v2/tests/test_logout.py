@@ -0,0 +1,38 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+from requests.exceptions import RequestException
+from rest_framework.status import HTTP_200_OK
+
+from api_v2.tests.base import BaseAPITestCase
+
+
+class TestLogout(BaseAPITestCase):
+    def test_logout_invalidates_session_in_status_server_success(self) -> None:
+        session_key = self.client.session.session_key
+
+        with patch("rbac.signals.invalidate_auth_cache") as invalidate, self.captureOnCommitCallbacks(execute=True):
+            response = (self.client.v2 / "logout").post(data=None)
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        invalidate.assert_called_once_with(sessions=[session_key])
+
+    def test_logout_status_server_unavailable_success(self) -> None:
+        with (
+            patch("cm.status_api.requests.request", side_effect=RequestException),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = (self.client.v2 / "logout").post(data=None)
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from io import BytesIO
 from operator import itemgetter
 from unittest.mock import patch
+import tarfile
 
 from cm.api import delete_service
 from cm.converters import model_name_to_core_type
@@ -33,8 +34,15 @@ from cm.services.job.action import prepare_task_for_action
 from cm.tests.mocks.task_runner import RunTaskMock
 from core.job.dto import TaskPayloadDTO
 from core.types import ADCMCoreType, CoreObjectDescriptor
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
+from guardian.models import GroupObjectPermission
+from rbac.models import Role
+from rbac.services.group import create as create_group
+from rbac.services.policy import policy_create
 from rest_framework.status import HTTP_200_OK, HTTP_404_NOT_FOUND
 import pytz
 
@@ -206,11 +214,32 @@ class TestTask(BaseAPITestCase):
         self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
 
     def test_task_log_download_success(self):
-        with patch("api_v2.task.views.get_task_download_archive_file_handler", return_value=BytesIO(b"content")):
+        with patch("api_v2.task.views.iter_task_download_archive", return_value=iter([b"content"])):
             response = self.client.v2[self.cluster_task, "logs", "download"].get()
 
         self.assertEqual(response.status_code, HTTP_200_OK)
 
+    def test_task_log_download_archive_content_success(self):
+        job = self.cluster_task.joblog_set.first()
+        job_dir = settings.RUN_DIR / str(job.pk)
+        job_dir.mkdir(parents=True, exist_ok=True)
+        files = {"ansible-stdout.txt": b"stdout\n" * 100_000, "ansible-stderr.txt": b"", "config.json": b"{}"}
+        for name, content in files.items():
+            (job_dir / name).write_bytes(content)
+
+        response = self.client.v2[self.cluster_task, "logs", "download"].get()
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        with tarfile.open(fileobj=BytesIO(b"".join(response.streaming_content)), mode="r:gz") as archive:
+            archived = {
+                member.name.rsplit("/", maxsplit=1)[-1]: archive.extractfile(member).read()
+                for member in archive.getmembers()
+                if member.name.startswith(f"{job.pk}-")
+            }
+
+        self.assertDictEqual(archived, files)
+
     def test_adcm_5158_adcm_task_view_for_not_superuser_fail(self):
         self.client.login(username="admin", password="admin")
         response = self.client.v2[self.adcm_task].get()
@@ -291,6 +320,106 @@ class TestTask(BaseAPITestCase):
             service_admin_response = log_list_endpoint.get()
             self.assertSetEqual({log["type"] for log in service_admin_response.json()}, {"stdout", "stderr"})
 
+    def test_deleted_service_task_not_visible_to_another_service_admin_fail(self):
+        service_2 = self.add_services_to_cluster(service_names=["service_2"], cluster=self.cluster_1).get()
+        job_pk = self.service_task.joblog_set.first().pk
+
+        with self.grant_permissions(to=self.test_user, on=service_2, role_name="Service Administrator"):
+            delete_service(service=self.service_1)
+
+            self.client.login(**self.test_user_credentials)
+
+            self.assertEqual(self.client.v2[self.cluster_1].get().status_code, HTTP_200_OK)
+            self.assertEqual((self.client.v2 / "tasks" / self.service_task.pk).get().status_code, HTTP_404_NOT_FOUND)
+            self.assertEqual((self.client.v2 / "jobs" / job_pk).get().status_code, HTTP_404_NOT_FOUND)
+            self.assertListEqual((self.client.v2 / "jobs" / job_pk / "logs").get().json(), [])
+
+            task_ids = {task["id"] for task in (self.client.v2 / "tasks").get().json()["results"]}
+            self.assertNotIn(self.service_task.pk, task_ids)
+
+    def test_task_permissions_evaluated_by_policy_success(self):
+        self.service_task.status = JobStatus.SUCCESS
+        self.service_task.save()
+
+        another_user_credentials = {"username": "another_user_username", "password": "another_user_passwd"}
+        self.create_user(**another_user_credentials)
+
+        with self.grant_permissions(to=self.test_user, on=self.service_1, role_name="Service Administrator"):
+            self.client.login(**self.test_user_credentials)
+            with RunTaskMock():
+                response = self.client.v2[self.service_1, "actions", self.service_1_action, "run"].post(
+                    data={"hostComponentMap": [], "config": {}, "adcmMeta": {}, "isVerbose": False},
+                )
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            task_pk = response.json()["id"]
+            job_pk = response.json()["childJobs"][0]["id"]
+
+            self.assertFalse(
+                GroupObjectPermission.objects.filter(
+                    content_type__app_label="cm", content_type__model__in=("tasklog", "joblog", "logstorage")
+                ).exists()
+            )
+
+            with self.subTest("Policy Grants Access"):
+                self.assertEqual((self.client.v2 / "tasks" / task_pk).get().status_code, HTTP_200_OK)
+
+                task_ids = {task["id"] for task in (self.client.v2 / "tasks").get().json()["results"]}
+                self.assertIn(task_pk, task_ids)
+                self.assertNotIn(self.cluster_task.pk, task_ids)
+
+                response = (self.client.v2 / "jobs" / job_pk / "logs").get()
+                self.assertSetEqual({log["type"] for log in response.json()}, {"stdout", "stderr"})
+
+            with self.subTest("No Policy No Access"):
+                self.client.login(**another_user_credentials)
+
+                self.assertEqual((self.client.v2 / "tasks" / task_pk).get().status_code, HTTP_404_NOT_FOUND)
+                self.assertEqual((self.client.v2 / "jobs" / job_pk).get().status_code, HTTP_404_NOT_FOUND)
+                self.assertListEqual((self.client.v2 / "jobs" / job_pk / "logs").get().json(), [])
+
+        with self.subTest("Policy Removed Access Revoked"):
+            self.client.login(**self.test_user_credentials)
+
+            self.assertEqual((self.client.v2 / "tasks" / task_pk).get().status_code, HTTP_404_NOT_FOUND)
+
+    def test_task_queries_amount_not_depend_on_policies_amount_success(self):
+        def launch() -> int:
+            # otherwise action won't be launched (see ADCM-6081)
+            TaskLog.objects.exclude(status=JobStatus.SUCCESS).update(status=JobStatus.SUCCESS)
+
+            with CaptureQueriesContext(connection) as queries, patch("cm.services.job.action.start_task"):
+                response = self.client.v2[self.service_1, "actions", self.service_1_action, "run"].post(
+                    data={"hostComponentMap": [], "config": {}, "adcmMeta": {}, "isVerbose": False},
+                )
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+
+            return len(queries)
+
+        def list_tasks() -> int:
+            with CaptureQueriesContext(connection) as queries:
+                response = (self.client.v2 / "tasks").get()
+
+            self.assertEqual(response.status_code, HTTP_200_OK)
+
+            return len(queries)
+
+        with self.grant_permissions(to=self.test_user, on=self.service_1, role_name="Service Administrator"):
+            self.client.login(**self.test_user_credentials)
+            launch()
+
+            launch_queries = launch()
+            list_queries = list_tasks()
+
+            role = Role.objects.get(name="Service Administrator")
+            for i in range(5):
+                group = create_group(name_to_display=f"Service group {i}", user_set=[{"id": self.test_user.pk}])
+                policy_create(name=f"Service policy {i}", role=role, group=[group], object=[self.service_1])
+
+            self.assertEqual(list_tasks(), list_queries)
+            self.assertEqual(launch(), launch_queries)
+
 
 class TestTaskObjects(BaseAPITestCase):
     def setUp(self) -> None:
@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
 import datetime
 
 from adcm.tests.client import ADCMTestClient
@@ -594,6 +595,37 @@ class TestUserAPI(BaseAPITestCase):
         with self.assertRaises(User.DoesNotExist):
             User.objects.get(pk=user.pk)
 
+    def test_delete_drops_status_server_auth_cache_once_success(self):
+        users = [
+            self.create_user(user_data={"username": f"user_{i}", "password": "bestpasseverever"}) for i in range(3)
+        ]
+
+        with patch("rbac.signals.invalidate_auth_cache") as invalidate, self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk__in=[user.pk for user in users[:2]]).delete()
+
+        invalidate.assert_called_once_with(drop_all=True)
+
+        # the next transaction drops cache again
+        with patch("rbac.signals.invalidate_auth_cache") as invalidate, self.captureOnCommitCallbacks(execute=True):
+            users[2].delete()
+
+        invalidate.assert_called_once_with(drop_all=True)
+
+    def test_deactivate_drops_status_server_auth_cache_success(self):
+        user = self.create_user()
+
+        with patch("rbac.signals.invalidate_auth_cache") as invalidate, self.captureOnCommitCallbacks(execute=True):
+            user.first_name = "new"
+            user.save(update_fields=["first_name"])
+
+        invalidate.assert_not_called()
+
+        with patch("rbac.signals.invalidate_auth_cache") as invalidate, self.captureOnCommitCallbacks(execute=True):
+            user.is_active = False
+            user.save(update_fields=["is_active"])
+
+        invalidate.assert_called_once_with(drop_all=True)
+
     def test_delete_built_in_fail(self):
         user = self.create_user()
         user.built_in = True
@@ -834,6 +866,16 @@ class TestBlockUnblockAPI(BaseAPITestCase):
         self.assertIsNone(self.user.blocked_at)
         self.assertFalse(self.user.is_active)
 
+    def test_block_manually_drops_status_server_auth_cache_success(self) -> None:
+        with (
+            patch("rbac.services.user.invalidate_auth_cache") as invalidate,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.v2[self.user, "block"].post(data=None)
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        invalidate.assert_called_once_with(drop_all=True)
+
     def test_block_manually_self_fail(self) -> None:
         response = self.client.v2[self.admin, "block"].post(data=None)
 
@@ -463,6 +463,20 @@ class set_add_hosts_name(AuditHook):  # noqa: N801
         self.context.name = f"[{host_fqdn}] host(s) added"
 
 
+class set_created_hosts_name(AuditHook):  # noqa: N801
+    def __call__(self):
+        request = self.call_arguments.get("request", "")
+        data = _retrieve_request_body(request=request)
+
+        host_fqdn = ""
+        if isinstance(data, list):
+            host_fqdn = ", ".join(
+                sorted(str(entry["name"]) for entry in data if isinstance(entry, dict) and entry.get("name"))
+            )
+
+        self.context.name = f"[{host_fqdn}] host(s) created"
+
+
 class set_removed_host_name(AuditHook):  # noqa: N801
     def __call__(self):
         host_id = self.call_arguments.get("pk")
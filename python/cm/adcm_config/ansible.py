@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Iterable
 
 from ansible.parsing.vault import VaultAES256, VaultSecret
 from django.conf import settings
@@ -37,3 +38,31 @@ def ansible_decrypt(msg: str | None) -> str:
     secret = VaultSecret(_bytes=bytes(settings.ANSIBLE_SECRET, settings.ENCODING_UTF_8))
 
     return str(vault.decrypt(b_vaulttext=ciphertext, secret=secret), settings.ENCODING_UTF_8)
+
+
+# Functions below don't touch settings or database, so they can be executed by worker process
+# that doesn't initialize django (see `cm.services.config.secrets.AnsibleSecrets`)
+
+
+def vault_encrypt(secret: bytes, values: Iterable[str], header: str) -> list[str]:
+    vault = VaultAES256()
+    vault_secret = VaultSecret(_bytes=secret)
+
+    return [
+        f"{header}\n{vault.encrypt(b_plaintext=value.encode('utf-8'), secret=vault_secret).decode('utf-8')}"
+        for value in values
+    ]
+
+
+def vault_decrypt(secret: bytes, values: Iterable[str]) -> list[str | None]:
+    vault = VaultAES256()
+    vault_secret = VaultSecret(_bytes=secret)
+
+    result = []
+    for value in values:
+        _, ciphertext = value.split("\n", maxsplit=1)
+        decrypted = vault.decrypt(b_vaulttext=ciphertext, secret=vault_secret)
+        # for some cases Ansible decryption may return `None` as a valid value
+        result.append(decrypted if decrypted is None else decrypted.decode("utf-8"))
+
+    return result
@@ -22,7 +22,7 @@ from ansible.errors import AnsibleError
 from django.conf import settings
 from django.db.models import QuerySet
 
-from cm.adcm_config.ansible import ansible_decrypt, ansible_encrypt_and_format
+from cm.adcm_config.ansible import ansible_encrypt_and_format
 from cm.adcm_config.checks import check_attr, check_config_type
 from cm.adcm_config.utils import (
     config_is_ro,
@@ -52,6 +52,7 @@ from cm.models import (
 )
 from cm.services.bundle import ADCMBundlePathResolver, BundlePathResolver, PathResolver
 from cm.services.config.jinja import get_jinja_config
+from cm.services.config.secrets import AnsibleSecrets
 from cm.utils import deep_merge, dict_to_obj, obj_to_dict
 from cm.variant import get_variant, process_variant
 
@@ -392,44 +393,36 @@ def save_file_type(obj, key, subkey, value):
 
 
 def process_file_type(obj: Any, spec: dict, conf: dict):
+    files = []
     for key in conf:
         if "type" in spec[key]:
-            if spec[key]["type"] == "file":
-                save_file_type(obj, key, "", conf[key])
-            elif spec[key]["type"] == "secretfile":
-                if conf[key] is not None:
-                    value = conf[key]
-                    if conf[key].startswith(settings.ANSIBLE_VAULT_HEADER):
-                        try:
-                            value = ansible_decrypt(msg=value)
-                        except AnsibleError:
-                            raise_adcm_ex(
-                                code="CONFIG_VALUE_ERROR",
-                                msg=f"Secret value must not starts with {settings.ANSIBLE_VAULT_HEADER}",
-                            )
-                else:
-                    value = None
-
-                save_file_type(obj, key, "", value)
+            if spec[key]["type"] in {"file", "secretfile"}:
+                files.append((key, "", spec[key]["type"], conf[key]))
         elif conf[key]:
             for subkey in conf[key]:
-                if spec[key][subkey]["type"] == "file":
-                    save_file_type(obj, key, subkey, conf[key][subkey])
-                elif spec[key][subkey]["type"] == "secretfile":
-                    value = conf[key][subkey]
-                    if conf[key][subkey] is not None:
-                        if conf[key][subkey].startswith(settings.ANSIBLE_VAULT_HEADER):
-                            try:
-                                value = ansible_decrypt(msg=value)
-                            except AnsibleError:
-                                raise_adcm_ex(
-                                    code="CONFIG_VALUE_ERROR",
-                                    msg=f"Secret value must not starts with {settings.ANSIBLE_VAULT_HEADER}",
-                                )
-                    else:
-                        value = None
+                if spec[key][subkey]["type"] in {"file", "secretfile"}:
+                    files.append((key, subkey, spec[key][subkey]["type"], conf[key][subkey]))
+
+    encrypted = [
+        value
+        for *_, type_, value in files
+        if type_ == "secretfile" and value is not None and value.startswith(settings.ANSIBLE_VAULT_HEADER)
+    ]
+    decrypted = {}
+    if encrypted:
+        try:
+            decrypted = dict(zip(encrypted, AnsibleSecrets().decrypt_many(encrypted), strict=True))
+        except AnsibleError:
+            raise_adcm_ex(
+                code="CONFIG_VALUE_ERROR",
+                msg=f"Secret value must not starts with {settings.ANSIBLE_VAULT_HEADER}",
+            )
 
-                    save_file_type(obj, key, subkey, value)
+    for key, subkey, type_, value in files:
+        if type_ == "secretfile":
+            value = decrypted.get(value, value)
+
+        save_file_type(obj, key, subkey, value)
 
 
 def process_config(
@@ -678,40 +671,64 @@ def check_config_spec(
             )
 
 
-def _process_secretfile(obj: ADCMEntity, key: str, subkey: str, value: Any) -> None:
+class _ConfigSecrets:
+    """
+    Secret values of config collected to be checked and encrypted in one batch,
+    because each vault operation costs key derivation
+    """
+
+    def __init__(self) -> None:
+        self._encrypted: list[str] = []
+        self._plain: list[tuple[dict, str]] = []
+        self._secrets: AnsibleSecrets | None = None
+
+    @property
+    def secrets(self) -> AnsibleSecrets:
+        if self._secrets is None:
+            self._secrets = AnsibleSecrets()
+
+        return self._secrets
+
+    def add(self, container: dict, key: str) -> None:
+        value = container[key]
+        if value.startswith(settings.ANSIBLE_VAULT_HEADER):
+            self._encrypted.append(value)
+        else:
+            self._plain.append((container, key))
+
+    def process(self) -> None:
+        if self._encrypted:
+            try:
+                self.secrets.check_decryptable(self._encrypted)
+            except AnsibleError as e:
+                raise AdcmEx(code="CONFIG_VALUE_ERROR", msg="Can't decrypt value") from e
+
+        if self._plain:
+            encrypted = self.secrets.encrypt_many([container[key] for container, key in self._plain])
+            for (container, key), value in zip(self._plain, encrypted, strict=True):
+                container[key] = value
+
+
+def _process_secretfile(obj: ADCMEntity, key: str, subkey: str, value: Any, secrets: _ConfigSecrets) -> None:
     if value is not None and value.startswith(settings.ANSIBLE_VAULT_HEADER):
         try:
-            value = ansible_decrypt(msg=value)
+            value = secrets.secrets.decrypt(value)
         except AnsibleError as e:
             raise AdcmEx(code="CONFIG_VALUE_ERROR", msg="Can't decrypt value") from e
 
     save_file_type(obj=obj, key=key, subkey=subkey, value=value)
 
 
-def _process_secret_param(conf: dict, key: str, subkey: str) -> None:
-    value = conf[key]
-    if subkey:
-        value = conf[key][subkey]
+def _process_secret_param(conf: dict, key: str, subkey: str, secrets: _ConfigSecrets) -> None:
+    container, param = (conf[key], subkey) if subkey else (conf, key)
 
-    if not value:
+    if not container[param]:
         return
 
-    if value.startswith(settings.ANSIBLE_VAULT_HEADER):
-        try:
-            ansible_decrypt(msg=value)
-        except AnsibleError as e:
-            raise AdcmEx(code="CONFIG_VALUE_ERROR", msg="Can't decrypt value") from e
-
-    else:
-        value = ansible_encrypt_and_format(msg=value)
+    secrets.add(container=container, key=param)
 
-        if subkey:
-            conf[key][subkey] = value
-        else:
-            conf[key] = value
 
-
-def _process_secretmap(conf: dict, key: str, subkey: str) -> None:
+def _process_secretmap(conf: dict, key: str, subkey: str, secrets: _ConfigSecrets) -> None:
     value = conf[key]
     if subkey:
         value = conf[key][subkey]
@@ -719,26 +736,13 @@ def _process_secretmap(conf: dict, key: str, subkey: str) -> None:
     if value is None:
         return
 
-    for secretmap_key, secretmap_value in value.items():
-        if secretmap_value.startswith(settings.ANSIBLE_VAULT_HEADER):
-            try:
-                ansible_decrypt(msg=secretmap_value)
-            except AnsibleError as e:
-                raise AdcmEx(code="CONFIG_VALUE_ERROR", msg="Can't decrypt value") from e
-
-            if subkey:
-                conf[key][subkey][secretmap_key] = secretmap_value
-            else:
-                conf[key][secretmap_key] = secretmap_value
-
-        else:
-            if subkey:
-                conf[key][subkey][secretmap_key] = ansible_encrypt_and_format(msg=secretmap_value)
-            else:
-                conf[key][secretmap_key] = ansible_encrypt_and_format(msg=secretmap_value)
+    for secretmap_key in value:
+        secrets.add(container=value, key=secretmap_key)
 
 
 def process_config_spec(obj: ADCMEntity | TaskLog, spec: dict, new_config: dict) -> dict:
+    secrets = _ConfigSecrets()
+
     for cfg_key, cfg_value in new_config.items():
         spec_type = spec[cfg_key].get("type")
 
@@ -746,14 +750,14 @@ def process_config_spec(obj: ADCMEntity | TaskLog, spec: dict, new_config: dict)
             save_file_type(obj=obj, key=cfg_key, subkey="", value=cfg_value)
 
         elif spec_type == "secretfile":
-            _process_secretfile(obj=obj, key=cfg_key, subkey="", value=cfg_value)
-            _process_secret_param(conf=new_config, key=cfg_key, subkey="")
+            _process_secretfile(obj=obj, key=cfg_key, subkey="", value=cfg_value, secrets=secrets)
+            _process_secret_param(conf=new_config, key=cfg_key, subkey="", secrets=secrets)
 
         elif spec_type in {"password", "secrettext"}:
-            _process_secret_param(conf=new_config, key=cfg_key, subkey="")
+            _process_secret_param(conf=new_config, key=cfg_key, subkey="", secrets=secrets)
 
         elif spec_type == "secretmap":
-            _process_secretmap(conf=new_config, key=cfg_key, subkey="")
+            _process_secretmap(conf=new_config, key=cfg_key, subkey="", secrets=secrets)
 
         elif spec_type is None and bool(cfg_value):
             for sub_cfg_key, sub_cfg_value in cfg_value.items():
@@ -763,14 +767,16 @@ def process_config_spec(obj: ADCMEntity | TaskLog, spec: dict, new_config: dict)
                     save_file_type(obj=obj, key=cfg_key, subkey=sub_cfg_key, value=sub_cfg_value)
 
                 elif sub_spec_type == "secretfile":
-                    _process_secretfile(obj=obj, key=cfg_key, subkey=sub_cfg_key, value=sub_cfg_value)
-                    _process_secret_param(conf=new_config, key=cfg_key, subkey=sub_cfg_key)
+                    _process_secretfile(obj=obj, key=cfg_key, subkey=sub_cfg_key, value=sub_cfg_value, secrets=secrets)
+                    _process_secret_param(conf=new_config, key=cfg_key, subkey=sub_cfg_key, secrets=secrets)
 
                 elif sub_spec_type in {"password", "secrettext"}:
-                    _process_secret_param(conf=new_config, key=cfg_key, subkey=sub_cfg_key)
+                    _process_secret_param(conf=new_config, key=cfg_key, subkey=sub_cfg_key, secrets=secrets)
 
                 elif sub_spec_type == "secretmap":
-                    _process_secretmap(conf=new_config, key=cfg_key, subkey=sub_cfg_key)
+                    _process_secretmap(conf=new_config, key=cfg_key, subkey=sub_cfg_key, secrets=secrets)
+
+    secrets.process()
 
     return new_config
 
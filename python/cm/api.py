@@ -10,7 +10,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
 from functools import partial
 from typing import Literal, TypedDict
 import json
@@ -83,7 +82,7 @@ from cm.services.concern.distribution import (
 )
 from cm.services.concern.flags import BuiltInFlag, raise_flag
 from cm.services.concern.locks import get_lock_on_object
-from cm.services.status.notify import reset_hc_map, reset_objects_in_mm
+from cm.services.status.notify import reset_clusters_hc_map, reset_hosts_hc_map, reset_objects_in_mm
 from cm.status_api import (
     notify_about_new_concern,
     notify_about_redistributed_concerns_from_maps,
@@ -148,7 +147,7 @@ def add_cluster(prototype: Prototype, name: str, description: str = "") -> Clust
         if recalculate_own_concerns_on_add_clusters(cluster):
             added, removed = redistribute_issues_and_flags(topology=retrieve_cluster_topology(cluster.pk))
 
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster.id,))
     notify_about_redistributed_concerns_from_maps(added=added, removed=removed)
 
     logger.info("cluster #%s %s is added", cluster.pk, cluster.name)
@@ -189,7 +188,7 @@ def add_host(prototype: Prototype, provider: Provider, fqdn: str, description: s
 
         re_apply_object_policy(provider)
 
-    reset_hc_map()
+    reset_hosts_hc_map(host_ids=(host.id,))
 
     if concern_id:
         notify_about_new_concern(concern_id=concern_id, related_objects=related_objects)
@@ -256,7 +255,7 @@ def delete_host(host: Host, cancel_tasks: bool = True) -> None:
 
     host_pk = host.pk
     host.delete()
-    reset_hc_map()
+    reset_hosts_hc_map(host_ids=(host_pk,))
     reset_objects_in_mm()
 
     logger.info("host #%s is deleted", host_pk)
@@ -287,19 +286,9 @@ def delete_service(service: Service) -> None:
         concern_id = concern.id
         related_objects = distribute_concern_on_related_objects(owner=cluster_cod, concern_id=concern_id)
 
-    keep_objects = defaultdict(set)
-    for task in TaskLog.objects.filter(
-        object_type=ContentType.objects.get_for_model(Service), object_id=service_pk
-    ).prefetch_related("joblog_set", "joblog_set__logstorage_set"):
-        keep_objects[task.__class__].add(task.pk)
-        for job in task.joblog_set.all():
-            keep_objects[job.__class__].add(job.pk)
-            for log in job.logstorage_set.all():
-                keep_objects[log.__class__].add(log.pk)
+    re_apply_object_policy(apply_object=cluster)
 
-    re_apply_object_policy(apply_object=cluster, keep_objects=keep_objects)
-
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster.id,))
     on_commit(func=partial(send_delete_service_event, service_id=service_pk))
     if concern_id:
         on_commit(func=partial(notify_about_new_concern, concern_id=concern_id, related_objects=related_objects))
@@ -330,9 +319,10 @@ def delete_cluster(cluster: Cluster) -> None:
         }
     )
 
+    cluster_id = cluster.id
     cluster.delete()
 
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster_id,))
     reset_objects_in_mm()
 
     for task in tasks:
@@ -368,7 +358,7 @@ def remove_host_from_cluster(host: Host) -> Host:
 
         re_apply_object_policy(apply_object=cluster)
 
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster.id,))
     reset_objects_in_mm()
 
     return host
@@ -408,7 +398,7 @@ def add_service_to_cluster(cluster: Cluster, proto: Prototype) -> Service:
 
         re_apply_object_policy(apply_object=cluster)
 
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster.id,))
     notify_about_redistributed_concerns_from_maps(added=added, removed=removed)
     logger.info(
         "service #%s %s is added to cluster #%s %s",
@@ -910,7 +900,7 @@ def add_host_to_cluster(cluster: Cluster, host: Host) -> Host:
         update_hierarchy_issues(cluster)
         re_apply_object_policy(cluster)
 
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster.id,))
     logger.info("host #%s %s is added to cluster #%s %s", host.pk, host.fqdn, cluster.pk, cluster.name)
 
     return host
@@ -19,7 +19,6 @@ import fcntl
 import shutil
 import hashlib
 import tarfile
-import functools
 
 from adcm_version import compare_adcm_versions, compare_prototype_versions
 from core.bundle_alt.bundle_load import (
@@ -71,6 +70,7 @@ from cm.models import (
     Upgrade,
 )
 from cm.services.bundle import ADCMBundlePathResolver, BundlePathResolver, PathResolver
+from cm.services.bundle_alt.repo import order_versions
 from cm.stack import get_config_files, read_definition, save_definition
 
 STAGE = (
@@ -347,29 +347,6 @@ def update_bundle(bundle):
         raise
 
 
-def order_model_versions(model):
-    items = []
-    for obj in model.objects.order_by("id"):
-        items.append(obj)
-    ver = ""
-    count = 0
-    for obj in sorted(
-        items,
-        key=functools.cmp_to_key(lambda obj1, obj2: compare_prototype_versions(obj1.version, obj2.version)),
-    ):
-        if ver != obj.version:
-            count += 1
-        obj.version_order = count
-        ver = obj.version
-    # Update all table in one time. That is much faster than one by one method
-    model.objects.bulk_update(items, ["version_order"])
-
-
-def order_versions():
-    order_model_versions(Prototype)
-    order_model_versions(Bundle)
-
-
 def process_file(bundle_file: str) -> tuple[str, Path]:
     path = Path(settings.DOWNLOAD_DIR, bundle_file)
     bundle_hash = get_hash_safe(path=str(path))
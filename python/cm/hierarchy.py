@@ -10,14 +10,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from itertools import chain
+from typing import Iterable
+
+from core.cluster.types import ClusterTopology
 
 from cm.models import (
     ADCMEntity,
+    Cluster,
     Component,
     Host,
-    HostComponent,
     Service,
 )
+from cm.services.cluster import retrieve_multiple_clusters_topology
 
 
 class HierarchyError(Exception):
@@ -107,14 +112,17 @@ class Tree:
     """
     Hierarchy tree class keep links and relations between its nodes like this:
         common_virtual_root -> *cluster -> *service -> *component -> *host -> provider
+
+    Whole neighbourhood of object is loaded at once:
+    topologies of related clusters are retrieved together and their objects are fetched in bulk,
+    so amount of queries doesn't depend on size of clusters.
     """
 
     def __init__(self, obj: ADCMEntity):
         self.root = Node(value=None)
         self._nodes = {self.root.key: self.root}
         self.built_from = self._make_node(obj)
-        self._build_tree_up(self.built_from)  # go to the root ...
-        self._build_tree_down(self.root)  # ... and find all its children
+        self._build_tree()
 
     def _make_node(self, obj: ADCMEntity) -> Node:
         cached = self._nodes.get(Node.get_obj_key(obj))
@@ -125,58 +133,85 @@ class Tree:
 
         return node
 
-    def _build_tree_down(self, node: Node) -> None:
-        children_values = []
-        if node.type == "root":
-            children_values = [n.value for n in node.children]
-
-        if node.type == "cluster":
-            children_values = Service.objects.filter(cluster=node.value).order_by("id")
-        elif node.type == "service":
-            children_values = Component.objects.filter(cluster=node.value.cluster, service=node.value).order_by("id")
-        elif node.type == "component":
-            children_values = [
-                c.host
-                for c in HostComponent.objects.filter(
-                    cluster=node.value.service.cluster,
-                    service=node.value.service,
-                    component=node.value,
+    @staticmethod
+    def _link(parent: Node, child: Node) -> None:
+        parent.add_child(child)
+        child.add_parent(parent)
+
+    def _build_tree(self) -> None:
+        obj = self.built_from.value
+        provider_hosts = ()
+
+        match self.built_from.type:
+            case "cluster":
+                cluster_ids = {obj.pk}
+            case "service" | "component":
+                cluster_ids = {obj.cluster_id}
+            case "host":
+                cluster_ids = {obj.cluster_id} if obj.cluster_id else set()
+            case "provider":
+                provider_hosts = tuple(Host.objects.select_related("prototype").filter(provider=obj).order_by("id"))
+                cluster_ids = {host.cluster_id for host in provider_hosts if host.cluster_id}
+            case _:
+                cluster_ids = set()
+
+        topologies = tuple(retrieve_multiple_clusters_topology(cluster_ids=cluster_ids)) if cluster_ids else ()
+
+        if self.built_from.type in ("host", "provider"):
+            # hosts are linked to cluster only through mapping, so clusters without related mapped hosts are skipped
+            host_ids = {obj.pk} if self.built_from.type == "host" else {host.pk for host in provider_hosts}
+            topologies = tuple(
+                topology
+                for topology in topologies
+                if not host_ids.isdisjoint(
+                    chain.from_iterable(service.host_ids for service in topology.services.values())
                 )
-                .select_related("host")
-                .order_by("id")
-            ]
-        elif node.type == "host":
-            children_values = []
-        elif node.type == "provider":
-            children_values = Host.objects.filter(provider=node.value)
-
-        for value in children_values:
-            child = self._make_node(value)
-            node.add_child(child)
-            child.add_parent(node)
-            self._build_tree_down(child)
-
-    def _build_tree_up(self, node: Node) -> None:
-        parent_values = []
-        if node.type == "cluster":
-            parent_values = [None]
-        elif node.type == "service":
-            parent_values = [node.value.cluster]
-        elif node.type == "component":
-            parent_values = [node.value.service]
-        elif node.type == "host":
-            parent_values = [
-                hc.component
-                for hc in HostComponent.objects.filter(host=node.value).select_related("component").order_by("id")
-            ]
-        elif node.type == "provider":
-            parent_values = Host.objects.filter(provider=node.value).order_by("id")
-
-        for value in parent_values:
-            parent = self._make_node(value)
-            node.add_parent(parent)
-            parent.add_child(node)
-            self._build_tree_up(parent)
+            )
+
+        self._add_clusters(topologies=topologies)
+
+        for host in provider_hosts:
+            self._link(parent=self._make_node(host), child=self.built_from)
+
+    def _add_clusters(self, topologies: Iterable[ClusterTopology]) -> None:
+        topologies = tuple(topologies)
+        if not topologies:
+            return
+
+        service_ids = set()
+        component_ids = set()
+        host_ids = set()
+        for topology in topologies:
+            service_ids.update(topology.services)
+            component_ids.update(topology.component_ids)
+            host_ids.update(chain.from_iterable(service.host_ids for service in topology.services.values()))
+
+        clusters = Cluster.objects.select_related("prototype").in_bulk(
+            {topology.cluster_id for topology in topologies}.difference(
+                node.node_id for node in self._nodes.values() if node.type == "cluster"
+            )
+        )
+        services = Service.objects.select_related("prototype").in_bulk(service_ids)
+        components = Component.objects.select_related("prototype").in_bulk(component_ids)
+        hosts = Host.objects.select_related("prototype").in_bulk(host_ids)
+
+        def get_node(type_: str, objects: dict[int, ADCMEntity], id_: int) -> Node:
+            return self._nodes.get((type_, id_)) or self._make_node(objects[id_])
+
+        for topology in topologies:
+            cluster_node = get_node("cluster", clusters, topology.cluster_id)
+            self._link(parent=self.root, child=cluster_node)
+
+            for service_id, service_topology in topology.services.items():
+                service_node = get_node("service", services, service_id)
+                self._link(parent=cluster_node, child=service_node)
+
+                for component_id, component_topology in service_topology.components.items():
+                    component_node = get_node("component", components, component_id)
+                    self._link(parent=service_node, child=component_node)
+
+                    for host_id in component_topology.hosts:
+                        self._link(parent=component_node, child=get_node("host", hosts, host_id))
 
     def get_node(self, obj: ADCMEntity) -> Node:
         """Get tree node by its object"""
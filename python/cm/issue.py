@@ -11,6 +11,7 @@
 # limitations under the License.
 
 from functools import partial
+from typing import Iterable
 
 from api_v2.concern.serializers import ConcernSerializer
 from core.types import CoreObjectDescriptor
@@ -28,7 +29,6 @@ from cm.models import (
     Component,
     ConcernCause,
     ConcernItem,
-    ConcernType,
     ObjectType,
     Prototype,
     Service,
@@ -41,7 +41,12 @@ from cm.services.concern.checks import (
     object_imports_has_issue,
     service_requirements_has_issue,
 )
-from cm.status_api import send_concern_creation_event, send_concern_delete_event
+from cm.services.concern.distribution import clean_up_issues_and_flags_of_objects
+from cm.status_api import (
+    notify_about_redistributed_concerns_from_maps,
+    send_concern_creation_event,
+    send_concern_delete_event,
+)
 
 
 def check_service_requires(cluster: Cluster, proto: Prototype) -> None:
@@ -126,19 +131,19 @@ def update_hierarchy_issues(obj: ADCMEntity) -> None:
         recheck_issues(obj=node.value)
 
 
-def update_issues_and_flags_after_deleting() -> None:
-    """Remove issues and flags which have no owners after object deleting"""
-    for concern in ConcernItem.objects.filter(type__in=(ConcernType.ISSUE, ConcernType.FLAG)):
-        tree = Tree(obj=concern.owner)
-        affected = {node.value for node in tree.get_directly_affected(node=tree.built_from)}
-        related = set(concern.related_objects)
-        if concern.owner is None:
-            concern_str = str(concern)
-            concern.delete()
-            logger.info("Deleted %s", concern_str)
-        elif related != affected:
-            for object_moved_out_hierarchy in related.difference(affected):
-                unlink_concern_from_object(object_=object_moved_out_hierarchy, concern=concern)
+def update_issues_and_flags_after_deleting(objects: Iterable[CoreObjectDescriptor]) -> None:
+    """
+    Remove issues and flags which have no owners after object deleting
+    and unlink ones from objects moved out of their owner's hierarchy.
+
+    Only concerns owned by or linked to given `objects` are re-evaluated.
+    """
+    deleted, removed = clean_up_issues_and_flags_of_objects(objects=objects)
+    if deleted:
+        logger.info("Deleted concerns %s", ", ".join(map(str, sorted(deleted))))
+
+    if removed:
+        on_commit(func=partial(notify_about_redistributed_concerns_from_maps, added={}, removed=removed))
 
 
 def add_concern_to_object(object_: ADCMEntity, concern: ConcernItem | None) -> None:
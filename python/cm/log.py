@@ -11,7 +11,14 @@
 # limitations under the License.
 
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Protocol
+import os
+
+from django.conf import settings
+
+READ_CHUNK_SIZE = 64 * 1024
+# utf-8 char takes up to 4 bytes
+_MAX_BYTES_PER_CHAR = 4
 
 
 class BasicLogInfo(Protocol):
@@ -21,9 +28,230 @@ class BasicLogInfo(Protocol):
     format: str
 
 
+class LogLine(NamedTuple):
+    content: str
+    is_cut: bool
+
+
+class LogChunk(NamedTuple):
+    content: bytes
+    offset: int
+    size: int
+    """Size of the whole log at the moment of reading"""
+
+    @property
+    def next_offset(self) -> int:
+        return self.offset + len(self.content)
+
+
+def get_log_file_path(jobs_dir: Path, log_info: BasicLogInfo) -> Path:
+    return jobs_dir / f"{log_info.job_id}" / f"{log_info.name}-{log_info.type}.{log_info.format}"
+
+
 def extract_log_content_from_fs(jobs_dir: Path, log_info: BasicLogInfo) -> str | None:
-    logfile = jobs_dir / f"{log_info.job_id}" / f"{log_info.name}-{log_info.type}.{log_info.format}"
+    logfile = get_log_file_path(jobs_dir=jobs_dir, log_info=log_info)
     if logfile.exists():
         return logfile.read_text(encoding="utf-8")
 
     return None
+
+
+def extract_log_preview_from_fs(jobs_dir: Path, log_info: BasicLogInfo) -> str | None:
+    """
+    Read log content suitable for displaying.
+
+    Small logs are returned as is, big ones are truncated to the last lines (each cut to the max length),
+    reading only required part of the file, so memory consumption doesn't depend on log size.
+    """
+
+    logfile = get_log_file_path(jobs_dir=jobs_dir, log_info=log_info)
+    if not logfile.is_file():
+        return None
+
+    # limit is set in chars, while utf-8 char takes 1 to 4 bytes,
+    # so only the file that may fit the limit is decoded to compare its length
+    max_length = settings.STDOUT_STDERR_LOG_MAX_UNCUT_LENGTH
+    if logfile.stat().st_size < max_length * _MAX_BYTES_PER_CHAR:
+        content = logfile.read_text(encoding="utf-8")
+        if len(content) < max_length:
+            return content
+
+    return format_truncated_log(
+        lines=read_last_lines(
+            path=logfile,
+            amount=settings.STDOUT_STDERR_LOG_CUT_LENGTH,
+            max_length=settings.STDOUT_STDERR_LOG_LINE_CUT_LENGTH,
+        )
+    )
+
+
+def cut_lines(lines: Iterable[str], max_length: int) -> Iterable[LogLine]:
+    for line in lines:
+        if len(line) <= max_length:
+            yield LogLine(content=line, is_cut=False)
+        else:
+            yield LogLine(content=line[:max_length], is_cut=True)
+
+
+def format_truncated_log(lines: Iterable[LogLine]) -> str:
+    message = settings.STDOUT_STDERR_TRUNCATED_LOG_MESSAGE
+    content = "\n".join(f"{line.content}{message}" if line.is_cut else line.content for line in lines)
+
+    return f"{message}\n{content}\n{message}\n"
+
+
+def read_last_lines(path: Path, amount: int, max_length: int) -> list[LogLine]:
+    """
+    Read last `amount` lines of the file, each one cut to `max_length` chars.
+
+    File is scanned backwards in chunks to find lines' boundaries
+    and only the beginning of each line is read, so the memory consumption is bounded by
+    `amount * max_length` no matter how big the file or its lines are.
+    """
+
+    if amount <= 0:
+        return []
+
+    with path.open(mode="rb") as file:
+        size = file.seek(0, os.SEEK_END)
+        end = size
+        # trailing line break doesn't start a new line (same as `str.splitlines`)
+        if end and _read_at(file=file, offset=end - 1, length=1) == b"\n":
+            end -= 1
+
+        starts = _find_last_lines_starts(file=file, end=end, amount=amount)
+        ends = [start - 1 for start in starts[1:]] + [end]
+
+        return [
+            _read_line_beginning(file=file, start=start, end=line_end, max_length=max_length)
+            for start, line_end in zip(starts, ends)
+        ]
+
+
+def read_log_range(path: Path, offset: int, limit: int | None = None) -> LogChunk:
+    """
+    Read `limit` bytes (till the end if not specified) starting from `offset`.
+    Negative `offset` is counted from the end of file.
+    """
+
+    with path.open(mode="rb") as file:
+        size = file.seek(0, os.SEEK_END)
+        if offset < 0:
+            offset = max(size + offset, 0)
+
+        offset = min(offset, size)
+        length = size - offset if limit is None else min(max(limit, 0), size - offset)
+
+        return LogChunk(content=_read_at(file=file, offset=offset, length=length), offset=offset, size=size)
+
+
+def iter_log_range(path: Path, offset: int, length: int) -> Iterator[bytes]:
+    """
+    Yield `length` bytes of log starting from `offset` by chunks of `READ_CHUNK_SIZE`,
+    so range of big log isn't read into memory at once
+    """
+
+    with path.open(mode="rb") as file:
+        file.seek(offset)
+        while length > 0 and (chunk := file.read(min(length, READ_CHUNK_SIZE))):
+            length -= len(chunk)
+            yield chunk
+
+
+def read_log_appended(path: Path, offset: int, limit: int, is_complete: bool = False) -> LogChunk:
+    """
+    Read up to `limit` bytes appended to the log after `offset`.
+
+    Only the new bytes are read, and if there are none, file isn't read at all.
+    Incomplete utf-8 char at the end (e.g. the one being written right now) is left for the next read,
+    so `next_offset` always points to the char boundary.
+    When log `is_complete` (won't be appended anymore), its remaining bytes are returned as is.
+    """
+
+    size = path.stat().st_size
+    if offset >= size:
+        return LogChunk(content=b"", offset=min(max(offset, 0), size), size=size)
+
+    return _cut_chunk(chunk=read_log_range(path=path, offset=offset, limit=limit), is_complete=is_complete)
+
+
+def read_body_appended(body: bytes, offset: int, limit: int) -> LogChunk:
+    """The same as `read_log_appended`, but for the complete log stored in DB"""
+
+    offset = min(offset, len(body))
+
+    return _cut_chunk(
+        chunk=LogChunk(content=body[offset : offset + limit], offset=offset, size=len(body)), is_complete=True
+    )
+
+
+def _cut_chunk(chunk: LogChunk, is_complete: bool) -> LogChunk:
+    if is_complete and chunk.next_offset >= chunk.size:
+        return chunk
+
+    return chunk._replace(content=_cut_incomplete_char(content=chunk.content))
+
+
+def _cut_incomplete_char(content: bytes) -> bytes:
+    for position in range(len(content) - 1, max(len(content) - _MAX_BYTES_PER_CHAR, 0) - 1, -1):
+        byte = content[position]
+        if byte & 0b1100_0000 == 0b1000_0000:
+            # continuation byte, char start is further
+            continue
+
+        if byte >= 0b1111_0000:
+            char_length = 4
+        elif byte >= 0b1110_0000:
+            char_length = 3
+        elif byte >= 0b1100_0000:
+            char_length = 2
+        else:
+            char_length = 1
+
+        return content if len(content) - position >= char_length else content[:position]
+
+    return content
+
+
+def _find_last_lines_starts(file: BinaryIO, end: int, amount: int) -> list[int]:
+    starts = []
+    position = end
+
+    while position > 0 and len(starts) < amount:
+        chunk_start = max(position - READ_CHUNK_SIZE, 0)
+        chunk = _read_at(file=file, offset=chunk_start, length=position - chunk_start)
+
+        line_break = len(chunk)
+        while len(starts) < amount:
+            line_break = chunk.rfind(b"\n", 0, line_break)
+            if line_break == -1:
+                break
+
+            starts.append(chunk_start + line_break + 1)
+
+        position = chunk_start
+
+    if len(starts) < amount:
+        starts.append(0)
+
+    return starts[::-1]
+
+
+def _read_line_beginning(file: BinaryIO, start: int, end: int, max_length: int) -> LogLine:
+    length = end - start
+    to_read = min(length, max_length * _MAX_BYTES_PER_CHAR)
+
+    # multibyte char may be split by the read boundary, it's out of `max_length` anyway
+    content = _read_at(file=file, offset=start, length=to_read).decode(encoding="utf-8", errors="ignore")
+    content = content.removesuffix("\r")
+
+    if len(content) > max_length or to_read < length:
+        return LogLine(content=content[:max_length], is_cut=True)
+
+    return LogLine(content=content, is_cut=False)
+
+
+def _read_at(file: BinaryIO, offset: int, length: int) -> bytes:
+    file.seek(offset)
+
+    return file.read(length)
@@ -0,0 +1,58 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import migrations
+
+# Keep in sync with `jobs.scheduler.settings.LAUNCHER_NOTIFY_CHANNEL`.
+# Notification is delivered by PostgreSQL only after the inserting transaction is committed,
+# so launcher won't wake up for the task that can't be selected yet.
+CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION cm_tasklog_notify_created() RETURNS trigger AS $$
+BEGIN
+    IF NEW.status = 'created' THEN
+        PERFORM pg_notify('adcm_task_created', NEW.id::text);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS cm_tasklog_notify_created ON cm_tasklog;
+CREATE TRIGGER cm_tasklog_notify_created
+    AFTER INSERT ON cm_tasklog
+    FOR EACH ROW EXECUTE FUNCTION cm_tasklog_notify_created();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS cm_tasklog_notify_created ON cm_tasklog;
+DROP FUNCTION IF EXISTS cm_tasklog_notify_created();
+"""
+
+
+def create_trigger(apps, schema_editor) -> None:
+    # LISTEN/NOTIFY is PostgreSQL-specific, other backends rely on scheduler's periodic wake up
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_TRIGGER)
+
+
+def drop_trigger(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_TRIGGER)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cm", "0142_action_wizard_template_and_process"),
+    ]
+
+    operations = [
+        migrations.RunPython(code=create_trigger, reverse_code=drop_trigger),
+    ]
@@ -0,0 +1,146 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import migrations
+
+# Keep in sync with `cm.services.cluster.TOPOLOGY_VERSION_TABLE`.
+# Versions are taken from sequence, so the value "used" by rolled back transaction is never seen again
+# and the pair (cluster_id, version) always identifies the same state of cluster's topology.
+CREATE_TRIGGERS = """
+CREATE SEQUENCE IF NOT EXISTS cm_cluster_topology_version_seq;
+
+CREATE TABLE IF NOT EXISTS cm_cluster_topology_version (
+    cluster_id integer PRIMARY KEY,
+    version bigint NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION cm_bump_cluster_topology_version(cluster_ids integer[]) RETURNS void AS $$
+BEGIN
+    INSERT INTO cm_cluster_topology_version (cluster_id, version)
+    SELECT changed.cluster_id, nextval('cm_cluster_topology_version_seq')
+    FROM (SELECT DISTINCT unnest(cluster_ids) AS cluster_id) AS changed
+    WHERE changed.cluster_id IS NOT NULL
+    ON CONFLICT (cluster_id) DO UPDATE SET version = EXCLUDED.version;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT cm_bump_cluster_topology_version(ARRAY(SELECT id FROM cm_cluster));
+
+CREATE OR REPLACE FUNCTION cm_cluster_topology_changed() RETURNS trigger AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'cm_cluster' THEN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM cm_bump_cluster_topology_version(ARRAY(SELECT id FROM new_rows));
+        ELSE
+            DELETE FROM cm_cluster_topology_version WHERE cluster_id IN (SELECT id FROM old_rows);
+        END IF;
+    ELSIF TG_OP = 'INSERT' THEN
+        PERFORM cm_bump_cluster_topology_version(ARRAY(SELECT cluster_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM cm_bump_cluster_topology_version(ARRAY(SELECT cluster_id FROM old_rows));
+    ELSIF TG_TABLE_NAME = 'cm_host' THEN
+        -- hosts are updated often (state, maintenance mode, etc.), only some fields are part of topology
+        PERFORM cm_bump_cluster_topology_version(ARRAY(
+            SELECT unnest(ARRAY[old_rows.cluster_id, new_rows.cluster_id])
+            FROM old_rows JOIN new_rows ON old_rows.id = new_rows.id
+            WHERE old_rows.cluster_id IS DISTINCT FROM new_rows.cluster_id OR old_rows.fqdn <> new_rows.fqdn
+        ));
+    ELSIF TG_TABLE_NAME IN ('cm_service', 'cm_component') THEN
+        -- name of service/component is the name of its prototype, which is changed on upgrade
+        PERFORM cm_bump_cluster_topology_version(ARRAY(
+            SELECT new_rows.cluster_id
+            FROM old_rows JOIN new_rows ON old_rows.id = new_rows.id
+            WHERE old_rows.prototype_id <> new_rows.prototype_id
+        ));
+    ELSE
+        PERFORM cm_bump_cluster_topology_version(ARRAY(
+            SELECT unnest(ARRAY[old_rows.cluster_id, new_rows.cluster_id])
+            FROM old_rows JOIN new_rows ON old_rows.id = new_rows.id
+        ));
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Transition tables can't be used in trigger for more than one event,
+# so each table gets separate trigger per operation.
+CREATE_TABLE_TRIGGERS = """
+DROP TRIGGER IF EXISTS cm_cluster_topology_inserted ON {table};
+CREATE TRIGGER cm_cluster_topology_inserted
+    AFTER INSERT ON {table}
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION cm_cluster_topology_changed();
+
+DROP TRIGGER IF EXISTS cm_cluster_topology_deleted ON {table};
+CREATE TRIGGER cm_cluster_topology_deleted
+    AFTER DELETE ON {table}
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION cm_cluster_topology_changed();
+"""
+
+CREATE_TABLE_UPDATE_TRIGGER = """
+DROP TRIGGER IF EXISTS cm_cluster_topology_updated ON {table};
+CREATE TRIGGER cm_cluster_topology_updated
+    AFTER UPDATE ON {table}
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION cm_cluster_topology_changed();
+"""
+
+DROP_TABLE_TRIGGERS = """
+DROP TRIGGER IF EXISTS cm_cluster_topology_inserted ON {table};
+DROP TRIGGER IF EXISTS cm_cluster_topology_deleted ON {table};
+DROP TRIGGER IF EXISTS cm_cluster_topology_updated ON {table};
+"""
+
+DROP_TRIGGERS = """
+DROP FUNCTION IF EXISTS cm_cluster_topology_changed();
+DROP FUNCTION IF EXISTS cm_bump_cluster_topology_version(integer[]);
+DROP TABLE IF EXISTS cm_cluster_topology_version;
+DROP SEQUENCE IF EXISTS cm_cluster_topology_version_seq;
+"""
+
+TOPOLOGY_TABLES = ("cm_host", "cm_service", "cm_component", "cm_hostcomponent")
+
+
+def create_triggers(apps, schema_editor) -> None:
+    # Topology cache relies on versions maintained by triggers, for other backends it's just not used
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(CREATE_TRIGGERS)
+    schema_editor.execute(CREATE_TABLE_TRIGGERS.format(table="cm_cluster"))
+
+    for table in TOPOLOGY_TABLES:
+        schema_editor.execute(CREATE_TABLE_TRIGGERS.format(table=table))
+        schema_editor.execute(CREATE_TABLE_UPDATE_TRIGGER.format(table=table))
+
+
+def drop_triggers(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table in ("cm_cluster", *TOPOLOGY_TABLES):
+        schema_editor.execute(DROP_TABLE_TRIGGERS.format(table=table))
+
+    schema_editor.execute(DROP_TRIGGERS)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cm", "0143_tasklog_notify_created"),
+    ]
+
+    operations = [
+        migrations.RunPython(code=create_triggers, reverse_code=drop_triggers),
+    ]
@@ -0,0 +1,213 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import defaultdict
+from functools import cached_property
+from typing import Iterable
+
+from cm.models import (
+    ADCM,
+    COMPONENT_IN_MM,
+    HOST_IN_MM,
+    MANY_HOSTS_IN_MM,
+    NO_LDAP_SETTINGS,
+    SERVICE_IN_MM,
+    Action,
+    ActionHostGroup,
+    ADCMEntity,
+    Cluster,
+    Component,
+    ConfigLog,
+    Host,
+    HostComponent,
+    MaintenanceMode,
+    Service,
+)
+
+
+def _service_maintenance_mode(
+    own_mm: str, components_own_mm: Iterable[str], hosts_mm: Iterable[str]
+) -> MaintenanceMode | str:
+    # same as `Service.maintenance_mode`, but on preloaded values
+    if own_mm != MaintenanceMode.OFF:
+        return own_mm
+
+    components_own_mm = tuple(components_own_mm)
+    if components_own_mm:
+        if all(mm == MaintenanceMode.ON for mm in components_own_mm):
+            return MaintenanceMode.ON
+
+        hosts_mm = tuple(hosts_mm)
+        if hosts_mm:
+            return MaintenanceMode.ON if all(mm == MaintenanceMode.ON for mm in hosts_mm) else MaintenanceMode.OFF
+
+    return own_mm
+
+
+def _component_maintenance_mode(own_mm: str, service_own_mm: str, hosts_mm: Iterable[str]) -> MaintenanceMode | str:
+    # same as `Component.maintenance_mode`, but on preloaded values
+    if own_mm != MaintenanceMode.OFF:
+        return own_mm
+
+    if service_own_mm == MaintenanceMode.ON:
+        return service_own_mm
+
+    hosts_mm = tuple(hosts_mm)
+    if hosts_mm:
+        return MaintenanceMode.ON if all(mm == MaintenanceMode.ON for mm in hosts_mm) else MaintenanceMode.OFF
+
+    return own_mm
+
+
+class ActionAvailability:
+    """
+    Check whether actions can be started on the owner.
+
+    Facts about the owner (LDAP settings, maintenance mode of the owner and related objects)
+    are retrieved once on first need, so checking any amount of actions costs the same amount of queries.
+    """
+
+    def __init__(self, owner: ADCMEntity | ActionHostGroup) -> None:
+        self._owner = owner.object if isinstance(owner, ActionHostGroup) else owner
+
+    def get_start_impossible_reason(self, action: Action) -> str | None:
+        if reason := self._owner_reason:
+            return reason
+
+        if action.allow_in_maintenance_mode:
+            return None
+
+        return self._maintenance_mode_reason
+
+    @cached_property
+    def _owner_reason(self) -> str | None:
+        if not isinstance(self._owner, ADCM):
+            return None
+
+        attr = ConfigLog.objects.values_list("attr", flat=True).get(
+            obj_ref_id=self._owner.config_id, id=self._owner.config.current
+        )
+        if not attr["ldap_integration"]["active"]:
+            return NO_LDAP_SETTINGS
+
+        return None
+
+    @cached_property
+    def _maintenance_mode_reason(self) -> str | None:
+        match self._owner:
+            case Cluster():
+                return self._cluster_maintenance_mode_reason(cluster=self._owner)
+            case Service():
+                return self._service_maintenance_mode_reason(service=self._owner)
+            case Component():
+                return self._component_maintenance_mode_reason(component=self._owner)
+            case Host():
+                return HOST_IN_MM if self._owner.maintenance_mode == MaintenanceMode.ON else None
+            case _:
+                return None
+
+    @staticmethod
+    def _cluster_maintenance_mode_reason(cluster: Cluster) -> str | None:
+        hosts_mm = dict(Host.objects.filter(cluster=cluster).values_list("id", "maintenance_mode"))
+        if any(mm == MaintenanceMode.ON for mm in hosts_mm.values()):
+            return MANY_HOSTS_IN_MM
+
+        services_mm = dict(Service.objects.filter(cluster=cluster).values_list("id", "_maintenance_mode"))
+        components = tuple(
+            Component.objects.filter(service__cluster=cluster).values_list("id", "service_id", "_maintenance_mode")
+        )
+
+        service_components_mm = defaultdict(list)
+        for _, service_id, mm in components:
+            service_components_mm[service_id].append(mm)
+
+        service_hosts = defaultdict(set)
+        component_hosts = defaultdict(set)
+        for service_id, component_id, host_id in HostComponent.objects.filter(cluster=cluster).values_list(
+            "service_id", "component_id", "host_id"
+        ):
+            service_hosts[service_id].add(host_id)
+            component_hosts[component_id].add(host_id)
+
+        if any(
+            _service_maintenance_mode(
+                own_mm=own_mm,
+                components_own_mm=service_components_mm[service_id],
+                hosts_mm=(hosts_mm[host_id] for host_id in service_hosts[service_id]),
+            )
+            == MaintenanceMode.ON
+            for service_id, own_mm in services_mm.items()
+        ):
+            return SERVICE_IN_MM
+
+        if any(
+            _component_maintenance_mode(
+                own_mm=own_mm,
+                service_own_mm=services_mm[service_id],
+                hosts_mm=(hosts_mm[host_id] for host_id in component_hosts[component_id]),
+            )
+            == MaintenanceMode.ON
+            for component_id, service_id, own_mm in components
+        ):
+            return COMPONENT_IN_MM
+
+        return None
+
+    @staticmethod
+    def _service_maintenance_mode_reason(service: Service) -> str | None:
+        components_mm = dict(Component.objects.filter(service=service).values_list("id", "_maintenance_mode"))
+
+        component_hosts_mm = defaultdict(list)
+        hosts_mm = {}
+        for component_id, host_id, host_mm in HostComponent.objects.filter(service=service).values_list(
+            "component_id", "host_id", "host__maintenance_mode"
+        ):
+            component_hosts_mm[component_id].append(host_mm)
+            hosts_mm[host_id] = host_mm
+
+        service_mm = _service_maintenance_mode(
+            own_mm=service.maintenance_mode_attr, components_own_mm=components_mm.values(), hosts_mm=hosts_mm.values()
+        )
+        if service_mm == MaintenanceMode.ON:
+            return SERVICE_IN_MM
+
+        if any(
+            _component_maintenance_mode(
+                own_mm=own_mm, service_own_mm=service.maintenance_mode_attr, hosts_mm=component_hosts_mm[component_id]
+            )
+            == MaintenanceMode.ON
+            for component_id, own_mm in components_mm.items()
+        ):
+            return COMPONENT_IN_MM
+
+        if any(mm == MaintenanceMode.ON for mm in hosts_mm.values()):
+            return MANY_HOSTS_IN_MM
+
+        return None
+
+    @staticmethod
+    def _component_maintenance_mode_reason(component: Component) -> str | None:
+        service_own_mm = Service.objects.values_list("_maintenance_mode", flat=True).get(pk=component.service_id)
+        hosts_mm = tuple(
+            HostComponent.objects.filter(component=component).values_list("host__maintenance_mode", flat=True)
+        )
+
+        component_mm = _component_maintenance_mode(
+            own_mm=component.maintenance_mode_attr, service_own_mm=service_own_mm, hosts_mm=hosts_mm
+        )
+        if component_mm == MaintenanceMode.ON:
+            return COMPONENT_IN_MM
+
+        if any(mm == MaintenanceMode.ON for mm in hosts_mm):
+            return MANY_HOSTS_IN_MM
+
+        return None
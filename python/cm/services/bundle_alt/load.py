@@ -15,11 +15,12 @@ from dataclasses import dataclass
 from functools import cache
 from operator import methodcaller
 from pathlib import Path
-from tempfile import gettempdir
+from tempfile import NamedTemporaryFile, gettempdir
 from typing import NamedTuple
 import os
 import fcntl
 import shutil
+import hashlib
 import logging
 import tarfile
 
@@ -66,19 +67,26 @@ class Directories(NamedTuple):
 def parse_bundle_from_request_to_db(
     file_from_request: File, *, directories: Directories, adcm_version: str, verified_signature_only: bool
 ) -> Bundle:
-    archive_in_downloads = save_bundle_file_from_request_to_downloads(
+    archive = _save_bundle_file_from_request_to_downloads(
         file_from_request=file_from_request, downloads_dir=directories.downloads
     )
     return parse_bundle_archive(
-        archive=archive_in_downloads,
+        archive=archive.path,
         directories=directories,
         adcm_version=adcm_version,
         verified_signature_only=verified_signature_only,
+        bundle_hash=archive.hash,
     )
 
 
 @convert_bundle_errors_to_adcm_ex
-def parse_bundle_archive(archive: Path, directories: Directories, adcm_version: str, verified_signature_only: bool):
+def parse_bundle_archive(
+    archive: Path,
+    directories: Directories,
+    adcm_version: str,
+    verified_signature_only: bool,
+    bundle_hash: str | None = None,
+):
     # Thou it's a bit of strange to remove archive in here,
     # but it's the original process,
     # required by upload-load separation in v1
@@ -89,6 +97,7 @@ def parse_bundle_archive(archive: Path, directories: Directories, adcm_version:
             files_dir=directories.files,
             adcm_version=adcm_version,
             verified_signature_only=verified_signature_only,
+            bundle_hash=bundle_hash,
         )
 
 
@@ -116,17 +125,28 @@ def parse_config_jinja(data: list[dict], context: ConfigJinjaContext, *, action,
 # Public
 
 
-@convert_bundle_errors_to_adcm_ex
 def save_bundle_file_from_request_to_downloads(file_from_request: File, downloads_dir: Path) -> Path:
-    archive_in_tmp = _write_bundle_archive_to_tempdir(file_from_request=file_from_request)
-    return _safe_copy_to_downloads(archive=archive_in_tmp, downloads_dir=downloads_dir)
+    return _save_bundle_file_from_request_to_downloads(
+        file_from_request=file_from_request, downloads_dir=downloads_dir
+    ).path
 
 
 def process_bundle_from_archive(
-    archive: Path, bundles_dir: Path, files_dir: Path, adcm_version: str, verified_signature_only: bool
+    archive: Path,
+    bundles_dir: Path,
+    files_dir: Path,
+    adcm_version: str,
+    verified_signature_only: bool,
+    bundle_hash: str | None = None,
 ) -> Bundle:
-    """Unpack bundle to bundles dir, read definitions, create bundle"""
-    bundle_hash = get_hash_safe(archive)
+    """
+    Unpack bundle to bundles dir, read definitions, create bundle
+
+    `bundle_hash` is the hash of archive's content, if it's known already (e.g. calculated on upload)
+    """
+    if bundle_hash is None:
+        bundle_hash = get_hash_safe(archive)
+
     unpacking_info = _unpack_bundle(
         archive=archive, bundles_dir=bundles_dir, bundle_hash=bundle_hash, files_dir=files_dir
     )
@@ -247,15 +267,57 @@ def _upload_fs_lock():
             fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
 
 
-def _find_duplicate(archive: Path, in_: Path) -> Path | None:
-    archive_hash = get_hash_safe(path=archive)
-    existing_files = filter(methodcaller("is_file"), in_.iterdir())
-    for file_ in existing_files:
-        file_hash = get_hash_safe(file_)
-        if archive_hash == file_hash:
-            return file_
+class _DownloadsHashIndex:
+    """
+    Process-wide index of content hashes of files in downloads dir.
+
+    Files can be added/removed by other processes, so directory is still listed on each lookup,
+    but only files of the same size as the searched one can be duplicates,
+    and the hash of each file is calculated only once while its size and modification time stay the same.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        # path -> (size, mtime_ns, hash)
+        self._entries: dict[Path, tuple[int, int, str]] = {}
+
+    def find(self, hash_: str, size: int, in_: Path) -> Path | None:
+        existing = set()
+
+        with os.scandir(in_) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+
+                file_ = Path(entry.path)
+                existing.add(file_)
+                stat = entry.stat()
+                if stat.st_size == size and self._get_hash(file_=file_, stat=stat) == hash_:
+                    return file_
+
+        for file_ in self._entries.keys() - existing:
+            if file_.parent == in_:
+                del self._entries[file_]
+
+        return None
 
-    return None
+    def add(self, file_: Path, hash_: str) -> None:
+        stat = file_.stat()
+        self._entries[file_] = (stat.st_size, stat.st_mtime_ns, hash_)
+
+    def _get_hash(self, file_: Path, stat: os.stat_result) -> str:
+        entry = self._entries.get(file_)
+        if entry is not None and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+            return entry[2]
+
+        hash_ = get_hash_safe(path=file_)
+        self._entries[file_] = (stat.st_size, stat.st_mtime_ns, hash_)
+
+        return hash_
+
+
+_downloads_hash_index = _DownloadsHashIndex()
 
 
 def _find_inner_archive(directory: Path) -> Path | None:
@@ -307,28 +369,50 @@ def _verify_signature(bundle_signature: SignatureStatus, verified_signature_only
         )
 
 
-def _write_bundle_archive_to_tempdir(file_from_request: File) -> Path:
-    """Save file from request to tempdir, so it can be processed further"""
-    tmp_path = Path(gettempdir(), str(file_from_request.name))
+class _ReceivedArchive(NamedTuple):
+    path: Path
+    hash: str
+    size: int
+
+
+@convert_bundle_errors_to_adcm_ex
+def _save_bundle_file_from_request_to_downloads(file_from_request: File, downloads_dir: Path) -> _ReceivedArchive:
+    received = _write_bundle_archive_to_downloads(file_from_request=file_from_request, downloads_dir=downloads_dir)
+    with _cleanup_on_fail(received.path):
+        return _safe_move_to_downloads(archive=received, target_path=downloads_dir / str(file_from_request.name))
+
+
+def _write_bundle_archive_to_downloads(file_from_request: File, downloads_dir: Path) -> _ReceivedArchive:
+    """
+    Save file from request to hidden dir inside downloads dir, calculating hash of its content on the way.
 
-    with tmp_path.open(mode="wb+") as f:
-        for chunk in file_from_request.chunks():
-            f.write(chunk)
+    Partially written files don't get into the way of ones already in downloads dir,
+    and saved file can be moved to its place without copying (it's the same file system).
+    """
+    incoming_dir = downloads_dir / ".incoming"
+    incoming_dir.mkdir(exist_ok=True)
 
-    return tmp_path
+    sha1 = hashlib.sha1()  # noqa: S324
+    size = 0
+    with NamedTemporaryFile(mode="wb", dir=incoming_dir, suffix=".part", delete=False) as f:
+        with _cleanup_on_fail(Path(f.name)):
+            for chunk in file_from_request.chunks():
+                f.write(chunk)
+                sha1.update(chunk)
+                size += len(chunk)
 
+    return _ReceivedArchive(path=Path(f.name), hash=sha1.hexdigest(), size=size)
 
-def _safe_copy_to_downloads(archive: Path, downloads_dir: Path) -> Path:
-    """Copy file to downloads dir if there isn't already archive with such content"""
-    target_path = downloads_dir / archive.name
 
+def _safe_move_to_downloads(archive: _ReceivedArchive, target_path: Path) -> _ReceivedArchive:
+    """Move file to downloads dir if there isn't already archive with such content"""
     with _upload_fs_lock():
-        existing_file = _find_duplicate(archive, in_=downloads_dir)
+        existing_file = _downloads_hash_index.find(hash_=archive.hash, size=archive.size, in_=target_path.parent)
         if existing_file:
             message = f"Bundle already exists: Bundle with the same content is already uploaded {existing_file}"
             raise AdcmEx(code="BUNDLE_ERROR", msg=message)
 
-        # move to downloads
-        shutil.move(src=archive, dst=target_path)
+        archive.path.replace(target_path)
+        _downloads_hash_index.add(file_=target_path, hash_=archive.hash)
 
-        return target_path
+        return archive._replace(path=target_path)
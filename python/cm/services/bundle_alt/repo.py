@@ -10,7 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import deque
+from collections import defaultdict, deque
 from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Generator, Iterable, TypeAlias
@@ -34,6 +34,7 @@ from core.bundle_alt.types import (
 )
 from core.job.types import JobSpec
 from django.db import IntegrityError
+from django.db.models import Case, Value, When
 
 from cm.errors import AdcmEx
 from cm.models import (
@@ -55,28 +56,34 @@ def find_bundle_by_hash(hash_: str) -> Bundle | None:
 
 
 def order_versions():
-    # COPIED FROM cm.bundle
     _order_model_versions(Prototype)
     _order_model_versions(Bundle)
 
 
 def _order_model_versions(model):
-    # COPIED FROM cm.bundle
-    items = []
-    for obj in model.objects.order_by("id"):
-        items.append(obj)
-    ver = ""
-    count = 0
-    for obj in sorted(
-        items,
-        key=functools.cmp_to_key(lambda obj1, obj2: compare_prototype_versions(obj1.version, obj2.version)),
-    ):
-        if ver != obj.version:
-            count += 1
-        obj.version_order = count
-        ver = obj.version
-    # Update all table in one time. That is much faster than one by one method
-    model.objects.bulk_update(items, fields=["version_order"])
+    """
+    Set `version_order` of `model` rows to the rank of their version among all versions in table.
+
+    Only distinct versions are sorted and only rows with changed rank are updated,
+    so uploading a bundle with known versions touches nothing but its own rows.
+    """
+    current_orders = defaultdict(set)
+    for version, version_order in model.objects.values_list("version", "version_order").distinct():
+        current_orders[version].add(version_order)
+
+    new_orders = {
+        version: order
+        for order, version in enumerate(
+            sorted(sorted(current_orders), key=functools.cmp_to_key(compare_prototype_versions)), start=1
+        )
+    }
+    changed = {version: order for version, order in new_orders.items() if current_orders[version] != {order}}
+    if not changed:
+        return
+
+    model.objects.filter(version__in=changed).update(
+        version_order=Case(*(When(version=version, then=Value(order)) for version, order in changed.items()))
+    )
 
 
 def recollect_categories():
@@ -22,6 +22,7 @@ from core.cluster.types import (
     ObjectMaintenanceModeState,
 )
 from core.types import ADCMCoreType, ClusterID, CoreObjectDescriptor, HostID, ShortObjectInfo
+from django.db import connection
 from django.db.transaction import atomic
 from rbac.models import re_apply_object_policy
 
@@ -90,8 +91,75 @@ class ClusterDB:
         return result
 
 
+# Keep in sync with migration `cm.0144_cluster_topology_version`
+TOPOLOGY_VERSION_TABLE = "cm_cluster_topology_version"
+
+
+class _ClusterTopologyCache:
+    """
+    Process-wide cache of clusters topologies.
+
+    Topology version of cluster is changed by DB triggers on each change of cluster's hosts,
+    services, components or mapping (including not committed ones from current transaction),
+    so cached topology is returned only when its version is the same as the one in DB.
+    Versions are unique, hence topology built in rolled back transaction will never be matched.
+
+    Returned topologies are shared between callers, so they must not be modified in place.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[ClusterID, tuple[int, ClusterTopology]] = {}
+
+    def retrieve(self, cluster_ids: Collection[ClusterID]) -> dict[ClusterID, ClusterTopology]:
+        if connection.vendor != "postgresql":
+            return {topology.cluster_id: topology for topology in build_clusters_topology(cluster_ids, db=ClusterDB)}
+
+        versions = self._get_versions(cluster_ids=cluster_ids)
+
+        result = {}
+        for cluster_id in cluster_ids:
+            cached = self._entries.get(cluster_id)
+            if cached and cached[0] == versions.get(cluster_id):
+                result[cluster_id] = cached[1]
+
+        missing = [cluster_id for cluster_id in cluster_ids if cluster_id not in result]
+        if not missing:
+            return result
+
+        result.update(
+            (topology.cluster_id, topology) for topology in build_clusters_topology(cluster_ids=missing, db=ClusterDB)
+        )
+
+        # topology may be changed (and committed) by someone else while it's built,
+        # in that case it's hard to tell which version the result corresponds to, so it isn't cached
+        versions_after_build = self._get_versions(cluster_ids=missing)
+        for cluster_id in missing:
+            version = versions.get(cluster_id)
+            if version is not None and version == versions_after_build.get(cluster_id):
+                self._entries[cluster_id] = (version, result[cluster_id])
+
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _get_versions(cluster_ids: Collection[ClusterID]) -> dict[ClusterID, int]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT cluster_id, version FROM {TOPOLOGY_VERSION_TABLE} WHERE cluster_id = ANY(%s);",  # noqa: S608
+                (list(cluster_ids),),
+            )
+            return dict(cursor.fetchall())
+
+
+topology_cache = _ClusterTopologyCache()
+
+
 class _StatusServerService(Protocol):
-    def reset_hc_map(self) -> None:
+    def reset_clusters_hc_map(self, cluster_ids: Collection[ClusterID]) -> None:
         ...
 
 
@@ -120,7 +188,7 @@ def perform_host_to_cluster_map(
 
         re_apply_object_policy(apply_object=cluster)
 
-    status_service.reset_hc_map()
+    status_service.reset_clusters_hc_map(cluster_ids=(cluster_id,))
     if concern_id:
         notify_about_new_concern(concern_id=concern_id, related_objects=related_objects)
 
@@ -139,7 +207,10 @@ def retrieve_cluster_topology(cluster_id: ClusterID) -> ClusterTopology:
 
 
 def retrieve_multiple_clusters_topology(cluster_ids: Iterable[ClusterID]) -> Generator[ClusterTopology, None, None]:
-    return build_clusters_topology(cluster_ids=cluster_ids, db=ClusterDB)
+    cluster_ids = tuple(cluster_ids)
+    topologies = topology_cache.retrieve(cluster_ids=set(cluster_ids))
+
+    return (topologies[cluster_id] for cluster_id in cluster_ids)
 
 
 def retrieve_related_cluster_topology(orm_object: Cluster | Service | Component | Host) -> ClusterTopology:
@@ -11,6 +11,7 @@
 # limitations under the License.
 
 from ._operations import (
+    create_config_issues,
     create_issue,
     delete_concerns_of_removed_objects,
     delete_issue,
@@ -22,6 +23,7 @@ __all__ = [
     "delete_issue",
     "retrieve_issue",
     "create_issue",
+    "create_config_issues",
     "delete_concerns_of_removed_objects",
     "retrieve_related_concerns",
 ]
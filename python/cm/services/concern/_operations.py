@@ -11,14 +11,14 @@
 # limitations under the License.
 
 from collections import defaultdict
-from typing import Iterable
+from typing import Collection, Iterable
 
 from core.types import ADCMCoreType, Concern, CoreObjectDescriptor, ObjectID
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
 
 from cm.converters import core_type_to_model, model_name_to_core_type
-from cm.models import ConcernCause, ConcernItem, ConcernType, ObjectType, Prototype, Service
+from cm.models import ADCMEntity, ConcernCause, ConcernItem, ConcernType, ObjectType, Prototype, Service
 from cm.services.concern.messages import ConcernMessage, PlaceholderObjectsDTO, PlaceholderTypeDTO, build_concern_reason
 
 _issue_template_map = {
@@ -92,6 +92,34 @@ def create_issue(owner: CoreObjectDescriptor, cause: ConcernCause) -> ConcernIte
     )
 
 
+def create_config_issues(owners: Collection[ADCMEntity]) -> list[ConcernItem]:
+    """
+    Bulk version of `create_issue` for `ConcernCause.CONFIG`.
+    Owners should be of the same type, their prototypes should be already fetched.
+    """
+    if not owners:
+        return []
+
+    template = _issue_template_map[ConcernCause.CONFIG].template
+    owner_type = ContentType.objects.get_for_model(model=type(next(iter(owners))))
+
+    return ConcernItem.objects.bulk_create(
+        ConcernItem(
+            type=ConcernType.ISSUE,
+            name=f"{ConcernCause.CONFIG}_{ConcernType.ISSUE}",
+            reason=build_concern_reason(
+                template=template,
+                placeholder_objects=PlaceholderObjectsDTO(source=owner),
+                placeholder_types=PlaceholderTypeDTO(source=f"{owner.prototype.type}_config"),
+            ),
+            owner_id=owner.id,
+            owner_type=owner_type,
+            cause=ConcernCause.CONFIG,
+        )
+        for owner in owners
+    )
+
+
 def _get_target_and_placeholder_types(
     concern_message: ConcernMessage, owner: CoreObjectDescriptor
 ) -> tuple[Prototype | None, PlaceholderTypeDTO]:
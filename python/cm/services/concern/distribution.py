@@ -17,6 +17,7 @@ from operator import itemgetter
 from typing import Iterable, TypeAlias
 
 from core.cluster.types import ClusterTopology
+from core.job.types import TaskMappingDelta
 from core.types import (
     ADCMCoreType,
     ClusterID,
@@ -106,6 +107,120 @@ def redistribute_issues_and_flags(
     return added, removed
 
 
+def redistribute_issues_and_flags_on_mapping_change(
+    topology: ClusterTopology, mapping_delta: TaskMappingDelta
+) -> tuple[AffectedObjectConcernMap, AffectedObjectConcernMap]:
+    """
+    Incremental version of `redistribute_issues_and_flags` for the case when only mapping of cluster is changed.
+
+    `topology` is the one with `mapping_delta` already applied.
+    Links of objects that aren't affected by delta are expected to be actual,
+    so only hosts and components from delta, their services and cluster are re-calculated.
+    Own concerns of objects shouldn't change with mapping (except for removal),
+    otherwise full redistribution is required.
+
+    Returns added and removed concerns.
+    """
+    changed_components = set(mapping_delta.add) | set(mapping_delta.remove)
+    if not changed_components:
+        return {}, {}
+
+    changed_hosts = set(chain.from_iterable(mapping_delta.add.values())) | set(
+        chain.from_iterable(mapping_delta.remove.values())
+    )
+
+    component_service_map = {
+        component_id: service_id
+        for service_id, service_topology in topology.services.items()
+        for component_id in service_topology.components
+    }
+    changed_services = {component_service_map[component_id] for component_id in changed_components}
+
+    # Links of changed objects depend on:
+    #   - service: all its components and hosts mapped on them
+    #   - component: hosts mapped on it, its service
+    #   - host: all components mapped on it with their services
+    required_components = set(
+        chain.from_iterable(topology.services[service_id].components for service_id in changed_services)
+    )
+    for service_topology in topology.services.values():
+        for component_id, component_topology in service_topology.components.items():
+            if not changed_hosts.isdisjoint(component_topology.hosts):
+                required_components.add(component_id)
+
+    partial_topology = ClusterTopology(
+        cluster_id=topology.cluster_id,
+        services={
+            service_id: service_topology._replace(
+                components={
+                    component_id: component_topology
+                    for component_id, component_topology in service_topology.components.items()
+                    if component_id in required_components
+                }
+            )
+            for service_id, service_topology in topology.services.items()
+            if service_id in changed_services or not required_components.isdisjoint(service_topology.components)
+        },
+        hosts={},
+    )
+    required_hosts = changed_hosts.union(
+        *(service_topology.host_ids for service_topology in partial_topology.services.values())
+    )
+
+    provider_host_ids_mapping: ProviderHostMap = defaultdict(set)
+    for host_id, provider_id in Host.objects.values_list("id", "provider_id").filter(id__in=required_hosts):
+        provider_host_ids_mapping[provider_id].add(host_id)
+
+    objects_concerns = _retrieve_concerns_of_objects_in_topology(
+        topology_objects={
+            ADCMCoreType.CLUSTER: (topology.cluster_id,),
+            ADCMCoreType.SERVICE: tuple(partial_topology.services),
+            ADCMCoreType.COMPONENT: tuple(partial_topology.component_ids),
+            ADCMCoreType.HOST: tuple(required_hosts),
+        },
+        provider_host_mapping=provider_host_ids_mapping,
+    )
+    provider_hierarchy_concerns = objects_concerns.get(ADCMCoreType.HOST, {})
+    partial_distribution = _remove_host_hierarchy_links_from_hosts(
+        concerns=_calculate_concerns_distribution_for_topology(
+            topology=partial_topology, objects_concerns=objects_concerns
+        ),
+        hosts_existing_concerns=provider_hierarchy_concerns,
+    )
+
+    # Cluster gathers concerns of all its services, links of unchanged ones are actual in DB
+    if unchanged_services := set(topology.services).difference(changed_services):
+        partial_distribution[ADCMCoreType.CLUSTER][topology.cluster_id] |= set(
+            Service.concerns.through.objects.filter(service_id__in=unchanged_services)
+            .exclude(concernitem__type=ConcernType.LOCK)
+            .values_list("concernitem_id", flat=True)
+        )
+
+    changed_objects: TopologyObjectMap = {
+        ADCMCoreType.CLUSTER: (topology.cluster_id,),
+        ADCMCoreType.SERVICE: tuple(changed_services),
+        ADCMCoreType.COMPONENT: tuple(changed_components),
+        ADCMCoreType.HOST: tuple(changed_hosts),
+    }
+    added, removed = _find_distribution_difference(
+        old=_retrieve_current_concerns_distribution(
+            topology_objects=changed_objects, hosts_existing_concerns=provider_hierarchy_concerns
+        ),
+        new={
+            core_type: {
+                object_id: partial_distribution[core_type][object_id]
+                for object_id in object_ids
+                if object_id in partial_distribution[core_type]
+            }
+            for core_type, object_ids in changed_objects.items()
+        },
+    )
+
+    _update_db_concerns_state(added=added, removed=removed)
+
+    return added, removed
+
+
 def _retrieve_concerns_of_objects_in_topology(
     topology_objects: TopologyObjectMap, provider_host_mapping: ProviderHostMap
 ) -> OwnObjectConcernMap:
@@ -264,6 +379,96 @@ def _update_db_concerns_state(added: AffectedObjectConcernMap, removed: Affected
             )
 
 
+# PUBLIC clean_up_issues_and_flags_of_objects
+
+
+def clean_up_issues_and_flags_of_objects(
+    objects: Iterable[CoreObjectDescriptor],
+) -> tuple[set[ConcernID], AffectedObjectConcernMap]:
+    """
+    Re-evaluate issues and flags owned by or linked to given objects:
+    concerns of owners that don't exist anymore are deleted,
+    links to objects that are out of concern owner's hierarchy are removed.
+
+    Concerns that aren't related to given objects aren't checked at all.
+
+    Returns IDs of deleted concerns and removed links.
+    """
+    objects_by_type: ConcernRelatedObjects = defaultdict(set)
+    for object_ in objects:
+        objects_by_type[object_.type].add(object_.id)
+
+    if not objects_by_type:
+        return set(), {}
+
+    related_to_objects = Q()
+    for core_type, ids in objects_by_type.items():
+        orm_model = core_type_to_model(core_type)
+        id_field = f"{orm_model.__name__.lower()}_id"
+        related_to_objects |= Q(owner_type=orm_model.class_content_type, owner_id__in=ids) | Q(
+            id__in=orm_model.concerns.through.objects.filter(**{f"{id_field}__in": ids}).values("concernitem_id")
+        )
+
+    concerns: dict[ConcernID, tuple[CoreObjectDescriptor, ConcernType]] = {}
+    owners_by_type: ConcernRelatedObjects = defaultdict(set)
+    for concern_id, type_, owner_id, owner_model in (
+        ConcernItem.objects.filter(related_to_objects, type__in=(ConcernType.ISSUE, ConcernType.FLAG))
+        .values_list("id", "type", "owner_id", "owner_type__model")
+        .distinct()
+    ):
+        owner = CoreObjectDescriptor(id=owner_id, type=model_name_to_core_type(owner_model))
+        concerns[concern_id] = (owner, type_)
+        owners_by_type[owner.type].add(owner.id)
+
+    existing_owners = {
+        CoreObjectDescriptor(id=owner_id, type=core_type)
+        for core_type, ids in owners_by_type.items()
+        for owner_id in core_type_to_model(core_type).objects.values_list("id", flat=True).filter(id__in=ids)
+    }
+
+    deleted = {concern_id for concern_id, (owner, _) in concerns.items() if owner not in existing_owners}
+    if deleted:
+        ConcernItem.objects.filter(id__in=deleted).delete()
+
+    # Targets are the same for all concerns of an owner, except for issues of service/component
+    # that are also distributed by hosts (see `distribute_concern_on_related_objects`)
+    owners_targets: dict[tuple[CoreObjectDescriptor, bool], ConcernRelatedObjects] = {}
+    concerns_targets: dict[ConcernID, ConcernRelatedObjects] = {}
+    for concern_id, (owner, type_) in concerns.items():
+        if concern_id in deleted:
+            continue
+
+        key = (owner, type_ == ConcernType.ISSUE and owner.type in (ADCMCoreType.SERVICE, ADCMCoreType.COMPONENT))
+        if key not in owners_targets:
+            owners_targets[key] = _find_concern_distribution_targets(owner=owner)
+            if key[1]:
+                _distribute_by_hosts(owners_targets[key])
+
+        concerns_targets[concern_id] = owners_targets[key]
+
+    removed: AffectedObjectConcernMap = defaultdict(lambda: defaultdict(set))
+    if not concerns_targets:
+        return deleted, removed
+
+    for core_type in ADCMCoreType:
+        orm_model = core_type_to_model(core_type)
+        id_field = f"{orm_model.__name__.lower()}_id"
+        m2m_model = orm_model.concerns.through
+
+        query = Q()
+        for object_id, concern_id in m2m_model.objects.filter(concernitem_id__in=concerns_targets).values_list(
+            id_field, "concernitem_id"
+        ):
+            if object_id not in concerns_targets[concern_id].get(core_type, ()):
+                removed[core_type][object_id].add(concern_id)
+                query |= Q(concernitem_id=concern_id, **{id_field: object_id})
+
+        if query:
+            m2m_model.objects.filter(query).delete()
+
+    return deleted, removed
+
+
 # PUBLIC distribute_concern_on_related_objects
 
 ConcernRelatedObjects: TypeAlias = dict[ADCMCoreType, set[ObjectID]]
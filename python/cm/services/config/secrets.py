@@ -10,7 +10,71 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ansible.parsing.vault import VaultAES256, VaultSecret
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from hashlib import sha256
+from itertools import chain
+from threading import Lock
+from typing import Callable, Collection, Iterable, TypeVar
+import math
+
+from core.workers import discard_process_pool, get_process_pool
+
+from cm.adcm_config.ansible import vault_decrypt, vault_encrypt
+
+T = TypeVar("T")
+
+# each worker gets several chunks, so one slow chunk doesn't keep others idle
+_CHUNKS_PER_WORKER = 4
+
+
+class _VerifiedCiphertexts:
+    """
+    Bounded LRU set of digests of ciphertexts that are known to be decryptable with the current secret.
+
+    Plain text values aren't stored, only knowledge that ciphertext is valid,
+    so re-saving config with the same secrets doesn't pay for key derivation again.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._digests: OrderedDict[bytes, None] = OrderedDict()
+        self._lock = Lock()
+
+    def __contains__(self, digest: bytes) -> bool:
+        with self._lock:
+            if digest not in self._digests:
+                return False
+
+            self._digests.move_to_end(digest)
+            return True
+
+    def add(self, digest: bytes) -> None:
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._digests[digest] = None
+            self._digests.move_to_end(digest)
+            while len(self._digests) > self._maxsize:
+                self._digests.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._digests.clear()
+
+
+_verified_ciphertexts: _VerifiedCiphertexts | None = None
+
+
+def _get_verified_ciphertexts(maxsize: int) -> _VerifiedCiphertexts:
+    global _verified_ciphertexts  # noqa: PLW0603
+
+    if _verified_ciphertexts is None:
+        _verified_ciphertexts = _VerifiedCiphertexts(maxsize=maxsize)
+
+    return _verified_ciphertexts
 
 
 class AnsibleSecrets:
@@ -26,32 +90,29 @@ class AnsibleSecrets:
             message = "Ansible secret is undefined, work with secrets is impossible"
             raise ValueError(message)
 
-        self._vault = VaultAES256()
-        self._secret = VaultSecret(_bytes=str(secret).encode("utf-8"))
+        self._secret = str(secret).encode("utf-8")
         self._encrypted_header = settings.ANSIBLE_VAULT_HEADER
 
+        self._parallel_threshold = settings.ANSIBLE_VAULT_PARALLEL_THRESHOLD
+        self._workers = settings.ANSIBLE_VAULT_WORKERS
+        self._verified = _get_verified_ciphertexts(maxsize=settings.ANSIBLE_VAULT_CACHE_SIZE)
+
     def reveal_secrets(self, source: dict) -> dict:
         """
         Recursively reveal ansible secrets from given source
         and return all values as new dictionary.
 
+        All secrets found in source are decrypted in one batch,
+        so pass all configs at once (e.g. as values of one dict) when there are many of them.
+
         Note: "nested" secrets are revealed only from `dict` and `list`,
         types like `tuple` and `deque` aren't currently supported.
         """
 
-        result = {}
+        encrypted = list(dict.fromkeys(self._collect_encrypted(source)))
+        revealed = dict(zip(encrypted, self.decrypt_many(encrypted), strict=True))
 
-        for key, value in source.items():
-            if isinstance(value, dict):
-                result[key] = self.reveal_secrets(value)
-            elif isinstance(value, list):
-                result[key] = [entry if not isinstance(entry, dict) else self.reveal_secrets(entry) for entry in value]
-            elif isinstance(value, str):
-                result[key] = self.decrypt(value)
-            else:
-                result[key] = value
-
-        return result
+        return self._replace_strings(source, revealed)
 
     def decrypt(self, value: str) -> str | None:
         """
@@ -61,25 +122,104 @@ class AnsibleSecrets:
         `reveal_secrets` is prefferred.
         """
 
-        if self._encrypted_header not in value:
+        return self.decrypt_many((value,))[0]
+
+    def encrypt(self, value: str) -> str:
+        """
+        Encrypt string value if it's not encrypted yet, otherwise return value itself
+        """
+
+        if self._encrypted_header in value:
             return value
 
-        _, ciphertext = value.split("\n", maxsplit=1)
+        return self.encrypt_many((value,))[0]
 
-        decrypted = self._vault.decrypt(b_vaulttext=ciphertext, secret=self._secret)
+    def decrypt_many(self, values: Collection[str]) -> list[str | None]:
+        """
+        Same as `decrypt`, but for multiple values at once.
+        Large batches are processed by pool of worker processes.
+        """
 
-        if decrypted is None:
-            # for some cases Ansible decryption may return `None` as a valid value
-            return decrypted
+        result: list[str | None] = list(values)
+        positions = [i for i, value in enumerate(values) if self._encrypted_header in value]
+        if not positions:
+            return result
 
-        return decrypted.decode("utf-8")
+        decrypted = self._run(vault_decrypt, [result[i] for i in positions])
+        for i, value in zip(positions, decrypted, strict=True):
+            self._verified.add(self._digest(result[i]))
+            result[i] = value
 
-    def encrypt(self, value: str) -> str:
+        return result
+
+    def encrypt_many(self, values: Collection[str]) -> list[str]:
         """
-        Encrypt string value if it's not encrypted yet, otherwise return value itself
+        Encrypt all given values, it's up to caller to pass only plain ones.
+        Large batches are processed by pool of worker processes.
         """
-        if self._encrypted_header in value:
-            return value
 
-        encrypted = self._vault.encrypt(b_plaintext=bytes(value, "utf-8"), secret=self._secret)
-        return f"{self._encrypted_header}\n{encrypted.decode('utf-8')}"
+        if not values:
+            return []
+
+        encrypted = self._run(partial(vault_encrypt, header=self._encrypted_header), list(values))
+        for value in encrypted:
+            self._verified.add(self._digest(value))
+
+        return encrypted
+
+    def check_decryptable(self, values: Iterable[str]) -> None:
+        """
+        Raise `AnsibleError` if any of given encrypted values can't be decrypted with current secret.
+        Successfully decrypted (or encrypted) values are remembered by process, so only unseen values are decrypted.
+        """
+
+        unchecked = [value for value in dict.fromkeys(values) if self._digest(value) not in self._verified]
+        if unchecked:
+            self.decrypt_many(unchecked)
+
+    def _digest(self, value: str) -> bytes:
+        return sha256(self._secret + b"\0" + value.encode("utf-8")).digest()
+
+    def _run(self, func: Callable[..., list[T]], values: list[str]) -> list[T]:
+        if self._workers < 2 or len(values) < self._parallel_threshold:
+            return func(self._secret, values)
+
+        chunk_size = math.ceil(len(values) / (self._workers * _CHUNKS_PER_WORKER))
+        chunks = [values[start : start + chunk_size] for start in range(0, len(values), chunk_size)]
+
+        # pool is shared and persistent, so workers are started once per process, not on each call
+        pool = get_process_pool(workers=self._workers)
+        try:
+            return list(chain.from_iterable(pool.map(partial(func, self._secret), chunks)))
+        except BrokenProcessPool:
+            # worker may be killed or fail to start, next call will start new pool
+            discard_process_pool(pool)
+
+        return func(self._secret, values)
+
+    def _collect_encrypted(self, source: dict | list) -> Iterable[str]:
+        for value in source.values() if isinstance(source, dict) else source:
+            if isinstance(value, dict):
+                yield from self._collect_encrypted(value)
+            elif isinstance(value, list):
+                yield from self._collect_encrypted([entry for entry in value if isinstance(entry, dict)])
+            elif isinstance(value, str) and self._encrypted_header in value:
+                yield value
+
+    def _replace_strings(self, source: dict, replacements: dict[str, str | None]) -> dict:
+        result = {}
+
+        for key, value in source.items():
+            if isinstance(value, dict):
+                result[key] = self._replace_strings(value, replacements)
+            elif isinstance(value, list):
+                result[key] = [
+                    entry if not isinstance(entry, dict) else self._replace_strings(entry, replacements)
+                    for entry in value
+                ]
+            elif isinstance(value, str):
+                result[key] = replacements.get(value, value)
+            else:
+                result[key] = value
+
+        return result
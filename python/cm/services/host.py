@@ -0,0 +1,115 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import partial
+from typing import Collection
+
+from core.types import ADCMCoreType, ConcernID, CoreObjectDescriptor, ObjectID
+from django.db.transaction import atomic, on_commit
+from rbac.models import re_apply_object_policy
+
+from cm.adcm_config.config import get_prototype_config, process_file_type
+from cm.api import check_license
+from cm.logger import logger
+from cm.models import ConcernCause, ConfigLog, Host, ObjectConfig, ObjectType, Prototype, Provider
+from cm.services.concern import create_config_issues, retrieve_issue
+from cm.services.concern.checks import filter_objects_with_configuration_issues
+from cm.services.concern.locks import get_lock_on_object
+from cm.services.config.spec import retrieve_flat_spec_for_objects
+from cm.services.status.notify import reset_hosts_hc_map
+from cm.status_api import notify_about_redistributed_concerns
+
+
+def create_hosts(provider: Provider, fqdns: Collection[str]) -> list[Host]:
+    """
+    Create hosts of given provider in bulk.
+
+    Unlike creating hosts one by one, number of queries doesn't depend on number of hosts (except for file configs),
+    provider's policies are re-applied once and SS is notified once for all new hosts.
+    Uniqueness of FQDNs should be checked beforehand.
+    """
+
+    if not fqdns:
+        return []
+
+    prototype = Prototype.objects.get(type=ObjectType.HOST, bundle_id=provider.prototype.bundle_id)
+    check_license(prototype=prototype)
+
+    with atomic():
+        spec, _, config, attr = get_prototype_config(prototype=prototype)
+        configs = (
+            _create_initial_configs(config=config, attr=attr, amount=len(fqdns)) if config else [None] * len(fqdns)
+        )
+
+        hosts = Host.objects.bulk_create(
+            Host(prototype=prototype, provider=provider, fqdn=fqdn, config=object_config)
+            for fqdn, object_config in zip(fqdns, configs)
+        )
+
+        if config:
+            for host in hosts:
+                process_file_type(obj=host, spec=spec, conf=config)
+
+        added_concerns = _add_concerns_to_new_hosts(provider=provider, hosts=hosts)
+
+        re_apply_object_policy(apply_object=provider)
+
+    reset_hosts_hc_map(host_ids=[host.id for host in hosts])
+    on_commit(func=partial(notify_about_redistributed_concerns, added=added_concerns, removed=()))
+
+    logger.info("%d hosts are added to provider #%s %s", len(hosts), provider.pk, provider.name)
+
+    return hosts
+
+
+def _create_initial_configs(config: dict, attr: dict, amount: int) -> list[ObjectConfig]:
+    object_configs = ObjectConfig.objects.bulk_create(ObjectConfig(current=0, previous=0) for _ in range(amount))
+    config_logs = ConfigLog.objects.bulk_create(
+        ConfigLog(obj_ref=object_config, config=config, attr=attr, description="init")
+        for object_config in object_configs
+    )
+
+    for object_config, config_log in zip(object_configs, config_logs):
+        object_config.current = config_log.id
+
+    ObjectConfig.objects.bulk_update(object_configs, fields=["current"])
+
+    return object_configs
+
+
+def _add_concerns_to_new_hosts(provider: Provider, hosts: list[Host]) -> list[tuple[ADCMCoreType, ObjectID, ConcernID]]:
+    # new hosts aren't mapped, so their own concerns don't go anywhere, and they only inherit provider's ones
+    provider_concerns = [
+        concern.id
+        for concern in (
+            get_lock_on_object(object_=provider),
+            retrieve_issue(
+                owner=CoreObjectDescriptor(id=provider.id, type=ADCMCoreType.PROVIDER), cause=ConcernCause.CONFIG
+            ),
+        )
+        if concern
+    ]
+
+    own_concerns = []
+    config_spec = next(iter(retrieve_flat_spec_for_objects(prototypes=(hosts[0].prototype_id,)).values()), None)
+    if config_spec:
+        hosts_with_issues = set(filter_objects_with_configuration_issues(config_spec, *hosts))
+        own_concerns = create_config_issues(owners=[host for host in hosts if host.id in hosts_with_issues])
+
+    links = [(host.id, concern_id) for host in hosts for concern_id in provider_concerns]
+    links.extend((concern.owner_id, concern.id) for concern in own_concerns)
+
+    Host.concerns.through.objects.bulk_create(
+        Host.concerns.through(host_id=host_id, concernitem_id=concern_id) for host_id, concern_id in links
+    )
+
+    return [(ADCMCoreType.HOST, host_id, concern_id) for host_id, concern_id in links]
@@ -22,7 +22,6 @@ from core.job.types import Task, TaskMappingDelta
 from core.types import ActionID, ActionTargetDescriptor, BundleID, CoreObjectDescriptor, GeneralEntityDescriptor, HostID
 from django.conf import settings
 from django.db.transaction import atomic
-from rbac.roles import re_apply_policy_for_jobs
 from rest_framework.status import HTTP_409_CONFLICT
 
 from cm.adcm_config.checks import check_attr
@@ -126,7 +125,6 @@ def run_action(
         )
 
         orm_task = TaskLog.objects.get(id=task.id)
-        re_apply_policy_for_jobs(action_object=action_objects.owner, task=orm_task)
 
     if not use_new_job_scheduler():
         start_task(orm_task)
@@ -10,7 +10,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cm.services.job.inventory._base import get_basic_info_for_hosts, get_cluster_vars, get_inventory_data
+from cm.services.job.inventory._base import (
+    get_basic_info_for_hosts,
+    get_cluster_vars,
+    get_inventory_data,
+    get_inventory_stream,
+)
+from cm.services.job.inventory._cache import OBJECTS_CHANGED_MARKER, TaskInventoryCache
 from cm.services.job.inventory._config import get_adcm_configuration, get_config_info, get_objects_configurations
 from cm.services.job.inventory._groups import detect_host_groups_for_cluster_bundle_action
 from cm.services.job.inventory._imports import get_imports_for_inventory
@@ -24,18 +30,21 @@ from cm.services.job.inventory._types import (
 )
 
 __all__ = [
+    "OBJECTS_CHANGED_MARKER",
     "ClusterNode",
     "ClusterVars",
     "ComponentNode",
     "HostNode",
     "ProviderNode",
     "ServiceNode",
+    "TaskInventoryCache",
     "detect_host_groups_for_cluster_bundle_action",
     "get_adcm_configuration",
     "get_basic_info_for_hosts",
     "get_cluster_vars",
     "get_imports_for_inventory",
     "get_inventory_data",
+    "get_inventory_stream",
     "get_objects_configurations",
     "get_config_info",
 ]
@@ -12,7 +12,7 @@
 
 from itertools import chain
 from operator import itemgetter
-from typing import Iterable
+from typing import Generator, Iterable
 
 from core.cluster.operations import calculate_maintenance_mode_for_cluster_objects
 from core.cluster.types import ClusterTopology, MaintenanceModeOfObjects, ObjectMaintenanceModeState
@@ -63,6 +63,10 @@ from cm.services.job.inventory._types import (
     ProviderNode,
     ServiceNode,
 )
+from cm.services.job.json_stream import JSONObjectStream, materialize
+
+# Amount of hosts which configurations are retrieved at once on inventory write
+HOSTS_CHUNK_SIZE = 1000
 
 
 def get_inventory_data(
@@ -71,6 +75,23 @@ def get_inventory_data(
     delta: TaskMappingDelta | None = None,
     related_objects: RelatedObjects | None = None,
 ) -> dict:
+    return materialize(
+        get_inventory_stream(target=target, is_host_action=is_host_action, delta=delta, related_objects=related_objects)
+    )
+
+
+def get_inventory_stream(
+    target: ActionTargetDescriptor,
+    is_host_action: bool,
+    delta: TaskMappingDelta | None = None,
+    related_objects: RelatedObjects | None = None,
+) -> JSONObjectStream:
+    """
+    Prepare inventory which hosts' vars are retrieved in chunks while it's written with `write_json`.
+
+    Such inventory can be consumed only once, use `get_inventory_data` to get it as a regular dict.
+    """
+
     if target.type == ExtraActionTargetType.ACTION_HOST_GROUP:
         # Some time ago `_get_inventory_for_action_from_cluster_bundle` required full ORM object to proceed,
         # now it's not the case, so you can optimize this call if you want to.
@@ -155,7 +176,7 @@ def get_cluster_vars(topology: ClusterTopology) -> ClusterVars:
 
 def _get_inventory_for_action_from_cluster_bundle(
     cluster_id: int, delta: TaskMappingDelta, target_hosts: Iterable[tuple[HostID, HostName]]
-) -> dict:
+) -> JSONObjectStream:
     host_groups: dict[HostGroupName, set[tuple[HostID, HostName]]] = {}
 
     if target_hosts:
@@ -193,9 +214,13 @@ def _get_inventory_for_action_from_cluster_bundle(
         config_host_groups=config_host_groups.values(),
     )
 
+    # hosts are retrieved separately on inventory write
+    objects_except_hosts = {
+        core_type: ids for core_type, ids in objects_in_inventory.items() if core_type != ADCMCoreType.HOST
+    }
     basic_nodes = _get_objects_basic_info(
-        objects_in_inventory=objects_in_inventory,
-        objects_configuration=get_objects_configurations(objects_in_inventory),
+        objects_in_inventory=objects_except_hosts,
+        objects_configuration=get_objects_configurations(objects_except_hosts),
         objects_before_upgrade=objects_before_upgrades,
         objects_maintenance_mode=objects_in_maintenance_mode,
     )
@@ -213,24 +238,12 @@ def _get_inventory_for_action_from_cluster_bundle(
 
     sorted_host_groups = sort_hosts_within_groups(host_groups)
 
-    return {
-        "all": {
-            "children": {
-                group_name: {"hosts": {host_name: {} for _, host_name in host_tuples}}
-                for group_name, host_tuples in sorted_host_groups.items()
-            },
-            "vars": cluster_vars_dict,
-            "hosts": {
-                host_name: basic_nodes[ADCMCoreType.HOST, host_id].model_dump(by_alias=True, exclude_defaults=True)
-                | alternative_host_nodes.get(host_name, {})
-                for host_tuples in sorted_host_groups.values()
-                for host_id, host_name in host_tuples
-            },
-        }
-    }
+    return _compose_inventory(
+        host_groups=sorted_host_groups, inventory_vars=cluster_vars_dict, alternative_host_nodes=alternative_host_nodes
+    )
 
 
-def _get_inventory_for_action_from_provider_bundle(object_: Provider | Host) -> dict:
+def _get_inventory_for_action_from_provider_bundle(object_: Provider | Host) -> JSONObjectStream:
     if isinstance(object_, Provider):
         provider_id = object_.pk
         hosts_group = set(Host.objects.values_list("id", "fqdn").filter(provider=object_))
@@ -255,8 +268,8 @@ def _get_inventory_for_action_from_provider_bundle(object_: Provider | Host) ->
     )
 
     nodes_info = _get_objects_basic_info(
-        objects_in_inventory=objects_in_inventory,
-        objects_configuration=get_objects_configurations(objects_in_inventory),
+        objects_in_inventory={ADCMCoreType.PROVIDER: {provider_id}},
+        objects_configuration=get_objects_configurations({ADCMCoreType.PROVIDER: {provider_id}}),
         objects_before_upgrade=objects_before_upgrades,
         objects_maintenance_mode=MaintenanceModeOfObjects(services={}, components={}, hosts={}),
     )
@@ -271,21 +284,47 @@ def _get_inventory_for_action_from_provider_bundle(object_: Provider | Host) ->
         objects_before_upgrade=objects_before_upgrades,
     )
 
-    return {
-        "all": {
-            "children": {
-                group_name: {
-                    "hosts": {host_name: {} for _, host_name in sorted(hosts_group, key=itemgetter(0))},
-                }
-            },
-            "vars": provider_vars,
-            "hosts": {
-                host_name: nodes_info[ADCMCoreType.HOST, host_id].model_dump(by_alias=True, exclude_defaults=True)
-                | alternative_host_nodes.get(host_name, {})
-                for host_id, host_name in sorted(set(hosts_group), key=itemgetter(0))
-            },
-        }
+    return _compose_inventory(
+        host_groups={group_name: sorted(hosts_group, key=itemgetter(0))},
+        inventory_vars=provider_vars,
+        alternative_host_nodes=alternative_host_nodes,
+    )
+
+
+def _compose_inventory(
+    host_groups: dict[HostGroupName, list[tuple[HostID, HostName]]],
+    inventory_vars: dict,
+    alternative_host_nodes: dict[HostName, dict],
+) -> JSONObjectStream:
+    # host can be in many groups, yet its vars should be written once
+    hosts = list(dict.fromkeys(chain.from_iterable(host_groups.values())))
+
+    children = {
+        group_name: {"hosts": {host_name: {} for _, host_name in host_tuples}}
+        for group_name, host_tuples in host_groups.items()
     }
+    hosts_vars = JSONObjectStream(_iter_hosts_vars(hosts=hosts, alternative_host_nodes=alternative_host_nodes))
+
+    return JSONObjectStream(
+        [("all", JSONObjectStream([("children", children), ("vars", inventory_vars), ("hosts", hosts_vars)]))]
+    )
+
+
+def _iter_hosts_vars(
+    hosts: list[tuple[HostID, HostName]], alternative_host_nodes: dict[HostName, dict]
+) -> Generator[tuple[HostName, JSONObjectStream], None, None]:
+    # Hosts' configurations are the biggest part of inventory for big clusters,
+    # so they are retrieved in chunks to keep memory consumption the same regardless of hosts amount.
+    for start in range(0, len(hosts), HOSTS_CHUNK_SIZE):
+        chunk = hosts[start : start + HOSTS_CHUNK_SIZE]
+        host_nodes = get_basic_info_for_hosts(hosts={host_id for host_id, _ in chunk})
+
+        for host_id, host_name in chunk:
+            host_vars = host_nodes[host_id].model_dump(by_alias=True, exclude_defaults=True)
+            host_vars |= alternative_host_nodes.get(host_name, {})
+            # vars are written key by key, so blocks of alternative vars shared by hosts
+            # from the same config host groups are encoded once (see `write_json`)
+            yield host_name, JSONObjectStream(tuple(host_vars.items()))
 
 
 def _prepare_cluster_vars(
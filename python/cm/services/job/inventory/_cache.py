@@ -0,0 +1,69 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from copy import deepcopy
+from pathlib import Path
+import shutil
+
+from core.job.types import RelatedObjects, TaskMappingDelta
+from core.types import ActionTargetDescriptor
+
+from cm.services.job.inventory._base import get_inventory_stream
+from cm.services.job.json_stream import write_json
+
+# File in job's working directory which presence means
+# that ADCM objects were changed by ansible plugins during this job
+OBJECTS_CHANGED_MARKER = "objects_changed"
+
+
+class TaskInventoryCache:
+    """
+    Inventory file written for one of task's jobs, kept to be reused by the next ones.
+
+    Inventory is built from the same arguments for all jobs of a task (except for changed mapping delta),
+    so while ADCM objects stay the same, there's no need to build it again: copying the file is enough.
+    It's up to the owner of cache to invalidate it after a job that may have changed objects.
+    """
+
+    __slots__ = ("_arguments", "_inventory_file")
+
+    def __init__(self) -> None:
+        self._arguments: tuple | None = None
+        self._inventory_file: Path | None = None
+
+    def write_inventory(
+        self,
+        file: Path,
+        target: ActionTargetDescriptor,
+        is_host_action: bool,
+        delta: TaskMappingDelta | None = None,
+        related_objects: RelatedObjects | None = None,
+    ) -> None:
+        arguments = (target, is_host_action, delta, related_objects)
+
+        if self._inventory_file is not None and self._arguments == arguments and self._inventory_file.is_file():
+            shutil.copyfile(self._inventory_file, file)
+            return
+
+        inventory = get_inventory_stream(
+            target=target, is_host_action=is_host_action, delta=delta, related_objects=related_objects
+        )
+        with file.open(mode="w", encoding="utf-8") as file_descriptor:
+            write_json(inventory, file_descriptor, deduplicate=True)
+
+        # arguments are copied, because mapping delta can be changed in place
+        self._arguments = deepcopy(arguments)
+        self._inventory_file = file
+
+    def invalidate(self) -> None:
+        self._arguments = None
+        self._inventory_file = None
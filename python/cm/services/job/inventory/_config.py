@@ -13,7 +13,7 @@
 from collections import defaultdict
 from copy import deepcopy
 from functools import reduce
-from typing import Any, Iterable, Literal, NamedTuple
+from typing import Any, Callable, Iterable, Literal, NamedTuple
 
 from core.cluster.types import ClusterTopology
 from core.types import (
@@ -63,8 +63,7 @@ def get_config_host_group_alternatives_for_hosts_in_cluster_groups(
         prototypes=(entry.prototype_id for entry in objects_config_info.values())
     )
 
-    result = defaultdict(lambda: deepcopy(cluster_vars))
-
+    groups_vars = {}
     for group in groups_with_hosts:
         configuration, attributes = configurations[group.current_config_id]
         specification = specifications_for_prototypes[objects_config_info[group.owner].prototype_id]
@@ -75,35 +74,38 @@ def get_config_host_group_alternatives_for_hosts_in_cluster_groups(
             config_owner=group.owner,
             config_host_group_id=group.id,
         )
+        groups_vars[group.id] = updated_config, objects_before_upgrade.get((group.owner, group.name), None)
 
-        group_before_upgrade = objects_before_upgrade.get((group.owner, group.name), None)
+    def apply_groups(groups: tuple[ConfigHostGroupInfo, ...]) -> dict:
+        alternative = deepcopy(cluster_vars)
 
-        for host_info in group.hosts:
+        for group in groups:
             node = None
             match group.owner.type:
                 case ADCMCoreType.CLUSTER:
-                    node = result[host_info.name]["cluster"]
+                    node = alternative["cluster"]
                 case ADCMCoreType.SERVICE:
-                    node = result[host_info.name]["services"][topology.services[group.owner.id].info.name]
+                    node = alternative["services"][topology.services[group.owner.id].info.name]
                 case ADCMCoreType.COMPONENT:
                     service = next(
                         (service_ for service_ in topology.services.values() if group.owner.id in service_.components),
                         None,
                     )
                     if service:
-                        node = result[host_info.name]["services"][service.info.name][
-                            service.components[group.owner.id].info.name
-                        ]
+                        node = alternative["services"][service.info.name][service.components[group.owner.id].info.name]
 
             if not node:
                 raise RuntimeError(f"Failed to determine node in `vars` for {group.owner}")
 
+            updated_config, group_before_upgrade = groups_vars[group.id]
             if group_before_upgrade:
                 node["before_upgrade"] = group_before_upgrade
 
             node["config"] = updated_config
 
-    return result
+        return alternative
+
+    return _share_alternatives_between_hosts(groups=groups_with_hosts, apply_groups=apply_groups)
 
 
 def get_config_host_group_alternatives_for_hosts_in_provider_groups(
@@ -132,8 +134,7 @@ def get_config_host_group_alternatives_for_hosts_in_provider_groups(
         prototypes=(entry.prototype_id for entry in objects_config_info.values())
     )
 
-    result = defaultdict(lambda: deepcopy(provider_vars))
-
+    groups_vars = {}
     for group in groups_of_provider_with_hosts:
         configuration, attributes = configurations[group.current_config_id]
         specification = specifications_for_prototypes[objects_config_info[group.owner].prototype_id]
@@ -144,17 +145,45 @@ def get_config_host_group_alternatives_for_hosts_in_provider_groups(
             config_owner=group.owner,
             config_host_group_id=group.id,
         )
+        groups_vars[group.id] = updated_config, objects_before_upgrade.get((group.owner, group.name), None)
 
-        group_before_upgrade = objects_before_upgrade.get((group.owner, group.name), None)
+    def apply_groups(groups: tuple[ConfigHostGroupInfo, ...]) -> dict:
+        alternative = deepcopy(provider_vars)
 
-        for host_info in group.hosts:
-            node = result[host_info.name]["provider"]
+        for group in groups:
+            node = alternative["provider"]
 
+            updated_config, group_before_upgrade = groups_vars[group.id]
             if group_before_upgrade:
                 node["before_upgrade"] = group_before_upgrade
 
             node["config"] = updated_config
 
+        return alternative
+
+    return _share_alternatives_between_hosts(groups=groups_of_provider_with_hosts, apply_groups=apply_groups)
+
+
+def _share_alternatives_between_hosts(
+    groups: Iterable[ConfigHostGroupInfo], apply_groups: Callable[[tuple[ConfigHostGroupInfo, ...]], dict]
+) -> dict[str, dict]:
+    # Hosts that are in the same config host groups get identical vars,
+    # so they are built once for each combination of groups and shared between such hosts.
+    # It saves a lot of memory for big clusters, yet result shouldn't be changed in place.
+    hosts_groups = defaultdict(list)
+    for group in groups:
+        for host_info in group.hosts:
+            hosts_groups[host_info.name].append(group)
+
+    alternatives = {}
+    result = {}
+    for host_name, host_groups in hosts_groups.items():
+        key = tuple(group.id for group in host_groups)
+        if key not in alternatives:
+            alternatives[key] = apply_groups(tuple(host_groups))
+
+        result[host_name] = alternatives[key]
+
     return result
 
 
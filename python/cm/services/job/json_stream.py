@@ -0,0 +1,111 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, TextIO
+import json
+
+# Amount of last encoded blocks remembered when deduplication is enabled
+DEDUPLICATION_MEMO_SIZE = 256
+
+
+class JSONObjectStream:
+    """
+    JSON object which items are produced on demand, so it doesn't have to be kept in memory as a whole.
+
+    Values can be streams themselves.
+    Items are consumed on write, so stream built from a generator can be written only once.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[tuple[str, Any]]) -> None:
+        self._items = items
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        return iter(self._items)
+
+
+def write_json(obj: Any, file: TextIO, *, sort_keys: bool = False, deduplicate: bool = False) -> None:
+    """
+    Write `obj` to `file` as compact JSON, consuming streams item by item.
+
+    Regular values are encoded as a whole, keys of streams are written in the order they're produced.
+    With `deduplicate` the same dict or list object met again as a value of stream
+    (e.g. config block shared by many hosts) isn't encoded again and its previously encoded text is written instead.
+    """
+
+    encode = json.JSONEncoder(separators=(",", ":"), sort_keys=sort_keys).encode
+    if deduplicate:
+        encode = _MemoizedEncoder(encode=encode, maxsize=DEDUPLICATION_MEMO_SIZE)
+
+    _write(obj=obj, write=file.write, encode=encode)
+
+
+def materialize(obj: Any) -> Any:
+    """
+    Convert streams to regular dicts, so the result can be used as an ordinary JSON-like structure.
+
+    Dicts and lists are copied, so blocks shared by stream items (see `write_json`)
+    aren't shared in result and it can be modified freely.
+    """
+
+    if isinstance(obj, JSONObjectStream):
+        return {key: materialize(value) for key, value in obj}
+
+    if isinstance(obj, dict):
+        return {key: materialize(value) for key, value in obj.items()}
+
+    if isinstance(obj, list):
+        return [materialize(value) for value in obj]
+
+    return obj
+
+
+def _write(obj: Any, write: Callable[[str], Any], encode: Callable[[Any], str]) -> None:
+    if not isinstance(obj, JSONObjectStream):
+        write(encode(obj))
+        return
+
+    write("{")
+
+    separator = ""
+    for key, value in obj:
+        write(f"{separator}{encode(key)}:")
+        _write(obj=value, write=write, encode=encode)
+        separator = ","
+
+    write("}")
+
+
+class _MemoizedEncoder:
+    def __init__(self, encode: Callable[[Any], str], maxsize: int) -> None:
+        self._encode = encode
+        self._maxsize = maxsize
+        self._encoded: OrderedDict[int, tuple[dict | list, str]] = OrderedDict()
+
+    def __call__(self, value: Any) -> str:
+        if not isinstance(value, (dict, list)):
+            return self._encode(value)
+
+        key = id(value)
+        if (entry := self._encoded.get(key)) is not None:
+            self._encoded.move_to_end(key)
+            return entry[1]
+
+        text = self._encode(value)
+        # value itself is kept to prevent its `id` from being reused by another object while it's remembered
+        self._encoded[key] = (value, text)
+        if len(self._encoded) > self._maxsize:
+            self._encoded.popitem(last=False)
+
+        return text
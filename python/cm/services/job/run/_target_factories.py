@@ -16,7 +16,6 @@ from functools import partial
 from logging import getLogger
 from pathlib import Path
 from typing import Any, Generator, Iterable, Literal
-import json
 import traceback
 
 from ansible_plugin.utils import finish_check
@@ -28,12 +27,17 @@ from core.types import ADCMCoreType, ClusterID, ComponentNameKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.transaction import atomic
-from rbac.roles import re_apply_policy_for_jobs
 
 from cm.errors import AdcmEx
 from cm.models import AnsibleConfig, Cluster, Component, LogStorage, Prototype, TaskLog
 from cm.services.cluster import retrieve_cluster_topology
-from cm.services.job.inventory import get_adcm_configuration, get_inventory_data
+from cm.services.job.inventory import (
+    OBJECTS_CHANGED_MARKER,
+    TaskInventoryCache,
+    get_adcm_configuration,
+    get_inventory_data,
+)
+from cm.services.job.json_stream import write_json
 from cm.services.job.run.executors import (
     AnsibleExecutorConfig,
     AnsibleProcessExecutor,
@@ -70,11 +74,15 @@ class ExecutionTargetFactory:
     def __call__(
         self, task: Task, jobs: Iterable[Job], configuration: ExternalSettings
     ) -> Generator[ExecutionTarget, None, None]:
+        # inventory is shared between jobs of one task until some job changes ADCM objects
+        inventory_cache = TaskInventoryCache()
+
         for job_info in jobs:
             work_dir = configuration.adcm.run_dir / str(job_info.id)
             finalizers = (
                 partial(save_fs_logs_to_db, work_dir=work_dir, log_type="stderr"),
                 partial(save_fs_logs_to_db, work_dir=work_dir, log_type="stdout"),
+                partial(invalidate_inventory_if_objects_changed, work_dir=work_dir, inventory_cache=inventory_cache),
             )
             match job_info.type:
                 case ScriptType.ANSIBLE:
@@ -90,7 +98,7 @@ class ExecutionTargetFactory:
                         )
                     )
                     finalizers = (*self._default_ansible_finalizers, *finalizers)
-                    environment_builders = (prepare_ansible_environment,)
+                    environment_builders = (partial(prepare_ansible_environment, inventory_cache=inventory_cache),)
                 case ScriptType.PYTHON:
                     executor = PythonProcessExecutor(
                         config=BundleExecutorConfig(
@@ -132,8 +140,6 @@ def internal_script_bundle_switch(task: Task, job: Job) -> int:
     bundle_switch(obj=task_.task_object, upgrade=task_.action.upgrade)
     _switch_hc_if_required(task=task)
 
-    re_apply_policy_for_jobs(action_object=task_.task_object, task=task_)
-
     return 0
 
 
@@ -159,8 +165,6 @@ def internal_script_bundle_revert(task: Task, job: Job) -> int:
 
     _switch_hc_if_required(task=task)
 
-    re_apply_policy_for_jobs(action_object=task_.task_object, task=task_)
-
     return 0
 
 
@@ -251,15 +255,17 @@ def _switch_hc_if_required(task: Task) -> None:
 # ENVIRONMENT BUILDERS
 
 
-def prepare_ansible_environment(task: Task, job: Job, configuration: ExternalSettings) -> None:
+def prepare_ansible_environment(
+    task: Task, job: Job, configuration: ExternalSettings, inventory_cache: TaskInventoryCache | None = None
+) -> None:
     job_config = prepare_ansible_job_config(task=task, job=job, configuration=configuration)
     job_run_dir = configuration.adcm.run_dir / str(job.id)
     with (job_run_dir / "config.json").open(mode="w", encoding="utf-8") as config_file:
-        json.dump(obj=job_config, fp=config_file, sort_keys=True, separators=(",", ":"))
+        write_json(job_config, config_file, sort_keys=True)
 
-    inventory = prepare_ansible_inventory(task=task)
-    with (job_run_dir / "inventory.json").open(mode="w", encoding="utf-8") as file_descriptor:
-        json.dump(obj=inventory, fp=file_descriptor, separators=(",", ":"))
+    (inventory_cache or TaskInventoryCache()).write_inventory(
+        file=job_run_dir / "inventory.json", **_get_inventory_arguments(task=task)
+    )
 
     ansible_cfg_config_parser: ConfigParser = prepare_ansible_cfg(task=task)
     with (job_run_dir / "ansible.cfg").open(mode="w", encoding="utf-8") as config_file:
@@ -267,6 +273,10 @@ def prepare_ansible_environment(task: Task, job: Job, configuration: ExternalSet
 
 
 def prepare_ansible_inventory(task: Task) -> dict[str, Any]:
+    return get_inventory_data(**_get_inventory_arguments(task=task))
+
+
+def _get_inventory_arguments(task: Task) -> dict[str, Any]:
     delta = None
     if task.action.hc_acl:
         cluster_id = None
@@ -282,12 +292,12 @@ def prepare_ansible_inventory(task: Task) -> dict[str, Any]:
 
         delta = task.hostcomponent.mapping_delta
 
-    return get_inventory_data(
-        target=task.target,
-        is_host_action=task.action.is_host_action,
-        delta=delta,
-        related_objects=task.owner.related_objects,
-    )
+    return {
+        "target": task.target,
+        "is_host_action": task.action.is_host_action,
+        "delta": delta,
+        "related_objects": task.owner.related_objects,
+    }
 
 
 def prepare_ansible_job_config(task: Task, job: Job, configuration: ExternalSettings) -> dict[str, Any]:
@@ -420,6 +430,12 @@ def finish_check_logs(job: Job) -> None:
     finish_check(job.id)
 
 
+def invalidate_inventory_if_objects_changed(job: Job, work_dir: Path, inventory_cache: TaskInventoryCache) -> None:
+    # python and internal scripts change objects directly, so there's no way to tell whether they did
+    if job.type != ScriptType.ANSIBLE or (work_dir / OBJECTS_CHANGED_MARKER).exists():
+        inventory_cache.invalidate()
+
+
 def save_fs_logs_to_db(job: Job, work_dir: Path, log_type: Literal["stdout", "stderr"]) -> None:
     log_path = work_dir / f"{job.type.value}-{log_type}.txt"
     if not log_path.is_file():
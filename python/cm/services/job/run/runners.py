@@ -11,7 +11,7 @@
 # limitations under the License.
 
 from logging import Logger
-from typing import Any, Protocol
+from typing import Any, Collection, Protocol
 import os
 import signal
 
@@ -20,6 +20,7 @@ from core.job.runners import ExecutionTarget, RunnerRuntime, TaskRunner
 from core.job.types import ExecutionStatus, Job, Task, TaskOwner
 from core.types import (
     ADCMCoreType,
+    ClusterID,
     CoreObjectDescriptor,
 )
 
@@ -58,6 +59,9 @@ class StatusServerInteractor(Protocol):
     def reset_hc_map(self) -> Any:
         ...
 
+    def reset_clusters_hc_map(self, cluster_ids: Collection[ClusterID]) -> Any:
+        ...
+
 
 class JobSequenceRunner(TaskRunner):
     _notifier: EventNotifier
@@ -285,7 +289,13 @@ class JobSequenceRunner(TaskRunner):
             self._logger.exception("Error loading mm objects on task finish")
 
         try:
-            self._status_server.reset_hc_map()
+            # action can only change mapping of its own cluster,
+            # but actions out of cluster context may add/remove hosts anywhere
+            cluster_id = finished_task.selector.get("cluster", {}).get("id")
+            if cluster_id:
+                self._status_server.reset_clusters_hc_map(cluster_ids=(cluster_id,))
+            else:
+                self._status_server.reset_hc_map()
         except:  # noqa: E722
             self._logger.exception("Error loading host-component map on task finish")
 
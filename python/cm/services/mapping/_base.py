@@ -43,12 +43,13 @@ from cm.services.concern.distribution import (
     AffectedObjectConcernMap,
     lock_objects,
     redistribute_issues_and_flags,
+    redistribute_issues_and_flags_on_mapping_change,
     unlock_objects,
 )
 from cm.services.concern.locks import retrieve_lock_on_object
 from cm.services.config_host_group import ConfigHostGroupRepo
 from cm.services.mapping._repo import _apply_mapping_delta_in_db, lock_cluster_mapping
-from cm.services.status.notify import reset_hc_map, reset_objects_in_mm
+from cm.services.status.notify import reset_clusters_hc_map, reset_objects_in_mm
 from cm.status_api import notify_about_redistributed_concerns_from_maps, send_host_component_map_update_event
 
 
@@ -171,14 +172,17 @@ def _change_host_component_mapping(
 
     # updates of related entities
     added, removed = _update_concerns(
-        old_topology=current_topology, new_topology=new_topology, bundle_restrictions=bundle_restrictions
+        old_topology=current_topology,
+        new_topology=new_topology,
+        mapping_delta=mapping_delta,
+        bundle_restrictions=bundle_restrictions,
     )
     ActionHostGroupRepo().remove_unmapped_hosts_from_groups(host_difference.unmapped)
     ConfigHostGroupRepo().remove_unmapped_hosts_from_groups(host_difference.unmapped)
     _update_policies(topology=new_topology)
 
     # update info in statistics service
-    reset_hc_map()
+    reset_clusters_hc_map(cluster_ids=(cluster_id,))
     reset_objects_in_mm()
     send_host_component_map_update_event(cluster_id=cluster_id)
     notify_about_redistributed_concerns_from_maps(added=added, removed=removed)
@@ -247,15 +251,27 @@ def _retrieve_delta_from_new_mapping(
 
 
 def _update_concerns(
-    old_topology: ClusterTopology, new_topology: ClusterTopology, bundle_restrictions: BundleRestrictions
+    old_topology: ClusterTopology,
+    new_topology: ClusterTopology,
+    mapping_delta: TaskMappingDelta,
+    bundle_restrictions: BundleRestrictions,
 ) -> tuple[AffectedObjectConcernMap, AffectedObjectConcernMap]:
     cluster = CoreObjectDescriptor(id=old_topology.cluster_id, type=ADCMCoreType.CLUSTER)
+    cluster_issue_created = False
     if not cluster_mapping_has_issue(cluster_id=cluster.id, bundle_restrictions=bundle_restrictions):
+        # links to deleted issue are deleted with it, so it doesn't require full redistribution
         delete_issue(owner=cluster, cause=ConcernCause.HOSTCOMPONENT)
     elif retrieve_issue(owner=cluster, cause=ConcernCause.HOSTCOMPONENT) is None:
         create_issue(owner=cluster, cause=ConcernCause.HOSTCOMPONENT)
-
-    added, removed = redistribute_issues_and_flags(topology=new_topology)
+        cluster_issue_created = True
+
+    if cluster_issue_created:
+        # new cluster's concern affects every object in cluster
+        added, removed = redistribute_issues_and_flags(topology=new_topology)
+    else:
+        added, removed = redistribute_issues_and_flags_on_mapping_change(
+            topology=new_topology, mapping_delta=mapping_delta
+        )
 
     lock = retrieve_lock_on_object(object_=cluster)
     if lock:
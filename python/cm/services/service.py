@@ -117,8 +117,15 @@ def delete_service_from_api(service: Service) -> Response:
         prototype_id=service.prototype_id,
         name=settings.ADCM_DELETE_SERVICE_ACTION_NAME,
     ).first()
-    topology_without_service = retrieve_cluster_topology(service.cluster_id)
-    service_topology = topology_without_service.services.pop(service.pk)
+    cluster_topology = retrieve_cluster_topology(service.cluster_id)
+    service_topology = cluster_topology.services[service.pk]
+    topology_without_service = cluster_topology._replace(
+        services={
+            service_id: topology
+            for service_id, topology in cluster_topology.services.items()
+            if service_id != service.pk
+        }
+    )
     related_mapping_exists = any(
         chain.from_iterable(
             component_topology.hosts.keys() for component_topology in service_topology.components.values()
@@ -10,9 +10,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
 from contextlib import suppress
-from typing import TypeAlias
+from functools import cached_property
+from threading import Lock
+from typing import NamedTuple, TypeAlias
+import time
 
+from django.conf import settings
 from pydantic import (
     BaseModel,
     Field,
@@ -50,10 +55,48 @@ class _ClusterStatusEntry(_StatusEntry):
     hosts: dict[StringID, _StatusEntry]
 
 
+class _StatusIndex(NamedTuple):
+    clusters: dict[RawStatus, set[StringID]]
+    services: dict[RawStatus, set[StringID]]
+    components: dict[RawStatus, set[StringID]]
+    hosts: dict[RawStatus, set[StringID]]
+
+
 class FullStatusMap(BaseModel):
     clusters: dict[StringID, _ClusterStatusEntry] = Field(default_factory=dict)
     hosts: dict[StringID, _StatusEntry] = Field(default_factory=dict)
 
+    @cached_property
+    def status_index(self) -> _StatusIndex:
+        """Reverse index: status -> ids of objects with such status (built once per map)"""
+        index = _StatusIndex(
+            clusters=defaultdict(set), services=defaultdict(set), components=defaultdict(set), hosts=defaultdict(set)
+        )
+
+        for cluster_id, cluster_info in self.clusters.items():
+            index.clusters[cluster_info.status].add(cluster_id)
+            for service_id, service_info in cluster_info.services.items():
+                index.services[service_info.status].add(service_id)
+                for component_id, component_info in service_info.components.items():
+                    index.components[component_info.status].add(component_id)
+
+        for host_id, host_info in self.hosts.items():
+            index.hosts[host_info.status].add(host_id)
+
+        return index
+
+    def get_cluster_ids_with_status(self, status: RawStatus) -> set[StringID]:
+        return self.status_index.clusters.get(status, set())
+
+    def get_service_ids_with_status(self, status: RawStatus) -> set[StringID]:
+        return self.status_index.services.get(status, set())
+
+    def get_component_ids_with_status(self, status: RawStatus) -> set[StringID]:
+        return self.status_index.components.get(status, set())
+
+    def get_host_ids_with_status(self, status: RawStatus) -> set[StringID]:
+        return self.status_index.hosts.get(status, set())
+
     def get_for_cluster(self, cluster_id: IntegerID) -> RawStatus | None:
         with suppress(KeyError):
             return self.clusters[str(cluster_id)].status
@@ -93,20 +136,66 @@ class FullStatusMap(BaseModel):
         )
 
 
+class _StatusMapCache:
+    """
+    Process-local storage of the last status map retrieved from SS.
+
+    Map is reused for `settings.STATUS_MAP_CACHE_TIMEOUT` seconds,
+    so all status filters and serializers of one request (and of concurrent ones) share single SS call.
+    Only successfully retrieved maps are stored, so unavailable SS is asked again on next call.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._status_map: FullStatusMap | None = None
+        self._expires_at = 0.0
+
+    def get(self) -> FullStatusMap:
+        with self._lock:
+            if self._status_map is not None and time.monotonic() < self._expires_at:
+                return self._status_map
+
+            status_map = _request_status_map()
+            if status_map is None:
+                self._status_map = None
+                return FullStatusMap()
+
+            self._status_map = status_map
+            self._expires_at = time.monotonic() + settings.STATUS_MAP_CACHE_TIMEOUT
+
+            return status_map
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._status_map = None
+
+
+_status_map_cache = _StatusMapCache()
+
+
 def retrieve_status_map() -> FullStatusMap:
+    return _status_map_cache.get()
+
+
+def invalidate_status_map_cache() -> None:
+    """Should be called when statuses are known to be changed by ADCM itself (e.g. HC map is changed)"""
+    _status_map_cache.invalidate()
+
+
+def _request_status_map() -> FullStatusMap | None:
     response = api_request(method="get", url="all/")
     if not response:
-        return FullStatusMap()
+        return None
 
     try:
         body = response.json()
     except JSONDecodeError:
-        return FullStatusMap()
+        return None
 
     if not isinstance(body, dict):
-        return FullStatusMap()
+        return None
 
     try:
         return FullStatusMap(**body)
     except ValidationError:
-        return FullStatusMap()
+        return None
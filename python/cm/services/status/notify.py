@@ -11,53 +11,121 @@
 # limitations under the License.
 
 from collections import defaultdict
+from collections.abc import Collection
 from functools import wraps
 
 from core.cluster.operations import calculate_maintenance_mode_for_cluster_objects
 from core.cluster.types import ObjectMaintenanceModeState
+from core.types import ClusterID, HostID
 from requests import Response
+from rest_framework.status import HTTP_200_OK
 
 from cm.models import Cluster, Component, Host, HostComponent, Service
 from cm.services.cluster import (
     retrieve_clusters_objects_maintenance_mode,
     retrieve_multiple_clusters_topology,
 )
+from cm.services.status.client import invalidate_status_map_cache
 from cm.status_api import api_request
 
 
 def reset_hc_map() -> None:
     """Send request to SS with new HC map of all clusters"""
+    hc_map, comps, services, hosts = _retrieve_hc_map_parts(cluster_ids=None)
+
+    data = {
+        "hostservice": hc_map,
+        "component": comps,
+        "service": services,
+        "host": {cluster_id or 0: host_ids for cluster_id, host_ids in hosts.items()},
+    }
+    api_request(method="post", url="servicemap/", data=data)
+    invalidate_status_map_cache()
+
+
+def reset_clusters_hc_map(cluster_ids: Collection[ClusterID]) -> None:
+    """
+    Send request to SS with HC map of given clusters only, it replaces their previous parts of the map.
+
+    Deleted clusters should be passed too: their parts will be dropped from the map,
+    and their hosts will be treated as hosts without cluster.
+    """
+    if not cluster_ids:
+        return
+
+    hc_map, comps, services, hosts = _retrieve_hc_map_parts(cluster_ids=cluster_ids)
+
+    clusters = {
+        cluster_id: {"hostservice": {}, "component": {}, "service": [], "host": []} for cluster_id in cluster_ids
+    }
+    for key, entry in hc_map.items():
+        clusters[entry["cluster"]]["hostservice"][key] = entry
+
+    for cluster_id in cluster_ids:
+        clusters[cluster_id]["component"] = comps.get(str(cluster_id), {})
+        clusters[cluster_id]["service"] = services.get(cluster_id, [])
+        clusters[cluster_id]["host"] = hosts.get(cluster_id, [])
+
+    _send_hc_map_delta(data={"clusters": clusters})
+
+
+def reset_hosts_hc_map(host_ids: Collection[HostID]) -> None:
+    """
+    Send request to SS with actual cluster of given hosts.
+    Hosts that don't exist anymore (or aren't monitored) are dropped from the map.
+    """
+    if not host_ids:
+        return
+
+    hosts = {host_id: None for host_id in host_ids}
+    for host_id, cluster_id in Host.objects.values_list("id", "cluster_id").filter(
+        id__in=host_ids, prototype__monitoring="active"
+    ):
+        hosts[host_id] = cluster_id or 0
+
+    _send_hc_map_delta(data={"hosts": hosts})
+
+
+def _send_hc_map_delta(data: dict) -> None:
+    response = api_request(method="post", url="servicemap/delta/", data=data)
+    if response is not None and response.status_code != HTTP_200_OK:
+        # SS hasn't got full map yet (e.g. it was restarted) or failed to apply delta, so full map is sent
+        reset_hc_map()
+        return
+
+    invalidate_status_map_cache()
+
+
+def _retrieve_hc_map_parts(
+    cluster_ids: Collection[ClusterID] | None,
+) -> tuple[dict, dict[str, dict[str, list]], dict[ClusterID, list], dict[ClusterID | None, list]]:
     comps = defaultdict(lambda: defaultdict(list))
     hosts = defaultdict(list)
     hc_map = {}
     services = defaultdict(list)
 
-    for cluster_id, service_id, component_id, host_id in (
-        HostComponent.objects.values_list("cluster_id", "service_id", "component_id", "host_id")
-        .exclude(
-            component_id__in=Component.objects.values_list("id", flat=True).filter(prototype__monitoring="passive")
-        )
-        .order_by("id")
-    ):
+    hc_query = HostComponent.objects.values_list("cluster_id", "service_id", "component_id", "host_id").exclude(
+        component_id__in=Component.objects.values_list("id", flat=True).filter(prototype__monitoring="passive")
+    )
+    hosts_query = Host.objects.values_list("id", "cluster_id").filter(prototype__monitoring="active")
+    services_query = Service.objects.values_list("id", "cluster_id").filter(prototype__monitoring="active")
+    if cluster_ids is not None:
+        hc_query = hc_query.filter(cluster_id__in=cluster_ids)
+        hosts_query = hosts_query.filter(cluster_id__in=cluster_ids)
+        services_query = services_query.filter(cluster_id__in=cluster_ids)
+
+    for cluster_id, service_id, component_id, host_id in hc_query.order_by("id"):
         key = f"{host_id}.{component_id}"
         hc_map[key] = {"cluster": cluster_id, "service": service_id}
         comps[str(cluster_id)][str(service_id)].append(key)
 
-    for host_id, cluster_id in Host.objects.values_list("id", "cluster_id").filter(prototype__monitoring="active"):
-        hosts[cluster_id or 0].append(host_id)
+    for host_id, cluster_id in hosts_query:
+        hosts[cluster_id].append(host_id)
 
-    for service_id, cluster_id in Service.objects.values_list("id", "cluster_id").filter(
-        prototype__monitoring="active"
-    ):
+    for service_id, cluster_id in services_query:
         services[cluster_id].append(service_id)
 
-    data = {
-        "hostservice": hc_map,
-        "component": comps,
-        "service": services,
-        "host": hosts,
-    }
-    api_request(method="post", url="servicemap/", data=data)
+    return hc_map, comps, services, hosts
 
 
 def reset_objects_in_mm() -> Response | None:
@@ -86,7 +154,7 @@ def reset_objects_in_mm() -> Response | None:
             entry_id for entry_id, mm in cluster_objects_mm.hosts.items() if mm == ObjectMaintenanceModeState.ON
         }
 
-    return api_request(
+    response = api_request(
         method="post",
         url="object/mm/",
         data={
@@ -95,6 +163,9 @@ def reset_objects_in_mm() -> Response | None:
             "hosts": list(host_ids),
         },
     )
+    invalidate_status_map_cache()
+
+    return response
 
 
 def update_mm_objects(func):
@@ -0,0 +1,124 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from threading import Condition, Lock, Thread
+from urllib.parse import urljoin
+import os
+import json
+import atexit
+
+from django.conf import settings
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
+import requests
+
+from cm.logger import logger
+
+SerializedEvent = str
+
+
+class _EventOutbox:
+    """
+    Process-local queue of events for SS.
+
+    Events are put to queue without waiting for SS and sent by background thread
+    in batches of `settings.STATUS_EVENTS_BATCH_SIZE` over single keep-alive connection.
+    Sender waits `settings.STATUS_EVENTS_FLUSH_INTERVAL` seconds before sending not full batch,
+    so events of one operation (e.g. concerns redistribution) are delivered together.
+    Identical events following each other within one batch are sent once, order of events is kept.
+    Batch is sent up to `settings.STATUS_EVENTS_SEND_ATTEMPTS` times if SS doesn't respond.
+
+    Events left in queue of `event_outbox` are sent on interpreter exit,
+    so short-living processes (like job runners) don't lose them.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        # after fork parent's state (including possibly held locks and dead sender thread) is useless for child
+        self._condition = Condition()
+        self._send_lock = Lock()
+        self._pending: deque[SerializedEvent] = deque()
+        self._sender: Thread | None = None
+        self._session: requests.Session | None = None
+
+    def put(self, event: dict) -> None:
+        with self._condition:
+            self._pending.append(json.dumps(event, sort_keys=True))
+
+            if self._sender is None or not self._sender.is_alive():
+                self._sender = Thread(target=self._run, name="ss-event-sender", daemon=True)
+                self._sender.start()
+
+            # sender is woken up when it's idle (nothing was queued) or when batch is full,
+            # in between it's waiting for the rest of batch
+            if len(self._pending) == 1 or len(self._pending) >= settings.STATUS_EVENTS_BATCH_SIZE:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Send all queued events right away"""
+        with self._send_lock:
+            while batch := self._take_batch():
+                self._send(batch=batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                if len(self._pending) < settings.STATUS_EVENTS_BATCH_SIZE:
+                    self._condition.wait(timeout=settings.STATUS_EVENTS_FLUSH_INTERVAL)
+
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to send events to status server")
+
+    def _take_batch(self) -> list[SerializedEvent]:
+        with self._condition:
+            size = min(len(self._pending), settings.STATUS_EVENTS_BATCH_SIZE)
+            return [self._pending.popleft() for _ in range(size)]
+
+    def _send(self, batch: list[SerializedEvent]) -> None:
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(
+                {"Content-Type": "application/json", "Authorization": f"Token {settings.ADCM_TOKEN}"}
+            )
+
+        url = urljoin(settings.API_URL, "event/batch/")
+        data = f"[{','.join(coalesce_events(batch))}]"
+
+        for attempt in range(1, settings.STATUS_EVENTS_SEND_ATTEMPTS + 1):
+            try:
+                response = self._session.post(url=url, data=data, timeout=settings.STATUS_REQUEST_TIMEOUT)
+                break
+            except requests.exceptions.Timeout:
+                logger.warning("post request to %s timed out (attempt %d)", url, attempt)
+            except requests.exceptions.ConnectionError:
+                logger.warning("post request to %s connection failed (attempt %d)", url, attempt)
+        else:
+            logger.error("post request to %s failed, %d events are lost", url, len(batch))
+            return
+
+        if response.status_code not in {HTTP_200_OK, HTTP_201_CREATED}:
+            logger.error("post %s error %d: %s", url, response.status_code, response.text)
+
+
+def coalesce_events(events: list[SerializedEvent]) -> list[SerializedEvent]:
+    # only repeats are dropped: moving event over the others may change result of applying them on client side
+    return [event for position, event in enumerate(events) if position == 0 or events[position - 1] != event]
+
+
+event_outbox = _EventOutbox()
+os.register_at_fork(after_in_child=event_outbox._reset)
+atexit.register(event_outbox.flush)
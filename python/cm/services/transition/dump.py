@@ -263,9 +263,11 @@ def retrieve_bundles_info(ids: set[BundleID]) -> dict[BundleHash, BundleExtraInf
 
 
 def fill_configurations(config_acc: ConfigUpdateAcc) -> None:
-    secrets = AnsibleSecrets()
-
+    configs = {}
     for config_id, config, attr in ConfigLog.objects.filter(id__in=config_acc).values_list("id", "config", "attr"):
-        target = config_acc[config_id]
-        target.config = secrets.reveal_secrets(config)
-        target.attr = attr
+        configs[config_id] = config
+        config_acc[config_id].attr = attr
+
+    # secrets of all configs are revealed at once to process them in one batch
+    for config_id, config in AnsibleSecrets().reveal_secrets(configs).items():
+        config_acc[config_id].config = config
@@ -12,6 +12,7 @@
 
 from collections import defaultdict
 from collections.abc import Iterable
+from typing import NamedTuple
 from urllib.parse import urljoin
 import json
 
@@ -41,6 +42,20 @@ from cm.models import (
     Service,
 )
 from cm.services.concern.distribution import AffectedObjectConcernMap, ConcernRelatedObjects
+from cm.services.status.outbox import event_outbox
+
+
+class ObjectsStatuses(NamedTuple):
+    """
+    Raw statuses of multiple objects retrieved from SS with one request (see `retrieve_objects_statuses`).
+    `get_*_status` functions use it instead of request per object, objects absent in it are requested separately.
+    """
+
+    clusters: dict[int, int]
+    services: dict[int, int]
+    components: dict[int, int]
+    hosts: dict[int, int]
+    host_components: dict[tuple[int, int], int]
 
 
 class EventTypes:
@@ -78,16 +93,17 @@ def api_request(method: str, url: str, data: dict = None) -> Response | None:
         return None
 
 
-def post_event(event: str, object_id: int | None, changes: dict | None = None) -> Response | None:
+def post_event(event: str, object_id: int | None, changes: dict | None = None) -> None:
+    """Queue event for SS, it's sent in background together with other ones (see `event_outbox`)"""
     if object_id is None:
-        return None
+        return
 
-    data = {
-        "event": event,
-        "object": {"id": object_id, **({"changes": changes} if changes else {})},
-    }
-
-    return api_request(method="post", url="event/", data=data)
+    event_outbox.put(
+        event={
+            "event": event,
+            "object": {"id": object_id, **({"changes": changes} if changes else {})},
+        }
+    )
 
 
 def fix_object_type(type_: str) -> str:
@@ -113,8 +129,8 @@ def send_concern_delete_event(object_id: int, object_type: str, concern_id: int)
     )
 
 
-def send_delete_service_event(service_id: int) -> Response | None:
-    return post_event(
+def send_delete_service_event(service_id: int) -> None:
+    post_event(
         event=EventTypes.DELETE_SERVICE,
         object_id=service_id,
     )
@@ -173,6 +189,25 @@ def send_prototype_and_state_update_event(object_: ADCMEntity) -> None:
     )
 
 
+def invalidate_auth_cache(
+    tokens: Iterable[str] = (), sessions: Iterable[str] = (), drop_all: bool = False
+) -> Response | None:
+    """
+    Make SS forget cached results of auth checks for given credentials (or all of them).
+
+    It's best-effort: failure doesn't break caller (e.g. logout), cached results expire in SS anyway.
+    """
+    try:
+        return api_request(
+            method="post",
+            url="auth/invalidate/",
+            data={"tokens": list(tokens), "sessions": list(sessions), "all": drop_all},
+        )
+    except requests.exceptions.RequestException:
+        logger.exception("Failed to invalidate auth cache of status server")
+        return None
+
+
 def get_raw_status(url: str) -> int:
     response = api_request(method="get", url=url)
     if response is None:
@@ -188,6 +223,57 @@ def get_raw_status(url: str) -> int:
     return settings.EMPTY_STATUS_STATUS_CODE
 
 
+def retrieve_objects_statuses(objects: Iterable[ADCMEntity | HostComponent]) -> ObjectsStatuses:
+    """
+    Retrieve raw statuses of all given objects with one request instead of `get_*_status` call per object.
+    Every given object gets status in result, the same one `get_raw_status` would return for it.
+    """
+    statuses = ObjectsStatuses(clusters={}, services={}, components={}, hosts={}, host_components={})
+    data = {"clusters": [], "services": [], "components": [], "hosts": [], "hostcomponents": []}
+    for obj in objects:
+        if isinstance(obj, Cluster):
+            data["clusters"].append(obj.id)
+        elif isinstance(obj, Service):
+            data["services"].append((obj.cluster_id, obj.id))
+        elif isinstance(obj, Component):
+            data["components"].append(obj.id)
+        elif isinstance(obj, Host):
+            data["hosts"].append(obj.id)
+        elif isinstance(obj, HostComponent):
+            data["hostcomponents"].append((obj.host_id, obj.component_id))
+
+    if not any(data.values()):
+        return statuses
+
+    response = api_request(method="post", url="batch/", data=data)
+    if response is None:
+        default, json_data = settings.EMPTY_REQUEST_STATUS_CODE, {}
+    else:
+        try:
+            default, json_data = settings.EMPTY_STATUS_STATUS_CODE, response.json()
+        except ValueError:
+            default, json_data = settings.VALUE_ERROR_STATUS_CODE, {}
+
+        if not isinstance(json_data, dict):
+            default, json_data = settings.VALUE_ERROR_STATUS_CODE, {}
+
+    def fill(target: dict, ids: Iterable, received: dict | None) -> None:
+        received = received or {}
+        for id_ in ids:
+            target[id_] = received.get(str(id_), default)
+
+    fill(statuses.clusters, data["clusters"], json_data.get("clusters"))
+    fill(statuses.services, (service_id for _, service_id in data["services"]), json_data.get("services"))
+    fill(statuses.components, data["components"], json_data.get("components"))
+    fill(statuses.hosts, data["hosts"], json_data.get("hosts"))
+
+    received_hc = json_data.get("hostcomponents") or {}
+    for host_id, component_id in data["hostcomponents"]:
+        statuses.host_components[host_id, component_id] = received_hc.get(f"{host_id}.{component_id}", default)
+
+    return statuses
+
+
 def get_status(obj: ADCMEntity, url: str) -> int:
     if obj.prototype.monitoring == "passive":
         return 0
@@ -195,31 +281,63 @@ def get_status(obj: ADCMEntity, url: str) -> int:
     return get_raw_status(url=url)
 
 
-def get_cluster_status(cluster: Cluster) -> int:
-    return get_raw_status(url=f"cluster/{cluster.id}/")
+def _get_prefetched_status(obj: ADCMEntity, statuses: dict, key: int | tuple[int, int], url: str) -> int:
+    if key not in statuses:
+        return get_status(obj=obj, url=url)
 
+    if obj.prototype.monitoring == "passive":
+        return 0
 
-def get_service_status(service: Service) -> int:
-    return get_status(obj=service, url=f"cluster/{service.cluster.id}/service/{service.id}/")
+    return statuses[key]
 
 
-def get_host_status(host: Host) -> int:
-    return get_status(obj=host, url=f"host/{host.id}/")
+def get_cluster_status(cluster: Cluster, statuses: ObjectsStatuses | None = None) -> int:
+    url = f"cluster/{cluster.id}/"
+    if statuses is not None and cluster.id in statuses.clusters:
+        return statuses.clusters[cluster.id]
 
+    return get_raw_status(url=url)
 
-def get_hc_status(hostcomponent: HostComponent) -> int:
-    return get_status(
-        obj=hostcomponent.component,
-        url=f"host/{hostcomponent.host_id}/component/{hostcomponent.component_id}/",
-    )
+
+def get_service_status(service: Service, statuses: ObjectsStatuses | None = None) -> int:
+    url = f"cluster/{service.cluster_id}/service/{service.id}/"
+    if statuses is not None:
+        return _get_prefetched_status(obj=service, statuses=statuses.services, key=service.id, url=url)
+
+    return get_status(obj=service, url=url)
+
+
+def get_host_status(host: Host, statuses: ObjectsStatuses | None = None) -> int:
+    url = f"host/{host.id}/"
+    if statuses is not None:
+        return _get_prefetched_status(obj=host, statuses=statuses.hosts, key=host.id, url=url)
+
+    return get_status(obj=host, url=url)
+
+
+def get_hc_status(hostcomponent: HostComponent, statuses: ObjectsStatuses | None = None) -> int:
+    url = f"host/{hostcomponent.host_id}/component/{hostcomponent.component_id}/"
+    if statuses is not None:
+        return _get_prefetched_status(
+            obj=hostcomponent.component,
+            statuses=statuses.host_components,
+            key=(hostcomponent.host_id, hostcomponent.component_id),
+            url=url,
+        )
+
+    return get_status(obj=hostcomponent.component, url=url)
 
 
 def get_host_comp_status(host: Host, component: Component) -> int:
     return get_status(obj=component, url=f"host/{host.id}/component/{component.id}/")
 
 
-def get_component_status(component: Component) -> int:
-    return get_status(obj=component, url=f"component/{component.id}/")
+def get_component_status(component: Component, statuses: ObjectsStatuses | None = None) -> int:
+    url = f"component/{component.id}/"
+    if statuses is not None:
+        return _get_prefetched_status(obj=component, statuses=statuses.components, key=component.id, url=url)
+
+    return get_status(obj=component, url=url)
 
 
 def get_object_map(obj: ADCMEntity, url_type: str) -> dict | None:
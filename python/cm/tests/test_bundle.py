@@ -41,6 +41,7 @@ from cm.models import (
     Service,
     SubAction,
 )
+from cm.services.bundle_alt.repo import order_versions
 from cm.tests.test_upgrade import (
     cook_cluster,
     cook_cluster_bundle,
@@ -393,6 +394,49 @@ class TestBundle(BaseTestCase, BusinessLogicMixin):
         self.assertEqual(response.data["code"], "BUNDLE_VALIDATION_ERROR")
 
 
+class TestVersionsOrdering(BaseTestCase):
+    def create_bundles(self, versions: list[str]) -> list[Bundle]:
+        start = Bundle.objects.count()
+        return [
+            Bundle.objects.create(name=f"bundle_{start + i}", version=version, hash=f"hash_{start + i}")
+            for i, version in enumerate(versions)
+        ]
+
+    def get_orders(self, bundles: list[Bundle]) -> list[int]:
+        orders = dict(Bundle.objects.values_list("id", "version_order").filter(id__in=(b.id for b in bundles)))
+        return [orders[bundle.id] for bundle in bundles]
+
+    def test_order_versions_success(self) -> None:
+        bundles = self.create_bundles(["2.0", "1.10", "1.0", "1.2", "2.0"])
+
+        order_versions()
+
+        v2_0, v1_10, v1_0, v1_2, v2_0_again = self.get_orders(bundles)
+        self.assertLess(v1_0, v1_2)
+        self.assertLess(v1_2, v1_10)
+        self.assertLess(v1_10, v2_0)
+        self.assertEqual(v2_0, v2_0_again)
+
+        bundles += self.create_bundles(["1.5", "1.0"])
+        order_versions()
+
+        v2_0, v1_10, v1_0, v1_2, v2_0_again, v1_5, v1_0_again = self.get_orders(bundles)
+        self.assertLess(v1_0, v1_2)
+        self.assertLess(v1_2, v1_5)
+        self.assertLess(v1_5, v1_10)
+        self.assertLess(v1_10, v2_0)
+        self.assertEqual(v2_0, v2_0_again)
+        self.assertEqual(v1_0, v1_0_again)
+
+    def test_only_changed_orders_are_updated_success(self) -> None:
+        self.create_bundles(["1.0", "2.0"])
+        order_versions()
+
+        # versions are read from both tables, nothing is updated
+        with self.assertNumQueries(2):
+            order_versions()
+
+
 class TestBundleParsing(BaseTestCase, BundleLogicMixin):
     def setUp(self) -> None:
         super().setUp()
@@ -10,16 +10,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pathlib import Path
+from unittest.mock import patch
 import string
 
 from adcm.tests.base import APPLICATION_JSON, BaseTestCase, BusinessLogicMixin
 from core.cluster.types import ClusterTopology, ComponentTopology, ServiceTopology
 from core.types import ShortObjectInfo
+from django.db import connection, transaction
+from django.db.transaction import atomic
 from django.urls import reverse
 from rest_framework import status
 
-from cm.models import Bundle, Cluster, Prototype
-from cm.services.cluster import retrieve_multiple_clusters_topology
+from cm.models import Bundle, Cluster, Host, Prototype, Service
+from cm.services.cluster import retrieve_cluster_topology, retrieve_multiple_clusters_topology, topology_cache
 from cm.tests.utils import gen_component, gen_host, gen_service, generate_hierarchy
 
 
@@ -206,13 +210,107 @@ class TestCluster(BaseTestCase, BusinessLogicMixin):
             hosts={host_1.pk: host_1_info, host_2.pk: ShortObjectInfo(id=host_2.pk, name=host_2.fqdn)},
         )
 
-        with self.assertNumQueries(num=5):
+        with self.assertNumQueries(num=7):
             actual_topology = next(retrieve_multiple_clusters_topology(cluster_ids=[cluster.pk]))
 
         self.assertEqual(actual_topology, expected_topology)
 
+        with self.assertNumQueries(num=1):
+            cached_topology = next(retrieve_multiple_clusters_topology(cluster_ids=[cluster.pk]))
+
+        self.assertEqual(cached_topology, expected_topology)
+
         second_cluster = generate_hierarchy()["cluster"]
-        with self.assertNumQueries(num=5):
+        with self.assertNumQueries(num=7):
             result = tuple(retrieve_multiple_clusters_topology(cluster_ids=[cluster.pk, second_cluster.pk]))
 
         self.assertSetEqual({entry.cluster_id for entry in result}, {cluster.pk, second_cluster.pk})
+
+
+class TestClusterTopologyCache(BaseTestCase, BusinessLogicMixin):
+    def setUp(self) -> None:
+        super().setUp()
+
+        bundles_dir = Path(__file__).parent / "bundles"
+        self.cluster = self.add_cluster(bundle=self.add_bundle(bundles_dir / "cluster_1"), name="Cluster")
+        self.provider = self.add_provider(bundle=self.add_bundle(bundles_dir / "provider"), name="Provider")
+        self.host_1 = self.add_host(provider=self.provider, fqdn="host-1", cluster=self.cluster)
+        self.host_2 = self.add_host(provider=self.provider, fqdn="host-2", cluster=self.cluster)
+        self.service = self.add_services_to_cluster(["service_one_component"], cluster=self.cluster).get()
+        self.component = self.service.components.get()
+
+    def test_cached_topology_changed_on_topology_change_success(self) -> None:
+        def retrieve_changed(previous: ClusterTopology) -> ClusterTopology:
+            topology = retrieve_cluster_topology(cluster_id=self.cluster.pk)
+            self.assertNotEqual(topology, previous)
+
+            topology_cache.clear()
+            self.assertEqual(topology, retrieve_cluster_topology(cluster_id=self.cluster.pk))
+
+            return topology
+
+        topology = retrieve_cluster_topology(cluster_id=self.cluster.pk)
+        self.assertIs(retrieve_cluster_topology(cluster_id=self.cluster.pk), topology)
+
+        with self.subTest("Mapping"):
+            self.set_hostcomponent(cluster=self.cluster, entries=[(self.host_1, self.component)])
+            topology = retrieve_changed(previous=topology)
+            self.assertIn(self.host_1.pk, topology.services[self.service.pk].components[self.component.pk].hosts)
+
+        with self.subTest("Service"):
+            self.add_services_to_cluster(["service_two_components"], cluster=self.cluster)
+            topology = retrieve_changed(previous=topology)
+            self.assertEqual(len(topology.services), 2)
+
+        with self.subTest("Host Rename"):
+            Host.objects.filter(pk=self.host_2.pk).update(fqdn="host-2-renamed")
+            topology = retrieve_changed(previous=topology)
+            self.assertEqual(topology.hosts[self.host_2.pk].name, "host-2-renamed")
+
+        with self.subTest("Host Removal"):
+            Host.objects.filter(pk=self.host_2.pk).update(cluster=None)
+            topology = retrieve_changed(previous=topology)
+            self.assertNotIn(self.host_2.pk, topology.hosts)
+
+        with self.subTest("Service Deletion"):
+            Service.objects.filter(pk=self.service.pk).delete()
+            topology = retrieve_changed(previous=topology)
+            self.assertNotIn(self.service.pk, topology.services)
+
+    def test_not_related_changes_keep_cache_success(self) -> None:
+        topology = retrieve_cluster_topology(cluster_id=self.cluster.pk)
+
+        Host.objects.filter(pk=self.host_1.pk).update(state="changed")
+        Service.objects.filter(pk=self.service.pk).update(state="changed")
+        another_cluster = self.add_cluster(bundle=self.cluster.prototype.bundle, name="Another Cluster")
+        self.add_services_to_cluster(["service_one_component"], cluster=another_cluster)
+
+        with self.assertNumQueries(num=1):
+            self.assertIs(retrieve_cluster_topology(cluster_id=self.cluster.pk), topology)
+
+    def test_rolled_back_topology_not_returned_success(self) -> None:
+        initial_topology = retrieve_cluster_topology(cluster_id=self.cluster.pk)
+
+        with atomic():
+            self.set_hostcomponent(cluster=self.cluster, entries=[(self.host_1, self.component)])
+            changed_topology = retrieve_cluster_topology(cluster_id=self.cluster.pk)
+            self.assertNotEqual(changed_topology, initial_topology)
+            transaction.set_rollback(True)
+
+        self.assertEqual(retrieve_cluster_topology(cluster_id=self.cluster.pk), initial_topology)
+
+    def test_cache_bypassed_on_not_postgresql_backend_success(self) -> None:
+        topology_cache.clear()
+
+        with patch.object(connection, "vendor", new="sqlite"):
+            with self.assertNumQueries(num=5):
+                topology = retrieve_cluster_topology(cluster_id=self.cluster.pk)
+
+            with self.assertNumQueries(num=5):
+                self.assertIsNot(retrieve_cluster_topology(cluster_id=self.cluster.pk), topology)
+
+            self.set_hostcomponent(cluster=self.cluster, entries=[(self.host_1, self.component)])
+            changed_topology = retrieve_cluster_topology(cluster_id=self.cluster.pk)
+
+        self.assertNotEqual(changed_topology, topology)
+        self.assertIn(self.host_1.pk, changed_topology.services[self.service.pk].components[self.component.pk].hosts)
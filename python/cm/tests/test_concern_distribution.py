@@ -0,0 +1,322 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import defaultdict
+from pathlib import Path
+import random
+
+from adcm.tests.base import BaseTestCase, BusinessLogicMixin
+from adcm.tests.benchmark import benchmark, measure
+from core.job.types import TaskMappingDelta
+from core.types import ADCMCoreType, CoreObjectDescriptor
+from django.db.transaction import atomic, set_rollback
+
+from cm.models import (
+    ADCMEntity,
+    Cluster,
+    Component,
+    ConcernItem,
+    ConcernType,
+    Host,
+    HostComponent,
+    Service,
+)
+from cm.services.cluster import retrieve_cluster_topology
+from cm.services.concern.distribution import (
+    AffectedObjectConcernMap,
+    clean_up_issues_and_flags_of_objects,
+    distribute_concern_on_related_objects,
+    redistribute_issues_and_flags,
+    redistribute_issues_and_flags_on_mapping_change,
+)
+from cm.services.host import create_hosts
+
+BUNDLES_DIR = Path(__file__).parent / "bundles"
+
+
+class ConcernsDistributionMixin:
+    cluster: Cluster
+
+    def add_own_concern(self, owner: ADCMEntity, type_: ConcernType = ConcernType.ISSUE) -> ConcernItem:
+        return ConcernItem.objects.create(
+            type=type_, name=f"{type_}_{ConcernItem.objects.count()}", reason={}, owner=owner
+        )
+
+    def apply_delta_in_db(self, delta: TaskMappingDelta) -> None:
+        for component_id, host_ids in delta.remove.items():
+            HostComponent.objects.filter(component_id=component_id, host_id__in=host_ids).delete()
+
+        service_ids = dict(Component.objects.values_list("id", "service_id").filter(cluster=self.cluster))
+        HostComponent.objects.bulk_create(
+            HostComponent(
+                cluster=self.cluster, service_id=service_ids[component_id], component_id=component_id, host_id=host_id
+            )
+            for component_id, host_ids in delta.add.items()
+            for host_id in host_ids
+        )
+
+    @staticmethod
+    def get_links() -> set[tuple[str, int, int]]:
+        return {
+            (model.__name__, object_id, concern_id)
+            for model in (Cluster, Service, Component, Host)
+            for object_id, concern_id in model.concerns.through.objects.values_list(
+                f"{model.__name__.lower()}_id", "concernitem_id"
+            )
+        }
+
+    @staticmethod
+    def flatten(concerns_map: AffectedObjectConcernMap) -> set[tuple[str, int, int]]:
+        return {
+            (core_type.value, object_id, concern_id)
+            for core_type, objects in concerns_map.items()
+            for object_id, concern_ids in objects.items()
+            for concern_id in concern_ids
+        }
+
+
+class TestIncrementalConcernsRedistribution(BaseTestCase, BusinessLogicMixin, ConcernsDistributionMixin):
+    ROUNDS = 50
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.cluster = self.add_cluster(bundle=self.add_bundle(BUNDLES_DIR / "cluster_1"), name="Cluster")
+        self.services = list(
+            self.add_services_to_cluster(
+                ["service_one_component", "service_two_components", "another_service_two_components"],
+                cluster=self.cluster,
+            )
+        )
+        self.components = list(Component.objects.filter(cluster=self.cluster).order_by("id"))
+
+        self.provider = self.add_provider(bundle=self.add_bundle(BUNDLES_DIR / "provider"), name="Provider")
+        self.hosts = [self.add_host(provider=self.provider, fqdn=f"host-{i}", cluster=self.cluster) for i in range(6)]
+
+        self.random = random.Random(4242)  # noqa: S311
+
+    def generate_delta(self) -> TaskMappingDelta:
+        mapped = set(HostComponent.objects.values_list("component_id", "host_id").filter(cluster=self.cluster))
+        all_pairs = {(component.id, host.id) for component in self.components for host in self.hosts}
+
+        delta = TaskMappingDelta(add=defaultdict(set), remove=defaultdict(set))
+        for component_id, host_id in self.random.sample(
+            sorted(all_pairs - mapped), k=min(len(all_pairs - mapped), self.random.randint(0, 4))
+        ):
+            delta.add[component_id].add(host_id)
+        for component_id, host_id in self.random.sample(sorted(mapped), k=min(len(mapped), self.random.randint(0, 3))):
+            delta.remove[component_id].add(host_id)
+
+        return delta
+
+    def test_incremental_equals_full_redistribution(self) -> None:
+        owners = [self.cluster, *self.services, *self.components, *self.hosts, self.provider]
+
+        for round_ in range(self.ROUNDS):
+            # own concerns may appear between mapping changes, links are expected to be actual before change
+            for _ in range(self.random.randint(0, 2)):
+                self.add_own_concern(
+                    owner=self.random.choice(owners), type_=self.random.choice((ConcernType.ISSUE, ConcernType.FLAG))
+                )
+            redistribute_issues_and_flags(topology=retrieve_cluster_topology(cluster_id=self.cluster.id))
+
+            delta = self.generate_delta()
+            self.apply_delta_in_db(delta=delta)
+            topology = retrieve_cluster_topology(cluster_id=self.cluster.id)
+
+            with self.subTest(round=round_, add=dict(delta.add), remove=dict(delta.remove)):
+                with atomic():
+                    incremental_result = redistribute_issues_and_flags_on_mapping_change(
+                        topology=topology, mapping_delta=delta
+                    )
+                    incremental_links = self.get_links()
+                    set_rollback(True)
+
+                full_result = redistribute_issues_and_flags(topology=topology)
+
+                self.assertSetEqual(incremental_links, self.get_links())
+                self.assertSetEqual(self.flatten(incremental_result[0]), self.flatten(full_result[0]))
+                self.assertSetEqual(self.flatten(incremental_result[1]), self.flatten(full_result[1]))
+
+    def test_empty_delta_changes_nothing(self) -> None:
+        self.add_own_concern(owner=self.cluster)
+        redistribute_issues_and_flags(topology=retrieve_cluster_topology(cluster_id=self.cluster.id))
+        links_before = self.get_links()
+
+        result = redistribute_issues_and_flags_on_mapping_change(
+            topology=retrieve_cluster_topology(cluster_id=self.cluster.id), mapping_delta=TaskMappingDelta()
+        )
+
+        self.assertTupleEqual(result, ({}, {}))
+        self.assertSetEqual(self.get_links(), links_before)
+
+
+class TestIssuesAndFlagsCleanUp(BaseTestCase, BusinessLogicMixin, ConcernsDistributionMixin):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.cluster = self.add_cluster(bundle=self.add_bundle(BUNDLES_DIR / "cluster_1"), name="Cluster")
+        self.add_services_to_cluster(["service_two_components"], cluster=self.cluster)
+        self.component_1, self.component_2 = Component.objects.filter(cluster=self.cluster).order_by("id")
+
+        self.provider = self.add_provider(bundle=self.add_bundle(BUNDLES_DIR / "provider"), name="Provider")
+        self.host_1, self.host_2, self.host_3 = (
+            self.add_host(provider=self.provider, fqdn=f"host-{i}", cluster=self.cluster) for i in range(1, 4)
+        )
+        self.set_hostcomponent(
+            cluster=self.cluster, entries=((self.host_1, self.component_1), (self.host_2, self.component_2))
+        )
+
+    def add_distributed_concern(self, owner: ADCMEntity, type_: ConcernType = ConcernType.FLAG) -> ConcernItem:
+        concern = self.add_own_concern(owner=owner, type_=type_)
+        distribute_concern_on_related_objects(
+            owner=CoreObjectDescriptor(id=owner.id, type=ADCMCoreType(owner.prototype.type)), concern_id=concern.id
+        )
+
+        return concern
+
+    def test_unlink_objects_moved_out_of_hierarchy_success(self) -> None:
+        concern_1 = self.add_distributed_concern(owner=self.component_1)
+        concern_2 = self.add_distributed_concern(owner=self.component_2)
+        HostComponent.objects.filter(cluster=self.cluster).delete()
+        links_before = self.get_links()
+
+        deleted, removed = clean_up_issues_and_flags_of_objects(
+            objects=(CoreObjectDescriptor(id=self.host_1.id, type=ADCMCoreType.HOST),)
+        )
+
+        self.assertSetEqual(deleted, set())
+        self.assertSetEqual(self.flatten(removed), {("host", self.host_1.id, concern_1.id)})
+        # concern of component 2 isn't related to host 1, so it isn't checked
+        self.assertSetEqual(self.get_links(), links_before - {("Host", self.host_1.id, concern_1.id)})
+        self.assertIn(("Host", self.host_2.id, concern_2.id), self.get_links())
+
+    def test_own_concerns_are_checked_success(self) -> None:
+        concern = self.add_distributed_concern(owner=self.host_1, type_=ConcernType.ISSUE)
+        self.host_3.concerns.add(concern)
+
+        _, removed = clean_up_issues_and_flags_of_objects(
+            objects=(CoreObjectDescriptor(id=self.host_1.id, type=ADCMCoreType.HOST),)
+        )
+
+        self.assertSetEqual(self.flatten(removed), {("host", self.host_3.id, concern.id)})
+        self.assertIn(("Component", self.component_1.id, concern.id), self.get_links())
+
+    def test_delete_concerns_of_removed_objects_success(self) -> None:
+        concern = self.add_distributed_concern(owner=self.host_3)
+        self.host_1.concerns.add(concern)
+        lock = self.add_own_concern(owner=self.host_3, type_=ConcernType.LOCK)
+        removed_host = CoreObjectDescriptor(id=self.host_3.id, type=ADCMCoreType.HOST)
+        Host.objects.filter(id=self.host_3.id).delete()
+
+        deleted, removed = clean_up_issues_and_flags_of_objects(objects=(removed_host,))
+
+        self.assertSetEqual(deleted, {concern.id})
+        self.assertDictEqual(removed, {})
+        self.assertFalse(ConcernItem.objects.filter(id=concern.id).exists())
+        self.assertTrue(ConcernItem.objects.filter(id=lock.id).exists())
+
+    def test_unrelated_concerns_dont_affect_queries_amount_success(self) -> None:
+        self.add_distributed_concern(owner=self.cluster)
+        host = CoreObjectDescriptor(id=self.host_1.id, type=ADCMCoreType.HOST)
+
+        with self.assertNumQueries(12):
+            clean_up_issues_and_flags_of_objects(objects=(host,))
+
+        for _ in range(10):
+            self.add_distributed_concern(owner=self.host_2)
+            self.add_distributed_concern(owner=self.provider)
+
+        # concerns of provider are linked to host 1 too, so they're checked once for all of them
+        with self.assertNumQueries(15):
+            clean_up_issues_and_flags_of_objects(objects=(host,))
+
+
+@benchmark
+class TestIssuesAndFlagsCleanUpBenchmark(BaseTestCase, BusinessLogicMixin, ConcernsDistributionMixin):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.cluster_bundle = self.add_bundle(BUNDLES_DIR / "cluster_1")
+        self.provider = self.add_provider(bundle=self.add_bundle(BUNDLES_DIR / "provider"), name="Provider")
+
+    def test_single_host_clean_up(self) -> None:
+        host = create_hosts(provider=self.provider, fqdns=["target-host"])[0]
+        self.add_own_concern(owner=host)
+
+        queries = set()
+        for clusters_amount in (10, 100, 500):
+            with self.subTest(clusters=clusters_amount):
+                for i in range(Cluster.objects.count(), clusters_amount):
+                    cluster = self.add_cluster(bundle=self.cluster_bundle, name=f"Cluster {i}")
+                    ConcernItem.objects.bulk_create(
+                        ConcernItem(type=type_, name=f"{type_}_{i}", reason={}, owner=cluster)
+                        for type_ in (ConcernType.ISSUE, ConcernType.FLAG)
+                    )
+
+                with measure(
+                    "issues and flags clean up", concerns=ConcernItem.objects.count(), clusters=clusters_amount
+                ) as result:
+                    clean_up_issues_and_flags_of_objects(
+                        objects=(CoreObjectDescriptor(id=host.id, type=ADCMCoreType.HOST),)
+                    )
+                    result.items = 1
+
+                queries.add(result.queries)
+
+        # amount of concerns that aren't related to host shouldn't matter
+        self.assertEqual(len(queries), 1)
+
+
+@benchmark
+class TestIncrementalConcernsRedistributionBenchmark(BaseTestCase, BusinessLogicMixin, ConcernsDistributionMixin):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.cluster = self.add_cluster(bundle=self.add_bundle(BUNDLES_DIR / "cluster_1"), name="Cluster")
+        self.add_services_to_cluster(
+            ["service_one_component", "service_two_components", "another_service_two_components"], cluster=self.cluster
+        )
+        self.components = list(Component.objects.filter(cluster=self.cluster).order_by("id"))
+        self.provider = self.add_provider(bundle=self.add_bundle(BUNDLES_DIR / "provider"), name="Provider")
+
+    def test_single_component_move(self) -> None:
+        for hosts_amount in (100, 1000, 2000):
+            with self.subTest(hosts=hosts_amount):
+                hosts = create_hosts(
+                    provider=self.provider, fqdns=[f"host-{hosts_amount}-{i}" for i in range(hosts_amount)]
+                )
+                Host.objects.filter(id__in=(host.id for host in hosts)).update(cluster=self.cluster)
+                # every host has all but the last component, so concerns go all over the cluster
+                self.apply_delta_in_db(
+                    TaskMappingDelta(
+                        add={component.id: {host.id for host in hosts} for component in self.components[:-1]}
+                    )
+                )
+                for host in hosts[::10]:
+                    self.add_own_concern(owner=host)
+                redistribute_issues_and_flags(topology=retrieve_cluster_topology(cluster_id=self.cluster.id))
+
+                delta = TaskMappingDelta(add={self.components[-1].id: {hosts[0].id}})
+                self.apply_delta_in_db(delta=delta)
+                topology = retrieve_cluster_topology(cluster_id=self.cluster.id)
+
+                with atomic():
+                    with measure("concerns redistribution full", hosts=hosts_amount):
+                        redistribute_issues_and_flags(topology=topology)
+                    set_rollback(True)
+
+                with measure("concerns redistribution incremental", hosts=hosts_amount):
+                    redistribute_issues_and_flags_on_mapping_change(topology=topology, mapping_delta=delta)
+
+                HostComponent.objects.filter(cluster=self.cluster).delete()
+                Host.objects.filter(cluster=self.cluster).update(cluster=None)
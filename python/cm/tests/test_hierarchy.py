@@ -12,6 +12,8 @@
 
 
 from adcm.tests.base import BaseTestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from cm.hierarchy import HierarchyError, Tree
 from cm.tests.utils import (
@@ -404,3 +406,31 @@ class HierarchyTest(BaseTestCase):
             got_affected = set(tree.get_all_affected(target_node))
 
             self.assertSetEqual(expected_affected, got_affected)
+
+    def test_queries_amount_does_not_depend_on_hierarchy_size(self):
+        hierarchy_objects = generate_hierarchy()
+        names = ("cluster_1", "service_11", "component_111", "host_11", "provider_1")
+
+        def count_queries() -> dict[str, int]:
+            result = {}
+            for name in names:
+                obj = (
+                    type(hierarchy_objects[name]).objects.select_related("prototype").get(pk=hierarchy_objects[name].pk)
+                )
+                with CaptureQueriesContext(connection) as queries:
+                    Tree(obj)
+                result[name] = len(queries)
+
+            return result
+
+        queries_before = count_queries()
+
+        for _ in range(10):
+            host = gen_host(hierarchy_objects["provider_1"], prototype=hierarchy_objects["host_11"].prototype)
+            for component in ("component_111", "component_121"):
+                gen_host_component(hierarchy_objects[component], host)
+
+        self.assertDictEqual(count_queries(), queries_before)
+
+        tree = Tree(hierarchy_objects["provider_1"])
+        self.assertEqual(len(tree.get_node(hierarchy_objects["component_111"]).children), 12)
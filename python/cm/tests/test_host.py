@@ -11,9 +11,11 @@
 # limitations under the License.
 
 from pathlib import Path
+from unittest.mock import patch
 import string
 
-from adcm.tests.base import APPLICATION_JSON, BaseTestCase
+from adcm.tests.base import APPLICATION_JSON, BaseTestCase, BusinessLogicMixin
+from adcm.tests.benchmark import benchmark, measure
 from django.urls import reverse
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -25,7 +27,9 @@ from rest_framework.status import (
     HTTP_409_CONFLICT,
 )
 
-from cm.models import Bundle, Cluster, Host, MaintenanceMode, Prototype, Provider
+from cm.api import add_host
+from cm.models import Bundle, Cluster, Host, MaintenanceMode, ObjectType, Prototype, Provider
+from cm.services.host import create_hosts
 
 
 class TestHostAPI(BaseTestCase):
@@ -469,3 +473,35 @@ class TestHostAPI(BaseTestCase):
                     content_type=APPLICATION_JSON,
                 )
                 self.check_success_fqdn_update(response, value)
+
+
+@benchmark
+@patch("cm.services.host.reset_hosts_hc_map")
+@patch("cm.api.reset_hosts_hc_map")
+class TestCreateHostsBenchmark(BaseTestCase, BusinessLogicMixin):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.provider = self.add_provider(
+            bundle=self.add_bundle(source_dir=Path(__file__).parent / "bundles" / "provider"), name="Provider"
+        )
+        self.host_prototype = Prototype.objects.get(bundle_id=self.provider.prototype.bundle_id, type=ObjectType.HOST)
+        # policy on provider is re-applied on each host creation, that's what makes one by one creation slow
+        self.create_policy(role_name="Provider Administrator", obj=self.provider, group_pk=self.test_user_group.pk)
+
+    def test_hosts_created_per_second(self, *_) -> None:
+        for amount in (10, 100, 1000):
+            with self.subTest("one by one", hosts=amount):
+                with measure("create hosts one by one", hosts=amount) as result:
+                    for i in range(amount):
+                        add_host(prototype=self.host_prototype, provider=self.provider, fqdn=f"single-{amount}-{i}")
+
+                    result.items = amount
+
+            with self.subTest("bulk", hosts=amount):
+                with measure("create hosts in bulk", hosts=amount) as result:
+                    result.items = len(
+                        create_hosts(provider=self.provider, fqdns=[f"bulk-{amount}-{i}" for i in range(amount)])
+                    )
+
+        self.assertEqual(Host.objects.filter(provider=self.provider).count(), 2 * (10 + 100 + 1000))
@@ -0,0 +1,87 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+import json
+
+from adcm.tests.base import BaseTestCase, BusinessLogicMixin
+from adcm.tests.benchmark import benchmark, measure
+from core.types import ActionTargetDescriptor, ADCMCoreType
+
+from cm.models import Cluster, Component
+from cm.services.cluster import perform_host_to_cluster_map
+from cm.services.host import create_hosts
+from cm.services.job.inventory import TaskInventoryCache, get_inventory_data
+from cm.services.status import notify
+
+
+@benchmark
+class TestInventoryBenchmark(BusinessLogicMixin, BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        bundles_dir = Path(__file__).parent.parent / "bundles"
+        self.cluster_bundle = self.add_bundle(source_dir=bundles_dir / "cluster_1")
+        self.provider_bundle = self.add_bundle(source_dir=bundles_dir / "provider")
+
+        self.provider = self.add_provider(bundle=self.provider_bundle, name="Provider")
+
+    def create_cluster(self, hosts_amount: int) -> Cluster:
+        cluster = self.add_cluster(bundle=self.cluster_bundle, name=f"Cluster with {hosts_amount} hosts")
+        self.add_services_to_cluster(
+            service_names=["service_one_component", "service_two_components", "another_service_two_components"],
+            cluster=cluster,
+        )
+
+        hosts = create_hosts(provider=self.provider, fqdns=[f"host-{hosts_amount}-{i}" for i in range(hosts_amount)])
+        perform_host_to_cluster_map(cluster_id=cluster.id, hosts=[host.id for host in hosts], status_service=notify)
+
+        components = tuple(Component.objects.filter(cluster=cluster).order_by("id"))
+        self.set_hostcomponent(
+            cluster=cluster, entries=((host, components[i % len(components)]) for i, host in enumerate(hosts))
+        )
+
+        return cluster
+
+    def test_cluster_inventory(self) -> None:
+        inventory_file = self.directories["RUN_DIR"] / "inventory.json"
+        reused_inventory_file = self.directories["RUN_DIR"] / "reused_inventory.json"
+
+        for hosts_amount in (10, 100, 1000, 5000):
+            cluster = self.create_cluster(hosts_amount=hosts_amount)
+            target = ActionTargetDescriptor(id=cluster.id, type=ADCMCoreType.CLUSTER)
+
+            with (
+                self.subTest("dict", hosts=hosts_amount),
+                measure("build inventory as dict", trace_memory=True, hosts=hosts_amount) as result,
+            ):
+                inventory = get_inventory_data(target=target, is_host_action=False)
+                result.items = hosts_amount
+
+            self.assertEqual(len(inventory["all"]["hosts"]), hosts_amount)
+            del inventory
+
+            cache = TaskInventoryCache()
+
+            with (
+                self.subTest("write", hosts=hosts_amount),
+                measure("write inventory", trace_memory=True, hosts=hosts_amount) as result,
+            ):
+                cache.write_inventory(file=inventory_file, target=target, is_host_action=False)
+                result.items = hosts_amount
+
+            with self.subTest("reuse", hosts=hosts_amount), measure("reuse inventory", hosts=hosts_amount) as result:
+                cache.write_inventory(file=reused_inventory_file, target=target, is_host_action=False)
+                result.items = hosts_amount
+
+            self.assertEqual(result.queries, 0)
+            self.assertEqual(len(json.loads(reused_inventory_file.read_text())["all"]["hosts"]), hosts_amount)
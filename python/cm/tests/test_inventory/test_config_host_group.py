@@ -10,8 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
+
 from api_v2.service.utils import bulk_add_services_to_cluster
-from core.types import CoreObjectDescriptor
+from core.types import ADCMCoreType, CoreObjectDescriptor
 
 from cm.converters import model_name_to_core_type
 from cm.models import (
@@ -20,7 +22,8 @@ from cm.models import (
     ObjectType,
     Prototype,
 )
-from cm.services.job.inventory import get_inventory_data
+from cm.services.job.inventory import _base as inventory_base
+from cm.services.job.inventory import get_inventory_data, get_inventory_stream
 from cm.tests.test_inventory.base import BaseInventoryTestCase, decrypt_secrets
 
 
@@ -201,3 +204,33 @@ class TestCHGsInInventory(BaseInventoryTestCase):
                         actual_data["cluster"]["config"], expected_parts[f"{host_name}_cluster_config"]
                     )
                     self.assertDictEqual(actual_data["services"], expected_parts[f"{host_name}_services"])
+
+    def test_hosts_in_same_groups_share_vars_success(self) -> None:
+        self.set_hostcomponent(
+            cluster=self.cluster,
+            entries=((host, self.component_thesame) for host in (self.host_1, self.host_2, self.host_3)),
+        )
+        cluster_group = self.add_config_host_group(parent=self.cluster, hosts=(self.host_1, self.host_2))
+        self.change_configuration(
+            target=cluster_group,
+            config_diff={"variant_inline": "f"},
+            meta_diff={"/variant_inline": {"isSynchronized": False}},
+        )
+        target = CoreObjectDescriptor(id=self.cluster.id, type=ADCMCoreType.CLUSTER)
+
+        inventory = get_inventory_data(target=target, is_host_action=False)
+        with patch.object(inventory_base, "HOSTS_CHUNK_SIZE", new=1):
+            inventory_from_chunks = get_inventory_data(target=target, is_host_action=False)
+
+        self.assertDictEqual(inventory_from_chunks, inventory)
+
+        hosts = inventory["all"]["hosts"]
+        self.assertEqual(hosts[self.host_1.name]["cluster"], hosts[self.host_2.name]["cluster"])
+        self.assertEqual(hosts[self.host_1.name]["cluster"]["config"]["variant_inline"], "f")
+        self.assertNotIn("cluster", hosts[self.host_3.name])
+
+        # shared block is written once, but it isn't shared by hosts in result which can be modified
+        hosts_stream = dict(dict(get_inventory_stream(target=target, is_host_action=False))["all"])["hosts"]
+        streamed_hosts = {host_name: dict(host_vars) for host_name, host_vars in hosts_stream}
+        self.assertIs(streamed_hosts[self.host_1.name]["cluster"], streamed_hosts[self.host_2.name]["cluster"])
+        self.assertIsNot(hosts[self.host_1.name]["cluster"], hosts[self.host_2.name]["cluster"])
@@ -0,0 +1,122 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+import json
+
+from cm.services.job import json_stream
+from cm.services.job.json_stream import JSONObjectStream, materialize, write_json
+
+
+class TestJSONStream(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.shared_config = {"password": {"__ansible_vault": "secret"}, "list": [1, 2, {"key": None}]}
+
+    def prepare_stream(self) -> JSONObjectStream:
+        def hosts():
+            for i in range(3):
+                yield f"host-{i}", {"adcm_hostid": i, "cluster": {"config": self.shared_config}}
+
+        return JSONObjectStream(
+            [
+                (
+                    "all",
+                    JSONObjectStream(
+                        [
+                            ("children", {"b": {"hosts": {}}, "a": {}}),
+                            ("vars", []),
+                            ("hosts", JSONObjectStream(hosts())),
+                        ]
+                    ),
+                )
+            ]
+        )
+
+    def test_write_same_as_json_dump_success(self) -> None:
+        expected = json.dumps(materialize(self.prepare_stream()), separators=(",", ":"))
+
+        for deduplicate in (False, True):
+            with self.subTest(deduplicate=deduplicate):
+                file = StringIO()
+                write_json(self.prepare_stream(), file, deduplicate=deduplicate)
+
+                self.assertEqual(file.getvalue(), expected)
+
+    def test_sort_keys_keeps_stream_order_success(self) -> None:
+        file = StringIO()
+        write_json(self.prepare_stream(), file, sort_keys=True)
+
+        result = json.loads(file.getvalue())
+        self.assertListEqual(list(result["all"]), ["children", "vars", "hosts"])
+        self.assertListEqual(list(result["all"]["children"]), ["a", "b"])
+        self.assertDictEqual(result, materialize(self.prepare_stream()))
+
+    def test_write_regular_values_success(self) -> None:
+        for value in ({"key": "value"}, [1, "2"], "string", 4, None):
+            with self.subTest(value=value):
+                file = StringIO()
+                write_json(value, file)
+
+                self.assertEqual(file.getvalue(), json.dumps(value, separators=(",", ":")))
+
+    def test_deduplicate_encodes_shared_block_once_success(self) -> None:
+        encoded = []
+
+        class TrackingEncoder(json.JSONEncoder):
+            def encode(self, o):
+                encoded.append(o)
+                return super().encode(o)
+
+        other_config = {"password": {"__ansible_vault": "secret"}, "list": [1, 2, {"key": None}]}
+        stream = JSONObjectStream(
+            [
+                (f"host-{i}", JSONObjectStream([("adcm_hostid", i), ("cluster", config)]))
+                for i, config in enumerate((self.shared_config, other_config, self.shared_config), start=1)
+            ]
+        )
+
+        file = StringIO()
+        with patch.object(json_stream.json, "JSONEncoder", new=TrackingEncoder):
+            write_json(stream, file, deduplicate=True)
+
+        self.assertEqual(sum(1 for value in encoded if value is self.shared_config), 1)
+        self.assertEqual(sum(1 for value in encoded if value is other_config), 1)
+        self.assertDictEqual(
+            json.loads(file.getvalue()),
+            {
+                "host-1": {"adcm_hostid": 1, "cluster": self.shared_config},
+                "host-2": {"adcm_hostid": 2, "cluster": other_config},
+                "host-3": {"adcm_hostid": 3, "cluster": self.shared_config},
+            },
+        )
+
+    def test_materialize_copies_shared_blocks_success(self) -> None:
+        result = materialize(self.prepare_stream())
+
+        hosts = result["all"]["hosts"]
+        self.assertEqual(hosts["host-0"]["cluster"]["config"], self.shared_config)
+        self.assertIsNot(hosts["host-0"]["cluster"]["config"], self.shared_config)
+        self.assertIsNot(hosts["host-0"]["cluster"]["config"], hosts["host-1"]["cluster"]["config"])
+        self.assertIsNot(hosts["host-0"]["cluster"]["config"]["list"], self.shared_config["list"])
+
+    def test_deduplication_memo_is_bounded_success(self) -> None:
+        encoder = json_stream._MemoizedEncoder(encode=json.dumps, maxsize=2)
+
+        values = [{"value": i} for i in range(4)]
+        for value in values:
+            encoder(value)
+
+        self.assertListEqual([value for value, _ in encoder._encoded.values()], values[2:])
@@ -0,0 +1,126 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from cm import log as log_module
+from cm.log import LogLine, extract_log_preview_from_fs, read_last_lines, read_log_range
+
+
+class _LogInfo:
+    job_id = 1
+    name = "ansible"
+    type = "stdout"
+    format = "txt"
+
+
+class TestLogReading(SimpleTestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.jobs_dir = Path(self.tmp_dir.name)
+        self.log_file = self.jobs_dir / "1" / "ansible-stdout.txt"
+        self.log_file.parent.mkdir()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_read_last_lines_same_as_splitlines_success(self) -> None:
+        contents = (
+            "",
+            "single",
+            "single\n",
+            "one\ntwo\nthree",
+            "one\n\n\nfour\n\n",
+            "windows\r\nline breaks\r\n",
+            "юникод\nстроки\nи ещё одна очень длинная строка\n",
+            "\n".join(f"line number {i}" for i in range(5000)),
+        )
+
+        # small chunk makes lines span across chunks' boundaries
+        with patch("cm.log.READ_CHUNK_SIZE", 7):
+            for content in contents:
+                for amount, max_length in ((1, 100), (3, 5), (1500, 10)):
+                    with self.subTest(content=content[:20], amount=amount, max_length=max_length):
+                        self.log_file.write_text(content, encoding="utf-8")
+                        expected = [
+                            LogLine(content=line[:max_length], is_cut=len(line) > max_length)
+                            for line in (content.splitlines() or [""])[-amount:]
+                        ]
+
+                        self.assertListEqual(
+                            read_last_lines(path=self.log_file, amount=amount, max_length=max_length), expected
+                        )
+
+    def test_read_last_lines_huge_line_is_not_read_fully_success(self) -> None:
+        self.log_file.write_text("first\n" + "x" * 1_000_000 + "\nlast", encoding="utf-8")
+
+        with patch.object(log_module, "_read_at", wraps=log_module._read_at) as read_mock:
+            lines = read_last_lines(path=self.log_file, amount=2, max_length=10)
+
+        self.assertListEqual(lines, [LogLine(content="x" * 10, is_cut=True), LogLine(content="last", is_cut=False)])
+        self.assertLessEqual(
+            max(call.kwargs["length"] for call in read_mock.call_args_list), log_module.READ_CHUNK_SIZE
+        )
+
+    def test_read_log_range_success(self) -> None:
+        content = b"0123456789"
+        self.log_file.write_bytes(content)
+
+        for offset, limit, expected in (
+            (0, None, content),
+            (3, 4, b"3456"),
+            (8, 100, b"89"),
+            (-3, None, b"789"),
+            (-100, 2, b"01"),
+            (100, None, b""),
+        ):
+            with self.subTest(offset=offset, limit=limit):
+                chunk = read_log_range(path=self.log_file, offset=offset, limit=limit)
+
+                self.assertEqual(chunk.content, expected)
+                self.assertEqual(chunk.size, len(content))
+                self.assertEqual(chunk.next_offset, chunk.offset + len(expected))
+
+    @override_settings(
+        STDOUT_STDERR_LOG_CUT_LENGTH=2,
+        STDOUT_STDERR_LOG_LINE_CUT_LENGTH=4,
+        STDOUT_STDERR_LOG_MAX_UNCUT_LENGTH=20,
+        STDOUT_STDERR_TRUNCATED_LOG_MESSAGE="<cut>",
+    )
+    def test_extract_log_preview_from_fs_success(self) -> None:
+        with self.subTest("Absent"):
+            self.assertIsNone(extract_log_preview_from_fs(jobs_dir=self.jobs_dir, log_info=_LogInfo()))
+
+        with self.subTest("Small is read as is"):
+            self.log_file.write_text("short\nlog\n", encoding="utf-8")
+
+            self.assertEqual(extract_log_preview_from_fs(jobs_dir=self.jobs_dir, log_info=_LogInfo()), "short\nlog\n")
+
+        with self.subTest("Limit is compared with length in chars"):
+            # 15 chars, but 27 bytes
+            self.log_file.write_text("привет\nмир\nдом\n", encoding="utf-8")
+
+            self.assertEqual(
+                extract_log_preview_from_fs(jobs_dir=self.jobs_dir, log_info=_LogInfo()), "привет\nмир\nдом\n"
+            )
+
+        with self.subTest("Big is truncated"):
+            self.log_file.write_text("first line\nsecond line\nthird\nlast\n", encoding="utf-8")
+
+            self.assertEqual(
+                extract_log_preview_from_fs(jobs_dir=self.jobs_dir, log_info=_LogInfo()),
+                "<cut>\nthir<cut>\nlast\n<cut>\n",
+            )
@@ -0,0 +1,215 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures.process import BrokenProcessPool
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from adcm.tests.benchmark import benchmark, measure
+from ansible.errors import AnsibleError
+from core import workers
+from django.conf import settings
+from django.test import override_settings
+
+from cm.adcm_config.ansible import ansible_decrypt, ansible_encrypt_and_format, vault_decrypt
+from cm.adcm_config.config import process_config_spec
+from cm.errors import AdcmEx
+from cm.services.config import secrets as secrets_module
+from cm.services.config.secrets import AnsibleSecrets
+
+ANSIBLE_SECRET = "test-ansible-secret"
+
+
+class BaseSecretsTestCase(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        secrets_settings = override_settings(ANSIBLE_SECRET=ANSIBLE_SECRET)
+        secrets_settings.enable()
+        self.addCleanup(secrets_settings.disable)
+
+        secrets_module._get_verified_ciphertexts(maxsize=settings.ANSIBLE_VAULT_CACHE_SIZE).clear()
+
+
+class TestAnsibleSecrets(BaseSecretsTestCase):
+    def test_reveal_secrets_success(self) -> None:
+        secrets = AnsibleSecrets()
+        encrypted_1, encrypted_2 = secrets.encrypt_many(["first", "second"])
+
+        source = {
+            "plain": "value",
+            "secret": encrypted_1,
+            "number": 4,
+            "group": {"secret": encrypted_2, "same_secret": encrypted_1, "none": None},
+            "list": [{"secret": encrypted_2}, encrypted_1, 3],
+        }
+
+        with patch.object(secrets_module, "vault_decrypt", wraps=vault_decrypt) as decrypt_mock:
+            result = secrets.reveal_secrets(source)
+
+        self.assertDictEqual(
+            result,
+            {
+                "plain": "value",
+                "secret": "first",
+                "number": 4,
+                "group": {"secret": "second", "same_secret": "first", "none": None},
+                "list": [{"secret": "second"}, encrypted_1, 3],
+            },
+        )
+        decrypt_mock.assert_called_once()
+        self.assertEqual(len(decrypt_mock.call_args.args[1]), 2)
+
+    def test_encrypt_decrypt_compatible_with_ansible_functions_success(self) -> None:
+        secrets = AnsibleSecrets()
+
+        self.assertEqual(ansible_decrypt(secrets.encrypt("value")), "value")
+        self.assertEqual(secrets.decrypt(ansible_encrypt_and_format("value")), "value")
+
+        encrypted = ansible_encrypt_and_format("value")
+        self.assertEqual(secrets.encrypt(encrypted), encrypted)
+        self.assertEqual(secrets.decrypt("plain"), "plain")
+
+    def test_check_decryptable_remembers_valid_values_success(self) -> None:
+        secrets = AnsibleSecrets()
+        known = secrets.encrypt("known")
+        unknown = ansible_encrypt_and_format("unknown")
+
+        with patch.object(secrets_module, "vault_decrypt", wraps=vault_decrypt) as decrypt_mock:
+            secrets.check_decryptable([known, unknown, unknown])
+            secrets.check_decryptable([known, unknown])
+
+        decrypt_mock.assert_called_once()
+        self.assertListEqual(decrypt_mock.call_args.args[1], [unknown])
+
+    def test_check_decryptable_invalid_value_fail(self) -> None:
+        encrypted = ansible_encrypt_and_format("value")
+
+        with override_settings(ANSIBLE_SECRET="another-secret"), self.assertRaises(AnsibleError):
+            AnsibleSecrets().check_decryptable([encrypted])
+
+        # valid with original secret doesn't mean valid with the other one
+        AnsibleSecrets().check_decryptable([encrypted])
+        with override_settings(ANSIBLE_SECRET="another-secret"), self.assertRaises(AnsibleError):
+            AnsibleSecrets().check_decryptable([encrypted])
+
+    def test_cache_is_bounded_success(self) -> None:
+        cache = secrets_module._VerifiedCiphertexts(maxsize=2)
+
+        cache.add(b"first")
+        cache.add(b"second")
+        self.assertIn(b"first", cache)
+        cache.add(b"third")
+
+        self.assertIn(b"first", cache)
+        self.assertNotIn(b"second", cache)
+        self.assertIn(b"third", cache)
+
+    @override_settings(ANSIBLE_VAULT_PARALLEL_THRESHOLD=2, ANSIBLE_VAULT_WORKERS=2)
+    def test_parallel_processing_success(self) -> None:
+        secrets = AnsibleSecrets()
+        values = [f"value-{i}" for i in range(10)]
+
+        encrypted = secrets.encrypt_many(values)
+
+        self.assertEqual(len(set(encrypted)), len(values))
+        self.assertListEqual([ansible_decrypt(value) for value in encrypted], values)
+        self.assertListEqual(secrets.decrypt_many(encrypted), values)
+
+    @override_settings(ANSIBLE_VAULT_PARALLEL_THRESHOLD=2, ANSIBLE_VAULT_WORKERS=2)
+    def test_parallel_processing_reuses_workers_success(self) -> None:
+        secrets = AnsibleSecrets()
+        workers.discard_process_pool(workers.get_process_pool(workers=2))
+
+        with patch.object(workers, "ProcessPoolExecutor", wraps=workers.ProcessPoolExecutor) as executor_mock:
+            encrypted = secrets.encrypt_many([f"value-{i}" for i in range(4)])
+            secrets.decrypt_many(encrypted)
+
+        executor_mock.assert_called_once()
+
+    @override_settings(ANSIBLE_VAULT_PARALLEL_THRESHOLD=2, ANSIBLE_VAULT_WORKERS=2)
+    def test_parallel_processing_broken_pool_success(self) -> None:
+        values = [f"value-{i}" for i in range(4)]
+        pool = Mock(map=Mock(side_effect=BrokenProcessPool))
+
+        with (
+            patch.object(secrets_module, "get_process_pool", return_value=pool),
+            patch.object(secrets_module, "discard_process_pool") as discard_mock,
+        ):
+            encrypted = AnsibleSecrets().encrypt_many(values)
+
+        discard_mock.assert_called_once_with(pool)
+        self.assertListEqual([ansible_decrypt(value) for value in encrypted], values)
+
+
+class TestProcessConfigSpecSecrets(BaseSecretsTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.spec = {
+            "password": {"type": "password"},
+            "text": {"type": "secrettext"},
+            "map": {"type": "secretmap"},
+            "group": {"password": {"type": "password"}, "map": {"type": "secretmap"}},
+        }
+
+    def test_plain_values_encrypted_success(self) -> None:
+        encrypted = ansible_encrypt_and_format("encrypted")
+        config = {
+            "password": "plain",
+            "text": encrypted,
+            "map": {"plain": "plain", "encrypted": encrypted},
+            "group": {"password": "", "map": None},
+        }
+
+        with patch.object(secrets_module, "vault_encrypt", wraps=secrets_module.vault_encrypt) as encrypt_mock:
+            result = process_config_spec(obj=None, spec=self.spec, new_config=config)
+
+        encrypt_mock.assert_called_once()
+        self.assertEqual(ansible_decrypt(result["password"]), "plain")
+        self.assertEqual(result["text"], encrypted)
+        self.assertEqual(ansible_decrypt(result["map"]["plain"]), "plain")
+        self.assertEqual(result["map"]["encrypted"], encrypted)
+        self.assertDictEqual(result["group"], {"password": "", "map": None})
+
+    def test_not_decryptable_value_fail(self) -> None:
+        with override_settings(ANSIBLE_SECRET="another-secret"):
+            encrypted = ansible_encrypt_and_format("encrypted")
+
+        config = {"password": "plain", "text": encrypted, "map": {}, "group": {"password": None, "map": {}}}
+
+        with self.assertRaises(AdcmEx) as err:
+            process_config_spec(obj=None, spec=self.spec, new_config=config)
+
+        self.assertEqual(err.exception.code, "CONFIG_VALUE_ERROR")
+
+
+@benchmark
+class TestConfigSecretsBenchmark(BaseSecretsTestCase):
+    def test_config_saved_per_second(self) -> None:
+        for amount in (10, 100, 1000):
+            spec = {f"password_{i}": {"type": "password"} for i in range(amount)}
+            config = {key: f"secret-{key}" for key in spec}
+
+            with self.subTest("new secrets", secrets=amount), measure("save new secrets", secrets=amount) as result:
+                config = process_config_spec(obj=None, spec=spec, new_config=config)
+                result.items = amount
+
+            with self.subTest("same secrets", secrets=amount), measure("save same secrets", secrets=amount) as result:
+                process_config_spec(obj=None, spec=spec, new_config=config)
+                result.items = amount
+
+            secrets_module._get_verified_ciphertexts(maxsize=settings.ANSIBLE_VAULT_CACHE_SIZE).clear()
+
+            with self.subTest("reveal", secrets=amount), measure("reveal secrets", secrets=amount) as result:
+                AnsibleSecrets().reveal_secrets(config)
+                result.items = amount
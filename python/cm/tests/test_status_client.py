@@ -0,0 +1,72 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from cm.services.status.client import FullStatusMap, invalidate_status_map_cache, retrieve_status_map
+
+RAW_STATUS_MAP = {
+    "clusters": {
+        "1": {
+            "status": 0,
+            "hosts": {"4": {"status": 0}},
+            "services": {
+                "2": {"status": 16, "components": {"3": {"status": 16}, "5": {"status": 0}}, "details": []},
+            },
+        },
+        "6": {"status": 16, "hosts": {}, "services": {}},
+    },
+    "hosts": {"4": {"status": 0}, "7": {"status": 16}},
+}
+
+
+@override_settings(STATUS_MAP_CACHE_TIMEOUT=60)
+class TestStatusMapCache(SimpleTestCase):
+    def setUp(self) -> None:
+        invalidate_status_map_cache()
+
+    def tearDown(self) -> None:
+        invalidate_status_map_cache()
+
+    def test_map_is_reused_until_invalidated(self) -> None:
+        response = Mock(json=Mock(return_value=RAW_STATUS_MAP))
+
+        with patch("cm.services.status.client.api_request", return_value=response) as request:
+            first = retrieve_status_map()
+            second = retrieve_status_map()
+            invalidate_status_map_cache()
+            third = retrieve_status_map()
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(third.get_for_cluster(cluster_id=1), 0)
+
+    def test_unavailable_status_server_result_is_not_cached(self) -> None:
+        with patch("cm.services.status.client.api_request", return_value=None) as request:
+            self.assertEqual(retrieve_status_map(), FullStatusMap())
+            self.assertEqual(retrieve_status_map(), FullStatusMap())
+
+        self.assertEqual(request.call_count, 2)
+
+    def test_ids_with_status(self) -> None:
+        status_map = FullStatusMap(**RAW_STATUS_MAP)
+
+        self.assertSetEqual(status_map.get_cluster_ids_with_status(0), {"1"})
+        self.assertSetEqual(status_map.get_cluster_ids_with_status(16), {"6"})
+        self.assertSetEqual(status_map.get_service_ids_with_status(0), set())
+        self.assertSetEqual(status_map.get_service_ids_with_status(16), {"2"})
+        self.assertSetEqual(status_map.get_component_ids_with_status(0), {"5"})
+        self.assertSetEqual(status_map.get_host_ids_with_status(0), {"4"})
+        self.assertSetEqual(status_map.get_host_ids_with_status(16), {"7"})
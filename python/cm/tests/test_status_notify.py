@@ -0,0 +1,84 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from adcm.tests.base import BaseTestCase, BusinessLogicMixin
+from rest_framework.status import HTTP_200_OK, HTTP_409_CONFLICT
+
+from cm.models import Component
+from cm.services.status.notify import reset_clusters_hc_map, reset_hosts_hc_map
+
+
+class TestHCMapDelta(BaseTestCase, BusinessLogicMixin):
+    def setUp(self) -> None:
+        super().setUp()
+
+        bundles_dir = Path(__file__).parent / "bundles"
+        self.cluster = self.add_cluster(bundle=self.add_bundle(bundles_dir / "cluster_1"), name="Cluster")
+        self.another_cluster = self.add_cluster(bundle=self.cluster.prototype.bundle, name="Another Cluster")
+        self.service = self.add_services_to_cluster(["service_one_component"], cluster=self.cluster).get()
+        self.add_services_to_cluster(["service_one_component"], cluster=self.another_cluster)
+        self.component = Component.objects.get(service=self.service)
+
+        self.provider = self.add_provider(bundle=self.add_bundle(bundles_dir / "provider"), name="Provider")
+        self.host_1 = self.add_host(provider=self.provider, fqdn="host-1", cluster=self.cluster)
+        self.host_2 = self.add_host(provider=self.provider, fqdn="host-2")
+        self.set_hostcomponent(cluster=self.cluster, entries=((self.host_1, self.component),))
+
+    def test_reset_clusters_hc_map_sends_only_given_clusters(self) -> None:
+        with patch("cm.services.status.notify.api_request", return_value=Mock(status_code=HTTP_200_OK)) as request:
+            reset_clusters_hc_map(cluster_ids=(self.cluster.id,))
+
+        request.assert_called_once()
+        self.assertEqual(request.call_args.kwargs["url"], "servicemap/delta/")
+        key = f"{self.host_1.id}.{self.component.id}"
+        self.assertDictEqual(
+            request.call_args.kwargs["data"],
+            {
+                "clusters": {
+                    self.cluster.id: {
+                        "hostservice": {key: {"cluster": self.cluster.id, "service": self.service.id}},
+                        "component": {str(self.service.id): [key]},
+                        "service": [self.service.id],
+                        "host": [self.host_1.id],
+                    }
+                }
+            },
+        )
+
+    def test_reset_hosts_hc_map_drops_deleted_hosts(self) -> None:
+        host_2_id = self.host_2.id
+        self.host_2.delete()
+
+        with patch("cm.services.status.notify.api_request", return_value=Mock(status_code=HTTP_200_OK)) as request:
+            reset_hosts_hc_map(host_ids=(self.host_1.id, host_2_id))
+
+        request.assert_called_once_with(
+            method="post",
+            url="servicemap/delta/",
+            data={"hosts": {self.host_1.id: self.cluster.id, host_2_id: None}},
+        )
+
+    def test_full_map_is_sent_when_delta_is_rejected(self) -> None:
+        with patch(
+            "cm.services.status.notify.api_request", return_value=Mock(status_code=HTTP_409_CONFLICT)
+        ) as request:
+            reset_clusters_hc_map(cluster_ids=(self.cluster.id,))
+
+        self.assertListEqual(
+            [call.kwargs["url"] for call in request.call_args_list], ["servicemap/delta/", "servicemap/"]
+        )
+        full_map = request.call_args.kwargs["data"]
+        self.assertDictEqual(full_map["host"], {self.cluster.id: [self.host_1.id], 0: [self.host_2.id]})
+        self.assertSetEqual(set(full_map["service"]), {self.cluster.id, self.another_cluster.id})
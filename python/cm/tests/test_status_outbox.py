@@ -0,0 +1,120 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Event
+from time import sleep
+from unittest.mock import Mock, patch
+import json
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.status import HTTP_200_OK
+import requests
+
+from cm.services.status import outbox as outbox_module
+from cm.services.status.outbox import _EventOutbox, coalesce_events
+from cm.status_api import post_event
+
+
+class TestEventOutbox(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.outbox = _EventOutbox()
+        self.post = Mock(return_value=Mock(status_code=HTTP_200_OK))
+        self.outbox._session = Mock(post=self.post)
+        # sender thread isn't needed, batches are sent with explicit flush
+        self.outbox._sender = Mock(is_alive=Mock(return_value=True))
+
+    def test_coalesce_events_drops_repeats_keeping_order_success(self) -> None:
+        self.assertListEqual(coalesce_events(["a", "a", "b", "a", "c", "c", "b"]), ["a", "b", "a", "c", "b"])
+
+    @override_settings(STATUS_EVENTS_BATCH_SIZE=2)
+    def test_flush_sends_queued_events_in_batches_success(self) -> None:
+        events = [{"event": "update_cluster", "object": {"id": id_}} for id_ in (1, 2, 3)]
+        for event in events:
+            self.outbox.put(event=event)
+
+        self.post.assert_not_called()
+
+        self.outbox.flush()
+
+        self.assertEqual(self.post.call_count, 2)
+        self.assertTrue(self.post.call_args_list[0].kwargs["url"].endswith("event/batch/"))
+        self.assertListEqual(
+            [json.loads(call.kwargs["data"]) for call in self.post.call_args_list], [events[:2], events[2:]]
+        )
+
+    def test_flush_sends_repeated_events_once_in_order_success(self) -> None:
+        create = {"event": "create_host_concern", "object": {"id": 1, "changes": {"id": 4}}}
+        delete = {"event": "delete_host_concern", "object": {"id": 1, "changes": {"id": 4}}}
+        for event in (create, create, delete, create):
+            self.outbox.put(event=event)
+
+        self.outbox.flush()
+
+        self.post.assert_called_once()
+        self.assertListEqual(json.loads(self.post.call_args.kwargs["data"]), [create, delete, create])
+
+    @override_settings(STATUS_EVENTS_SEND_ATTEMPTS=3)
+    def test_flush_retries_batch_on_timeout_success(self) -> None:
+        self.post.side_effect = [
+            requests.exceptions.Timeout,
+            requests.exceptions.ConnectionError,
+            self.post.return_value,
+        ]
+        event = {"event": "update_cluster", "object": {"id": 1}}
+        self.outbox.put(event=event)
+
+        self.outbox.flush()
+
+        self.assertEqual(self.post.call_count, 3)
+        self.assertListEqual(json.loads(self.post.call_args.kwargs["data"]), [event])
+
+    @override_settings(STATUS_EVENTS_BATCH_SIZE=100, STATUS_EVENTS_FLUSH_INTERVAL=0.01)
+    def test_sender_delivers_lone_event_after_previous_flush_success(self) -> None:
+        outbox = _EventOutbox()
+        delivered = {1: Event(), 2: Event()}
+
+        def post(**kwargs):
+            for event in json.loads(kwargs["data"]):
+                delivered[event["object"]["id"]].set()
+            return Mock(status_code=HTTP_200_OK)
+
+        outbox._session = Mock(post=Mock(side_effect=post))
+
+        outbox.put(event={"event": "update_cluster", "object": {"id": 1}})
+        self.assertTrue(delivered[1].wait(timeout=5))
+        # let sender become idle after sending the first batch
+        sleep(0.1)
+        outbox.put(event={"event": "update_cluster", "object": {"id": 2}})
+
+        self.assertTrue(delivered[2].wait(timeout=5))
+
+    def test_new_outbox_registers_no_process_hooks_success(self) -> None:
+        with (
+            patch.object(outbox_module.atexit, "register") as atexit_mock,
+            patch.object(outbox_module.os, "register_at_fork") as at_fork_mock,
+        ):
+            _EventOutbox()
+
+        atexit_mock.assert_not_called()
+        at_fork_mock.assert_not_called()
+
+    def test_post_event_is_queued_success(self) -> None:
+        with patch("cm.status_api.event_outbox") as outbox, patch("cm.status_api.api_request") as request:
+            post_event(event="update_task", object_id=3, changes={"status": "running"})
+            post_event(event="update_task", object_id=None)
+
+        request.assert_not_called()
+        outbox.put.assert_called_once_with(
+            event={"event": "update_task", "object": {"id": 3, "changes": {"status": "running"}}}
+        )
@@ -0,0 +1,97 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import patch
+import json
+
+from adcm.tests.ansible import ADCMAnsiblePluginTestMixin
+from adcm.tests.base import BusinessLogicMixin, ParallelReadyTestCase, TestCaseWithCommonSetUpTearDown
+from ansible_plugin.executors.hostcomponent import ADCMHostComponentPluginExecutor
+
+from cm.models import Action, Component
+from cm.services.job.action import ActionRunPayload, run_action
+from cm.services.job.inventory import OBJECTS_CHANGED_MARKER
+from cm.services.job.inventory import _cache as cache_module
+from cm.tests.mocks.task_runner import ETFMockWithEnvPreparation, JobImitator, RunTaskMock
+
+
+class TestInventoryReuseWithinTask(
+    TestCaseWithCommonSetUpTearDown, ParallelReadyTestCase, BusinessLogicMixin, ADCMAnsiblePluginTestMixin
+):
+    def setUp(self) -> None:
+        super().setUp()
+
+        bundles_dir = Path(__file__).parent / "bundles"
+
+        self.cluster = self.add_cluster(bundle=self.add_bundle(bundles_dir / "cluster"), name="Just Cluster")
+        self.service = self.add_services_to_cluster(["simple"], cluster=self.cluster).first()
+        self.component_1, self.component_2 = Component.objects.filter(service=self.service).order_by("id")
+
+        provider_bundle = self.add_bundle(bundles_dir / "provider")
+        provider = self.add_provider(bundle=provider_bundle, name="Just HP")
+        self.host_1 = self.add_host(provider=provider, fqdn="host-1", cluster=self.cluster)
+        self.host_2 = self.add_host(provider=provider, fqdn="host-2", cluster=self.cluster)
+
+        self.set_hostcomponent(cluster=self.cluster, entries=((self.host_1, self.component_1),))
+
+        self.action = Action.objects.get(prototype=self.cluster.prototype, name="two_ansible_steps")
+
+    def run_task(self, job_imitators: dict[int, JobImitator]) -> list[dict]:
+        with RunTaskMock(execution_target_factory=ETFMockWithEnvPreparation(change_jobs=job_imitators)) as run_task:
+            run_action(action=self.action, obj=self.cluster, payload=ActionRunPayload())
+
+        run_task.runner.run(task_id=run_task.target_task.pk)
+        run_task.target_task.refresh_from_db()
+        self.assertEqual(run_task.target_task.status, "success")
+
+        return [
+            json.loads((self.directories["RUN_DIR"] / str(job_id) / "inventory.json").read_text())
+            for job_id in run_task.target_task.joblog_set.order_by("id").values_list("id", flat=True)
+        ]
+
+    def test_inventory_built_once_for_unchanged_objects_success(self) -> None:
+        with patch.object(cache_module, "get_inventory_stream", wraps=cache_module.get_inventory_stream) as build_mock:
+            first_inventory, second_inventory = self.run_task(job_imitators={})
+
+        build_mock.assert_called_once()
+        self.assertDictEqual(first_inventory, second_inventory)
+
+    def test_inventory_rebuilt_after_objects_changed_success(self) -> None:
+        def add_component_to_host(executor) -> int:
+            job_id = int(executor._config.work_dir.name)
+            plugin_executor = self.prepare_executor(
+                executor_type=ADCMHostComponentPluginExecutor,
+                call_arguments={
+                    "operations": [
+                        {"action": "add", "service": "simple", "component": "part_2", "host": self.host_2.fqdn}
+                    ]
+                },
+                call_context=job_id,
+            )
+            result = plugin_executor.execute()
+            if result.error:
+                return 1
+
+            # that's what ansible plugin does when executor reports about changes
+            (executor._config.work_dir / OBJECTS_CHANGED_MARKER).touch()
+
+            return 0
+
+        with patch.object(cache_module, "get_inventory_stream", wraps=cache_module.get_inventory_stream) as build_mock:
+            first_inventory, second_inventory = self.run_task(
+                job_imitators={0: JobImitator(call=add_component_to_host, use_call_return_code=True)}
+            )
+
+        self.assertEqual(build_mock.call_count, 2)
+        self.assertNotIn("simple.part_2", first_inventory["all"]["children"])
+        self.assertDictEqual(second_inventory["all"]["children"]["simple.part_2"], {"hosts": {"host-2": {}}})
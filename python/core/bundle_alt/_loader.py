@@ -0,0 +1,221 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Collection, Hashable, Iterable
+import os
+import pickle
+import hashlib
+import collections.abc
+
+import yaml
+
+from core.bundle_alt.errors import BundleProcessingError
+from core.workers import discard_process_pool, get_process_pool
+
+# Total size of pickled YAML content kept in cache
+PARSED_YAML_CACHE_SIZE = 64 * 1024 * 1024
+# Files are parsed in separate processes only when there are at least that many of them,
+# otherwise starting workers takes longer than parsing itself
+PARALLEL_LOAD_MIN_FILES = 16
+PARALLEL_LOAD_MAX_WORKERS = 4
+
+
+class _FirstExplicitKeyConstructor:
+    def construct_mapping(self, node, deep: bool = False) -> dict[Hashable, Any]:
+        if not isinstance(node, yaml.MappingNode):
+            raise yaml.constructor.ConstructorError(
+                None, None, "expected a mapping node, but found %s" % node.id, node.start_mark
+            )
+
+        self.flatten_mapping(node)
+
+        mapping = {}
+        for key_node, value_node in node.value:
+            key = self.construct_object(key_node, deep=deep)
+            if not isinstance(key, collections.abc.Hashable):
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping", node.start_mark, "found unhashable key", key_node.start_mark
+                )
+
+            if key in mapping:
+                continue
+
+            value = self.construct_object(value_node, deep=deep)
+            mapping[key] = value
+
+        return mapping
+
+    def flatten_mapping(self, node):
+        merge = []
+        index = 0
+        while index < len(node.value):
+            key_node, value_node = node.value[index]
+            if key_node.tag == "tag:yaml.org,2002:merge":
+                del node.value[index]
+                if isinstance(value_node, yaml.MappingNode):
+                    self.flatten_mapping(value_node)
+                    merge.extend(value_node.value)
+                elif isinstance(value_node, yaml.SequenceNode):
+                    submerge = []
+                    for subnode in value_node.value:
+                        if not isinstance(subnode, yaml.MappingNode):
+                            raise yaml.constructor.ConstructorError(
+                                "while constructing a mapping",
+                                node.start_mark,
+                                "expected a mapping for merging, but found %s" % subnode.id,
+                                subnode.start_mark,
+                            )
+                        self.flatten_mapping(subnode)
+                        submerge.append(subnode.value)
+                    submerge.reverse()
+                    for value in submerge:
+                        merge.extend(value)
+                else:
+                    raise yaml.constructor.ConstructorError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        "expected a mapping or list of mappings for merging, but found %s" % value_node.id,
+                        value_node.start_mark,
+                    )
+            elif key_node.tag == "tag:yaml.org,2002:value":
+                key_node.tag = "tag:yaml.org,2002:str"
+                index += 1
+            else:
+                index += 1
+        if merge:
+            # the only changed line to change priority of anchors
+            node.value += merge
+
+
+class FirstExplicitKeyLoader(_FirstExplicitKeyConstructor, yaml.SafeLoader):
+    """
+    Alternative Safe Loader that imitates ruyaml behavior
+    in terms of overwritting keys, (when it's important for us)
+
+    Code is copied from SafeLoader implementation with minor changes to ensure:
+    1. First unique key in map stays, others are dropped silently
+    2. Entries in mapping that came from anchors (<<: * syntax)
+       have lower priority than "explicitly" defined.
+       They are processed after "explicitly" defined
+       => if they duplicate some key, they will be dropped.
+    """
+
+
+if yaml.__with_libyaml__:
+
+    class CFirstExplicitKeyLoader(_FirstExplicitKeyConstructor, yaml.CSafeLoader):
+        """
+        The same as `FirstExplicitKeyLoader`, but with libyaml parser.
+
+        Keys overwriting is handled on construction of nodes, so result is the same,
+        only messages of parsing errors may differ.
+        """
+
+    DefaultLoader = CFirstExplicitKeyLoader
+else:
+    DefaultLoader = FirstExplicitKeyLoader
+
+
+def load_yaml(path: Path, source: bytes) -> Any:
+    # the same newlines handling as in `Path.read_text`
+    content = source.decode(encoding="utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    try:
+        # Check is silenced, because Loader inherits from SafeLoader
+        # and doesn't override important safe-related stuff
+        return yaml.load(content, Loader=DefaultLoader)  # noqa: S506
+    except yaml.error.YAMLError as e:
+        message = f'Error during parsing yaml file at "{path}": {e}'
+        raise BundleProcessingError(message) from e
+
+
+class ParsedYAMLCache:
+    """
+    Process-wide cache of parsed YAML files by hash of their content.
+
+    Bundles often share files (re-upload, upgrade with the same services),
+    so the same content doesn't have to be parsed again.
+    Content is kept pickled: it's faster to unpickle than to parse,
+    and each caller gets its own copy that can be modified freely.
+    """
+
+    __slots__ = ("_entries", "_size", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._size = 0
+        self._maxsize = maxsize
+
+    def load(self, path: Path, source: bytes) -> Any:
+        digest = hashlib.sha256(source).digest()
+
+        pickled = self._get(digest)
+        if pickled is None:
+            pickled = self._put(digest=digest, content=load_yaml(path=path, source=source))
+
+        return pickle.loads(pickled)  # noqa: S301
+
+    def preload(self, files: Iterable[tuple[Path, bytes]]) -> None:
+        """Parse files with content that isn't in cache yet, in parallel when there are many of them"""
+
+        to_load = {}
+        for path, source in files:
+            digest = hashlib.sha256(source).digest()
+            if digest not in self._entries:
+                to_load.setdefault(digest, (path, source))
+
+        for digest, content in zip(to_load, _load_files(to_load.values())):
+            self._put(digest=digest, content=content)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _get(self, digest: bytes) -> bytes | None:
+        pickled = self._entries.get(digest)
+        if pickled is not None:
+            self._entries.move_to_end(digest)
+
+        return pickled
+
+    def _put(self, digest: bytes, content: Any) -> bytes:
+        pickled = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(pickled) > self._maxsize:
+            return pickled
+
+        self._entries[digest] = pickled
+        self._size += len(pickled)
+        while self._size > self._maxsize:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+        return pickled
+
+
+def _load_files(files: Collection[tuple[Path, bytes]]) -> list[Any]:
+    workers = min(len(files), os.cpu_count() or 1, PARALLEL_LOAD_MAX_WORKERS)
+    if len(files) >= PARALLEL_LOAD_MIN_FILES and workers > 1:
+        paths, sources = zip(*files)
+        # pool is shared and persistent, so workers are started once per process, not on each bundle load
+        pool = get_process_pool(workers=workers)
+        try:
+            return list(pool.map(load_yaml, paths, sources, chunksize=max(1, len(files) // (workers * 4))))
+        except BrokenProcessPool:
+            # spawned worker may fail to start, e.g. when main module of current process can't be imported again
+            discard_process_pool(pool)
+
+    return [load_yaml(path=path, source=source) for path, source in files]
+
+
+parsed_yaml_cache = ParsedYAMLCache(maxsize=PARSED_YAML_CACHE_SIZE)
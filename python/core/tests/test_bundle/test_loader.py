@@ -0,0 +1,149 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest import TestCase, skipUnless
+from unittest.mock import Mock, patch
+
+import yaml
+
+from core.bundle_alt import _loader
+from core.bundle_alt._loader import FirstExplicitKeyLoader, ParsedYAMLCache
+from core.bundle_alt.errors import BundleProcessingError
+from core.workers import get_process_pool
+
+BUNDLE_CONFIG = """
+- &cluster
+  type: cluster
+  name: cluster
+  version: 1.0
+  name: duplicated
+  config:
+    - name: param
+      type: string
+      default: "multi\\r\\nline"
+- <<: *cluster
+  type: service
+  name: service
+  description: |
+    first line
+    second line
+"""
+
+
+class TestYAMLLoader(TestCase):
+    @skipUnless(yaml.__with_libyaml__, "libyaml isn't available")
+    def test_libyaml_loader_same_as_pure_python_success(self) -> None:
+        self.assertIs(_loader.DefaultLoader, _loader.CFirstExplicitKeyLoader)
+
+        expected = yaml.load(BUNDLE_CONFIG, Loader=FirstExplicitKeyLoader)  # noqa: S506
+
+        self.assertEqual(expected[0]["name"], "cluster")
+        self.assertEqual(expected[1]["name"], "service")
+        self.assertEqual(expected[1]["version"], 1.0)
+        self.assertEqual(_loader.load_yaml(path=Path("config.yaml"), source=BUNDLE_CONFIG.encode()), expected)
+
+    def test_windows_newlines_success(self) -> None:
+        source = BUNDLE_CONFIG.replace("\n", "\r\n").encode()
+
+        self.assertEqual(
+            _loader.load_yaml(path=Path("config.yaml"), source=source),
+            yaml.load(BUNDLE_CONFIG, Loader=FirstExplicitKeyLoader),  # noqa: S506
+        )
+
+    def test_parsing_error_fail(self) -> None:
+        with self.assertRaises(BundleProcessingError) as err:
+            _loader.load_yaml(path=Path("some/config.yaml"), source=b"- name: [")
+
+        self.assertIn('Error during parsing yaml file at "some/config.yaml"', err.exception.message)
+
+
+class TestParsedYAMLCache(TestCase):
+    def test_same_content_parsed_once_success(self) -> None:
+        cache = ParsedYAMLCache(maxsize=1024 * 1024)
+
+        with patch.object(_loader, "load_yaml", wraps=_loader.load_yaml) as load_mock:
+            first = cache.load(path=Path("one/config.yaml"), source=BUNDLE_CONFIG.encode())
+            first[0]["name"] = "changed"
+            second = cache.load(path=Path("another/config.yaml"), source=BUNDLE_CONFIG.encode())
+
+        load_mock.assert_called_once()
+        self.assertEqual(second[0]["name"], "cluster")
+
+    def test_cache_size_is_bounded_success(self) -> None:
+        sources = [f"- name: object_{i}\n  type: service\n".encode() for i in range(3)]
+        cache = ParsedYAMLCache(maxsize=100)
+
+        for source in sources:
+            cache.load(path=Path("config.yaml"), source=source)
+
+        with patch.object(_loader, "load_yaml", wraps=_loader.load_yaml) as load_mock:
+            cache.load(path=Path("config.yaml"), source=sources[-1])
+            load_mock.assert_not_called()
+
+            cache.load(path=Path("config.yaml"), source=sources[0])
+            load_mock.assert_called_once()
+
+    def test_preload_in_parallel_success(self) -> None:
+        files = [(Path(f"service_{i}/config.yaml"), f"- name: service_{i}\n".encode()) for i in range(6)]
+        files.append((Path("copy/config.yaml"), files[0][1]))
+        cache = ParsedYAMLCache(maxsize=1024 * 1024)
+
+        with (
+            patch.object(_loader, "PARALLEL_LOAD_MIN_FILES", new=2),
+            patch.object(_loader.os, "cpu_count", return_value=2),
+            patch.object(_loader, "get_process_pool", wraps=get_process_pool) as get_pool_mock,
+        ):
+            cache.preload(files)
+
+        get_pool_mock.assert_called_once_with(workers=2)
+        with patch.object(_loader, "load_yaml") as load_mock:
+            result = [cache.load(path=path, source=source) for path, source in files]
+
+        load_mock.assert_not_called()
+        self.assertListEqual(result, [[{"name": f"service_{i}"}] for i in (*range(6), 0)])
+
+    def test_preload_in_parallel_error_fail(self) -> None:
+        files = [(Path(f"service_{i}/config.yaml"), f"- name: service_{i}\n".encode()) for i in range(3)]
+        files.insert(1, (Path("broken/config.yaml"), b"- name: ["))
+
+        with (
+            patch.object(_loader, "PARALLEL_LOAD_MIN_FILES", new=2),
+            patch.object(_loader.os, "cpu_count", return_value=2),
+            self.assertRaises(BundleProcessingError) as err,
+        ):
+            ParsedYAMLCache(maxsize=1024 * 1024).preload(files)
+
+        self.assertIn('Error during parsing yaml file at "broken/config.yaml"', err.exception.message)
+
+    def test_preload_when_workers_cant_start_success(self) -> None:
+        files = [(Path(f"service_{i}/config.yaml"), f"- name: service_{i}\n".encode()) for i in range(3)]
+        cache = ParsedYAMLCache(maxsize=1024 * 1024)
+
+        pool = Mock(map=Mock(side_effect=BrokenProcessPool))
+
+        with (
+            patch.object(_loader, "PARALLEL_LOAD_MIN_FILES", new=2),
+            patch.object(_loader.os, "cpu_count", return_value=2),
+            patch.object(_loader, "get_process_pool", return_value=pool),
+            patch.object(_loader, "discard_process_pool") as discard_mock,
+        ):
+            cache.preload(files)
+
+        discard_mock.assert_called_once_with(pool)
+
+        with patch.object(_loader, "load_yaml") as load_mock:
+            result = [cache.load(path=path, source=source) for path, source in files]
+
+        load_mock.assert_not_called()
+        self.assertListEqual(result, [[{"name": f"service_{i}"}] for i in range(3)])
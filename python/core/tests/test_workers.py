@@ -0,0 +1,52 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+import sys
+
+from core import workers
+
+
+class TestProcessPool(TestCase):
+    def test_pool_is_reused_success(self) -> None:
+        pool = workers.get_process_pool(workers=2)
+        self.addCleanup(workers.discard_process_pool, pool)
+
+        self.assertListEqual(list(pool.map(abs, [-1, -2, 3])), [1, 2, 3])
+        self.assertIs(workers.get_process_pool(workers=2), pool)
+
+    def test_discarded_pool_is_replaced_success(self) -> None:
+        pool = workers.get_process_pool(workers=2)
+
+        workers.discard_process_pool(pool)
+        new_pool = workers.get_process_pool(workers=2)
+        self.addCleanup(workers.discard_process_pool, new_pool)
+
+        self.assertIsNot(new_pool, pool)
+
+    def test_python_executable_of_embedded_interpreter_success(self) -> None:
+        version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+
+        with TemporaryDirectory() as venv:
+            Path(venv, "bin").mkdir()
+            Path(venv, "bin", version).touch()
+
+            with (
+                patch.object(workers.sys, "executable", "/usr/bin/uwsgi"),
+                patch.object(workers.sys, "exec_prefix", venv),
+            ):
+                self.assertEqual(workers._get_python_executable(), str(Path(venv, "bin", version)))
+
+        self.assertEqual(workers._get_python_executable(), sys.executable)
@@ -0,0 +1,83 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.context import SpawnContext
+from pathlib import Path
+from threading import Lock
+import os
+import sys
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+_lock = Lock()
+
+
+def get_process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return pool of `workers` worker processes, which lives as long as current process does.
+
+    Starting workers takes longer than small portions of CPU-bound work (YAML parsing, vault key derivation),
+    so pool is created once and reused by all callers.
+    If pool breaks (e.g. worker is killed), it should be dropped with `discard_process_pool`.
+    """
+
+    with _lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=_get_spawn_context())
+
+        return pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    with _lock:
+        for workers, known_pool in tuple(_pools.items()):
+            if known_pool is pool:
+                del _pools[workers]
+
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_spawn_context() -> SpawnContext:
+    # "spawn" is used, because forking process with threads (e.g. web server) may deadlock,
+    # and spawned workers don't share anything (like DB connections) with current process.
+    context = get_context("spawn")
+    context.set_executable(_get_python_executable())
+
+    return context
+
+
+def _get_python_executable() -> str:
+    # When python is embedded (e.g. uwsgi), `sys.executable` is the server binary,
+    # which can't start workers, so interpreter is looked up in environment (venv) instead
+    executable = Path(sys.executable or "python")
+    if executable.name.startswith("python") and executable.is_file():
+        return str(executable)
+
+    for name in (f"python{sys.version_info.major}.{sys.version_info.minor}", f"python{sys.version_info.major}"):
+        candidate = Path(sys.exec_prefix, "bin", name)
+        if candidate.is_file():
+            return str(candidate)
+
+    return str(executable)
+
+
+def _reset_after_fork() -> None:
+    global _lock  # noqa: PLW0603
+
+    # parent's workers belong to parent, child starts its own pool on demand
+    _pools.clear()
+    _lock = Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -91,6 +91,15 @@ class TaskShortInfo:
     action: ActionShortInfo
 
 
+class ActiveTasksLimits(NamedTuple):
+    total: int = 0
+    per_cluster: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.total or self.per_cluster)
+
+
 class LiveCheckResult(NamedTuple):
     is_dead: bool
     status: ExecutionStatus | None = None
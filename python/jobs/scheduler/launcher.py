@@ -10,9 +10,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import Counter, defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
 from types import ModuleType
+from typing import Callable, ContextManager, Iterable
 import os
-import time
 
 import adcm.init_django  # noqa: F401, isort:skip
 
@@ -25,13 +28,15 @@ from cm.services.job.run.repo import JobRepoImpl, JobRepoInterface, TaskTargetCo
 from core.cluster.operations import construct_mapping_from_delta
 from core.job.dto import TaskUpdateDTO
 from core.job.types import ExecutionStatus, Task
-from core.types import BundleID, TaskID
+from core.types import BundleID, ClusterID, TaskID
+from django.db import connection
 from django.db.transaction import atomic
 
 from jobs.scheduler import repo, settings
-from jobs.scheduler._types import TaskQueuer, TaskRunnerEnvironment
+from jobs.scheduler._types import ActiveTasksLimits, TaskQueuer, TaskRunnerEnvironment
 from jobs.scheduler.errors import LauncherError
 from jobs.scheduler.logger import logger
+from jobs.scheduler.notifications import TaskWakeUp, get_task_wake_up
 from jobs.scheduler.queuers import QUEUER_REGISTRY
 from jobs.scheduler.utils import clear_concerns_on_error, set_status_on_fail, set_status_on_success
 
@@ -40,27 +45,197 @@ def run_launcher_in_loop() -> None:
     job_repo: JobRepoInterface = JobRepoImpl
     scheduler_repo: ModuleType = repo
     queuer = QUEUER_REGISTRY[settings.DEFAULT_JOB_EXECUTION_ENVIRONMENT]()
+    wake_up: TaskWakeUp = get_task_wake_up()
+
+    if settings.LAUNCHER_MODE == "parallel":
+        executor = ThreadPoolExecutor(max_workers=settings.LAUNCHER_WORKERS, thread_name_prefix="launcher")
+        drain = partial(
+            drain_created_tasks_in_parallel,
+            executor=executor,
+            batch_size=settings.LAUNCHER_BATCH_SIZE,
+            limits=ActiveTasksLimits(
+                total=settings.LAUNCHER_MAX_ACTIVE_TASKS, per_cluster=settings.LAUNCHER_MAX_ACTIVE_TASKS_PER_CLUSTER
+            ),
+        )
+    else:
+        drain = drain_created_tasks
+
+    logger.info(f"{queuer.env.capitalize()} {settings.LAUNCHER_MODE} launcher started (pid: {os.getpid()})")
+
+    try:
+        while True:
+            try:
+                launched = drain(queuer=queuer, job_repo=job_repo, scheduler_repo=scheduler_repo)
+                if launched:
+                    logger.debug(f"{queuer.env.capitalize()} launcher processed {launched} task(s)")
+            except Exception:  # noqa: BLE001
+                logger.exception(f"{queuer.env.capitalize()} launcher encountered an error. Skipping iteration.")
+
+            wake_up.wait(timeout=settings.LAUNCHER_ITERATION_INTERVAL)
+    finally:
+        wake_up.close()
+
+
+def drain_created_tasks(*, queuer: TaskQueuer, job_repo: JobRepoInterface, scheduler_repo: ModuleType) -> int:
+    """Process created tasks one by one until there are none left, return number of processed tasks"""
+
+    processed = 0
+
+    while launch_task(
+        lock_task=job_repo.retrieve_and_lock_first_created_task,
+        queuer=queuer,
+        job_repo=job_repo,
+        scheduler_repo=scheduler_repo,
+    ):
+        processed += 1
+
+    return processed
 
-    logger.info(f"{queuer.env.capitalize()} launcher started (pid: {os.getpid()})")
+
+def drain_created_tasks_in_parallel(
+    *,
+    queuer: TaskQueuer,
+    job_repo: JobRepoInterface,
+    scheduler_repo: ModuleType,
+    executor: Executor,
+    batch_size: int,
+    limits: ActiveTasksLimits,
+) -> int:
+    """
+    Process created tasks in batches until there are none left (or limits are reached),
+    return number of processed tasks.
+
+    Tasks of the same cluster are processed sequentially in order of creation,
+    since scheduling of one task affects validation of the next one (locks, concerns, states),
+    while tasks of different clusters are independent and are processed concurrently.
+
+    Batch is only a candidates list: each task is claimed right before scheduling,
+    so the same task won't be launched twice by concurrent launchers.
+    Clusters that reached the limit are left out of the batch,
+    so their created tasks don't take place of other clusters' ones.
+    """
+
+    processed = 0
 
     while True:
-        time.sleep(settings.LAUNCHER_ITERATION_INTERVAL)
+        active = scheduler_repo.retrieve_active_tasks_clusters() if limits.enabled else ()
+        created = scheduler_repo.retrieve_created_tasks_clusters(
+            limit=batch_size, exclude_clusters=find_saturated_clusters(active=active, limits=limits)
+        )
+
+        lanes = split_tasks_to_lanes(created=created, active=active, limits=limits)
+        if not lanes:
+            return processed
+
+        futures = [
+            executor.submit(
+                _launch_lane, task_ids=task_ids, queuer=queuer, job_repo=job_repo, scheduler_repo=scheduler_repo
+            )
+            for task_ids in lanes.values()
+        ]
+        processed_in_batch = sum(future.result() for future in futures)
+        processed += processed_in_batch
+
+        if not processed_in_batch:
+            return processed
+
+
+def find_saturated_clusters(
+    active: Iterable[tuple[TaskID, ClusterID | None]], limits: ActiveTasksLimits
+) -> set[ClusterID]:
+    """Return clusters which can't have more active tasks due to per cluster limit"""
+
+    if not limits.per_cluster:
+        return set()
 
-        try:
-            scheduled = False
-            with atomic(), job_repo.retrieve_and_lock_first_created_task() as task_id:
-                if task_id is None:
-                    continue
+    active_per_cluster = Counter(cluster_id for _, cluster_id in active if cluster_id is not None)
 
-                scheduled = schedule_task(
-                    task_id=task_id, env_type=queuer.env, job_repo=job_repo, scheduler_repo=scheduler_repo
+    return {cluster_id for cluster_id, amount in active_per_cluster.items() if amount >= limits.per_cluster}
+
+
+def split_tasks_to_lanes(
+    created: Iterable[tuple[TaskID, ClusterID | None]],
+    active: Iterable[tuple[TaskID, ClusterID | None]],
+    limits: ActiveTasksLimits,
+) -> dict[ClusterID | None, list[TaskID]]:
+    """
+    Group created tasks by cluster preserving their order (non-cluster tasks form a separate lane),
+    leaving out tasks that would exceed limits of active tasks.
+    Once task of a cluster is left out, all the following tasks of this cluster are left out too.
+    """
+
+    active_total = 0
+    active_per_cluster = defaultdict(int)
+    for _, cluster_id in active:
+        active_total += 1
+        active_per_cluster[cluster_id] += 1
+
+    lanes = defaultdict(list)
+    for task_id, cluster_id in sorted(created):
+        if limits.total and active_total >= limits.total:
+            break
+
+        if limits.per_cluster and cluster_id is not None and active_per_cluster[cluster_id] >= limits.per_cluster:
+            continue
+
+        lanes[cluster_id].append(task_id)
+        active_total += 1
+        active_per_cluster[cluster_id] += 1
+
+    return dict(lanes)
+
+
+def _launch_lane(
+    *, task_ids: Iterable[TaskID], queuer: TaskQueuer, job_repo: JobRepoInterface, scheduler_repo: ModuleType
+) -> int:
+    processed = 0
+
+    try:
+        for task_id in task_ids:
+            try:
+                processed += launch_task(
+                    lock_task=partial(scheduler_repo.retrieve_and_lock_created_task, task_id=task_id),
+                    queuer=queuer,
+                    job_repo=job_repo,
+                    scheduler_repo=scheduler_repo,
                 )
+            except Exception:  # noqa: BLE001
+                logger.exception(f"{queuer.env.capitalize()} launcher failed to process task #{task_id}")
+    finally:
+        # Lane is processed in executor's thread which has its own DB connection
+        connection.close()
 
-            if scheduled:
-                with atomic():
-                    queue_task(queuer=queuer, task_id=task_id, job_repo=job_repo)
-        except Exception:  # noqa: BLE001
-            logger.exception(f"{queuer.env.capitalize()} launcher encountered an error. Skipping iteration.")
+    return processed
+
+
+def launch_task(
+    *,
+    lock_task: Callable[[], ContextManager[TaskID | None]],
+    queuer: TaskQueuer,
+    job_repo: JobRepoInterface,
+    scheduler_repo: ModuleType,
+) -> bool:
+    """
+    Schedule and queue the task returned by `lock_task`.
+    Return `False` if there was no task to process.
+
+    Failed scheduling/queueing moves task out of "created" status (see decorators),
+    so task won't be picked up again on the next call.
+    """
+
+    with atomic(), lock_task() as task_id:
+        if task_id is None:
+            return False
+
+        scheduled = schedule_task(
+            task_id=task_id, env_type=queuer.env, job_repo=job_repo, scheduler_repo=scheduler_repo
+        )
+
+    if scheduled:
+        with atomic():
+            queue_task(queuer=queuer, task_id=task_id, job_repo=job_repo)
+
+    return True
 
 
 @set_status_on_fail(status=ExecutionStatus.BROKEN, errors=Exception)
@@ -10,51 +10,125 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import dataclass, field
+from typing import Iterable
 import os
 import time
 
 from core.job.types import ExecutionStatus
+from core.types import TaskID
 
 from jobs.scheduler import repo, settings
 from jobs.scheduler._types import CELERY_RUNNING_STATES, CeleryTaskState, TaskRunnerEnvironment, TaskShortInfo
 from jobs.scheduler.logger import logger
-from jobs.scheduler.utils import finalize_task, is_pid_exists, retrieve_celery_task_state
+from jobs.scheduler.utils import finalize_task, retrieve_alive_pids, retrieve_celery_tasks_states
 
 
-def _is_alive_local(task: TaskShortInfo) -> bool:
-    worker_id = int(task.worker["worker_id"])
-    if worker_id < 2:
-        raise ValueError("Specify a valid PID (>=2)")
+def _retrieve_alive_local(tasks: list[TaskShortInfo]) -> set[TaskID]:
+    pids = {}
+    for task in tasks:
+        worker_id = int(task.worker["worker_id"])
+        if worker_id < 2:
+            raise ValueError(f"Specify a valid PID (>=2) for Task #{task.id}")
 
-    return is_pid_exists(pid=worker_id)
+        pids[task.id] = worker_id
 
+    alive_pids = retrieve_alive_pids(pids=pids.values())
 
-def _is_alive_celery(task: TaskShortInfo) -> bool:
-    celery_state = retrieve_celery_task_state(worker_id=task.worker["worker_id"])
-    if celery_state == CeleryTaskState.ADCM_UNREACHABLE:
-        logger.warning(f"Task #{task.id} can't check celery state. Considering dead.")
-        return False
+    return {task_id for task_id, pid in pids.items() if pid in alive_pids}
 
-    return celery_state in CELERY_RUNNING_STATES
+
+def _retrieve_alive_celery(tasks: list[TaskShortInfo]) -> set[TaskID]:
+    states = retrieve_celery_tasks_states(worker_ids=[task.worker["worker_id"] for task in tasks])
+
+    alive = set()
+    for task in tasks:
+        celery_state = states[task.worker["worker_id"]]
+        if celery_state == CeleryTaskState.ADCM_UNREACHABLE:
+            logger.warning(f"Task #{task.id} can't check celery state. Considering dead.")
+            continue
+
+        if celery_state in CELERY_RUNNING_STATES:
+            alive.add(task.id)
+
+    return alive
 
 
 ALIVE_CHECKS_REGISTRY = {
-    TaskRunnerEnvironment.LOCAL: _is_alive_local,
-    TaskRunnerEnvironment.CELERY: _is_alive_celery,
+    TaskRunnerEnvironment.LOCAL: _retrieve_alive_local,
+    TaskRunnerEnvironment.CELERY: _retrieve_alive_celery,
 }
 
 
-def run_monitor_in_loop() -> None:
+@dataclass(slots=True)
+class DeadWorkerDetectionMetric:
+    """
+    Time passed between the last check when task's worker was seen alive and the check it was detected dead.
+    It's an upper bound of time required to detect a dead worker, so it shouldn't exceed the monitor interval.
+    """
+
+    last_seen_alive: dict[TaskID, float] = field(default_factory=dict)
+    detected: int = 0
+    max_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    def observe_alive(self, task_ids: Iterable[TaskID], now: float) -> None:
+        for task_id in task_ids:
+            self.last_seen_alive[task_id] = now
+
+    def observe_dead(self, task_id: TaskID, now: float) -> None:
+        last_seen = self.last_seen_alive.pop(task_id, None)
+        if last_seen is None:
+            logger.info(f"Task #{task_id} worker detected dead on the first check")
+            return
+
+        seconds = now - last_seen
+        self.detected += 1
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.total_seconds += seconds
+
+        logger.info(
+            f"Task #{task_id} worker detected dead in {seconds:.2f}s "
+            f"(detected: {self.detected}, avg: {self.total_seconds / self.detected:.2f}s, max: {self.max_seconds:.2f}s)"
+        )
+
+    def forget_except(self, task_ids: set[TaskID]) -> None:
+        # tasks finished by their workers shouldn't pile up
+        for task_id in self.last_seen_alive.keys() - task_ids:
+            del self.last_seen_alive[task_id]
+
+
+def check_running_tasks(metric: DeadWorkerDetectionMetric) -> None:
     scheduler_repo = repo
-    logger.info(f"Monitor started (pid: {os.getpid()})")
+
+    running_tasks = list(scheduler_repo.retrieve_running_tasks())
+    now = time.monotonic()
+
+    dead_tasks = [task for task in running_tasks if not task.worker]
+    tasks_by_env = {}
+    for task in running_tasks:
+        if task.worker:
+            tasks_by_env.setdefault(task.worker["environment"], []).append(task)
+
+    for env, tasks in tasks_by_env.items():
+        alive = ALIVE_CHECKS_REGISTRY[env](tasks=tasks)
+        metric.observe_alive(task_ids=alive, now=now)
+        dead_tasks.extend(task for task in tasks if task.id not in alive)
+
+    for task in dead_tasks:
+        finalize_task(task=task, status=ExecutionStatus.ABORTED)
+        metric.observe_dead(task_id=task.id, now=now)
+
+    metric.forget_except(task_ids={task.id for task in running_tasks})
+
+
+def run_monitor_in_loop() -> None:
+    metric = DeadWorkerDetectionMetric()
+    logger.info(f"Monitor started (pid: {os.getpid()}, interval: {settings.TASK_HEALTHCHECK_INTERVAL}s)")
 
     while True:
         time.sleep(settings.TASK_HEALTHCHECK_INTERVAL)
         try:
-            for running_task in scheduler_repo.retrieve_running_tasks():
-                if not running_task.worker or not ALIVE_CHECKS_REGISTRY[running_task.worker["environment"]](
-                    task=running_task
-                ):
-                    finalize_task(task=running_task, status=ExecutionStatus.ABORTED)
+            check_running_tasks(metric=metric)
         except Exception:  # noqa: BLE001
             logger.exception("Skipping monitor iteration due to exception:")
@@ -0,0 +1,113 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+import time
+import select
+
+from django.db import connection
+
+from jobs.scheduler import settings
+from jobs.scheduler.logger import logger
+
+
+class TaskWakeUp(ABC):
+    """
+    Blocks launcher until there's a chance that new task is ready to be scheduled.
+
+    `wait` is allowed to return early (spurious wake up) or by timeout,
+    so launcher should always check for created tasks on its own after it.
+    """
+
+    @abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """Return `True` if woken up by notification, `False` on timeout"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release resources used for waiting, `wait` may be called again after it"""
+
+
+class PostgresTaskWakeUp(TaskWakeUp):
+    """
+    Listens for notifications sent by `cm_tasklog_notify_created` trigger on `TaskLog` insert.
+
+    Dedicated connection is used, because Django's one is reused for transactions
+    and may be closed/reopened by `CONN_MAX_AGE` handling, losing the subscription.
+    """
+
+    def __init__(self, channel: str = settings.LAUNCHER_NOTIFY_CHANNEL) -> None:
+        self._channel = channel
+        self._connection = None
+
+    def _connect(self):
+        if self._connection is None or self._connection.closed:
+            self._connection = connection.get_new_connection(conn_params=connection.get_connection_params())
+            self._connection.autocommit = True
+
+            with self._connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self._channel}";')
+
+            logger.debug(f"Listening for new tasks on '{self._channel}' channel")
+
+        return self._connection
+
+    def wait(self, timeout: float) -> bool:
+        try:
+            listener = self._connect()
+
+            if not listener.notifies:
+                readable, _, _ = select.select([listener], [], [], timeout)
+                if not readable:
+                    return False
+
+            listener.poll()
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to wait for new tasks notifications, reconnecting")
+            self.close()
+
+            return False
+
+        notified = bool(listener.notifies)
+        # All pending notifications are coalesced into one wake up, since launcher drains all created tasks anyway
+        listener.notifies.clear()
+
+        return notified
+
+    def close(self) -> None:
+        if self._connection is not None and not self._connection.closed:
+            self._connection.close()
+
+        self._connection = None
+
+
+class PollingTaskWakeUp(TaskWakeUp):
+    """
+    Stand-in for backends without LISTEN/NOTIFY support.
+
+    Tasks are created by other processes, so there's nothing to wait for but timeout.
+    """
+
+    def wait(self, timeout: float) -> bool:
+        time.sleep(timeout)
+
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+def get_task_wake_up() -> TaskWakeUp:
+    if connection.vendor == "postgresql":
+        return PostgresTaskWakeUp()
+
+    return PollingTaskWakeUp()
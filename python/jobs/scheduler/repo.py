@@ -10,7 +10,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Generator, Sequence
+from contextlib import contextmanager
+from typing import Collection, Generator, Iterable, Sequence
 
 from adcm.settings import (
     ADCM_HOST_TURN_OFF_MM_ACTION_NAME,
@@ -18,12 +19,14 @@ from adcm.settings import (
     ADCM_TURN_OFF_MM_ACTION_NAME,
     ADCM_TURN_ON_MM_ACTION_NAME,
 )
-from cm.models import UNFINISHED_STATUS, Action, ConcernItem, ConcernType, JobLog, JobStatus, TaskLog
+from cm.models import UNFINISHED_STATUS, Action, ConcernItem, ConcernType, Host, JobLog, JobStatus, TaskLog
 from core.job.types import ExecutionStatus
-from core.types import ActionID, ConcernID, JobID, TaskID
+from core.types import ActionID, ClusterID, ConcernID, JobID, TaskID
+from django.db.models import Q
 
 from jobs.scheduler._types import ActionShortInfo, TaskShortInfo
 
+_ACTIVE_STATUSES = (JobStatus.SCHEDULED, JobStatus.QUEUED, JobStatus.RUNNING)
 _FIELDS = ("id", "executor", "status", "lock_id", "action_id", "action__name")
 MM_ACTION_NAMES = {
     ADCM_TURN_ON_MM_ACTION_NAME,
@@ -78,3 +81,70 @@ def retrieve_concern_tasks(
     type_: ConcernType = ConcernType.LOCK,
 ) -> Generator[tuple[ConcernID, TaskID | None], None, None]:
     yield from ConcernItem.objects.filter(type=type_).values_list("id", "tasklog")
+
+
+@contextmanager
+def retrieve_and_lock_created_task(task_id: TaskID) -> Generator[TaskID | None, None, None]:
+    """Lock task if it's still in "created" status and isn't locked by other transaction"""
+
+    yield (
+        TaskLog.objects.select_for_update(skip_locked=True)
+        .filter(id=task_id, status=JobStatus.CREATED)
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def retrieve_created_tasks_clusters(
+    limit: int, exclude_clusters: Collection[ClusterID] = ()
+) -> list[tuple[TaskID, ClusterID | None]]:
+    """
+    Return up to `limit` first created tasks with ids of clusters they belong to (`None` for non-cluster tasks),
+    leaving out tasks of `exclude_clusters` (including tasks of hosts in these clusters).
+
+    Tasks aren't locked here: each task should be claimed with `retrieve_and_lock_created_task`
+    in the same transaction where its status is changed.
+    """
+
+    tasks = TaskLog.objects.filter(status=JobStatus.CREATED)
+    if exclude_clusters:
+        exclude_hosts = list(Host.objects.filter(cluster_id__in=exclude_clusters).values_list("id", flat=True))
+        tasks = tasks.exclude(
+            Q(selector__cluster__id__in=list(exclude_clusters)) | Q(selector__host__id__in=exclude_hosts)
+        )
+
+    return _resolve_tasks_clusters(rows=tasks.order_by("id").values_list("id", "selector")[:limit])
+
+
+def retrieve_active_tasks_clusters() -> list[tuple[TaskID, ClusterID | None]]:
+    """Return ids of scheduled/queued/running tasks with ids of clusters they belong to"""
+
+    return _resolve_tasks_clusters(
+        rows=TaskLog.objects.filter(status__in=_ACTIVE_STATUSES).values_list("id", "selector")
+    )
+
+
+def _resolve_tasks_clusters(rows: Iterable[tuple[TaskID, dict]]) -> list[tuple[TaskID, ClusterID | None]]:
+    # Host's own actions don't have cluster in selector,
+    # but host in cluster should be considered a part of it, so it's looked up separately
+    result = []
+    hosts_to_resolve = set()
+
+    for task_id, selector in rows:
+        selector = selector or {}
+        cluster_id = selector.get("cluster", {}).get("id")
+        host_id = selector.get("host", {}).get("id")
+
+        if cluster_id is None and host_id is not None:
+            hosts_to_resolve.add(host_id)
+
+        result.append((task_id, cluster_id, host_id))
+
+    host_cluster_map = (
+        dict(Host.objects.filter(id__in=hosts_to_resolve).values_list("id", "cluster_id")) if hosts_to_resolve else {}
+    )
+
+    return [
+        (task_id, cluster_id if cluster_id is not None else host_cluster_map.get(host_id))
+        for task_id, cluster_id, host_id in result
+    ]
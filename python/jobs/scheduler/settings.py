@@ -14,9 +14,22 @@ from pathlib import Path
 import os
 import logging
 
-TASK_HEALTHCHECK_INTERVAL = int(os.environ.get("TASK_HEALTHCHECK_INTERVAL", 60))
+# Liveness of all running tasks is checked in bulk (one query/pass per environment), so the check is cheap
+TASK_HEALTHCHECK_INTERVAL = float(os.environ.get("TASK_HEALTHCHECK_INTERVAL", 10))
 DEFAULT_JOB_EXECUTION_ENVIRONMENT = os.environ.get("DEFAULT_JOB_EXECUTION_ENVIRONMENT", "local")
-LAUNCHER_ITERATION_INTERVAL = 1
+# Launcher is woken up by notification on task creation,
+# interval is a fallback for missed notifications and backends without LISTEN/NOTIFY support
+LAUNCHER_ITERATION_INTERVAL = float(os.environ.get("LAUNCHER_ITERATION_INTERVAL", 1))
+LAUNCHER_NOTIFY_CHANNEL = "adcm_task_created"
+# "sequential" launcher schedules tasks one by one,
+# "parallel" one claims tasks in batches and schedules tasks of different clusters concurrently
+LAUNCHER_MODE = os.environ.get("LAUNCHER_MODE", "sequential")
+LAUNCHER_BATCH_SIZE = int(os.environ.get("LAUNCHER_BATCH_SIZE", 100))
+LAUNCHER_WORKERS = int(os.environ.get("LAUNCHER_WORKERS", 8))
+# Limits of scheduled/queued/running tasks for "parallel" launcher, 0 means no limit.
+# Tasks exceeding limits stay "created" until earlier ones are finished.
+LAUNCHER_MAX_ACTIVE_TASKS = int(os.environ.get("LAUNCHER_MAX_ACTIVE_TASKS", 0))
+LAUNCHER_MAX_ACTIVE_TASKS_PER_CLUSTER = int(os.environ.get("LAUNCHER_MAX_ACTIVE_TASKS_PER_CLUSTER", 0))
 
 LOG_DIR = Path(__file__).absolute().parent.parent.parent.parent / "data" / "log"
 DEFAULT_LOG_LEVEL = os.getenv("LOG_LEVEL", logging.getLevelName(logging.ERROR))
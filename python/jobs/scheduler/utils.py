@@ -13,6 +13,7 @@
 from contextlib import suppress
 from datetime import datetime
 from functools import wraps
+from typing import Collection, Iterable
 import os
 import errno
 
@@ -103,25 +104,48 @@ def clear_concerns_on_error(func):
 
 
 def retrieve_celery_task_state(worker_id: WorkerID) -> CeleryTaskState:
+    return retrieve_celery_tasks_states(worker_ids=(worker_id,))[worker_id]
+
+
+def retrieve_celery_tasks_states(worker_ids: Collection[WorkerID]) -> dict[WorkerID, CeleryTaskState]:
+    """
+    Retrieve states of all given celery tasks with one query to taskmeta table
+    and (if there are running tasks) one query to workers heartbeat table.
+    """
+
+    if not worker_ids:
+        return {}
+
     table = "celery_taskmeta"
-    fields = "status, worker"
-    condition = f"task_id = '{worker_id}'"
+    fields = "task_id, status, worker"
+    ids = tuple(map(str, worker_ids))
+    condition = f"task_id IN ({', '.join(['%s'] * len(ids))})"
 
     with connection.cursor() as cursor:
-        cursor.execute(f"SELECT {fields} FROM {table} WHERE {condition};")  # noqa: S608
-        row = cursor.fetchone()
+        cursor.execute(f"SELECT {fields} FROM {table} WHERE {condition};", ids)  # noqa: S608
+        rows = {task_id: (status_raw, hostname) for task_id, status_raw, hostname in cursor.fetchall()}
 
-    if not row:
-        return CeleryTaskState.ADCM_UNREACHABLE
+    states = {}
+    alive_workers = None
 
-    status_raw, hostname = row
+    for worker_id, id_ in zip(worker_ids, ids):
+        if id_ not in rows:
+            states[worker_id] = CeleryTaskState.ADCM_UNREACHABLE
+            continue
 
-    status = CeleryTaskState(status_raw.upper())
+        status_raw, hostname = rows[id_]
+        status = CeleryTaskState(status_raw.upper())
 
-    if status in CELERY_RUNNING_STATES and hostname not in app.ping():
-        return CeleryTaskState.FAILURE
+        if status in CELERY_RUNNING_STATES:
+            if alive_workers is None:
+                alive_workers = app.ping()
 
-    return status
+            if hostname not in alive_workers:
+                status = CeleryTaskState.FAILURE
+
+        states[worker_id] = status
+
+    return states
 
 
 @atomic
@@ -166,3 +190,9 @@ def is_pid_exists(pid: PID) -> bool:
         raise
 
     return True
+
+
+def retrieve_alive_pids(pids: Iterable[PID]) -> set[PID]:
+    """Check all `pids` in one pass, return the ones that exist"""
+
+    return {pid for pid in set(pids) if is_pid_exists(pid=pid)}
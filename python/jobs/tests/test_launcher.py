@@ -0,0 +1,254 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from pathlib import Path
+from unittest.mock import patch
+
+from adcm.tests.base import BusinessLogicMixin, ParallelReadyTestCase, TaskTestMixin
+from adcm.tests.benchmark import benchmark, measure
+from cm.models import Cluster, JobStatus, TaskLog
+from cm.services.job.run.repo import JobRepoImpl
+from core.job.dto import TaskPayloadDTO
+from core.types import TaskID
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase
+from init_db import init
+from rbac.upgrade.role import init_roles
+
+from jobs.scheduler import repo
+from jobs.scheduler._types import ActiveTasksLimits, TaskQueuer, TaskRunnerEnvironment, WorkerInfo
+from jobs.scheduler.launcher import drain_created_tasks, drain_created_tasks_in_parallel, split_tasks_to_lanes
+from jobs.scheduler.notifications import PollingTaskWakeUp, PostgresTaskWakeUp, get_task_wake_up
+
+
+class TestSplitTasksToLanes(SimpleTestCase):
+    def test_no_limits_tasks_grouped_by_cluster_in_order(self) -> None:
+        created = [(4, 1), (1, 1), (2, 2), (3, None), (5, None)]
+
+        lanes = split_tasks_to_lanes(created=created, active=(), limits=ActiveTasksLimits())
+
+        self.assertDictEqual(lanes, {1: [1, 4], 2: [2], None: [3, 5]})
+
+    def test_per_cluster_limit_respects_active_tasks(self) -> None:
+        created = [(10, 1), (11, 2), (12, 1), (13, 2), (14, None), (15, None)]
+        active = [(1, 1), (2, None)]
+
+        lanes = split_tasks_to_lanes(created=created, active=active, limits=ActiveTasksLimits(per_cluster=2))
+
+        self.assertDictEqual(lanes, {1: [10], 2: [11, 13], None: [14, 15]})
+
+    def test_total_limit_stops_in_creation_order(self) -> None:
+        created = [(10, 1), (11, 2), (12, 3), (13, 1)]
+        active = [(1, 4)]
+
+        lanes = split_tasks_to_lanes(created=created, active=active, limits=ActiveTasksLimits(total=3))
+
+        self.assertDictEqual(lanes, {1: [10], 2: [11]})
+
+    def test_limits_reached_nothing_to_launch(self) -> None:
+        lanes = split_tasks_to_lanes(
+            created=[(10, 1)], active=[(1, 1)], limits=ActiveTasksLimits(total=5, per_cluster=1)
+        )
+
+        self.assertDictEqual(lanes, {})
+
+
+class NoOpQueuer(TaskQueuer):
+    env = TaskRunnerEnvironment.LOCAL
+
+    def queue(self, task_id: TaskID) -> WorkerInfo:
+        return WorkerInfo(environment=self.env.value, worker_id=task_id)
+
+
+class RecordingQueuer(NoOpQueuer):
+    def __init__(self) -> None:
+        self.queued = []
+
+    def queue(self, task_id: TaskID) -> WorkerInfo:
+        # list.append is atomic, so it's safe to call from launcher's threads
+        self.queued.append(task_id)
+
+        return super().queue(task_id)
+
+
+@patch("jobs.scheduler.utils.send_task_status_update_event")
+class TestLauncher(TransactionTestCase, ParallelReadyTestCase, BusinessLogicMixin, TaskTestMixin):
+    def setUp(self) -> None:
+        # DB is flushed after each test of TransactionTestCase
+        init_roles()
+        init()
+
+        self.bundle = self.add_bundle(
+            source_dir=Path(__file__).parent.parent.parent / "cm" / "tests" / "bundles" / "cluster_1"
+        )
+
+    def _create_task(self, cluster: Cluster | None = None) -> TaskLog:
+        # running task's flag is unique per action and owner, so each launched task should have its own cluster
+        cluster = cluster or self.add_cluster(bundle=self.bundle, name=f"Cluster {Cluster.objects.count()}")
+        return self.prepare_task(owner=cluster, name="action_on_cluster", payload=TaskPayloadDTO(is_blocking=False))
+
+    def test_drain_processes_all_created_tasks_success(self, _) -> None:
+        tasks = [self._create_task() for _ in range(3)]
+
+        processed = drain_created_tasks(queuer=NoOpQueuer(), job_repo=JobRepoImpl, scheduler_repo=repo)
+
+        self.assertEqual(processed, 3)
+        self.assertListEqual(
+            list(TaskLog.objects.filter(id__in=[task.id for task in tasks]).values_list("status", flat=True)),
+            [JobStatus.QUEUED] * 3,
+        )
+        self.assertEqual(drain_created_tasks(queuer=NoOpQueuer(), job_repo=JobRepoImpl, scheduler_repo=repo), 0)
+
+    def test_wake_up_on_task_creation_success(self, _) -> None:
+        wake_up = get_task_wake_up()
+        self.addCleanup(wake_up.close)
+
+        self.assertIsInstance(wake_up, PostgresTaskWakeUp)
+        # the first call subscribes for notifications
+        self.assertFalse(wake_up.wait(timeout=0))
+
+        self._create_task()
+        self._create_task()
+
+        self.assertTrue(wake_up.wait(timeout=5))
+        # notifications received by the time of wake up are coalesced into it
+        self.assertFalse(wake_up.wait(timeout=0.1))
+
+    def test_polling_wake_up_on_other_backends_success(self, _) -> None:
+        with patch.object(connection, "vendor", new="sqlite"):
+            wake_up = get_task_wake_up()
+        self.addCleanup(wake_up.close)
+
+        self.assertIsInstance(wake_up, PollingTaskWakeUp)
+        self.assertFalse(wake_up.wait(timeout=0))
+
+    def test_concurrent_parallel_drains_launch_each_task_once_success(self, _) -> None:
+        tasks = [self._create_task() for _ in range(10)]
+        queuer = RecordingQueuer()
+
+        def drain() -> int:
+            try:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    return drain_created_tasks_in_parallel(
+                        queuer=queuer,
+                        job_repo=JobRepoImpl,
+                        scheduler_repo=repo,
+                        executor=executor,
+                        batch_size=len(tasks),
+                        limits=ActiveTasksLimits(),
+                    )
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=2) as launchers:
+            processed = [future.result() for future in [launchers.submit(drain), launchers.submit(drain)]]
+
+        self.assertEqual(sum(processed), len(tasks))
+        self.assertListEqual(sorted(queuer.queued), sorted(task.id for task in tasks))
+        self.assertFalse(TaskLog.objects.exclude(status=JobStatus.QUEUED).exists())
+
+    def test_saturated_clusters_dont_take_batch_success(self, _) -> None:
+        busy_cluster = self.add_cluster(bundle=self.bundle, name="Busy Cluster")
+        active_task = self._create_task(cluster=busy_cluster)
+        TaskLog.objects.filter(id=active_task.id).update(status=JobStatus.RUNNING)
+        waiting_tasks = [self._create_task(cluster=busy_cluster) for _ in range(3)]
+        free_task = self._create_task()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            processed = drain_created_tasks_in_parallel(
+                queuer=NoOpQueuer(),
+                job_repo=JobRepoImpl,
+                scheduler_repo=repo,
+                executor=executor,
+                batch_size=2,
+                limits=ActiveTasksLimits(per_cluster=1),
+            )
+
+        self.assertEqual(processed, 1)
+        self.assertEqual(TaskLog.objects.get(id=free_task.id).status, JobStatus.QUEUED)
+        self.assertEqual(
+            set(TaskLog.objects.filter(id__in=[task.id for task in waiting_tasks]).values_list("status", flat=True)),
+            {JobStatus.CREATED},
+        )
+
+
+_flags_counter = count()
+
+
+def _unique_flag_name(action_name: str) -> str:
+    return f"adcm_running_job_{action_name}_{next(_flags_counter)}"
+
+
+@benchmark
+@patch("jobs.scheduler.utils.send_task_status_update_event")
+# running task's flag is unique per action and owner, while many tasks of the same action are launched in here
+@patch("cm.services.concern.locks._detect_name_for_flag", new=_unique_flag_name)
+class TestLauncherBenchmark(TransactionTestCase, ParallelReadyTestCase, BusinessLogicMixin, TaskTestMixin):
+    TASKS_AMOUNT = 100
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        init_roles()
+        init()
+
+    def setUp(self) -> None:
+        self.bundle = self.add_bundle(
+            source_dir=Path(__file__).parent.parent.parent / "cm" / "tests" / "bundles" / "cluster_1"
+        )
+
+    def _create_tasks(self, clusters_amount: int, prefix: str) -> None:
+        clusters = [self.add_cluster(bundle=self.bundle, name=f"{prefix}-{i}") for i in range(clusters_amount)]
+
+        for i in range(self.TASKS_AMOUNT):
+            # non-blocking tasks don't lock the cluster, so all tasks of one cluster can be scheduled
+            self.prepare_task(
+                owner=clusters[i % clusters_amount],
+                name="action_on_cluster",
+                payload=TaskPayloadDTO(is_blocking=False),
+            )
+
+    def _check_all_queued(self) -> None:
+        self.assertFalse(TaskLog.objects.filter(status=JobStatus.CREATED).exists())
+        self.assertFalse(TaskLog.objects.exclude(status=JobStatus.QUEUED).exists())
+
+    def test_tasks_scheduled_per_second(self, _) -> None:
+        for clusters_amount in (1, 10, 100):
+            with self.subTest("sequential", clusters=clusters_amount):
+                self._create_tasks(clusters_amount=clusters_amount, prefix=f"seq-{clusters_amount}")
+
+                with measure("launcher sequential", clusters=clusters_amount) as result:
+                    processed = result.items = drain_created_tasks(
+                        queuer=NoOpQueuer(), job_repo=JobRepoImpl, scheduler_repo=repo
+                    )
+
+                self.assertEqual(processed, self.TASKS_AMOUNT)
+                self._check_all_queued()
+
+            with self.subTest("parallel", clusters=clusters_amount), ThreadPoolExecutor(max_workers=8) as executor:
+                self._create_tasks(clusters_amount=clusters_amount, prefix=f"par-{clusters_amount}")
+
+                with measure("launcher parallel", clusters=clusters_amount) as result:
+                    processed = result.items = drain_created_tasks_in_parallel(
+                        queuer=NoOpQueuer(),
+                        job_repo=JobRepoImpl,
+                        scheduler_repo=repo,
+                        executor=executor,
+                        batch_size=self.TASKS_AMOUNT,
+                        limits=ActiveTasksLimits(),
+                    )
+
+                self.assertEqual(processed, self.TASKS_AMOUNT)
+                self._check_all_queued()
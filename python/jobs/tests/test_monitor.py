@@ -0,0 +1,78 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+from core.job.types import ExecutionStatus
+from django.test import SimpleTestCase
+
+from jobs.scheduler._types import ActionShortInfo, CeleryTaskState, TaskRunnerEnvironment, TaskShortInfo
+from jobs.scheduler.monitor import DeadWorkerDetectionMetric, check_running_tasks
+
+
+def _task(id_: int, environment: TaskRunnerEnvironment, worker_id: int | str) -> TaskShortInfo:
+    return TaskShortInfo(
+        id=id_,
+        worker={"environment": environment, "worker_id": worker_id},
+        status=ExecutionStatus.RUNNING,
+        lock_id=None,
+        action=ActionShortInfo(id=1, is_mm_action=False),
+    )
+
+
+class TestCheckRunningTasks(SimpleTestCase):
+    def setUp(self) -> None:
+        self.local_alive = _task(id_=1, environment=TaskRunnerEnvironment.LOCAL, worker_id=100)
+        self.local_dead = _task(id_=2, environment=TaskRunnerEnvironment.LOCAL, worker_id=200)
+        self.celery_alive = _task(id_=3, environment=TaskRunnerEnvironment.CELERY, worker_id="a")
+        self.celery_failed = _task(id_=4, environment=TaskRunnerEnvironment.CELERY, worker_id="b")
+        self.celery_unknown = _task(id_=5, environment=TaskRunnerEnvironment.CELERY, worker_id="c")
+        self.tasks = [self.local_alive, self.local_dead, self.celery_alive, self.celery_failed, self.celery_unknown]
+
+    def test_liveness_checked_in_bulk_success(self) -> None:
+        celery_states = {
+            "a": CeleryTaskState.STARTED,
+            "b": CeleryTaskState.FAILURE,
+            "c": CeleryTaskState.ADCM_UNREACHABLE,
+        }
+
+        with (
+            patch("jobs.scheduler.monitor.repo.retrieve_running_tasks", return_value=iter(self.tasks)),
+            patch("jobs.scheduler.monitor.retrieve_alive_pids", return_value={100}) as alive_pids_mock,
+            patch(
+                "jobs.scheduler.monitor.retrieve_celery_tasks_states", return_value=celery_states
+            ) as celery_states_mock,
+            patch("jobs.scheduler.monitor.finalize_task") as finalize_mock,
+        ):
+            check_running_tasks(metric=DeadWorkerDetectionMetric())
+
+        alive_pids_mock.assert_called_once()
+        self.assertSetEqual(set(alive_pids_mock.call_args.kwargs["pids"]), {100, 200})
+        celery_states_mock.assert_called_once_with(worker_ids=["a", "b", "c"])
+        self.assertListEqual(
+            [call.kwargs["task"].id for call in finalize_mock.call_args_list],
+            [self.local_dead.id, self.celery_failed.id, self.celery_unknown.id],
+        )
+
+    def test_detection_time_measured_from_last_alive_check_success(self) -> None:
+        metric = DeadWorkerDetectionMetric()
+
+        metric.observe_alive(task_ids=[1, 2], now=10.0)
+        metric.observe_alive(task_ids=[1], now=15.0)
+        metric.observe_dead(task_id=2, now=15.0)
+        metric.observe_dead(task_id=1, now=17.0)
+        metric.observe_dead(task_id=3, now=17.0)
+
+        self.assertEqual(metric.detected, 2)
+        self.assertEqual(metric.max_seconds, 5.0)
+        self.assertEqual(metric.total_seconds, 7.0)
+        self.assertDictEqual(metric.last_seen_alive, {})
@@ -20,4 +20,8 @@ class RBACConfig(AppConfig):
     def ready(self):
         from rbac.signals import (  # noqa: F401, PLC0415
             handle_name_type_display_name,
+            invalidate_deactivated_user,
+            invalidate_deleted_token,
+            invalidate_deleted_user,
+            invalidate_logged_out_session,
         )
@@ -0,0 +1,359 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from cm.models import Action, Component, Host, HostComponent, JobLog, LogStorage, Service, TaskLog
+from core.types import ADCMCoreType
+from django.contrib.auth.models import User as AuthUser
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Exists, IntegerField, Model, OuterRef, Q, QuerySet
+from django.db.models.functions import Cast
+from guardian.models import GroupObjectPermission
+from guardian.shortcuts import get_objects_for_user as get_objects_for_user_by_rows
+
+from rbac.models import Policy, PolicyObject, Role
+
+# Permissions on tasks, jobs and logs aren't stored as object permission rows,
+# they are evaluated from policies that grant access to task's action and its owner.
+TASK_PERMISSIONS: dict[type[Model], frozenset[str]] = {
+    TaskLog: frozenset(("cm.view_tasklog", "cm.change_tasklog")),
+    JobLog: frozenset(("cm.view_joblog", "cm.change_joblog")),
+    LogStorage: frozenset(("cm.view_logstorage",)),
+}
+TASK_LOOKUP: dict[type[Model], str] = {TaskLog: "pk", JobLog: "task_id", LogStorage: "job__task_id"}
+
+_GRANTS_CACHE_ATTR = "_task_grants_cache"
+_TASKS_CACHE_ATTR = "_task_perms_cache"
+
+
+def _owners_in_hierarchy_of(objects: dict[str, set[int]]) -> Q:
+    """
+    Build condition on task owner to be one of `objects` or to be a child of one of them,
+    which is the reverse of `rbac.models.get_objects_for_policy`
+    """
+
+    clusters = objects.get(ADCMCoreType.CLUSTER.value, set())
+    services = objects.get(ADCMCoreType.SERVICE.value, set())
+    components = objects.get(ADCMCoreType.COMPONENT.value, set())
+    providers = objects.get(ADCMCoreType.PROVIDER.value, set())
+    hosts = objects.get(ADCMCoreType.HOST.value, set())
+
+    condition = Q(owner_type=ADCMCoreType.ADCM.value, owner_id__in=objects.get(ADCMCoreType.ADCM.value, set()))
+    condition |= Q(owner_type=ADCMCoreType.CLUSTER.value, owner_id__in=clusters)
+    condition |= Q(owner_type=ADCMCoreType.PROVIDER.value, owner_id__in=providers)
+    condition |= Q(
+        owner_type=ADCMCoreType.SERVICE.value,
+        owner_id__in=Service.objects.filter(Q(pk__in=services) | Q(cluster_id__in=clusters)).values("pk"),
+    )
+    condition |= Q(
+        owner_type=ADCMCoreType.COMPONENT.value,
+        owner_id__in=Component.objects.filter(
+            Q(pk__in=components) | Q(service_id__in=services) | Q(cluster_id__in=clusters)
+        ).values("pk"),
+    )
+
+    hosts_condition = Q(pk__in=hosts) | Q(provider_id__in=providers) | Q(cluster_id__in=clusters)
+    if services or components:
+        mapped_hosts = HostComponent.objects.filter(Q(service_id__in=services) | Q(component_id__in=components))
+        hosts_condition |= Q(pk__in=mapped_hosts.values("host_id"))
+
+    condition |= Q(owner_type=ADCMCoreType.HOST.value, owner_id__in=Host.objects.filter(hosts_condition).values("pk"))
+
+    return condition
+
+
+def _owners_viewable_by(group_id: int) -> Q:
+    condition = Q(pk__in=())
+    for core_type in ADCMCoreType:
+        object_ids = (
+            GroupObjectPermission.objects.filter(
+                group_id=group_id,
+                permission__content_type__app_label="cm",
+                permission__codename=f"view_{core_type.value}",
+            )
+            .annotate(object_id=Cast("object_pk", output_field=IntegerField()))
+            .values("object_id")
+        )
+        condition |= Q(owner_type=core_type.value, owner_id__in=object_ids)
+
+    return condition
+
+
+def _selector_has_any_of(objects: dict[str, set[int]]) -> Q:
+    condition = Q(pk__in=())
+    for core_type, object_ids in objects.items():
+        condition |= Q(**{f"selector__{core_type}__id__in": object_ids})
+
+    return condition
+
+
+def _orphaned_owners() -> Q:
+    condition = Q(pk__in=())
+    for core_type, model in (
+        (ADCMCoreType.SERVICE, Service),
+        (ADCMCoreType.COMPONENT, Component),
+        (ADCMCoreType.HOST, Host),
+    ):
+        condition |= Q(owner_type=core_type.value) & ~Exists(model.objects.filter(pk=OuterRef("owner_id")))
+
+    return condition
+
+
+def _actions_of_roles(role_ids: set[int]) -> dict[int, set[int]]:
+    """Collect actions of `ActionRole` roles from the hierarchy of each role of `role_ids`"""
+
+    children: dict[int, set[int]] = defaultdict(set)
+    known_ids = set(role_ids)
+    level_ids = set(role_ids)
+    while level_ids:
+        for parent_id, child_id in Role.child.through.objects.filter(from_role_id__in=level_ids).values_list(
+            "from_role_id", "to_role_id"
+        ):
+            children[parent_id].add(child_id)
+
+        level_ids = {child_id for parent_id in level_ids for child_id in children[parent_id]} - known_ids
+        known_ids |= level_ids
+
+    role_actions = {
+        role_id: int(init_params["action_id"])
+        for role_id, init_params in Role.objects.filter(pk__in=known_ids, class_name="ActionRole").values_list(
+            "id", "init_params"
+        )
+    }
+
+    roles_actions = {}
+    for role_id in role_ids:
+        actions, visited, to_visit = set(), set(), [role_id]
+        while to_visit:
+            current_id = to_visit.pop()
+            if current_id in visited:
+                continue
+
+            visited.add(current_id)
+            if current_id in role_actions:
+                actions.add(role_actions[current_id])
+
+            to_visit.extend(children[current_id])
+
+        roles_actions[role_id] = actions
+
+    return roles_actions
+
+
+def _actions_condition(action_ids: Iterable[int], actions_keys: dict[int, tuple[str, str, str]]) -> Q:
+    names_by_prototype = defaultdict(set)
+    for action_id in action_ids:
+        if action_id in actions_keys:
+            prototype_type, prototype_name, action_name = actions_keys[action_id]
+            names_by_prototype[prototype_type, prototype_name].add(action_name)
+
+    condition = Q(pk__in=())
+    for (prototype_type, prototype_name), action_names in names_by_prototype.items():
+        condition |= Q(
+            action__prototype__type=prototype_type,
+            action__prototype__name=prototype_name,
+            action__name__in=action_names,
+        )
+
+    return condition
+
+
+def _build_grants_condition(user: AuthUser) -> Q | None:
+    """
+    Task is available to group when some policy of this group grants `view_action` on task's action
+    to an object from the hierarchy of task's owner and group can view the owner itself.
+    That's what `TaskRole` used to materialize into object permissions on task creation.
+
+    Actions are matched by prototype and name, so tasks launched before bundle upgrade stay available.
+    Task of deleted service, component or host can't be checked against its owner,
+    so it's available when some policy grants `view_action` on task's action and `view` on cluster or provider
+    from task's selector. Policies re-applied after deletion lose permissions on actions of deleted object,
+    so for them task's action is looked up in policy's role and policy's object should be in task's selector.
+    """
+
+    user_policies = Policy.objects.filter(group__user__pk=user.pk).values_list("id", "role_id").distinct()
+    policies_roles = dict(user_policies)
+    if not policies_roles:
+        return None
+
+    granted_actions = (
+        Policy.group_object_perm.through.objects.filter(
+            policy_id__in=policies_roles,
+            groupobjectpermission__group__user__pk=user.pk,
+            groupobjectpermission__content_type=ContentType.objects.get_for_model(model=Action),
+            groupobjectpermission__permission__codename="view_action",
+        )
+        .values_list("groupobjectpermission__group_id", "policy_id", "groupobjectpermission__object_pk")
+        .distinct()
+    )
+
+    group_policies_actions: dict[int, dict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+    for group_id, policy_id, action_id in granted_actions:
+        group_policies_actions[group_id][policy_id].add(int(action_id))
+
+    policies_objects: dict[int, dict[str, set[int]]] = defaultdict(lambda: defaultdict(set))
+    for policy_id, model, object_id in PolicyObject.objects.filter(policy__in=policies_roles).values_list(
+        "policy", "content_type__model", "object_id"
+    ):
+        policies_objects[policy_id][model].add(object_id)
+
+    policies_roots: dict[int, dict[str, set[int]]] = defaultdict(lambda: defaultdict(set))
+    for policy_id, codename, object_id in Policy.group_object_perm.through.objects.filter(
+        policy_id__in=policies_roles,
+        groupobjectpermission__permission__content_type__app_label="cm",
+        groupobjectpermission__permission__codename__in=(
+            f"view_{ADCMCoreType.CLUSTER.value}",
+            f"view_{ADCMCoreType.PROVIDER.value}",
+        ),
+    ).values_list("policy_id", "groupobjectpermission__permission__codename", "groupobjectpermission__object_pk"):
+        policies_roots[policy_id][codename.removeprefix("view_")].add(int(object_id))
+
+    roles_actions = _actions_of_roles(role_ids=set(policies_roles.values()))
+
+    action_ids = {
+        action_id
+        for policies in group_policies_actions.values()
+        for policy_action_ids in policies.values()
+        for action_id in policy_action_ids
+    }
+    action_ids.update(action_id for role_action_ids in roles_actions.values() for action_id in role_action_ids)
+    actions_keys = {
+        action_id: (prototype_type, prototype_name, action_name)
+        for action_id, prototype_type, prototype_name, action_name in Action.objects.filter(
+            pk__in=action_ids
+        ).values_list("id", "prototype__type", "prototype__name", "name")
+    }
+
+    condition = Q(pk__in=())
+    orphans_condition = Q(pk__in=())
+    for group_id, policies in group_policies_actions.items():
+        group_condition = Q(pk__in=())
+        for policy_id, policy_action_ids in policies.items():
+            actions_condition = _actions_condition(action_ids=policy_action_ids, actions_keys=actions_keys)
+            if policy_id in policies_roots:
+                orphans_condition |= actions_condition & _selector_has_any_of(objects=policies_roots[policy_id])
+
+            if policy_id in policies_objects:
+                group_condition |= actions_condition & _owners_in_hierarchy_of(objects=policies_objects[policy_id])
+
+        condition |= group_condition & _owners_viewable_by(group_id=group_id)
+
+    # policies of the same role share the actions condition, only objects differ
+    roles_selectors: dict[int, Q] = defaultdict(lambda: Q(pk__in=()))
+    for policy_id, role_id in policies_roles.items():
+        if policy_id in policies_objects and roles_actions[role_id]:
+            roles_selectors[role_id] |= _selector_has_any_of(objects=policies_objects[policy_id])
+
+    for role_id, selector_condition in roles_selectors.items():
+        orphans_condition |= (
+            _actions_condition(action_ids=roles_actions[role_id], actions_keys=actions_keys) & selector_condition
+        )
+
+    return condition | (_orphaned_owners() & orphans_condition)
+
+
+def _get_grants_condition(user: AuthUser) -> Q | None:
+    # User object lives as long as request does, so it's a natural place for per-request cache
+    # (the same way `ModelBackend` caches permissions)
+    if not hasattr(user, _GRANTS_CACHE_ATTR):
+        setattr(user, _GRANTS_CACHE_ATTR, _build_grants_condition(user=user))
+
+    return getattr(user, _GRANTS_CACHE_ATTR)
+
+
+def _normalize_perms(perms: str | Iterable[str], model: type[Model]) -> set[str]:
+    if isinstance(perms, str):
+        perms = (perms,)
+
+    return {perm if "." in perm else f"{model._meta.app_label}.{perm}" for perm in perms}
+
+
+def filter_tasks_for_user(user: AuthUser, queryset: QuerySet) -> QuerySet:
+    """Filter tasks, jobs or logs queryset to the ones which belong to tasks available to user by policies"""
+
+    condition = _get_grants_condition(user=user)
+    if condition is None:
+        return queryset.none()
+
+    return queryset.filter(
+        **{f"{TASK_LOOKUP[queryset.model]}__in": TaskLog.objects.filter(condition).values("pk")}
+    ).distinct()
+
+
+def get_objects_for_user(
+    user: AuthUser,
+    perms: str | Iterable[str],
+    klass: type[Model] | QuerySet,
+    with_superuser: bool = True,
+    accept_global_perms: bool = True,
+    **kwargs,
+) -> QuerySet:
+    """
+    Replacement of `guardian.shortcuts.get_objects_for_user`,
+    which evaluates permissions on tasks, jobs and logs instead of looking for object permission rows
+    """
+
+    queryset = klass if isinstance(klass, QuerySet) else klass._default_manager.all()
+    perms = _normalize_perms(perms=perms, model=queryset.model)
+
+    if kwargs or not perms or not perms.issubset(TASK_PERMISSIONS.get(queryset.model, ())):
+        return get_objects_for_user_by_rows(
+            user, perms, queryset, with_superuser=with_superuser, accept_global_perms=accept_global_perms, **kwargs
+        )
+
+    if user.is_anonymous or not user.is_active:
+        return queryset.none()
+
+    if with_superuser and user.is_superuser:
+        return queryset
+
+    if accept_global_perms and user.has_perms(perms):
+        return queryset
+
+    return filter_tasks_for_user(user=user, queryset=queryset)
+
+
+class TaskPermissionBackend:
+    """Object permission backend for tasks, jobs and logs"""
+
+    def authenticate(self, request, **credentials) -> None:  # noqa: ARG002
+        return None
+
+    def has_perm(self, user_obj: AuthUser, perm: str, obj: Model | None = None) -> bool:
+        if obj is None or user_obj.is_anonymous or not user_obj.is_active:
+            return False
+
+        if perm not in TASK_PERMISSIONS.get(type(obj), ()):
+            return False
+
+        match obj:
+            case TaskLog():
+                task_id = obj.pk
+            case JobLog():
+                task_id = obj.task_id
+            case _:
+                task_id = JobLog.objects.values_list("task_id", flat=True).get(pk=obj.job_id)
+
+        if task_id is None:
+            return False
+
+        if not hasattr(user_obj, _TASKS_CACHE_ATTR):
+            setattr(user_obj, _TASKS_CACHE_ATTR, {})
+
+        cache = getattr(user_obj, _TASKS_CACHE_ATTR)
+        if task_id not in cache:
+            condition = _get_grants_condition(user=user_obj)
+            cache[task_id] = condition is not None and TaskLog.objects.filter(condition, pk=task_id).exists()
+
+        return cache[task_id]
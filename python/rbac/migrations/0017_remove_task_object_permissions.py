@@ -0,0 +1,38 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import migrations
+
+# Permissions on these objects are evaluated by `rbac.backends.TaskPermissionBackend`
+TASK_MODELS = ("tasklog", "joblog", "logstorage")
+
+
+def remove_task_object_permissions(apps, schema_editor) -> None:
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    GroupObjectPermission = apps.get_model("guardian", "GroupObjectPermission")
+    Role = apps.get_model("rbac", "Role")
+
+    GroupObjectPermission.objects.filter(
+        content_type__in=ContentType.objects.filter(app_label="cm", model__in=TASK_MODELS)
+    ).delete()
+    Role.objects.filter(module_name="rbac.roles", class_name="TaskRole").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rbac", "0016_fix_roles_after_rename_models"),
+        ("guardian", "0002_generic_permissions_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(code=remove_task_object_permissions, reverse_code=migrations.RunPython.noop),
+    ]
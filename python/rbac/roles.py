@@ -13,17 +13,13 @@
 from cm.errors import raise_adcm_ex
 from cm.models import (
     Action,
-    ActionHostGroup,
     ADCMEntity,
     Component,
     ConfigHostGroup,
     ConfigLog,
     Host,
     HostComponent,
-    JobLog,
-    LogStorage,
     Service,
-    TaskLog,
 )
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
@@ -37,7 +33,6 @@ from rbac.models import (
     Policy,
     PolicyPermission,
     Role,
-    RoleTypes,
     get_objects_for_policy,
 )
 
@@ -175,98 +170,6 @@ class ActionRole(AbstractRole):
                 assign_group_perm(policy=policy, permission=perm, obj=obj)
 
 
-class TaskRole(AbstractRole):
-    def apply(self, policy: Policy, role: Role, param_obj: ADCMEntity = None) -> None:
-        task = TaskLog.objects.filter(id=self.params["task_id"]).first()
-        if not task:
-            role.delete()
-
-            return
-
-        for obj in policy.get_objects(param_obj):
-            if obj == task.task_object:
-                apply_jobs(task=task, policy=policy)
-
-        return
-
-
-def apply_jobs(task: TaskLog, policy: Policy) -> None:
-    view_tasklog_permission, _ = Permission.objects.get_or_create(
-        content_type=ContentType.objects.get_for_model(model=TaskLog),
-        codename=f"view_{TaskLog.__name__.lower()}",
-    )
-    assign_group_perm(policy=policy, permission=view_tasklog_permission, obj=task)
-
-    change_tasklog_permission, _ = Permission.objects.get_or_create(
-        content_type=ContentType.objects.get_for_model(model=TaskLog),
-        codename=f"change_{TaskLog.__name__.lower()}",
-    )
-    change_joblog_permission, _ = Permission.objects.get_or_create(
-        content_type=ContentType.objects.get_for_model(model=JobLog),
-        codename=f"change_{JobLog.__name__.lower()}",
-    )
-    assign_group_perm(policy=policy, permission=change_tasklog_permission, obj=task)
-
-    view_joblog_permission, _ = Permission.objects.get_or_create(
-        content_type=ContentType.objects.get_for_model(model=JobLog),
-        codename=f"view_{JobLog.__name__.lower()}",
-    )
-    view_logstorage_permission, _ = Permission.objects.get_or_create(
-        content_type=ContentType.objects.get_for_model(model=LogStorage),
-        codename=f"view_{LogStorage.__name__.lower()}",
-    )
-
-    for job in JobLog.objects.filter(task=task):
-        assign_group_perm(policy=policy, permission=view_joblog_permission, obj=job)
-        assign_group_perm(policy=policy, permission=change_joblog_permission, obj=job)
-
-        for log in LogStorage.objects.filter(job=job):
-            assign_group_perm(policy=policy, permission=view_logstorage_permission, obj=log)
-
-
-def re_apply_policy_for_jobs(action_object: ADCMEntity, task: TaskLog) -> None:
-    obj_type_map = get_objects_for_policy(obj=action_object)
-    object_model = action_object.__class__.__name__.lower()
-
-    target = task.task_object
-    if isinstance(target, ActionHostGroup):
-        target = target.object
-
-    task_role, _ = Role.objects.get_or_create(
-        name=f"View role for task {task.id}",
-        display_name=f"View role for task {task.id}",
-        description="View tasklog object with following joblog and logstorage",
-        type=RoleTypes.HIDDEN,
-        module_name="rbac.roles",
-        class_name="TaskRole",
-        init_params={
-            "task_id": task.id,
-        },
-        parametrized_by_type=[target.prototype.type],
-    )
-
-    for obj, content_type in obj_type_map.items():
-        for policy in Policy.objects.filter(object__object_id=obj.id, object__content_type=content_type):
-            for group in policy.group.all():
-                try:
-                    group_obj_perm = GroupObjectPermission.objects.get(
-                        group=group,
-                        permission__codename="view_action",
-                        object_pk=task.action.pk,
-                    )
-                    model_view_gop = GroupObjectPermission.objects.get(
-                        group=group,
-                        permission__codename=f"view_{object_model}",
-                        object_pk=action_object.pk,
-                    )
-                except GroupObjectPermission.DoesNotExist:
-                    continue
-
-                if group_obj_perm in policy.group_object_perm.all() and model_view_gop:
-                    policy.role.child.add(task_role)
-                    apply_jobs(task=task, policy=policy)
-
-
 def apply_policy_for_new_config(config_object: ADCMEntity, config_log: ConfigLog) -> None:
     obj_type_map = get_objects_for_policy(obj=config_object)
     object_model = config_object.__class__.__name__.lower()
@@ -330,7 +233,7 @@ class ConfigRole(AbstractRole):
 class ParentRole(AbstractRole):
     @staticmethod
     def find_and_apply(obj: ADCMEntity, policy: Policy, role: Role) -> None:
-        for child_role in role.child.filter(class_name__in=("ObjectRole", "TaskRole", "ConfigRole")):
+        for child_role in role.child.filter(class_name__in=("ObjectRole", "ConfigRole")):
             if obj.prototype.type in child_role.parametrized_by_type:
                 child_role.apply(policy=policy, obj=obj)
 
@@ -15,7 +15,7 @@ from operator import attrgetter
 from typing import Any, Iterable
 
 from cm.services.adcm import retrieve_password_requirements
-from cm.status_api import send_object_update_event
+from cm.status_api import invalidate_auth_cache, send_object_update_event
 from core.errors import NotFoundError
 from core.rbac.dto import UserCreateDTO, UserUpdateDTO
 from core.rbac.errors import UpdateLDAPUserError
@@ -131,8 +131,10 @@ class GroupDB:
 
 
 def drop_user_connections(user_ids: Iterable[UserID]) -> None:
-    # sessions will expire "by default" Django mechanism
+    # sessions will expire "by default" Django mechanism,
+    # but SS doesn't know which sessions belong to these users, so all its cached checks are dropped
     Token.objects.filter(user_id__in=user_ids).delete()
+    on_commit(func=partial(invalidate_auth_cache, drop_all=True))
 
 
 def perform_user_creation(create_data: UserCreateDTO, groups: Iterable[GroupID]) -> UserID:
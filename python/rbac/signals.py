@@ -10,13 +10,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
+from threading import local
 import re
 
 from cm.errors import raise_adcm_ex
-from django.db.models.signals import pre_save
+from cm.status_api import invalidate_auth_cache
+from django.contrib.auth.models import User as AuthUser
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.db.transaction import on_commit
 from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
 
-from rbac.models import Group, OriginType
+from rbac.models import Group, OriginType, User
 from rbac.utils import get_group_name_display_name
 
 
@@ -33,3 +40,61 @@ def handle_name_type_display_name(sender, instance, **kwargs):  # noqa: ARG001
         instance.display_name = display_name
     else:
         raise_adcm_ex(code="GROUP_CONFLICT", msg=f"Check regex. Data: `{instance.name}`")
+
+
+@receiver(signal=post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):  # noqa: ARG001
+    on_commit(func=partial(invalidate_auth_cache, tokens=[instance.key]))
+
+
+@receiver(signal=user_logged_out)
+def invalidate_logged_out_session(sender, request, **kwargs):  # noqa: ARG001
+    session_key = getattr(getattr(request, "session", None), "session_key", None)
+    if session_key:
+        on_commit(func=partial(invalidate_auth_cache, sessions=[session_key]))
+
+
+@receiver(signal=post_save, sender=User)
+@receiver(signal=post_save, sender=AuthUser)
+def invalidate_deactivated_user(sender, instance, created, update_fields, **kwargs):  # noqa: ARG001
+    if kwargs["raw"] or created or instance.is_active:
+        return
+
+    if update_fields is None or "is_active" in update_fields:
+        _drop_auth_cache_on_commit()
+
+
+@receiver(signal=post_delete, sender=User)
+@receiver(signal=post_delete, sender=AuthUser)
+def invalidate_deleted_user(sender, instance, **kwargs):  # noqa: ARG001
+    _drop_auth_cache_on_commit()
+
+
+class _AuthCacheDrop:
+    """Drop of all SS auth cache shared by callbacks registered within one transaction"""
+
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = False
+
+    def __call__(self) -> None:
+        if self.done:
+            return
+
+        self.done = True
+        invalidate_auth_cache(drop_all=True)
+
+
+_pending_drop = local()
+
+
+def _drop_auth_cache_on_commit() -> None:
+    # SS doesn't know which sessions belong to the user, so all its cached checks are dropped.
+    # Users are deleted in bulk (e.g. by LDAP sync), so callbacks of one transaction share one drop
+    # and only the first of them does the request.
+    drop = getattr(_pending_drop, "drop", None)
+    if drop is None or drop.done:
+        drop = _pending_drop.drop = _AuthCacheDrop()
+
+    on_commit(func=drop)
@@ -38,11 +38,6 @@ def upgrade(data: dict) -> None:
 
     for role_data in data["roles"]:
         role_obj = new_roles[role_data["name"]]
-        task_roles = []
-        for child in role_obj.child.order_by("id"):
-            if child.class_name == "TaskRole":
-                task_roles.append(child)
-
         role_obj.child.clear()
         if "child" not in role_data:
             continue
@@ -51,7 +46,6 @@ def upgrade(data: dict) -> None:
             child_role = new_roles[child]
             role_obj.child.add(child_role)
 
-        role_obj.child.add(*task_roles)
         role_obj.save()
 
 